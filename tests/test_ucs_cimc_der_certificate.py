@@ -0,0 +1,319 @@
+"""
+UCS CIMC Certificate Renewal Tool DER Certificate Parser Tests
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The tests of the DER certificate parser used to verify the
+         certificates served by the UCS CIMCs. The certificates are created
+         with the openssl command line tool.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import os
+import ssl
+import shutil
+import datetime
+import tempfile
+import unittest
+import subprocess
+
+from ucs_cimc_operations import (
+    UcsCimcCertificateParseError,
+    _read_der_element,
+    parse_ucs_cimc_der_certificate,
+    verify_ucs_cimc_fleet_tls_certificates
+    )
+
+
+# Establish function to create a certificate with the openssl command line tool
+def create_openssl_der_certificate(
+    working_directory,
+    subject,
+    days=365,
+    self_signed_version_1=False,
+    string_mask="utf8only"
+    ):
+    """This is a function to create a self-signed certificate with the openssl
+    command line tool.
+
+    Args:
+        working_directory (str):
+            The directory to write the key, request and certificate to.
+        subject (str):
+            The subject of the certificate, such as "/CN=cimc01".
+        days (int):
+            The number of days the certificate is valid for. The default value
+            is 365.
+        self_signed_version_1 (bool):
+            Whether a version 1 certificate without extensions is created, by
+            signing a certificate signing request. The default value is False,
+            which creates a version 3 certificate.
+        string_mask (str):
+            The openssl string_mask setting, which selects the DER string
+            types of the subject. The default value is "utf8only".
+
+    Returns:
+        The DER encoded certificate as bytes.
+    """
+    openssl_config_filepath = os.path.join(working_directory, "openssl.cnf")
+    with open(openssl_config_filepath, "w", encoding="utf-8") as openssl_config_file:
+        openssl_config_file.write(
+            "[req]\n"
+            "distinguished_name = req_distinguished_name\n"
+            f"string_mask = {string_mask}\n"
+            "[req_distinguished_name]\n"
+            )
+    key_filepath = os.path.join(working_directory, "key.pem")
+    certificate_filepath = os.path.join(working_directory, "certificate.pem")
+    openssl_request_arguments = [
+        "openssl", "req", "-config", openssl_config_filepath, "-utf8", "-subj", subject,
+        "-newkey", "rsa:2048", "-nodes", "-keyout", key_filepath
+        ]
+    if self_signed_version_1:
+        request_filepath = os.path.join(working_directory, "request.csr")
+        subprocess.run(openssl_request_arguments + ["-out", request_filepath], check=True, capture_output=True)
+        subprocess.run(
+            ["openssl", "x509", "-req", "-in", request_filepath, "-signkey", key_filepath,
+             "-days", str(days), "-out", certificate_filepath],
+            check=True,
+            capture_output=True
+            )
+    else:
+        subprocess.run(
+            openssl_request_arguments + ["-x509", "-days", str(days), "-out", certificate_filepath],
+            check=True,
+            capture_output=True
+            )
+    with open(certificate_filepath, encoding="ascii") as certificate_file:
+        return ssl.PEM_cert_to_DER_cert(certificate_file.read())
+
+
+# Establish function to replace the validity dates of a DER encoded certificate
+def replace_der_certificate_time(
+    der_certificate,
+    original_time,
+    replacement_time
+    ):
+    """This is a function to replace a validity date of a DER encoded
+    certificate with another of the same length and string type. The
+    signature is no longer valid, which the parser does not check.
+
+    Args:
+        der_certificate (bytes):
+            The DER encoded certificate.
+        original_time (bytes):
+            The encoded time to replace, including its tag and length.
+        replacement_time (bytes):
+            The encoded time to replace it with, including its tag and length.
+
+    Returns:
+        The DER encoded certificate with the replaced time.
+    """
+    assert len(original_time) == len(replacement_time)
+    assert der_certificate.count(original_time) == 1
+    return der_certificate.replace(original_time, replacement_time)
+
+
+# Establish function to read the validity dates of a certificate with the openssl command line tool
+def read_openssl_certificate_dates(der_certificate):
+    """This is a function to read the notBefore and notAfter dates of a DER
+    encoded certificate with the openssl command line tool.
+
+    Args:
+        der_certificate (bytes):
+            The DER encoded certificate.
+
+    Returns:
+        A tuple of the notBefore and notAfter dates as timezone-aware datetime
+        class instances.
+    """
+    openssl_dates = subprocess.run(
+        ["openssl", "x509", "-inform", "DER", "-noout", "-dates"],
+        input=der_certificate,
+        check=True,
+        capture_output=True
+        ).stdout.decode("ascii")
+    openssl_date_values = dict(
+        openssl_date_line.split("=", 1)
+        for openssl_date_line in openssl_dates.splitlines()
+        )
+    return tuple(
+        datetime.datetime.strptime(
+            " ".join(openssl_date_values[openssl_date_name].split()),
+            "%b %d %H:%M:%S %Y %Z"
+            ).replace(tzinfo=datetime.timezone.utc)
+        for openssl_date_name in ("notBefore", "notAfter")
+        )
+
+
+@unittest.skipUnless(shutil.which("openssl"), "The openssl command line tool is not available.")
+class UcsCimcDerCertificateParserTest(unittest.TestCase):
+    """This is a class for the tests of parse_ucs_cimc_der_certificate()."""
+    def setUp(self):
+        self.working_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.working_directory)
+
+    def test_version_3_certificate(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc01.example.com/O=Example/OU=Data Center"
+            )
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(parsed_certificate["commonName"], "cimc01.example.com")
+        self.assertEqual(parsed_certificate["organization"], "Example")
+        self.assertEqual(parsed_certificate["organizationalUnit"], "Data Center")
+        self.assertEqual(
+            (parsed_certificate["notBefore"], parsed_certificate["notAfter"]),
+            read_openssl_certificate_dates(der_certificate)
+            )
+
+    def test_version_1_certificate_without_version_field(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc02.example.com/O=Example",
+            self_signed_version_1=True
+            )
+        # The version 1 certificate has no explicitly tagged [0] version field
+        _, certificate_offset, _ = _read_der_element(der_certificate, 0)
+        _, tbs_offset, _ = _read_der_element(der_certificate, certificate_offset)
+        self.assertNotEqual(der_certificate[tbs_offset], 0xA0)
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(parsed_certificate["commonName"], "cimc02.example.com")
+        self.assertEqual(parsed_certificate["organization"], "Example")
+        self.assertEqual(
+            (parsed_certificate["notBefore"], parsed_certificate["notAfter"]),
+            read_openssl_certificate_dates(der_certificate)
+            )
+
+    def test_generalized_time_after_2049(self):
+        days_to_2060 = (datetime.date(2060, 1, 1) - datetime.date.today()).days
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc03.example.com",
+            days=days_to_2060
+            )
+        # The notAfter date from 2050 onwards is encoded as a GeneralizedTime
+        self.assertIn(b"\x18\x0f2060", der_certificate)
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(parsed_certificate["notAfter"].year, 2060)
+        self.assertEqual(
+            (parsed_certificate["notBefore"], parsed_certificate["notAfter"]),
+            read_openssl_certificate_dates(der_certificate)
+            )
+
+    def test_utc_time_on_either_side_of_2050(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc04.example.com"
+            )
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        original_not_before = b"\x17\x0d" + parsed_certificate["notBefore"].strftime("%y%m%d%H%M%SZ").encode("ascii")
+        original_not_after = b"\x17\x0d" + parsed_certificate["notAfter"].strftime("%y%m%d%H%M%SZ").encode("ascii")
+        # Two-digit years from 50 are in the 1900s and those up to 49 are in the 2000s
+        der_certificate = replace_der_certificate_time(der_certificate, original_not_before, b"\x17\x0d500101000000Z")
+        der_certificate = replace_der_certificate_time(der_certificate, original_not_after, b"\x17\x0d491231235959Z")
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(
+            parsed_certificate["notBefore"],
+            datetime.datetime(1950, 1, 1, tzinfo=datetime.timezone.utc)
+            )
+        self.assertEqual(
+            parsed_certificate["notAfter"],
+            datetime.datetime(2049, 12, 31, 23, 59, 59, tzinfo=datetime.timezone.utc)
+            )
+        self.assertEqual(
+            (parsed_certificate["notBefore"], parsed_certificate["notAfter"]),
+            read_openssl_certificate_dates(der_certificate)
+            )
+
+    def test_bmp_string_subject(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc05.example.com/O=Ωmega Systems",
+            string_mask="default"
+            )
+        # The organization does not fit a PrintableString or T61String, so it is a BMPString
+        self.assertIn(b"\x1e\x1a" + "Ωmega Systems".encode("utf-16-be"), der_certificate)
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(parsed_certificate["commonName"], "cimc05.example.com")
+        self.assertEqual(parsed_certificate["organization"], "Ωmega Systems")
+
+    def test_t61_string_subject(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc06.example.com/O=Société Générale",
+            string_mask="default"
+            )
+        self.assertIn(b"\x14\x10" + "Société Générale".encode("latin-1"), der_certificate)
+        parsed_certificate = parse_ucs_cimc_der_certificate(der_certificate)
+        self.assertEqual(parsed_certificate["organization"], "Société Générale")
+
+    def test_truncated_certificate(self):
+        der_certificate = create_openssl_der_certificate(
+            self.working_directory,
+            "/CN=cimc07.example.com"
+            )
+        for truncated_length in (0, 1, 3, 100, len(der_certificate) - 1):
+            with self.subTest(truncated_length=truncated_length):
+                with self.assertRaises(UcsCimcCertificateParseError):
+                    parse_ucs_cimc_der_certificate(der_certificate[:truncated_length])
+
+
+class UcsCimcDerElementReaderTest(unittest.TestCase):
+    """This is a class for the tests of _read_der_element()."""
+    def test_short_form_length(self):
+        self.assertEqual(_read_der_element(b"\x04\x03abc", 0), (0x04, 2, 5))
+
+    def test_long_form_lengths(self):
+        self.assertEqual(_read_der_element(b"\x04\x81\x80" + b"a" * 128, 0), (0x04, 3, 131))
+        self.assertEqual(_read_der_element(b"\x04\x82\x01\x00" + b"a" * 256, 0), (0x04, 4, 260))
+        self.assertEqual(_read_der_element(b"\x00\x30\x84\x00\x00\x00\x01a", 1), (0x30, 7, 8))
+
+    def test_unsupported_lengths(self):
+        for der_data in (b"\x30\x80abc\x00\x00", b"\x30\x85\x00\x00\x00\x00\x01a"):
+            with self.subTest(der_data=der_data):
+                with self.assertRaises(ValueError):
+                    _read_der_element(der_data, 0)
+
+    def test_truncated_elements(self):
+        for der_data in (b"", b"\x30", b"\x04\x05abc", b"\x04\x82\x01", b"\x04\x81\x80" + b"a" * 127):
+            with self.subTest(der_data=der_data):
+                with self.assertRaises(ValueError):
+                    _read_der_element(der_data, 0)
+
+
+class UcsCimcServedCertificateVerificationTest(unittest.TestCase):
+    """This is a class for the tests of how
+    verify_ucs_cimc_fleet_tls_certificates() handles served certificates
+    that cannot be parsed.
+    """
+    def test_parse_error_fails_at_once(self):
+        def verify_task(ucs_cimc_server):
+            return parse_ucs_cimc_der_certificate(b"\x30\x03\x02\x01")
+
+        ucs_cimc_verification_result, = verify_ucs_cimc_fleet_tls_certificates(
+            ["cimc01.example.com"],
+            verify_task,
+            interval=0.01,
+            timeout=5.0
+            )
+        self.assertEqual(ucs_cimc_verification_result["state"], "failed")
+        self.assertEqual(ucs_cimc_verification_result["probes"], 1)
+        self.assertIn("Unable to parse the certificate", ucs_cimc_verification_result["reason"])
+
+    def test_connection_error_stays_pending(self):
+        def verify_task(ucs_cimc_server):
+            raise ConnectionRefusedError("Connection refused")
+
+        ucs_cimc_verification_result, = verify_ucs_cimc_fleet_tls_certificates(
+            ["cimc01.example.com"],
+            verify_task,
+            interval=0.01,
+            timeout=0.05
+            )
+        self.assertEqual(ucs_cimc_verification_result["state"], "timed_out")
+        self.assertGreater(ucs_cimc_verification_result["probes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
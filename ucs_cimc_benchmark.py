@@ -0,0 +1,234 @@
+"""
+UCS CIMC Certificate Renewal Tool Benchmark
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC Certificate Renewal Tool Benchmark measures the fleet
+         throughput of the UCS CIMC Certificate Renewal Tool against the UCS
+         CIMC Mock XML API Server, reporting the wall time, hosts per second
+         and peak memory for each fleet size and client engine.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import sys
+import os
+import io
+import json
+import time
+import argparse
+import resource
+import tracemalloc
+import subprocess
+import contextlib
+
+import ucs_cimc_client
+import ucs_cimc_csr_tool
+
+
+# Establish function to build the simulated UCS CIMC server list
+def build_simulated_ucs_cimc_server_list(
+    host_count,
+    port
+    ):
+    """This is a function to build a list of simulated UCS CIMC servers. Each
+    server is given a separate loopback address in the 127.0.0.0/8 range, so
+    the mock server treats it as a separate UCS CIMC.
+
+    Args:
+        host_count (int):
+            The number of simulated UCS CIMC servers.
+        port (int):
+            The port the mock server is listening on.
+
+    Returns:
+        A list of the simulated UCS CIMC server addresses.
+    """
+    return [
+        f"127.{1 + host_index // 64516}.{host_index // 254 % 254}.{host_index % 254 + 1}:{port}"
+        for host_index in range(host_count)
+        ]
+
+
+# Establish function to start the mock server in a separate process
+@contextlib.contextmanager
+def run_ucs_cimc_mock_server_process(mock_server_arguments):
+    """This is a function to run the UCS CIMC Mock XML API Server in a
+    separate process, so its CPU and memory use is not counted in the
+    benchmark results.
+
+    Args:
+        mock_server_arguments (list):
+            The command line arguments for the mock server.
+
+    Yields:
+        The subprocess.Popen class instance of the mock server.
+
+    Raises:
+        Exception:
+            The mock server failed to start.
+    """
+    mock_server_process = subprocess.Popen(
+        [sys.executable,
+         os.path.join(os.path.dirname(os.path.abspath(__file__)), "ucs_cimc_mock_server.py"),
+         *mock_server_arguments],
+        stdout=subprocess.PIPE,
+        text=True
+        )
+    try:
+        if not mock_server_process.stdout.readline():
+            raise Exception("The UCS CIMC Mock XML API Server failed to start.")
+        yield mock_server_process
+    finally:
+        mock_server_process.terminate()
+        mock_server_process.wait()
+
+
+# Establish function to benchmark a single fleet run
+def run_ucs_cimc_fleet_benchmark(
+    ucs_cimc_server_list,
+    client_engine="threads",
+    max_concurrent_workers=32,
+    max_concurrent_sessions=100
+    ):
+    """This is a function to benchmark a single run of the UCS CIMC
+    Certificate Renewal Tool main() entry point.
+
+    Args:
+        ucs_cimc_server_list (list):
+            The UCS CIMC servers to run against.
+        client_engine (str):
+            The client engine, either "threads" or "asyncio". The default
+            value is "threads".
+        max_concurrent_workers (int):
+            The maximum number of concurrent workers for the threads engine.
+            The default value is 32.
+        max_concurrent_sessions (int):
+            The maximum number of concurrent sessions for the asyncio engine.
+            The default value is 100.
+
+    Returns:
+        A dictionary of the benchmark results, including the succeeded and
+        failed UCS CIMCs, the wall time, hosts per second and peak memory.
+    """
+    ucs_cimc_csr_tool.ucs_cimc_server_list = ucs_cimc_server_list
+    ucs_cimc_csr_tool.ucs_cimc_client_engine = client_engine
+    ucs_cimc_csr_tool.ucs_cimc_max_concurrent_workers = max_concurrent_workers
+    ucs_cimc_csr_tool.ucs_cimc_max_concurrent_sessions = max_concurrent_sessions
+    ucs_cimc_client._ucs_cimc_circuit_breakers.clear()
+
+    tracemalloc.start()
+    benchmark_start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ucs_cimc_fleet_results = ucs_cimc_csr_tool.main(
+            ["--journal", "", "--metrics", "", "--prometheus-textfile", "", "--verbosity", "quiet"]
+            )
+    wall_time = time.perf_counter() - benchmark_start_time
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # UCS CIMCs without a result, such as those skipped before the run, are counted as failed
+    host_count = len(ucs_cimc_server_list)
+    succeeded_count = sum(1 for ucs_cimc_result in ucs_cimc_fleet_results if ucs_cimc_result["succeeded"])
+    return {
+        "hosts": host_count,
+        "engine": client_engine,
+        "concurrency": max_concurrent_sessions if client_engine == "asyncio" else max_concurrent_workers,
+        "succeeded": succeeded_count,
+        "failed": host_count - succeeded_count,
+        "success_rate": succeeded_count / host_count if host_count else 1.0,
+        "wall_time": wall_time,
+        "hosts_per_second": host_count / wall_time if wall_time else 0.0,
+        "peak_memory_mib": peak_memory / (1024 * 1024),
+        "max_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        }
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(
+        description="Benchmark the fleet throughput of the UCS CIMC Certificate "
+                    "Renewal Tool against the UCS CIMC Mock XML API Server."
+        )
+    argument_parser.add_argument("--hosts", type=int, nargs="+",
+                                 help="The simulated fleet sizes to benchmark. The default is 10, 100 and 1000, "
+                                      "or 10 for a smoke test.")
+    argument_parser.add_argument("--engines", nargs="+", choices=["threads", "asyncio"],
+                                 default=["threads", "asyncio"])
+    argument_parser.add_argument("--workers", type=int, default=32,
+                                 help="The maximum concurrent workers for the threads engine.")
+    argument_parser.add_argument("--sessions", type=int, default=100,
+                                 help="The maximum concurrent sessions for the asyncio engine.")
+    argument_parser.add_argument("--port", type=int, default=18443)
+    argument_parser.add_argument("--latency", type=float, default=0.05)
+    argument_parser.add_argument("--tls-handshake-delay", type=float, default=0.01)
+    argument_parser.add_argument("--error-rate", type=float, default=0.0)
+    argument_parser.add_argument("--drop-rate", type=float, default=0.0)
+    argument_parser.add_argument("--max-sessions", type=int, default=4)
+    argument_parser.add_argument("--output",
+                                 help="The filepath to write the benchmark results to as JSON lines.")
+    argument_parser.add_argument("--min-success-rate", type=float, default=0.0,
+                                 help="The minimum fraction of UCS CIMCs that must succeed in every run, "
+                                      "otherwise the benchmark exits with a non-zero status.")
+    argument_parser.add_argument("--smoke", action="store_true",
+                                 help="Run a smoke test, which exits with a non-zero status if any UCS CIMC fails.")
+    arguments = argument_parser.parse_args()
+    if arguments.hosts is None:
+        arguments.hosts = [10] if arguments.smoke else [10, 100, 1000]
+    if arguments.smoke:
+        arguments.min_success_rate = 1.0
+
+    # Measure the certificate requests only, with short retry waits against the mock server
+    ucs_cimc_csr_tool.request_self_signed_certificate = True
+    ucs_cimc_csr_tool.tls_verification_enabled = False
+    ucs_cimc_csr_tool.ucs_cimc_retry_backoff_factor = 0.1
+    ucs_cimc_csr_tool.ucs_cimc_retry_backoff_max = 1
+
+    mock_server_arguments = [
+        "--bind-address", "0.0.0.0",
+        "--port", str(arguments.port),
+        "--latency", str(arguments.latency),
+        "--tls-handshake-delay", str(arguments.tls_handshake_delay),
+        "--error-rate", str(arguments.error_rate),
+        "--drop-rate", str(arguments.drop_rate),
+        "--max-sessions", str(arguments.max_sessions)
+        ]
+    benchmark_results = []
+    print(f"{'Hosts':>7} {'Engine':>8} {'Concurrency':>12} {'Succeeded':>10} {'Failed':>7} "
+          f"{'Wall Time':>10} {'Hosts/s':>9} {'Peak MiB':>9} {'Max RSS MiB':>12}")
+    with run_ucs_cimc_mock_server_process(mock_server_arguments):
+        for host_count in arguments.hosts:
+            ucs_cimc_server_list = build_simulated_ucs_cimc_server_list(host_count, arguments.port)
+            for client_engine in arguments.engines:
+                benchmark_result = run_ucs_cimc_fleet_benchmark(
+                    ucs_cimc_server_list,
+                    client_engine=client_engine,
+                    max_concurrent_workers=arguments.workers,
+                    max_concurrent_sessions=arguments.sessions
+                    )
+                benchmark_results.append(benchmark_result)
+                print(f"{benchmark_result['hosts']:>7} {benchmark_result['engine']:>8} "
+                      f"{benchmark_result['concurrency']:>12} {benchmark_result['succeeded']:>10} "
+                      f"{benchmark_result['failed']:>7} "
+                      f"{benchmark_result['wall_time']:>9.2f}s {benchmark_result['hosts_per_second']:>9.1f} "
+                      f"{benchmark_result['peak_memory_mib']:>9.1f} {benchmark_result['max_rss_mib']:>12.1f}")
+
+    if arguments.output:
+        with open(arguments.output, "w") as benchmark_output_file:
+            for benchmark_result in benchmark_results:
+                benchmark_output_file.write(json.dumps(benchmark_result) + "\n")
+        print(f"\nThe benchmark results have been written to {arguments.output}.")
+
+    # Fail the benchmark if too many UCS CIMCs failed in any run
+    failed_benchmark_results = [
+        benchmark_result
+        for benchmark_result in benchmark_results
+        if benchmark_result["success_rate"] < arguments.min_success_rate
+        ]
+    for benchmark_result in failed_benchmark_results:
+        print(f"\nThe {benchmark_result['engine']} run of {benchmark_result['hosts']} host(s) succeeded for "
+              f"{benchmark_result['success_rate']:.1%} of the UCS CIMCs, below the minimum of "
+              f"{arguments.min_success_rate:.1%}.")
+    return 1 if failed_benchmark_results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
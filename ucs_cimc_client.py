@@ -0,0 +1,2918 @@
+"""
+UCS CIMC XML API Client
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC XML API Client provides the persistent sessions,
+         login cookie cache, retries, circuit breakers and run metrics
+         used to communicate with the XML API of the Cisco Integrated
+         Management Controller (CIMC), with a threaded requests engine
+         and an asyncio engine. The requests, urllib3, asyncio and ssl
+         modules are imported when first used, so importing this module
+         does no work.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import os
+import re
+import sys
+import time
+import json
+import math
+import random
+import hashlib
+import logging
+import functools
+import threading
+import contextlib
+import collections
+import urllib.parse
+import xml.etree.ElementTree as et
+
+# Establish the client settings, which can be changed with set_ucs_cimc_client_settings()
+ucs_cimc_connect_timeout = 10
+ucs_cimc_read_timeout = 60
+ucs_cimc_max_retries = 3
+ucs_cimc_retry_backoff_factor = 1
+ucs_cimc_retry_backoff_max = 30
+ucs_cimc_circuit_breaker_failure_threshold = 5
+ucs_cimc_circuit_breaker_reset_timeout = 300
+
+
+# Establish function to set the client settings for UCS CIMC requests
+def set_ucs_cimc_client_settings(
+    connect_timeout=None,
+    read_timeout=None,
+    max_retries=None,
+    retry_backoff_factor=None,
+    retry_backoff_max=None,
+    circuit_breaker_failure_threshold=None,
+    circuit_breaker_reset_timeout=None
+    ):
+    """This is a function to set the timeouts, retry policy and circuit
+    breaker settings used for every UCS CIMC request made in the process.
+    Settings left as None are unchanged. Circuit breakers that already exist
+    keep their settings.
+
+    Args:
+        connect_timeout (float):
+            The number of seconds to wait for a connection to a UCS CIMC.
+        read_timeout (float):
+            The number of seconds to wait for a response from a UCS CIMC.
+        max_retries (int):
+            The maximum number of retries for idempotent requests.
+        retry_backoff_factor (float):
+            The base number of seconds of the exponential backoff between
+            retries.
+        retry_backoff_max (float):
+            The maximum number of seconds to wait between retries.
+        circuit_breaker_failure_threshold (int):
+            The number of consecutive failures after which the circuit
+            breaker for a UCS CIMC opens.
+        circuit_breaker_reset_timeout (float):
+            The number of seconds an open circuit breaker waits before
+            allowing a trial request.
+    """
+    global ucs_cimc_connect_timeout, ucs_cimc_read_timeout, ucs_cimc_max_retries
+    global ucs_cimc_retry_backoff_factor, ucs_cimc_retry_backoff_max
+    global ucs_cimc_circuit_breaker_failure_threshold, ucs_cimc_circuit_breaker_reset_timeout
+    if connect_timeout is not None:
+        ucs_cimc_connect_timeout = connect_timeout
+    if read_timeout is not None:
+        ucs_cimc_read_timeout = read_timeout
+    if max_retries is not None:
+        ucs_cimc_max_retries = max_retries
+    if retry_backoff_factor is not None:
+        ucs_cimc_retry_backoff_factor = retry_backoff_factor
+    if retry_backoff_max is not None:
+        ucs_cimc_retry_backoff_max = retry_backoff_max
+    if circuit_breaker_failure_threshold is not None:
+        ucs_cimc_circuit_breaker_failure_threshold = circuit_breaker_failure_threshold
+    if circuit_breaker_reset_timeout is not None:
+        ucs_cimc_circuit_breaker_reset_timeout = circuit_breaker_reset_timeout
+
+
+# Establish function to import the requests module when it is first needed
+@functools.lru_cache(maxsize=None)
+def _import_requests():
+    """This is a function to import the requests module on the first HTTP
+    request of the threaded client engine, so importing this module and
+    using the asyncio client engine do not pay for it. The
+    InsecureRequestWarning error messages are suppressed once imported.
+
+    Returns:
+        The requests module.
+    """
+    import requests
+    import requests.adapters
+    import urllib3
+    urllib3.disable_warnings()
+    return requests
+
+
+# Establish function to escape a value for a UCS CIMC XML API request attribute
+def _escape_ucs_cimc_xml_attribute(attribute_value):
+    """This is a function to escape a value for use in a single or double
+    quoted attribute of a UCS CIMC XML API request body. Line breaks and tabs
+    are written as character references, so they are kept when the attribute
+    value is parsed.
+
+    Args:
+        attribute_value (str):
+            The attribute value.
+
+    Returns:
+        A string of the escaped attribute value.
+    """
+    return (str(attribute_value)
+            .replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace("'", "&apos;")
+            .replace('"', "&quot;")
+            .replace("\r", "&#13;")
+            .replace("\n", "&#10;")
+            .replace("\t", "&#9;"))
+
+
+# Establish function to build the UCS CIMC login request body
+def _build_ucs_cimc_login_post_body(
+    ucs_cimc_username,
+    ucs_cimc_password
+    ):
+    """This is a function to build the XML API request body for a login to a
+    UCS CIMC.
+
+    Args:
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+
+    Returns:
+        A string of the aaaLogin XML API request body.
+    """
+    return (f"""<aaaLogin inName='{_escape_ucs_cimc_xml_attribute(ucs_cimc_username)}' """
+            f"""inPassword='{_escape_ucs_cimc_xml_attribute(ucs_cimc_password)}'></aaaLogin>""")
+
+
+# Establish function to build the UCS CIMC logout request body
+def _build_ucs_cimc_logout_post_body(ucs_cimc_login_cookie):
+    """This is a function to build the XML API request body for a logout of
+    a UCS CIMC.
+
+    Args:
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC 
+            login HTTP request.
+
+    Returns:
+        A string of the aaaLogout XML API request body.
+    """
+    ucs_cimc_login_cookie = _escape_ucs_cimc_xml_attribute(ucs_cimc_login_cookie)
+    return f"""<aaaLogout cookie='{ucs_cimc_login_cookie}' inCookie='{ucs_cimc_login_cookie}'></aaaLogout>"""
+
+
+# Establish function to build the UCS CIMC login refresh request body
+def _build_ucs_cimc_refresh_post_body(
+    ucs_cimc_username,
+    ucs_cimc_password,
+    ucs_cimc_login_cookie
+    ):
+    """This is a function to build the XML API request body for refreshing
+    the login session of a UCS CIMC.
+
+    Args:
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC 
+            login HTTP request.
+
+    Returns:
+        A string of the aaaRefresh XML API request body.
+    """
+    ucs_cimc_login_cookie = _escape_ucs_cimc_xml_attribute(ucs_cimc_login_cookie)
+    return (f"""<aaaRefresh cookie='{ucs_cimc_login_cookie}' inCookie='{ucs_cimc_login_cookie}' """
+            f"""inName='{_escape_ucs_cimc_xml_attribute(ucs_cimc_username)}' """
+            f"""inPassword='{_escape_ucs_cimc_xml_attribute(ucs_cimc_password)}'></aaaRefresh>""")
+
+
+# Establish function to build the XML of a UCS CIMC managed object
+def _build_ucs_cimc_managed_object_xml(
+    ucs_cimc_class_id,
+    ucs_cimc_attributes
+    ):
+    """This is a function to build the XML element of a UCS CIMC managed
+    object, with each attribute on its own line and every attribute value
+    escaped, so values containing quotes, ampersands or angle brackets
+    cannot change the structure of the request.
+
+    Args:
+        ucs_cimc_class_id (str):
+            The class ID of the managed object, such as
+            "generateCertificateSigningRequest".
+        ucs_cimc_attributes (dict):
+            The attributes of the managed object in the order they are
+            written. Attributes with a value of None are left out.
+
+    Returns:
+        A string of the XML element of the managed object.
+    """
+    ucs_cimc_attribute_lines = "".join(
+        f"{ucs_cimc_attribute_name}='{_escape_ucs_cimc_xml_attribute(ucs_cimc_attribute_value)}'\n"
+        for ucs_cimc_attribute_name, ucs_cimc_attribute_value in ucs_cimc_attributes.items()
+        if ucs_cimc_attribute_value is not None
+        )
+    return f"<{ucs_cimc_class_id}\n{ucs_cimc_attribute_lines}/>"
+
+
+# Establish function to build the UCS CIMC configConfMo request body
+def _build_ucs_cimc_config_conf_mo_post_body(
+    ucs_cimc_login_cookie,
+    dn,
+    in_config,
+    in_hierarchical="false"
+    ):
+    """This is a function to build the XML API request body for configuring a
+    managed object on a UCS CIMC.
+
+    Args:
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC
+            login HTTP request.
+        dn (str):
+            The distinguished name (DN) of the managed object.
+        in_config (str):
+            The XML of the managed object configuration placed within the
+            inConfig element, such as from _build_ucs_cimc_managed_object_xml().
+        in_hierarchical (str):
+            Whether the response includes the child managed objects. The
+            default value is "false".
+
+    Returns:
+        A string of the configConfMo XML API request body.
+    """
+    return f"""<configConfMo cookie='{_escape_ucs_cimc_xml_attribute(ucs_cimc_login_cookie)}' dn='{_escape_ucs_cimc_xml_attribute(dn)}' inHierarchical='{_escape_ucs_cimc_xml_attribute(in_hierarchical)}'>
+<inConfig>
+{in_config}
+</inConfig>
+</configConfMo>"""
+
+
+# Establish exception raised when the circuit breaker for a UCS CIMC is open
+class UcsCimcCircuitOpenError(Exception):
+    """This is an exception raised when a request to a UCS CIMC is refused
+    because the circuit breaker for the UCS CIMC is open after repeated
+    failures.
+    """
+
+
+# Establish exception raised when a login to a UCS CIMC is refused
+class UcsCimcLoginError(Exception):
+    """This is an exception raised when a UCS CIMC responds to a login
+    request without a login cookie, carrying the error description returned
+    by the UCS CIMC.
+    """
+
+
+# Establish class for the retry policy of idempotent UCS CIMC requests
+class UcsCimcRetryPolicy:
+    """This is a class for the retry policy of idempotent UCS CIMC XML API
+    requests, such as login, resolve and logout. Retries are spaced with
+    exponential backoff and full jitter.
+
+    Args:
+        max_retries (int):
+            The maximum number of retries after the first attempt. The
+            default value is 3.
+        backoff_factor (float):
+            The base number of seconds for the backoff. The backoff ceiling
+            doubles with each retry. The default value is 1.0.
+        backoff_max (float):
+            The maximum number of seconds to wait between retries. The default
+            value is 30.0.
+    """
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=1.0,
+        backoff_max=30.0
+        ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+
+    def get_backoff(self, retry_number):
+        """This is a method to obtain the number of seconds to wait before a
+        retry.
+
+        Args:
+            retry_number (int):
+                The number of the retry, starting from 1.
+
+        Returns:
+            A float of the number of seconds to wait.
+        """
+        return random.uniform(
+            0,
+            min(self.backoff_max, self.backoff_factor * (2 ** (retry_number - 1)))
+            )
+
+
+# Establish class for the circuit breaker of a UCS CIMC
+class UcsCimcCircuitBreaker:
+    """This is a class for a per-host circuit breaker that stops requests to
+    a UCS CIMC after repeated failures. Once the reset timeout has passed, a
+    single trial request is allowed through. A successful trial closes the
+    circuit breaker and a failed trial opens it again.
+
+    Args:
+        failure_threshold (int):
+            The number of consecutive failures that opens the circuit breaker.
+            The default value is 5.
+        reset_timeout (float):
+            The number of seconds the circuit breaker stays open before a
+            trial request is allowed. The default value is 300.0.
+    """
+    def __init__(
+        self,
+        failure_threshold=5,
+        reset_timeout=300.0
+        ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._trial_in_progress = False
+        self._circuit_breaker_lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """A boolean indicating whether the circuit breaker is open."""
+        return self.opened_at is not None
+
+    def before_request(self):
+        """This is a method to check whether a request may be sent.
+
+        Raises:
+            UcsCimcCircuitOpenError:
+                The circuit breaker is open and the reset timeout has not
+                passed, or a trial request is already in progress.
+        """
+        with self._circuit_breaker_lock:
+            if self.opened_at is None:
+                return
+            if (time.monotonic() - self.opened_at >= self.reset_timeout
+                    and not self._trial_in_progress):
+                self._trial_in_progress = True
+                return
+            raise UcsCimcCircuitOpenError(
+                f"The circuit breaker is open after {self.consecutive_failures} "
+                "consecutive failures."
+                )
+
+    def record_success(self):
+        """This is a method to record a successful request."""
+        with self._circuit_breaker_lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self):
+        """This is a method to record a failed request."""
+        with self._circuit_breaker_lock:
+            self.consecutive_failures += 1
+            if self._trial_in_progress or self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_progress = False
+
+
+_ucs_cimc_circuit_breakers = {}
+_ucs_cimc_circuit_breakers_lock = threading.Lock()
+
+
+# Establish function to obtain the circuit breaker for a UCS CIMC
+def get_ucs_cimc_circuit_breaker(ucs_cimc_server):
+    """This is a function to obtain the circuit breaker for a UCS CIMC. One
+    circuit breaker is kept per UCS CIMC for the lifetime of the process,
+    using the circuit breaker client settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Returns:
+        A UcsCimcCircuitBreaker class instance for the UCS CIMC.
+    """
+    with _ucs_cimc_circuit_breakers_lock:
+        ucs_cimc_circuit_breaker = _ucs_cimc_circuit_breakers.get(ucs_cimc_server)
+        if ucs_cimc_circuit_breaker is None:
+            ucs_cimc_circuit_breaker = UcsCimcCircuitBreaker(
+                failure_threshold=ucs_cimc_circuit_breaker_failure_threshold,
+                reset_timeout=ucs_cimc_circuit_breaker_reset_timeout
+                )
+            _ucs_cimc_circuit_breakers[ucs_cimc_server] = ucs_cimc_circuit_breaker
+        return ucs_cimc_circuit_breaker
+
+
+# Establish function to obtain the default retry policy for UCS CIMC requests
+def _get_default_ucs_cimc_retry_policy():
+    """This is a function to obtain the retry policy for idempotent UCS CIMC
+    requests from the retry client settings.
+
+    Returns:
+        A UcsCimcRetryPolicy class instance.
+    """
+    return UcsCimcRetryPolicy(
+        max_retries=ucs_cimc_max_retries,
+        backoff_factor=ucs_cimc_retry_backoff_factor,
+        backoff_max=ucs_cimc_retry_backoff_max
+        )
+
+
+# Establish class for the latency and outcome metrics of a UCS CIMC fleet run
+class UcsCimcRunMetrics:
+    """This is a class for collecting the duration and outcome of each phase
+    performed against each UCS CIMC during a fleet run, such as connect,
+    login, configure, resolve and logout, and for reporting them as JSON
+    lines, aggregate percentiles and a Prometheus textfile.
+
+    Args:
+        host_phase (str):
+            The name of the phase recorded once per UCS CIMC, which is used to
+            count the UCS CIMCs processed. The default value is
+            "certificate_request".
+    """
+    def __init__(self, host_phase="certificate_request"):
+        self.host_phase = host_phase
+        self.records = []
+        self.start_time = time.time()
+        self.end_time = None
+        self._metrics_lock = threading.Lock()
+
+    def record(
+        self,
+        ucs_cimc_server,
+        phase,
+        duration,
+        succeeded
+        ):
+        """This is a method to record the duration and outcome of a phase for
+        a UCS CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            phase (str):
+                The name of the phase, such as "login".
+            duration (float):
+                The duration of the phase in seconds.
+            succeeded (bool):
+                Whether the phase succeeded.
+        """
+        with self._metrics_lock:
+            self.records.append({
+                "timestamp": time.time(),
+                "ucs_cimc_server": ucs_cimc_server,
+                "phase": phase,
+                "duration": duration,
+                "succeeded": succeeded
+                })
+
+    def finish(self):
+        """This is a method to mark the end of the fleet run."""
+        self.end_time = time.time()
+
+    @staticmethod
+    def _calculate_percentile(
+        sorted_values,
+        percentile
+        ):
+        """This is a method to calculate a percentile of a sorted list of
+        values with the nearest-rank method.
+
+        Args:
+            sorted_values (list):
+                The values, sorted in ascending order.
+            percentile (float):
+                The percentile to calculate, between 0 and 100.
+
+        Returns:
+            The value at the percentile, or 0.0 if the list is empty.
+        """
+        if not sorted_values:
+            return 0.0
+        return sorted_values[max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1)]
+
+    def get_summary(self, host_phase=None):
+        """This is a method to calculate the aggregate metrics of the fleet
+        run.
+
+        Args:
+            host_phase (str):
+                The name of the phase recorded once per UCS CIMC, which is
+                used to count the UCS CIMCs processed. The default value is
+                None, which uses the host phase of the class instance.
+
+        Returns:
+            A dictionary of the run duration, the number of UCS CIMCs
+            processed, the throughput in UCS CIMCs per minute and, for each
+            phase, the count, number of failures and the p50, p95 and p99
+            durations.
+        """
+        if host_phase is None:
+            host_phase = self.host_phase
+        with self._metrics_lock:
+            ucs_cimc_metric_records = list(self.records)
+        ucs_cimc_run_duration = (self.end_time or time.time()) - self.start_time
+        ucs_cimc_phase_durations = collections.defaultdict(list)
+        ucs_cimc_phase_failures = collections.Counter()
+        ucs_cimc_processed_servers = set()
+        for ucs_cimc_metric_record in ucs_cimc_metric_records:
+            ucs_cimc_phase_durations[ucs_cimc_metric_record["phase"]].append(ucs_cimc_metric_record["duration"])
+            if not ucs_cimc_metric_record["succeeded"]:
+                ucs_cimc_phase_failures[ucs_cimc_metric_record["phase"]] += 1
+            if ucs_cimc_metric_record["phase"] == host_phase:
+                ucs_cimc_processed_servers.add(ucs_cimc_metric_record["ucs_cimc_server"])
+        ucs_cimc_phase_summaries = {}
+        for ucs_cimc_phase, ucs_cimc_durations in ucs_cimc_phase_durations.items():
+            ucs_cimc_durations.sort()
+            ucs_cimc_phase_summaries[ucs_cimc_phase] = {
+                "count": len(ucs_cimc_durations),
+                "failures": ucs_cimc_phase_failures[ucs_cimc_phase],
+                "p50": self._calculate_percentile(ucs_cimc_durations, 50),
+                "p95": self._calculate_percentile(ucs_cimc_durations, 95),
+                "p99": self._calculate_percentile(ucs_cimc_durations, 99)
+                }
+        return {
+            "run_duration": ucs_cimc_run_duration,
+            "hosts": len(ucs_cimc_processed_servers),
+            "hosts_per_minute": (len(ucs_cimc_processed_servers) / ucs_cimc_run_duration * 60
+                                 if ucs_cimc_run_duration > 0 else 0.0),
+            "phases": ucs_cimc_phase_summaries
+            }
+
+    def write_json_lines(self, metrics_filepath):
+        """This is a method to write each metric record and a final summary
+        record to a JSON lines file.
+
+        Args:
+            metrics_filepath (str):
+                The filepath of the JSON lines file.
+        """
+        with self._metrics_lock:
+            ucs_cimc_metric_records = list(self.records)
+        with open(metrics_filepath, "w", encoding="utf-8") as ucs_cimc_metrics_file:
+            for ucs_cimc_metric_record in ucs_cimc_metric_records:
+                ucs_cimc_metrics_file.write(json.dumps(dict(ucs_cimc_metric_record, type="phase")) + "\n")
+            ucs_cimc_metrics_file.write(json.dumps(dict(
+                self.get_summary(),
+                type="summary",
+                start_time=self.start_time,
+                end_time=self.end_time or time.time()
+                )) + "\n")
+
+    @classmethod
+    def load_json_lines(
+        cls,
+        metrics_filepaths,
+        host_phase="certificate_request"
+        ):
+        """This is a method to combine the JSON lines files written by one or
+        more fleet runs, such as the shards of a fleet run, into a single
+        metrics collector. The percentiles of the combined collector are
+        calculated from all the metric records, and its run spans from the
+        earliest start to the latest end of the runs.
+
+        Args:
+            metrics_filepaths (list):
+                The filepaths of the JSON lines files.
+            host_phase (str):
+                The name of the phase recorded once per UCS CIMC, which is used
+                to count the UCS CIMCs processed. The default value is
+                "certificate_request".
+
+        Returns:
+            A UcsCimcRunMetrics class instance with the combined metric
+            records.
+        """
+        ucs_cimc_run_metrics = cls(host_phase=host_phase)
+        ucs_cimc_run_start_times = []
+        ucs_cimc_run_end_times = []
+        for metrics_filepath in metrics_filepaths:
+            with open(metrics_filepath, encoding="utf-8") as ucs_cimc_metrics_file:
+                for ucs_cimc_metrics_line in ucs_cimc_metrics_file:
+                    try:
+                        ucs_cimc_metric_record = json.loads(ucs_cimc_metrics_line)
+                    except json.JSONDecodeError:
+                        continue
+                    if ucs_cimc_metric_record.get("type") == "phase":
+                        del ucs_cimc_metric_record["type"]
+                        ucs_cimc_run_metrics.records.append(ucs_cimc_metric_record)
+                        ucs_cimc_run_start_times.append(
+                            ucs_cimc_metric_record["timestamp"] - ucs_cimc_metric_record["duration"]
+                            )
+                        ucs_cimc_run_end_times.append(ucs_cimc_metric_record["timestamp"])
+                    elif ucs_cimc_metric_record.get("type") == "summary" and "start_time" in ucs_cimc_metric_record:
+                        ucs_cimc_run_start_times.append(ucs_cimc_metric_record["start_time"])
+                        ucs_cimc_run_end_times.append(ucs_cimc_metric_record["end_time"])
+        if ucs_cimc_run_start_times:
+            ucs_cimc_run_metrics.start_time = min(ucs_cimc_run_start_times)
+            ucs_cimc_run_metrics.end_time = max(ucs_cimc_run_end_times)
+        else:
+            ucs_cimc_run_metrics.finish()
+        return ucs_cimc_run_metrics
+
+    def write_prometheus_textfile(self, prometheus_filepath):
+        """This is a method to write the aggregate metrics in the Prometheus
+        text exposition format, for use with the node exporter textfile
+        collector. The file is replaced atomically.
+
+        Args:
+            prometheus_filepath (str):
+                The filepath of the Prometheus textfile.
+        """
+        ucs_cimc_run_summary = self.get_summary()
+        ucs_cimc_prometheus_lines = [
+            "# HELP ucs_cimc_csr_tool_run_duration_seconds Duration of the last UCS CIMC fleet run.",
+            "# TYPE ucs_cimc_csr_tool_run_duration_seconds gauge",
+            f"ucs_cimc_csr_tool_run_duration_seconds {ucs_cimc_run_summary['run_duration']:.6f}",
+            "# HELP ucs_cimc_csr_tool_run_timestamp_seconds Completion time of the last UCS CIMC fleet run.",
+            "# TYPE ucs_cimc_csr_tool_run_timestamp_seconds gauge",
+            f"ucs_cimc_csr_tool_run_timestamp_seconds {(self.end_time or time.time()):.3f}",
+            "# HELP ucs_cimc_csr_tool_hosts Number of UCS CIMCs processed in the last fleet run.",
+            "# TYPE ucs_cimc_csr_tool_hosts gauge",
+            f"ucs_cimc_csr_tool_hosts {ucs_cimc_run_summary['hosts']}",
+            "# HELP ucs_cimc_csr_tool_hosts_per_minute Throughput of the last UCS CIMC fleet run.",
+            "# TYPE ucs_cimc_csr_tool_hosts_per_minute gauge",
+            f"ucs_cimc_csr_tool_hosts_per_minute {ucs_cimc_run_summary['hosts_per_minute']:.6f}",
+            "# HELP ucs_cimc_csr_tool_phase_duration_seconds Duration percentiles of each phase in the last fleet run.",
+            "# TYPE ucs_cimc_csr_tool_phase_duration_seconds gauge",
+            ]
+        for ucs_cimc_phase, ucs_cimc_phase_summary in sorted(ucs_cimc_run_summary["phases"].items()):
+            for ucs_cimc_quantile_key, ucs_cimc_quantile in (("p50", "0.5"), ("p95", "0.95"), ("p99", "0.99")):
+                ucs_cimc_prometheus_lines.append(
+                    f'ucs_cimc_csr_tool_phase_duration_seconds{{phase="{ucs_cimc_phase}",'
+                    f'quantile="{ucs_cimc_quantile}"}} {ucs_cimc_phase_summary[ucs_cimc_quantile_key]:.6f}'
+                    )
+        ucs_cimc_prometheus_lines += [
+            "# HELP ucs_cimc_csr_tool_phase_total Number of times each phase ran in the last fleet run.",
+            "# TYPE ucs_cimc_csr_tool_phase_total gauge",
+            ]
+        for ucs_cimc_phase, ucs_cimc_phase_summary in sorted(ucs_cimc_run_summary["phases"].items()):
+            ucs_cimc_prometheus_lines.append(
+                f'ucs_cimc_csr_tool_phase_total{{phase="{ucs_cimc_phase}",outcome="succeeded"}} '
+                f'{ucs_cimc_phase_summary["count"] - ucs_cimc_phase_summary["failures"]}'
+                )
+            ucs_cimc_prometheus_lines.append(
+                f'ucs_cimc_csr_tool_phase_total{{phase="{ucs_cimc_phase}",outcome="failed"}} '
+                f'{ucs_cimc_phase_summary["failures"]}'
+                )
+        ucs_cimc_prometheus_temporary_filepath = f"{prometheus_filepath}.tmp"
+        with open(ucs_cimc_prometheus_temporary_filepath, "w", encoding="utf-8") as ucs_cimc_prometheus_file:
+            ucs_cimc_prometheus_file.write("\n".join(ucs_cimc_prometheus_lines) + "\n")
+        os.replace(ucs_cimc_prometheus_temporary_filepath, prometheus_filepath)
+
+
+_ucs_cimc_run_metrics = None
+
+_UCS_CIMC_XML_API_METHOD_PHASES = {
+    "aaaLogin": "login",
+    "aaaRefresh": "refresh",
+    "aaaLogout": "logout",
+    "configConfMo": "configure",
+    "configResolveDn": "resolve",
+    "configResolveClass": "resolve"
+    }
+
+
+# Establish function to set the metrics collector for UCS CIMC requests
+def set_ucs_cimc_run_metrics(ucs_cimc_run_metrics):
+    """This is a function to set the UcsCimcRunMetrics class instance that
+    records the duration and outcome of every UCS CIMC request made in the
+    process.
+
+    Args:
+        ucs_cimc_run_metrics (UcsCimcRunMetrics):
+            The metrics collector, or None to stop recording metrics.
+    """
+    global _ucs_cimc_run_metrics
+    _ucs_cimc_run_metrics = ucs_cimc_run_metrics
+
+
+# Establish function to record a phase metric for a UCS CIMC
+def _record_ucs_cimc_phase_metric(
+    ucs_cimc_server,
+    phase,
+    duration,
+    succeeded
+    ):
+    """This is a function to record the duration and outcome of a phase for
+    a UCS CIMC in the current metrics collector, if one is set. The
+    arguments are described in UcsCimcRunMetrics.record().
+    """
+    if _ucs_cimc_run_metrics is not None:
+        _ucs_cimc_run_metrics.record(
+            ucs_cimc_server,
+            phase,
+            duration,
+            succeeded
+            )
+
+
+# Establish function to record the metric for a UCS CIMC XML API request
+def _record_ucs_cimc_xml_api_metric(
+    ucs_cimc_server,
+    ucs_cimc_post_body,
+    ucs_cimc_response,
+    ucs_cimc_request_start_time
+    ):
+    """This is a function to record the duration and outcome of a UCS CIMC
+    XML API request, named after the XML API method in the request body.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_post_body (str):
+            The XML API request body.
+        ucs_cimc_response (Response):
+            The response to the request, or None if no response was received.
+        ucs_cimc_request_start_time (float):
+            The time.monotonic() value when the request started.
+    """
+    if _ucs_cimc_run_metrics is None:
+        return
+    ucs_cimc_xml_api_method = re.match(r"\s*<(\w+)", ucs_cimc_post_body)
+    ucs_cimc_xml_api_method = ucs_cimc_xml_api_method.group(1) if ucs_cimc_xml_api_method else "unknown"
+    _record_ucs_cimc_phase_metric(
+        ucs_cimc_server,
+        _UCS_CIMC_XML_API_METHOD_PHASES.get(ucs_cimc_xml_api_method, ucs_cimc_xml_api_method),
+        time.monotonic() - ucs_cimc_request_start_time,
+        _evaluate_ucs_cimc_response(ucs_cimc_response)[0]
+        )
+
+
+# Establish the event log verbosity levels and the logger that UCS CIMC events are written to
+UCS_CIMC_EVENT_LOG_VERBOSITY_LEVELS = {
+    "quiet": logging.WARNING,
+    "normal": logging.INFO,
+    "verbose": logging.DEBUG
+    }
+
+_ucs_cimc_event_logger = logging.getLogger("ucs_cimc")
+_ucs_cimc_event_log = None
+
+_UCS_CIMC_REDACTED_ATTRIBUTE_PATTERN = re.compile(
+    r"""\b(\w*[Cc]ookie|\w*[Pp]ass(?:word)?|pwd)=("[^"]+"|'[^']+')"""
+    )
+
+
+# Establish function to redact the passwords from a UCS CIMC XML API body
+def redact_ucs_cimc_xml_api_body(ucs_cimc_xml_api_body):
+    """This is a function to replace the values of the password attributes,
+    such as inPassword and pwd, and the cookie attributes, such as cookie,
+    inCookie and outCookie, in a UCS CIMC XML API request or response body,
+    so the body can be logged.
+
+    Args:
+        ucs_cimc_xml_api_body (str):
+            The XML API request or response body.
+
+    Returns:
+        The XML API body with the password and cookie values replaced by
+        asterisks.
+
+    Examples:
+        >>> redact_ucs_cimc_xml_api_body('<aaaLogin inName="admin" inPassword="secret"/>')
+        '<aaaLogin inName="admin" inPassword="********"/>'
+        >>> redact_ucs_cimc_xml_api_body('<aaaLogout cookie="abc" inCookie="abc"/>')
+        '<aaaLogout cookie="********" inCookie="********"/>'
+        >>> redact_ucs_cimc_xml_api_body('<aaaRefresh cookie="" inCookie="abc" outCookie="def"/>')
+        '<aaaRefresh cookie="" inCookie="********" outCookie="********"/>'
+    """
+    return _UCS_CIMC_REDACTED_ATTRIBUTE_PATTERN.sub(
+        lambda ucs_cimc_attribute_match: (f"{ucs_cimc_attribute_match.group(1)}="
+                                          f"{ucs_cimc_attribute_match.group(2)[0]}********"
+                                          f"{ucs_cimc_attribute_match.group(2)[0]}"),
+        ucs_cimc_xml_api_body
+        )
+
+
+# Establish function to log an event for a UCS CIMC
+def log_ucs_cimc_event(
+    message,
+    ucs_cimc_server="",
+    phase="",
+    status="",
+    duration=None,
+    error=None,
+    error_class="",
+    level=logging.INFO,
+    exc_info=False,
+    **details
+    ):
+    """This is a function to log a structured event, such as the start or
+    outcome of a phase for a UCS CIMC, to the "ucs_cimc" logger. The event is
+    only built when the logger is enabled for the level, and the password
+    attributes of the message and details are redacted. Events are written
+    by the sinks of the running UcsCimcEventLog, if any.
+
+    Args:
+        message (str):
+            The human-readable message of the event.
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, if the event is for a
+            single UCS CIMC. The default value is "".
+        phase (str):
+            The name of the phase, such as "login". The default value is "".
+        status (str):
+            The status of the phase, such as "started", "succeeded" or
+            "failed". The default value is "".
+        duration (float):
+            The duration of the phase in seconds. The default value is None.
+        error (Exception or str):
+            The exception raised, or a description of the error. The default
+            value is None.
+        error_class (str):
+            The class of the error. The default value is "", which uses the
+            class name of the exception provided as the error.
+        level (int):
+            The logging level of the event. The default value is
+            logging.INFO.
+        exc_info (bool):
+            Whether to attach the traceback of the exception being handled.
+            The default value is False.
+        **details:
+            Additional fields of the event, such as an XML API request body.
+    """
+    if not _ucs_cimc_event_logger.isEnabledFor(level):
+        return
+    if isinstance(error, BaseException):
+        error_class = error_class or type(error).__name__
+    ucs_cimc_event = {
+        "ucs_cimc_server": ucs_cimc_server,
+        "phase": phase,
+        "status": status,
+        "duration": duration,
+        "error_class": error_class,
+        "error": redact_ucs_cimc_xml_api_body(str(error)) if error else ""
+        }
+    ucs_cimc_event_details = {
+        ucs_cimc_detail_name: (redact_ucs_cimc_xml_api_body(ucs_cimc_detail_value)
+                               if isinstance(ucs_cimc_detail_value, str) else ucs_cimc_detail_value)
+        for ucs_cimc_detail_name, ucs_cimc_detail_value in details.items()
+        }
+    _ucs_cimc_event_logger.log(
+        level,
+        redact_ucs_cimc_xml_api_body(message),
+        exc_info=exc_info,
+        extra={"ucs_cimc_event": ucs_cimc_event, "ucs_cimc_event_details": ucs_cimc_event_details}
+        )
+
+
+# Establish class to format UCS CIMC events as human-readable text
+class UcsCimcEventFormatter(logging.Formatter):
+    """This is a class for formatting UCS CIMC events as human-readable
+    text. Events for a single UCS CIMC are prefixed with the UCS CIMC, so
+    the output of concurrent UCS CIMCs stays readable.
+
+    Args:
+        include_tracebacks (bool):
+            Whether to include the traceback of events logged with exc_info.
+            The default value is False.
+    """
+    def __init__(self, include_tracebacks=False):
+        super().__init__()
+        self.include_tracebacks = include_tracebacks
+
+    def format(self, record):
+        ucs_cimc_event = getattr(record, "ucs_cimc_event", {})
+        ucs_cimc_event_text = record.getMessage()
+        if ucs_cimc_event.get("ucs_cimc_server"):
+            ucs_cimc_event_text = f"[{ucs_cimc_event['ucs_cimc_server']}] {ucs_cimc_event_text}"
+        if ucs_cimc_event.get("error"):
+            ucs_cimc_event_text += (f"\n- {ucs_cimc_event['error_class']}: {ucs_cimc_event['error']}"
+                                    if ucs_cimc_event.get("error_class") else f"\n- {ucs_cimc_event['error']}")
+        for ucs_cimc_detail_name, ucs_cimc_detail_value in getattr(record, "ucs_cimc_event_details", {}).items():
+            ucs_cimc_event_text += f"\n- {ucs_cimc_detail_name.replace('_', ' ').capitalize()}: {ucs_cimc_detail_value}"
+        if self.include_tracebacks and record.exc_info:
+            ucs_cimc_event_text += "\n" + self.formatException(record.exc_info)
+        return ucs_cimc_event_text
+
+
+# Establish class to format UCS CIMC events as JSON lines
+class UcsCimcJsonLinesEventFormatter(logging.Formatter):
+    """This is a class for formatting UCS CIMC events as JSON objects, one
+    per line, with the timestamp, level, UCS CIMC, phase, status, duration,
+    error class, error and message of each event.
+    """
+    def format(self, record):
+        ucs_cimc_event_record = {
+            "timestamp": record.created,
+            "level": record.levelname.lower(),
+            **getattr(record, "ucs_cimc_event", {}),
+            "message": record.getMessage().strip(),
+            **getattr(record, "ucs_cimc_event_details", {})
+            }
+        if record.exc_info:
+            ucs_cimc_event_record["traceback"] = self.formatException(record.exc_info)
+        return json.dumps(ucs_cimc_event_record)
+
+
+# Establish class for the background writer of UCS CIMC events
+class UcsCimcEventLog:
+    """This is a class for writing UCS CIMC events from a queue on a
+    background thread, so the threads and coroutines processing UCS CIMCs
+    never wait for the console or a file. Events are written to a
+    human-readable stream and, optionally, to a JSON lines file, each with
+    its own verbosity. Only one event log can run at a time in a process.
+
+    Args:
+        verbosity (str):
+            The verbosity of the human-readable stream. Options: quiet,
+            normal, verbose. The quiet verbosity only writes warnings and
+            errors, and the verbose verbosity adds every XML API request and
+            response, with the passwords redacted, and tracebacks. The
+            default value is "normal".
+        json_lines_filepath (str):
+            The filepath of the JSON lines file to write the events to. The
+            default value is "", which does not write a file.
+        json_lines_verbosity (str):
+            The verbosity of the JSON lines file. The default value is
+            "verbose".
+        stream (file):
+            The stream for the human-readable events. The default value is
+            None, which uses sys.stdout.
+    """
+    def __init__(
+        self,
+        verbosity="normal",
+        json_lines_filepath="",
+        json_lines_verbosity="verbose",
+        stream=None
+        ):
+        for ucs_cimc_verbosity in (verbosity, json_lines_verbosity):
+            if ucs_cimc_verbosity not in UCS_CIMC_EVENT_LOG_VERBOSITY_LEVELS:
+                raise ValueError(f"Unsupported verbosity {ucs_cimc_verbosity!r}. "
+                                 f"Options: {', '.join(UCS_CIMC_EVENT_LOG_VERBOSITY_LEVELS)}")
+        self.verbosity = verbosity
+        self.json_lines_filepath = json_lines_filepath
+        self.json_lines_verbosity = json_lines_verbosity
+        self.stream = stream
+        self._event_queue = None
+        self._queue_handler = None
+        self._queue_listener = None
+        self._event_handlers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def start(self):
+        """This is a method to start the background writer and attach it to
+        the "ucs_cimc" logger.
+
+        Returns:
+            The UcsCimcEventLog class instance.
+        """
+        global _ucs_cimc_event_log
+        import queue
+        import logging.handlers
+
+        ucs_cimc_stream_handler = logging.StreamHandler(self.stream or sys.stdout)
+        ucs_cimc_stream_handler.setLevel(UCS_CIMC_EVENT_LOG_VERBOSITY_LEVELS[self.verbosity])
+        ucs_cimc_stream_handler.setFormatter(UcsCimcEventFormatter(include_tracebacks=self.verbosity == "verbose"))
+        self._event_handlers = [ucs_cimc_stream_handler]
+        if self.json_lines_filepath:
+            ucs_cimc_file_handler = logging.FileHandler(self.json_lines_filepath, mode="a", encoding="utf-8", delay=True)
+            ucs_cimc_file_handler.setLevel(UCS_CIMC_EVENT_LOG_VERBOSITY_LEVELS[self.json_lines_verbosity])
+            ucs_cimc_file_handler.setFormatter(UcsCimcJsonLinesEventFormatter())
+            self._event_handlers.append(ucs_cimc_file_handler)
+
+        # Queue the records as they are, since the traceback and event fields are formatted by the writer thread
+        self._event_queue = queue.Queue()
+        self._queue_handler = logging.handlers.QueueHandler(self._event_queue)
+        self._queue_handler.prepare = lambda record: record
+        self._queue_listener = logging.handlers.QueueListener(
+            self._event_queue,
+            *self._event_handlers,
+            respect_handler_level=True
+            )
+        self._queue_listener.start()
+        _ucs_cimc_event_logger.addHandler(self._queue_handler)
+        _ucs_cimc_event_logger.setLevel(min(ucs_cimc_event_handler.level for ucs_cimc_event_handler in self._event_handlers))
+        _ucs_cimc_event_logger.propagate = False
+        _ucs_cimc_event_log = self
+        return self
+
+    def flush(self):
+        """This is a method to wait until every event logged so far has been
+        written, so output written directly to the stream afterwards appears
+        in order.
+        """
+        if self._event_queue is not None:
+            self._event_queue.join()
+        for ucs_cimc_event_handler in self._event_handlers:
+            ucs_cimc_event_handler.flush()
+
+    def stop(self):
+        """This is a method to write the remaining events, stop the
+        background writer and detach it from the "ucs_cimc" logger.
+        """
+        global _ucs_cimc_event_log
+        if self._queue_listener is None:
+            return
+        _ucs_cimc_event_logger.removeHandler(self._queue_handler)
+        _ucs_cimc_event_logger.setLevel(logging.NOTSET)
+        _ucs_cimc_event_logger.propagate = True
+        self._queue_listener.stop()
+        self._queue_listener = None
+        for ucs_cimc_event_handler in self._event_handlers:
+            ucs_cimc_event_handler.flush()
+            if isinstance(ucs_cimc_event_handler, logging.FileHandler):
+                ucs_cimc_event_handler.close()
+        if _ucs_cimc_event_log is self:
+            _ucs_cimc_event_log = None
+
+
+# Establish function to wait for the running event log to write every event logged so far
+def flush_ucs_cimc_event_log():
+    """This is a function to wait until the running UcsCimcEventLog, if any,
+    has written every event logged so far, before printing output that must
+    follow the events.
+    """
+    if _ucs_cimc_event_log is not None:
+        _ucs_cimc_event_log.flush()
+
+
+# Establish function to log the outcome of a UCS CIMC XML API request
+def _log_ucs_cimc_xml_api_request(
+    ucs_cimc_server,
+    ucs_cimc_post_body,
+    ucs_cimc_response,
+    ucs_cimc_request_start_time,
+    ucs_cimc_request_error=None
+    ):
+    """This is a function to log the outcome of a UCS CIMC XML API request,
+    with the redacted request and response bodies, as a verbose event.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_post_body (str):
+            The XML API request body.
+        ucs_cimc_response (Response):
+            The response to the request, or None if no response was received.
+        ucs_cimc_request_start_time (float):
+            The time.monotonic() value when the request started.
+        ucs_cimc_request_error (Exception):
+            The exception raised by the request, if any. The default value is
+            None.
+    """
+    if not _ucs_cimc_event_logger.isEnabledFor(logging.DEBUG):
+        return
+    ucs_cimc_xml_api_method = re.match(r"\s*<(\w+)", ucs_cimc_post_body)
+    ucs_cimc_xml_api_method = ucs_cimc_xml_api_method.group(1) if ucs_cimc_xml_api_method else "unknown"
+    ucs_cimc_request_succeeded, ucs_cimc_response_error = _evaluate_ucs_cimc_response(ucs_cimc_response)
+    log_ucs_cimc_event(
+        f"{ucs_cimc_xml_api_method} request "
+        f"{'succeeded' if ucs_cimc_request_succeeded else 'failed'}"
+        f"{f' with status code {ucs_cimc_response.status_code}' if ucs_cimc_response is not None else ''}.",
+        ucs_cimc_server=ucs_cimc_server,
+        phase=_UCS_CIMC_XML_API_METHOD_PHASES.get(ucs_cimc_xml_api_method, ucs_cimc_xml_api_method),
+        status="succeeded" if ucs_cimc_request_succeeded else "failed",
+        duration=time.monotonic() - ucs_cimc_request_start_time,
+        error=ucs_cimc_request_error or ucs_cimc_response_error or None,
+        error_class="" if ucs_cimc_request_error or ucs_cimc_request_succeeded else "InvalidResponse",
+        level=logging.DEBUG,
+        request_body=ucs_cimc_post_body,
+        response_body=ucs_cimc_response.text if ucs_cimc_response is not None else ""
+        )
+
+
+# Establish the SHA-256 fingerprints of the certificates first served by each UCS CIMC in the process
+_ucs_cimc_initial_certificate_fingerprints = {}
+
+
+# Establish function to record the certificate first served by a UCS CIMC
+def _record_ucs_cimc_initial_certificate(
+    ucs_cimc_server,
+    ucs_cimc_der_certificate
+    ):
+    """This is a function to record the fingerprint of the certificate a UCS
+    CIMC served on the first connection to it, so the certificate served
+    after a renewal can be told apart from the one it replaced.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_der_certificate (bytes):
+            The DER encoded certificate served by the UCS CIMC.
+    """
+    if ucs_cimc_der_certificate:
+        _ucs_cimc_initial_certificate_fingerprints.setdefault(
+            ucs_cimc_server,
+            hashlib.sha256(ucs_cimc_der_certificate).hexdigest()
+            )
+
+
+# Establish function to obtain the fingerprint of the certificate first served by a UCS CIMC
+def get_ucs_cimc_initial_certificate_fingerprint(ucs_cimc_server):
+    """This is a function to obtain the SHA-256 fingerprint of the
+    certificate a UCS CIMC served on the first connection to it in the
+    process.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Returns:
+        A string of the SHA-256 fingerprint, or None if no connection has
+        been made to the UCS CIMC.
+    """
+    return _ucs_cimc_initial_certificate_fingerprints.get(ucs_cimc_server)
+
+
+# Establish function to forget the certificates first served by the UCS CIMCs
+def clear_ucs_cimc_initial_certificate_fingerprints():
+    """This is a function to forget the certificates recorded on the first
+    connection to each UCS CIMC, so the next connections record them again.
+    """
+    _ucs_cimc_initial_certificate_fingerprints.clear()
+
+
+# Establish class for a cache of the resolved addresses of UCS CIMC hostnames
+class UcsCimcResolverCache:
+    """This is a class for a cache of the IP addresses resolved for UCS CIMC
+    hostnames. Resolving every hostname once, before the UCS CIMCs are
+    contacted, avoids a separate lookup for each connection and keeps a
+    slow resolver from stalling the UCS CIMC sessions. Addresses that have
+    expired keep being used for connections while they are resolved again
+    in the background.
+
+    Args:
+        ttl (float):
+            The number of seconds a resolved address is used before the
+            hostname is resolved again. The default value is 300.
+    """
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._resolved_addresses = {}
+        self._refreshing_hostnames = set()
+        self._resolver_lock = threading.Lock()
+
+    @staticmethod
+    def _lookup_address(hostname):
+        """This is a method to resolve a hostname to an IP address with the
+        system resolver.
+
+        Args:
+            hostname (str):
+                The hostname to resolve.
+
+        Returns:
+            A string of the first IP address returned by the resolver.
+
+        Raises:
+            OSError:
+                The hostname could not be resolved.
+        """
+        import socket
+        return socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)[0][4][0]
+
+    def get_address(self, hostname):
+        """This is a method to obtain the cached IP address of a hostname,
+        without resolving it.
+
+        Args:
+            hostname (str):
+                The hostname of the UCS CIMC.
+
+        Returns:
+            A string of the IP address, or None if the hostname has not been
+            resolved or its address has expired.
+        """
+        with self._resolver_lock:
+            ucs_cimc_resolved_address = self._resolved_addresses.get(hostname)
+        if ucs_cimc_resolved_address is None or ucs_cimc_resolved_address[1] < time.monotonic():
+            return None
+        return ucs_cimc_resolved_address[0]
+
+    def get_connect_address(self, hostname):
+        """This is a method to obtain the cached IP address of a hostname to
+        open a connection to, without waiting for the resolver. An expired
+        address is still returned, and the hostname is resolved again in a
+        background thread, so a stalled lookup never holds up a connection.
+
+        Args:
+            hostname (str):
+                The hostname of the UCS CIMC.
+
+        Returns:
+            A string of the IP address, or None if the hostname has not been
+            resolved.
+        """
+        with self._resolver_lock:
+            ucs_cimc_resolved_address = self._resolved_addresses.get(hostname)
+            if ucs_cimc_resolved_address is None:
+                return None
+            if ucs_cimc_resolved_address[1] < time.monotonic() and hostname not in self._refreshing_hostnames:
+                self._refreshing_hostnames.add(hostname)
+                threading.Thread(target=self._refresh_address, args=(hostname,), daemon=True).start()
+        return ucs_cimc_resolved_address[0]
+
+    def _refresh_address(self, hostname):
+        """This is a method to resolve an expired hostname again in the
+        background. If the lookup fails, the expired address is kept for
+        another TTL before the next attempt.
+
+        Args:
+            hostname (str):
+                The hostname of the UCS CIMC.
+        """
+        try:
+            ucs_cimc_address = self._lookup_address(hostname)
+        except OSError:
+            ucs_cimc_address = None
+        with self._resolver_lock:
+            if ucs_cimc_address is None:
+                ucs_cimc_address = self._resolved_addresses[hostname][0]
+            self._resolved_addresses[hostname] = (ucs_cimc_address, time.monotonic() + self.ttl)
+            self._refreshing_hostnames.discard(hostname)
+
+    def resolve(self, hostname):
+        """This is a method to obtain the IP address of a hostname, resolving
+        it if it is not cached or its address has expired.
+
+        Args:
+            hostname (str):
+                The hostname of the UCS CIMC.
+
+        Returns:
+            A string of the IP address.
+
+        Raises:
+            OSError:
+                The hostname could not be resolved.
+        """
+        ucs_cimc_address = self.get_address(hostname)
+        if ucs_cimc_address is None:
+            ucs_cimc_address = self._lookup_address(hostname)
+            with self._resolver_lock:
+                self._resolved_addresses[hostname] = (ucs_cimc_address, time.monotonic() + self.ttl)
+        return ucs_cimc_address
+
+    def resolve_all(
+        self,
+        hostnames,
+        max_concurrent_lookups=32,
+        timeout=10
+        ):
+        """This is a method to resolve many hostnames concurrently and cache
+        their addresses. IP addresses are not looked up. Each lookup is given
+        its own timeout. A lookup still running after it is reported as
+        failed and left to finish in the background, and the next lookup is
+        started in its place. If as many lookups in a row as can run at once
+        time out, the resolver is considered unresponsive, and the hostnames
+        not looked up yet are returned as not attempted instead of failed.
+
+        Args:
+            hostnames (iterable):
+                The hostnames of the UCS CIMCs.
+            max_concurrent_lookups (int):
+                The maximum number of lookups in progress at once. The default
+                value is 32.
+            timeout (float):
+                The number of seconds to wait for each lookup to complete. The
+                default value is 10.
+
+        Returns:
+            A tuple of a dictionary of the hostnames that could not be
+            resolved and a description of the error for each, and a list of
+            the hostnames that were not looked up.
+        """
+        import ipaddress
+
+        ucs_cimc_pending_hostnames = collections.deque()
+        for hostname in dict.fromkeys(hostnames):
+            try:
+                ipaddress.ip_address(hostname)
+            except ValueError:
+                ucs_cimc_pending_hostnames.append(hostname)
+        ucs_cimc_running_lookups = {}
+        ucs_cimc_unresolved_hostnames = {}
+        ucs_cimc_consecutive_timeouts = 0
+        ucs_cimc_lookups_finished = False
+        ucs_cimc_lookup_condition = threading.Condition()
+
+        def resolve_ucs_cimc_hostname(hostname):
+            nonlocal ucs_cimc_consecutive_timeouts
+            try:
+                self.resolve(hostname)
+                ucs_cimc_lookup_error = None
+            except OSError as exception_message:
+                ucs_cimc_lookup_error = f"The hostname could not be resolved: {exception_message}"
+            with ucs_cimc_lookup_condition:
+                if ucs_cimc_lookups_finished:
+                    return
+                if hostname not in ucs_cimc_running_lookups:
+                    # The lookup completed after its timeout
+                    if ucs_cimc_lookup_error is None:
+                        ucs_cimc_unresolved_hostnames.pop(hostname, None)
+                    return
+                del ucs_cimc_running_lookups[hostname]
+                ucs_cimc_consecutive_timeouts = 0
+                if ucs_cimc_lookup_error is not None:
+                    ucs_cimc_unresolved_hostnames[hostname] = ucs_cimc_lookup_error
+                ucs_cimc_lookup_condition.notify_all()
+
+        # The lookup threads are daemon threads, so a lookup that never returns does not block the exit
+        with ucs_cimc_lookup_condition:
+            while True:
+                ucs_cimc_current_time = time.monotonic()
+                for hostname, ucs_cimc_lookup_deadline in list(ucs_cimc_running_lookups.items()):
+                    if ucs_cimc_lookup_deadline <= ucs_cimc_current_time:
+                        del ucs_cimc_running_lookups[hostname]
+                        ucs_cimc_unresolved_hostnames[hostname] = f"The lookup did not complete within {timeout} seconds."
+                        ucs_cimc_consecutive_timeouts += 1
+                if ucs_cimc_consecutive_timeouts >= max_concurrent_lookups:
+                    break
+                while ucs_cimc_pending_hostnames and len(ucs_cimc_running_lookups) < max_concurrent_lookups:
+                    hostname = ucs_cimc_pending_hostnames.popleft()
+                    ucs_cimc_running_lookups[hostname] = ucs_cimc_current_time + timeout
+                    threading.Thread(target=resolve_ucs_cimc_hostname, args=(hostname,), daemon=True).start()
+                if not ucs_cimc_running_lookups:
+                    break
+                ucs_cimc_lookup_condition.wait(min(ucs_cimc_running_lookups.values()) - ucs_cimc_current_time)
+            ucs_cimc_lookups_finished = True
+            return (
+                dict(ucs_cimc_unresolved_hostnames),
+                list(ucs_cimc_running_lookups) + list(ucs_cimc_pending_hostnames)
+                )
+
+
+_ucs_cimc_resolver_cache = None
+
+
+# Establish function to set the resolver cache for UCS CIMC connections
+def set_ucs_cimc_resolver_cache(ucs_cimc_resolver_cache):
+    """This is a function to set the UcsCimcResolverCache class instance
+    used for every UCS CIMC connection made in the process. Connections to
+    a hostname in the cache are opened to its cached IP address, while the
+    TLS server name (SNI) and the HTTP Host header keep the hostname.
+
+    Args:
+        ucs_cimc_resolver_cache (UcsCimcResolverCache):
+            The resolver cache, or None to let each connection resolve the
+            hostname itself.
+    """
+    global _ucs_cimc_resolver_cache
+    _ucs_cimc_resolver_cache = ucs_cimc_resolver_cache
+
+
+# Establish function to obtain the address to connect to for a UCS CIMC host
+def _get_ucs_cimc_connect_address(ucs_cimc_host):
+    """This is a function to obtain the address to open a connection to for
+    a UCS CIMC host, from the current resolver cache if one is set.
+    Addresses that have expired are used while they are resolved again in
+    the background.
+
+    Args:
+        ucs_cimc_host (str):
+            The hostname or IP address of the UCS CIMC, without a port.
+
+    Returns:
+        A string of the cached IP address of the host, or the host itself if
+        no resolver cache is set or the host has not been resolved.
+    """
+    if _ucs_cimc_resolver_cache is None:
+        return ucs_cimc_host
+    return _ucs_cimc_resolver_cache.get_connect_address(ucs_cimc_host) or ucs_cimc_host
+
+
+# Establish function to create a connection pool class that records connection metrics for a UCS CIMC
+def _create_ucs_cimc_timed_connection_pool_class(ucs_cimc_server):
+    """This is a function to create an HTTPS connection pool class that
+    records the duration of each TCP connection and TLS handshake to a UCS
+    CIMC as the "connect" phase.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Returns:
+        A subclass of urllib3 HTTPSConnectionPool.
+    """
+    import urllib3.connectionpool
+
+    class UcsCimcTimedHTTPSConnection(urllib3.connectionpool.HTTPSConnectionPool.ConnectionCls):
+        def _new_conn(self):
+            # Connect to the cached address of the UCS CIMC, while SNI and the Host header keep the hostname
+            ucs_cimc_connect_address = _get_ucs_cimc_connect_address(self.host)
+            if ucs_cimc_connect_address == self.host:
+                return super()._new_conn()
+            import socket
+            import urllib3.exceptions
+            import urllib3.util.connection
+            try:
+                return urllib3.util.connection.create_connection(
+                    (ucs_cimc_connect_address, self.port),
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options
+                    )
+            except socket.timeout as exception_message:
+                raise urllib3.exceptions.ConnectTimeoutError(
+                    self,
+                    f"Connection to {self.host} ({ucs_cimc_connect_address}) timed out. "
+                    f"(connect timeout={self.timeout})"
+                    ) from exception_message
+            except OSError as exception_message:
+                raise urllib3.exceptions.NewConnectionError(
+                    self,
+                    f"Failed to establish a new connection to {ucs_cimc_connect_address}: {exception_message}"
+                    ) from exception_message
+
+        def connect(self):
+            ucs_cimc_connect_start_time = time.monotonic()
+            ucs_cimc_connect_succeeded = False
+            try:
+                super().connect()
+                ucs_cimc_connect_succeeded = True
+                _record_ucs_cimc_initial_certificate(ucs_cimc_server, self.sock.getpeercert(binary_form=True))
+            finally:
+                _record_ucs_cimc_phase_metric(
+                    ucs_cimc_server,
+                    "connect",
+                    time.monotonic() - ucs_cimc_connect_start_time,
+                    ucs_cimc_connect_succeeded
+                    )
+
+    class UcsCimcTimedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+        ConnectionCls = UcsCimcTimedHTTPSConnection
+
+    return UcsCimcTimedHTTPSConnectionPool
+
+
+# Establish function to post an XML API request body to a UCS CIMC
+def _post_ucs_cimc_xml_api(
+    ucs_cimc_server,
+    ucs_cimc_post_body,
+    http_session=None,
+    idempotent=False,
+    timeout=None,
+    retry_policy=None
+    ):
+    """This is a function to post an XML API request body to the /nuova
+    endpoint of a UCS CIMC with a timeout, retries for idempotent requests
+    and the circuit breaker for the UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_post_body (str):
+            The XML API request body.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+        idempotent (bool):
+            Whether the request can safely be retried. Only idempotent
+            requests are retried. The default value is False.
+        timeout (tuple):
+            A tuple of the connect and read timeouts in seconds. The default
+            value is None, which uses the timeout client settings.
+        retry_policy (UcsCimcRetryPolicy):
+            The retry policy for idempotent requests. The default value is
+            None, which uses the retry client settings.
+
+    Returns:
+        A Response class instance for the UCS CIMC XML API HTTP request.
+
+    Raises:
+        UcsCimcCircuitOpenError:
+            The circuit breaker for the UCS CIMC is open.
+        requests.RequestException:
+            The request failed after all permitted attempts.
+    """
+    requests = _import_requests()
+    if timeout is None:
+        timeout = (ucs_cimc_connect_timeout, ucs_cimc_read_timeout)
+    if retry_policy is None:
+        retry_policy = _get_default_ucs_cimc_retry_policy()
+    ucs_cimc_circuit_breaker = get_ucs_cimc_circuit_breaker(ucs_cimc_server)
+    ucs_cimc_max_attempts = retry_policy.max_retries + 1 if idempotent else 1
+    ucs_cimc_request_start_time = time.monotonic()
+    ucs_cimc_response = None
+    try:
+        for ucs_cimc_attempt in range(1, ucs_cimc_max_attempts + 1):
+            ucs_cimc_circuit_breaker.before_request()
+            try:
+                ucs_cimc_response = (http_session or requests).post(
+                    f"https://{ucs_cimc_server}/nuova",
+                    headers={"Content-Type": "application/xml"},
+                    data=ucs_cimc_post_body,
+                    verify=False,
+                    timeout=timeout
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                ucs_cimc_circuit_breaker.record_failure()
+                if ucs_cimc_attempt == ucs_cimc_max_attempts or ucs_cimc_circuit_breaker.is_open:
+                    raise
+            else:
+                if ucs_cimc_response.status_code < 500:
+                    ucs_cimc_circuit_breaker.record_success()
+                    return ucs_cimc_response
+                ucs_cimc_circuit_breaker.record_failure()
+                if ucs_cimc_attempt == ucs_cimc_max_attempts or ucs_cimc_circuit_breaker.is_open:
+                    return ucs_cimc_response
+            time.sleep(retry_policy.get_backoff(ucs_cimc_attempt))
+    finally:
+        _record_ucs_cimc_xml_api_metric(
+            ucs_cimc_server,
+            ucs_cimc_post_body,
+            ucs_cimc_response,
+            ucs_cimc_request_start_time
+            )
+        _log_ucs_cimc_xml_api_request(
+            ucs_cimc_server,
+            ucs_cimc_post_body,
+            ucs_cimc_response,
+            ucs_cimc_request_start_time,
+            ucs_cimc_request_error=sys.exc_info()[1]
+            )
+
+
+# Establish function to login to UCS CIMC
+def _request_ucs_cimc_login(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    http_session=None
+    ):
+    """This is a function to request an HTTP response for a login to a UCS
+    CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+
+    Returns:
+        A Response class instance for the UCS CIMC Device
+        Console login HTTP request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the UCS CIMC
+            login HTTP request.
+    """
+    # Login to UCS CIMC
+    ucs_cimc_post_body = _build_ucs_cimc_login_post_body(
+        ucs_cimc_username,
+        ucs_cimc_password
+        )
+    ucs_cimc_login_request = _post_ucs_cimc_xml_api(
+        ucs_cimc_server,
+        ucs_cimc_post_body,
+        http_session=http_session,
+        idempotent=True
+        )
+    return ucs_cimc_login_request
+
+
+# Establish function to obtain UCS CIMC login session details
+def _obtain_ucs_cimc_login_session(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    http_session=None,
+    raise_on_failure=False
+    ):
+    """This is a function to login to a UCS CIMC and obtain the cookie and
+    refresh period for the login session.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+        raise_on_failure (bool):
+            Whether an unsuccessful login raises an exception instead of
+            returning (None, 0). The default value is False.
+
+    Returns:
+        A tuple of the string of the cookie from a Response class instance of
+        a UCS CIMC login HTTP request and the refresh period of the cookie in
+        seconds. If the login was unsuccessful, the tuple is (None, 0).
+
+    Raises:
+        UcsCimcLoginError:
+            The UCS CIMC did not return a login cookie, if raise_on_failure is
+            True.
+        Exception:
+            An exception occurred due to an issue with accessing the provided
+            UCS CIMC, if raise_on_failure is True.
+    """
+    try:
+        # Login to UCS CIMC
+        log_ucs_cimc_event(
+            "Logging in...",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="login",
+            status="started"
+            )
+        ucs_cimc_login = _request_ucs_cimc_login(
+            ucs_cimc_server,
+            ucs_cimc_username,
+            ucs_cimc_password,
+            http_session=http_session
+            )
+        ucs_cimc_login_text = ucs_cimc_login.text
+        ucs_cimc_login_xml_string_response = et.fromstring(ucs_cimc_login_text)
+        ucs_cimc_login_cookie = ucs_cimc_login_xml_string_response.attrib.get("outCookie")
+        if ucs_cimc_login_cookie:
+            ucs_cimc_login_refresh_period = int(
+                ucs_cimc_login_xml_string_response.attrib.get("outRefreshPeriod") or 600
+                )
+            return ucs_cimc_login_cookie, ucs_cimc_login_refresh_period
+        else:
+            log_ucs_cimc_event(
+                "Unable to retrieve the login cookie.",
+                ucs_cimc_server=ucs_cimc_server,
+                phase="login",
+                status="failed",
+                error=str(ucs_cimc_login_xml_string_response.attrib),
+                error_class="InvalidResponse",
+                level=logging.ERROR
+                )
+            ucs_cimc_login_error = UcsCimcLoginError(
+                ucs_cimc_login_xml_string_response.attrib.get("errorDescr")
+                or "Unable to retrieve the login cookie."
+                )
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to login to the UCS CIMC.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="login",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR,
+            exc_info=True
+            )
+        if raise_on_failure:
+            raise
+        return None, 0
+    if raise_on_failure:
+        raise ucs_cimc_login_error
+    return None, 0
+
+
+# Establish function to obtain UCS CIMC login cookie
+def _obtain_ucs_cimc_login_cookie(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    http_session=None
+    ):
+    """This is a function to login to a UCS CIMC and obtain the cookies for
+    the login session.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+
+    Returns:
+        A string of the cookie from a Response class instance of a UCS CIMC 
+        login HTTP request.
+    """
+    return _obtain_ucs_cimc_login_session(
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password,
+        http_session=http_session
+        )[0]
+
+
+# Establish function to refresh UCS CIMC login session
+def _request_ucs_cimc_refresh(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    ucs_cimc_login_cookie,
+    http_session=None
+    ):
+    """This is a function to request an HTTP response for a refresh of the
+    login session of a UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC 
+            login HTTP request.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+
+    Returns:
+        A Response class instance for the UCS CIMC refresh HTTP request.
+    """
+    return _post_ucs_cimc_xml_api(
+        ucs_cimc_server,
+        _build_ucs_cimc_refresh_post_body(
+            ucs_cimc_username,
+            ucs_cimc_password,
+            ucs_cimc_login_cookie
+            ),
+        http_session=http_session
+        )
+
+
+# Establish function to logout of UCS CIMC
+def _request_ucs_cimc_logout(
+    ucs_cimc_server,
+    ucs_cimc_login_cookie,
+    http_session=None
+    ):
+    """This is a function to logout of a UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC 
+            login HTTP request.
+        http_session (Session):
+            An optional requests Session class instance to send the HTTP
+            request through. The default value is None, which sends the HTTP
+            request on a new connection.
+
+    Returns:
+        A Response class instance for the UCS CIMC logout HTTP request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the UCS CIMC
+            logout HTTP request.
+    """
+    # Logout of UCS CIMC
+    ucs_cimc_post_body = _build_ucs_cimc_logout_post_body(ucs_cimc_login_cookie)
+    try:
+        ucs_cimc_logout_request = _post_ucs_cimc_xml_api(
+            ucs_cimc_server,
+            ucs_cimc_post_body,
+            http_session=http_session,
+            idempotent=True
+            )
+        return ucs_cimc_logout_request
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to logout of the UCS CIMC.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="logout",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR
+            )
+
+
+# Establish class for a persistent HTTPS session to a UCS CIMC
+class UcsCimcSession:
+    """This is a class for a persistent HTTPS session to a UCS CIMC. The
+    login, configuration and logout requests made through a session share
+    a pooled keep-alive connection, so the TCP and TLS handshakes are only
+    performed once per UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        pool_maxsize (int):
+            The maximum number of keep-alive connections kept open to the UCS
+            CIMC. The default value is 2.
+        refresh_margin (int):
+            The number of seconds before the login cookie expires at which the
+            login session is refreshed with aaaRefresh. The default value is
+            60.
+
+    Attributes:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_login_cookie (str):
+            The cookie for the current login session, or None if the session
+            is not logged in.
+        ucs_cimc_login_cookie_expiry (float):
+            The time.monotonic() value at which the login cookie expires.
+        http_session (Session):
+            The requests Session class instance holding the connection pool.
+    """
+    def __init__(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password,
+        pool_maxsize=2,
+        refresh_margin=60
+        ):
+        self.ucs_cimc_server = ucs_cimc_server
+        self.ucs_cimc_username = ucs_cimc_username
+        self.ucs_cimc_password = ucs_cimc_password
+        self.ucs_cimc_url = f"https://{ucs_cimc_server}/nuova"
+        self.ucs_cimc_login_cookie = None
+        self.ucs_cimc_login_cookie_expiry = 0.0
+        self.refresh_margin = refresh_margin
+        self._login_lock = threading.RLock()
+        requests = _import_requests()
+        self.http_session = requests.Session()
+        ucs_cimc_http_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize
+            )
+        ucs_cimc_http_adapter.poolmanager.pool_classes_by_scheme = dict(
+            ucs_cimc_http_adapter.poolmanager.pool_classes_by_scheme,
+            https=_create_ucs_cimc_timed_connection_pool_class(ucs_cimc_server)
+            )
+        self.http_session.mount("https://", ucs_cimc_http_adapter)
+
+    def __enter__(self):
+        self.login()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def post(
+        self,
+        ucs_cimc_post_body,
+        idempotent=False
+        ):
+        """This is a method to post an XML API request body to the UCS CIMC.
+
+        Args:
+            ucs_cimc_post_body (str):
+                The XML API request body.
+            idempotent (bool):
+                Whether the request can safely be retried. The default value
+                is False.
+
+        Returns:
+            A Response class instance for the UCS CIMC XML API HTTP request.
+        """
+        return _post_ucs_cimc_xml_api(
+            self.ucs_cimc_server,
+            ucs_cimc_post_body,
+            http_session=self.http_session,
+            idempotent=idempotent
+            )
+
+    def login(self, raise_on_failure=False):
+        """This is a method to login to the UCS CIMC, if the session is not
+        already logged in. A login cookie that is close to expiring is
+        refreshed with aaaRefresh instead of performing a new login.
+
+        Args:
+            raise_on_failure (bool):
+                Whether an unsuccessful login raises an exception instead of
+                returning None. The default value is False.
+
+        Returns:
+            A string of the cookie for the login session, or None if the
+            login was unsuccessful.
+
+        Raises:
+            UcsCimcLoginError:
+                The UCS CIMC did not return a login cookie, if
+                raise_on_failure is True.
+            Exception:
+                An exception occurred due to an issue with accessing the
+                UCS CIMC, if raise_on_failure is True.
+        """
+        with self._login_lock:
+            if self.ucs_cimc_login_cookie:
+                if time.monotonic() < self.ucs_cimc_login_cookie_expiry - self.refresh_margin:
+                    return self.ucs_cimc_login_cookie
+                if self.refresh():
+                    return self.ucs_cimc_login_cookie
+            ucs_cimc_login_cookie, ucs_cimc_login_refresh_period = _obtain_ucs_cimc_login_session(
+                self.ucs_cimc_server,
+                self.ucs_cimc_username,
+                self.ucs_cimc_password,
+                http_session=self.http_session,
+                raise_on_failure=raise_on_failure
+                )
+            self.ucs_cimc_login_cookie = ucs_cimc_login_cookie
+            self.ucs_cimc_login_cookie_expiry = time.monotonic() + ucs_cimc_login_refresh_period
+            return self.ucs_cimc_login_cookie
+
+    def refresh(self):
+        """This is a method to refresh the login session of the UCS CIMC with
+        aaaRefresh, extending the lifetime of the login cookie.
+
+        Returns:
+            A string of the refreshed cookie for the login session, or None if
+            the session was not logged in or the refresh was unsuccessful.
+        """
+        with self._login_lock:
+            if not self.ucs_cimc_login_cookie:
+                return None
+            try:
+                ucs_cimc_refresh = _request_ucs_cimc_refresh(
+                    self.ucs_cimc_server,
+                    self.ucs_cimc_username,
+                    self.ucs_cimc_password,
+                    self.ucs_cimc_login_cookie,
+                    http_session=self.http_session
+                    )
+                ucs_cimc_refresh_xml_string_response = et.fromstring(ucs_cimc_refresh.text)
+            except Exception:
+                ucs_cimc_refresh_xml_string_response = None
+            ucs_cimc_refresh_cookie = None
+            if ucs_cimc_refresh_xml_string_response is not None:
+                ucs_cimc_refresh_cookie = ucs_cimc_refresh_xml_string_response.attrib.get("outCookie")
+            if not ucs_cimc_refresh_cookie:
+                # The expired or rejected cookie can no longer be used
+                self.ucs_cimc_login_cookie = None
+                return None
+            self.ucs_cimc_login_cookie = ucs_cimc_refresh_cookie
+            self.ucs_cimc_login_cookie_expiry = time.monotonic() + int(
+                ucs_cimc_refresh_xml_string_response.attrib.get("outRefreshPeriod") or 600
+                )
+            return self.ucs_cimc_login_cookie
+
+    def logout(self):
+        """This is a method to logout of the UCS CIMC, if the session is
+        logged in.
+
+        Returns:
+            A Response class instance for the UCS CIMC logout HTTP request, or
+            None if the session was not logged in.
+        """
+        with self._login_lock:
+            if not self.ucs_cimc_login_cookie:
+                return None
+            ucs_cimc_logout_request = _request_ucs_cimc_logout(
+                self.ucs_cimc_server,
+                self.ucs_cimc_login_cookie,
+                http_session=self.http_session
+                )
+            self.ucs_cimc_login_cookie = None
+            return ucs_cimc_logout_request
+
+    def close(self):
+        """This is a method to logout of the UCS CIMC and close the pooled
+        connections.
+        """
+        try:
+            self.logout()
+        finally:
+            self.http_session.close()
+
+    def config_conf_mo(
+        self,
+        dn,
+        in_config,
+        in_hierarchical="false"
+        ):
+        """This is a method to configure a managed object (MO) on the UCS
+        CIMC using the configConfMo XML API method.
+
+        Args:
+            dn (str):
+                The distinguished name (DN) of the managed object.
+            in_config (str):
+                The XML of the managed object configuration placed within the
+                inConfig element.
+            in_hierarchical (str):
+                Whether the response includes the child managed objects. The
+                default value is "false".
+
+        Returns:
+            A Response class instance for the configConfMo HTTP request.
+        """
+        return self.post(
+            _build_ucs_cimc_config_conf_mo_post_body(
+                self.login(),
+                dn,
+                in_config,
+                in_hierarchical=in_hierarchical
+                )
+            )
+
+    def config_resolve_dn(
+        self,
+        dn,
+        in_hierarchical="false"
+        ):
+        """This is a method to retrieve a managed object (MO) from the UCS
+        CIMC using the configResolveDn XML API method.
+
+        Args:
+            dn (str):
+                The distinguished name (DN) of the managed object.
+            in_hierarchical (str):
+                Whether the response includes the child managed objects. The
+                default value is "false".
+
+        Returns:
+            A Response class instance for the configResolveDn HTTP request.
+        """
+        return self.post(
+            f"""<configResolveDn cookie='{_escape_ucs_cimc_xml_attribute(self.login())}' """
+            f"""dn='{_escape_ucs_cimc_xml_attribute(dn)}' """
+            f"""inHierarchical='{_escape_ucs_cimc_xml_attribute(in_hierarchical)}'></configResolveDn>""",
+            idempotent=True
+            )
+
+    def config_resolve_class(
+        self,
+        class_id,
+        in_hierarchical="false"
+        ):
+        """This is a method to retrieve all managed objects (MOs) of a class
+        from the UCS CIMC using the configResolveClass XML API method.
+
+        Args:
+            class_id (str):
+                The class ID of the managed objects.
+            in_hierarchical (str):
+                Whether the response includes the child managed objects. The
+                default value is "false".
+
+        Returns:
+            A Response class instance for the configResolveClass HTTP request.
+        """
+        return self.post(
+            f"""<configResolveClass cookie='{_escape_ucs_cimc_xml_attribute(self.login())}' """
+            f"""classId='{_escape_ucs_cimc_xml_attribute(class_id)}' """
+            f"""inHierarchical='{_escape_ucs_cimc_xml_attribute(in_hierarchical)}'></configResolveClass>""",
+            idempotent=True
+            )
+
+
+# Establish class for a cache of logged in UCS CIMC sessions
+class UcsCimcSessionCache:
+    """This is a class for a cache of logged in UCS CIMC sessions, keyed by
+    the UCS CIMC server and username. Operations on the same UCS CIMC share
+    one login cookie, which is refreshed with aaaRefresh before it expires.
+    A session is only logged out when it is evicted from the cache or the
+    cache is closed.
+
+    Args:
+        max_sessions (int):
+            The maximum number of sessions kept in the cache. When the limit
+            is reached, the least recently used session that is not in use is
+            logged out and evicted. The default value is 100.
+        pool_maxsize (int):
+            The maximum number of keep-alive connections kept open to each UCS
+            CIMC. The default value is 2.
+    """
+    def __init__(
+        self,
+        max_sessions=100,
+        pool_maxsize=2
+        ):
+        self.max_sessions = max_sessions
+        self.pool_maxsize = pool_maxsize
+        self._sessions = collections.OrderedDict()
+        self._session_lease_counts = collections.Counter()
+        self._cache_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close_all()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get_session(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password
+        ):
+        """This is a method to obtain the cached session for a UCS CIMC,
+        creating the session if it is not already cached.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            ucs_cimc_username (str):
+                The admin username of the UCS CIMC.
+            ucs_cimc_password (str):
+                The admin password of the UCS CIMC.
+
+        Returns:
+            A UcsCimcSession class instance for the UCS CIMC.
+        """
+        ucs_cimc_session_key = (ucs_cimc_server, ucs_cimc_username)
+        ucs_cimc_evicted_sessions = []
+        with self._cache_lock:
+            ucs_cimc_session = self._sessions.get(ucs_cimc_session_key)
+            if ucs_cimc_session is None:
+                ucs_cimc_session = UcsCimcSession(
+                    ucs_cimc_server,
+                    ucs_cimc_username,
+                    ucs_cimc_password,
+                    pool_maxsize=self.pool_maxsize
+                    )
+                self._sessions[ucs_cimc_session_key] = ucs_cimc_session
+            self._sessions.move_to_end(ucs_cimc_session_key)
+            for ucs_cimc_cached_session_key in list(self._sessions):
+                if len(self._sessions) - len(ucs_cimc_evicted_sessions) <= self.max_sessions:
+                    break
+                if (ucs_cimc_cached_session_key != ucs_cimc_session_key
+                        and not self._session_lease_counts[ucs_cimc_cached_session_key]):
+                    ucs_cimc_evicted_sessions.append(self._sessions[ucs_cimc_cached_session_key])
+            for ucs_cimc_evicted_session in ucs_cimc_evicted_sessions:
+                del self._sessions[(ucs_cimc_evicted_session.ucs_cimc_server, ucs_cimc_evicted_session.ucs_cimc_username)]
+        for ucs_cimc_evicted_session in ucs_cimc_evicted_sessions:
+            self._close_session(ucs_cimc_evicted_session)
+        return ucs_cimc_session
+
+    @contextlib.contextmanager
+    def lease_session(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password
+        ):
+        """This is a method to obtain the cached session for a UCS CIMC for
+        the duration of a with statement. A leased session is not evicted
+        from the cache while it is in use.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            ucs_cimc_username (str):
+                The admin username of the UCS CIMC.
+            ucs_cimc_password (str):
+                The admin password of the UCS CIMC.
+
+        Yields:
+            A UcsCimcSession class instance for the UCS CIMC.
+        """
+        ucs_cimc_session_key = (ucs_cimc_server, ucs_cimc_username)
+        with self._cache_lock:
+            self._session_lease_counts[ucs_cimc_session_key] += 1
+        try:
+            yield self.get_session(
+                ucs_cimc_server,
+                ucs_cimc_username,
+                ucs_cimc_password
+                )
+        finally:
+            with self._cache_lock:
+                self._session_lease_counts[ucs_cimc_session_key] -= 1
+                if not self._session_lease_counts[ucs_cimc_session_key]:
+                    del self._session_lease_counts[ucs_cimc_session_key]
+
+    @contextlib.contextmanager
+    def lease_login_cookie(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_username
+        ):
+        """This is a method to obtain the login cookie of the cached session
+        for a UCS CIMC for the duration of a with statement, so the asyncio
+        client engine can reuse the login instead of logging in again. No
+        request is sent and no session is created, so the method does not
+        block the event loop. A leased session is not evicted from the cache
+        while it is in use.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            ucs_cimc_username (str):
+                The admin username of the UCS CIMC.
+
+        Yields:
+            A string of the login cookie, or None if no session is cached for
+            the UCS CIMC or its login cookie is close to expiring.
+        """
+        ucs_cimc_session_key = (ucs_cimc_server, ucs_cimc_username)
+        with self._cache_lock:
+            self._session_lease_counts[ucs_cimc_session_key] += 1
+            ucs_cimc_session = self._sessions.get(ucs_cimc_session_key)
+        try:
+            ucs_cimc_login_cookie = None
+            if (ucs_cimc_session is not None and ucs_cimc_session.ucs_cimc_login_cookie and
+                    time.monotonic() < ucs_cimc_session.ucs_cimc_login_cookie_expiry - ucs_cimc_session.refresh_margin):
+                ucs_cimc_login_cookie = ucs_cimc_session.ucs_cimc_login_cookie
+            yield ucs_cimc_login_cookie
+        finally:
+            with self._cache_lock:
+                self._session_lease_counts[ucs_cimc_session_key] -= 1
+                if not self._session_lease_counts[ucs_cimc_session_key]:
+                    del self._session_lease_counts[ucs_cimc_session_key]
+
+    def evict(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_username
+        ):
+        """This is a method to logout of and remove the cached session for a
+        UCS CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            ucs_cimc_username (str):
+                The admin username of the UCS CIMC.
+        """
+        with self._cache_lock:
+            ucs_cimc_session = self._sessions.pop((ucs_cimc_server, ucs_cimc_username), None)
+        if ucs_cimc_session is not None:
+            self._close_session(ucs_cimc_session)
+
+    def close_all(self):
+        """This is a method to logout of and remove all cached sessions."""
+        with self._cache_lock:
+            ucs_cimc_sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for ucs_cimc_session in ucs_cimc_sessions:
+            self._close_session(ucs_cimc_session)
+
+    @staticmethod
+    def _close_session(ucs_cimc_session):
+        if ucs_cimc_session.ucs_cimc_login_cookie:
+            log_ucs_cimc_event(
+                "Logging out...",
+                ucs_cimc_server=ucs_cimc_session.ucs_cimc_server,
+                phase="logout",
+                status="started"
+                )
+        try:
+            ucs_cimc_session.close()
+        except Exception as exception_message:
+            log_ucs_cimc_event(
+                "Unable to logout of the UCS CIMC.",
+                ucs_cimc_server=ucs_cimc_session.ucs_cimc_server,
+                phase="logout",
+                status="failed",
+                error=exception_message,
+                level=logging.ERROR
+                )
+
+
+# Establish function to evaluate a UCS CIMC XML API response
+def _evaluate_ucs_cimc_response(ucs_cimc_response):
+    """This is a function to determine whether a UCS CIMC XML API HTTP
+    response indicates a successful request.
+
+    Args:
+        ucs_cimc_response (Response):
+            A Response class instance for a UCS CIMC XML API HTTP request.
+            A value of None is treated as a failed request.
+
+    Returns:
+        A tuple of a boolean indicating whether the request succeeded and a
+        string describing the error, if any.
+    """
+    if ucs_cimc_response is None:
+        return False, "No response was received."
+    if ucs_cimc_response.status_code != 200:
+        return False, f"HTTP status code {ucs_cimc_response.status_code}."
+    try:
+        ucs_cimc_xml_response = et.fromstring(ucs_cimc_response.text)
+    except et.ParseError as exception_message:
+        return False, f"Unable to parse the response: {exception_message}"
+    ucs_cimc_error_code = ucs_cimc_xml_response.attrib.get("errorCode")
+    if ucs_cimc_error_code:
+        ucs_cimc_error_description = ucs_cimc_xml_response.attrib.get("errorDescr", "")
+        return False, f"Error code {ucs_cimc_error_code}: {ucs_cimc_error_description}"
+    return True, ""
+
+
+# Establish function to run a function across UCS CIMCs with a bounded pool of worker threads
+def _map_ucs_cimc_servers(
+    ucs_cimc_function,
+    ucs_cimc_servers,
+    max_concurrent_workers=1
+    ):
+    """This is a function to run a function for each of multiple UCS CIMCs
+    using a bounded pool of worker threads. No more UCS CIMCs are submitted
+    than the worker threads can absorb, so large inventories are not queued
+    in memory all at once.
+
+    Args:
+        ucs_cimc_function (function):
+            A function that accepts the hostname or IP address of a UCS CIMC.
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs. Any iterable is
+            accepted and is consumed as worker threads become available.
+        max_concurrent_workers (int):
+            The maximum number of UCS CIMCs to process concurrently. The
+            default value is 1.
+
+    Returns:
+        A list of the values returned by the function, in the order the UCS
+        CIMCs were provided.
+    """
+    if max_concurrent_workers <= 1:
+        return [ucs_cimc_function(ucs_cimc_server) for ucs_cimc_server in ucs_cimc_servers]
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    ucs_cimc_indexed_results = {}
+    with ThreadPoolExecutor(max_workers=max_concurrent_workers) as ucs_cimc_executor:
+        ucs_cimc_pending_tasks = {}
+        for ucs_cimc_server_index, ucs_cimc_server in enumerate(ucs_cimc_servers):
+            if len(ucs_cimc_pending_tasks) >= max_concurrent_workers * 2:
+                ucs_cimc_completed_tasks, _ = wait(
+                    ucs_cimc_pending_tasks,
+                    return_when=FIRST_COMPLETED
+                    )
+                for ucs_cimc_completed_task in ucs_cimc_completed_tasks:
+                    ucs_cimc_indexed_results[ucs_cimc_pending_tasks.pop(ucs_cimc_completed_task)] = ucs_cimc_completed_task.result()
+            ucs_cimc_pending_task = ucs_cimc_executor.submit(ucs_cimc_function, ucs_cimc_server)
+            ucs_cimc_pending_tasks[ucs_cimc_pending_task] = ucs_cimc_server_index
+        for ucs_cimc_completed_task in wait(ucs_cimc_pending_tasks)[0]:
+            ucs_cimc_indexed_results[ucs_cimc_pending_tasks[ucs_cimc_completed_task]] = ucs_cimc_completed_task.result()
+    return [ucs_cimc_indexed_results[ucs_cimc_server_index] for ucs_cimc_server_index in sorted(ucs_cimc_indexed_results)]
+
+
+# Establish the response type returned by the asyncio UCS CIMC client engine
+UcsCimcAsyncResponse = collections.namedtuple(
+    "UcsCimcAsyncResponse",
+    ["status_code", "text"]
+    )
+
+
+# Establish function to split a UCS CIMC server entry into a host and port
+def _split_ucs_cimc_server_address(ucs_cimc_server):
+    """This is a function to split a UCS CIMC server entry into a host and a
+    port for a direct HTTPS connection.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, optionally followed by
+            a colon and a port number.
+
+    Returns:
+        A tuple of the host string and the port integer. The port defaults to
+        443.
+    """
+    ucs_cimc_url_parts = urllib.parse.urlsplit(f"https://{ucs_cimc_server}")
+    return ucs_cimc_url_parts.hostname, ucs_cimc_url_parts.port or 443
+
+
+# Establish function to remove the port from a UCS CIMC server entry
+def _get_ucs_cimc_server_host(ucs_cimc_server):
+    """This is a function to remove the port from a UCS CIMC server entry,
+    keeping the hostname or IP address as it was provided.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, optionally followed by
+            a colon and a port number.
+
+    Returns:
+        A string of the hostname or IP address of the UCS CIMC.
+
+    Examples:
+        >>> _get_ucs_cimc_server_host("CIMC01.example.com:8443")
+        'CIMC01.example.com'
+        >>> _get_ucs_cimc_server_host("[2001:db8::10]:443")
+        '2001:db8::10'
+        >>> _get_ucs_cimc_server_host("2001:db8::10")
+        '2001:db8::10'
+    """
+    ucs_cimc_server = str(ucs_cimc_server)
+    ucs_cimc_host, ucs_cimc_separator, ucs_cimc_port = ucs_cimc_server.rpartition(":")
+    if ucs_cimc_separator and ucs_cimc_port.isdigit() and (
+            ":" not in ucs_cimc_host or ucs_cimc_host.endswith("]")):
+        ucs_cimc_server = ucs_cimc_host
+    if ucs_cimc_server.startswith("[") and ucs_cimc_server.endswith("]"):
+        ucs_cimc_server = ucs_cimc_server[1:-1]
+    return ucs_cimc_server
+
+
+# Establish function to create the TLS context of the asyncio client engine when it is first needed
+@functools.lru_cache(maxsize=None)
+def _get_ucs_cimc_async_ssl_context():
+    """This is a function to create the TLS context shared by every
+    connection of the asyncio client engine, so the default CA store is only
+    loaded once per process. Like the threaded client engine, the
+    certificates of the UCS CIMCs are not verified.
+
+    Returns:
+        The ssl.SSLContext class instance.
+    """
+    import ssl
+    ucs_cimc_ssl_context = ssl.create_default_context()
+    ucs_cimc_ssl_context.check_hostname = False
+    ucs_cimc_ssl_context.verify_mode = ssl.CERT_NONE
+    return ucs_cimc_ssl_context
+
+
+# Establish function to read an HTTP response from a UCS CIMC with asyncio
+async def _async_read_ucs_cimc_http_response(ucs_cimc_reader):
+    """This is a function to read an HTTP response from a UCS CIMC using an
+    asyncio stream.
+
+    Args:
+        ucs_cimc_reader (asyncio.StreamReader):
+            The stream reader for the connection to the UCS CIMC.
+
+    Returns:
+        A tuple of the UcsCimcAsyncResponse instance for the HTTP response,
+        and a boolean of whether the connection can be kept open for the next
+        request.
+
+    Raises:
+        ConnectionResetError:
+            The UCS CIMC closed the connection before sending a valid status
+            line.
+    """
+    # Read the status line and headers
+    ucs_cimc_status_line = await ucs_cimc_reader.readline()
+    ucs_cimc_status_line_parts = ucs_cimc_status_line.split()
+    if len(ucs_cimc_status_line_parts) < 2 or not ucs_cimc_status_line_parts[1].isdigit():
+        raise ConnectionResetError(
+            "The UCS CIMC closed the connection without a valid HTTP status line: "
+            f"{ucs_cimc_status_line[:80]!r}"
+            )
+    ucs_cimc_status_code = int(ucs_cimc_status_line_parts[1])
+    ucs_cimc_response_headers = {}
+    while True:
+        ucs_cimc_header_line = await ucs_cimc_reader.readline()
+        if ucs_cimc_header_line in (b"\r\n", b"\n", b""):
+            break
+        ucs_cimc_header_name, _, ucs_cimc_header_value = ucs_cimc_header_line.decode("latin-1").partition(":")
+        ucs_cimc_response_headers[ucs_cimc_header_name.strip().lower()] = ucs_cimc_header_value.strip()
+    ucs_cimc_keep_alive = (
+        ucs_cimc_status_line_parts[0] == b"HTTP/1.1" and
+        ucs_cimc_response_headers.get("connection", "").lower() != "close"
+        )
+
+    # Read the body
+    if ucs_cimc_response_headers.get("transfer-encoding", "").lower() == "chunked":
+        ucs_cimc_response_body = b""
+        while True:
+            ucs_cimc_chunk_size = int((await ucs_cimc_reader.readline()).split(b";")[0], 16)
+            if ucs_cimc_chunk_size == 0:
+                break
+            ucs_cimc_response_body += await ucs_cimc_reader.readexactly(ucs_cimc_chunk_size)
+            await ucs_cimc_reader.readline()
+        await ucs_cimc_reader.readline()
+    elif "content-length" in ucs_cimc_response_headers:
+        ucs_cimc_response_body = await ucs_cimc_reader.readexactly(
+            int(ucs_cimc_response_headers["content-length"])
+            )
+    else:
+        ucs_cimc_response_body = await ucs_cimc_reader.read()
+        ucs_cimc_keep_alive = False
+    return UcsCimcAsyncResponse(
+        status_code=ucs_cimc_status_code,
+        text=ucs_cimc_response_body.decode("utf-8", errors="replace")
+        ), ucs_cimc_keep_alive
+
+
+# Establish class for a keep-alive connection to a UCS CIMC with asyncio
+class UcsCimcAsyncConnection:
+    """This is a class for a keep-alive HTTPS connection to a UCS CIMC used
+    by the asyncio client engine. The login, configuration and logout
+    requests made through a connection share it, so the TCP and TLS
+    handshakes are only performed once per UCS CIMC. The connection is
+    opened on the first request, and opened again if the UCS CIMC has closed
+    it or a request fails.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Attributes:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+    """
+    def __init__(self, ucs_cimc_server):
+        self.ucs_cimc_server = ucs_cimc_server
+        self._ucs_cimc_reader = None
+        self._ucs_cimc_writer = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        await self.close()
+
+    async def _open(self, connect_timeout):
+        """This is a method to open the connection to the UCS CIMC and record
+        the certificate it serves.
+
+        Args:
+            connect_timeout (float):
+                The number of seconds to wait for the connection.
+        """
+        import asyncio
+        ucs_cimc_host, ucs_cimc_port = _split_ucs_cimc_server_address(self.ucs_cimc_server)
+        ucs_cimc_connect_start_time = time.monotonic()
+        ucs_cimc_connect_succeeded = False
+        try:
+            self._ucs_cimc_reader, self._ucs_cimc_writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    _get_ucs_cimc_connect_address(ucs_cimc_host),
+                    ucs_cimc_port,
+                    ssl=_get_ucs_cimc_async_ssl_context(),
+                    server_hostname=ucs_cimc_host
+                    ),
+                connect_timeout
+                )
+            ucs_cimc_connect_succeeded = True
+            _record_ucs_cimc_initial_certificate(
+                self.ucs_cimc_server,
+                self._ucs_cimc_writer.get_extra_info("ssl_object").getpeercert(binary_form=True)
+                )
+        finally:
+            _record_ucs_cimc_phase_metric(
+                self.ucs_cimc_server,
+                "connect",
+                time.monotonic() - ucs_cimc_connect_start_time,
+                ucs_cimc_connect_succeeded
+                )
+
+    async def send(self, ucs_cimc_post_body, timeout):
+        """This is a method to send a single XML API request to the /nuova
+        endpoint of the UCS CIMC over the connection.
+
+        Args:
+            ucs_cimc_post_body (str):
+                The XML API request body.
+            timeout (tuple):
+                A tuple of the connect and read timeouts in seconds. The read
+                timeout covers both writing the request and reading the
+                response.
+
+        Returns:
+            A UcsCimcAsyncResponse instance for the UCS CIMC XML API HTTP
+            request.
+
+        Raises:
+            Exception:
+                An exception occurred due to an issue with the connection to
+                the UCS CIMC or the HTTP response. The connection is closed.
+        """
+        import asyncio
+        if self._ucs_cimc_writer is not None and (self._ucs_cimc_reader.at_eof() or
+                                                  self._ucs_cimc_writer.is_closing()):
+            await self.close()
+        if self._ucs_cimc_writer is None:
+            await self._open(timeout[0])
+
+        async def exchange_ucs_cimc_http_request():
+            ucs_cimc_encoded_post_body = ucs_cimc_post_body.encode("utf-8")
+            self._ucs_cimc_writer.write(
+                (f"POST /nuova HTTP/1.1\r\n"
+                 f"Host: {self.ucs_cimc_server}\r\n"
+                 f"Content-Type: application/xml\r\n"
+                 f"Content-Length: {len(ucs_cimc_encoded_post_body)}\r\n"
+                 f"Connection: keep-alive\r\n"
+                 f"\r\n").encode("latin-1") + ucs_cimc_encoded_post_body
+                )
+            await self._ucs_cimc_writer.drain()
+            return await _async_read_ucs_cimc_http_response(self._ucs_cimc_reader)
+
+        try:
+            ucs_cimc_response, ucs_cimc_keep_alive = await asyncio.wait_for(
+                exchange_ucs_cimc_http_request(),
+                timeout[1]
+                )
+        except BaseException:
+            await self.close()
+            raise
+        if not ucs_cimc_keep_alive:
+            await self.close()
+        return ucs_cimc_response
+
+    async def close(self):
+        """This is a method to close the connection to the UCS CIMC, if it is
+        open.
+        """
+        import ssl
+        ucs_cimc_writer = self._ucs_cimc_writer
+        self._ucs_cimc_reader = self._ucs_cimc_writer = None
+        if ucs_cimc_writer is None:
+            return
+        ucs_cimc_writer.close()
+        try:
+            await ucs_cimc_writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
+
+
+# Establish function to send an XML API request to a UCS CIMC with asyncio
+async def _async_send_ucs_cimc_xml_api_request(
+    ucs_cimc_server,
+    ucs_cimc_post_body,
+    timeout,
+    ucs_cimc_connection=None
+    ):
+    """This is a function to send a single XML API request to the /nuova
+    endpoint of a UCS CIMC using asyncio streams.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_post_body (str):
+            The XML API request body.
+        timeout (tuple):
+            A tuple of the connect and read timeouts in seconds.
+        ucs_cimc_connection (UcsCimcAsyncConnection):
+            An optional keep-alive connection to the UCS CIMC to send the
+            request over. The default value is None, which sends the request
+            over a new connection that is closed afterwards.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the UCS CIMC XML API HTTP request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the connection to the
+            UCS CIMC or the HTTP response.
+    """
+    if ucs_cimc_connection is not None:
+        return await ucs_cimc_connection.send(ucs_cimc_post_body, timeout)
+    async with UcsCimcAsyncConnection(ucs_cimc_server) as ucs_cimc_one_time_connection:
+        return await ucs_cimc_one_time_connection.send(ucs_cimc_post_body, timeout)
+
+
+# Establish function to post an XML API request body to a UCS CIMC with asyncio
+async def _async_post_ucs_cimc_xml_api(
+    ucs_cimc_server,
+    ucs_cimc_post_body,
+    idempotent=False,
+    ucs_cimc_connection=None
+    ):
+    """This is a function to post an XML API request body to the /nuova
+    endpoint of a UCS CIMC using asyncio streams, with the timeout, retry and
+    circuit breaker client settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_post_body (str):
+            The XML API request body.
+        idempotent (bool):
+            Whether the request can safely be retried. Only idempotent
+            requests are retried. The default value is False.
+        ucs_cimc_connection (UcsCimcAsyncConnection):
+            An optional keep-alive connection to the UCS CIMC to send the
+            request over. The default value is None, which uses a new
+            connection for each attempt.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the UCS CIMC XML API HTTP request.
+
+    Raises:
+        UcsCimcCircuitOpenError:
+            The circuit breaker for the UCS CIMC is open.
+        Exception:
+            An exception occurred due to an issue with the connection to the
+            UCS CIMC or the HTTP response after all permitted attempts.
+    """
+    import asyncio
+    ucs_cimc_retry_policy = _get_default_ucs_cimc_retry_policy()
+    ucs_cimc_circuit_breaker = get_ucs_cimc_circuit_breaker(ucs_cimc_server)
+    ucs_cimc_max_attempts = ucs_cimc_retry_policy.max_retries + 1 if idempotent else 1
+    ucs_cimc_request_start_time = time.monotonic()
+    ucs_cimc_response = None
+    try:
+        for ucs_cimc_attempt in range(1, ucs_cimc_max_attempts + 1):
+            ucs_cimc_circuit_breaker.before_request()
+            try:
+                ucs_cimc_response = await _async_send_ucs_cimc_xml_api_request(
+                    ucs_cimc_server,
+                    ucs_cimc_post_body,
+                    (ucs_cimc_connect_timeout, ucs_cimc_read_timeout),
+                    ucs_cimc_connection=ucs_cimc_connection
+                    )
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                ucs_cimc_circuit_breaker.record_failure()
+                if ucs_cimc_attempt == ucs_cimc_max_attempts or ucs_cimc_circuit_breaker.is_open:
+                    raise
+            else:
+                if ucs_cimc_response.status_code < 500:
+                    ucs_cimc_circuit_breaker.record_success()
+                    return ucs_cimc_response
+                ucs_cimc_circuit_breaker.record_failure()
+                if ucs_cimc_attempt == ucs_cimc_max_attempts or ucs_cimc_circuit_breaker.is_open:
+                    return ucs_cimc_response
+            await asyncio.sleep(ucs_cimc_retry_policy.get_backoff(ucs_cimc_attempt))
+    finally:
+        _record_ucs_cimc_xml_api_metric(
+            ucs_cimc_server,
+            ucs_cimc_post_body,
+            ucs_cimc_response,
+            ucs_cimc_request_start_time
+            )
+        _log_ucs_cimc_xml_api_request(
+            ucs_cimc_server,
+            ucs_cimc_post_body,
+            ucs_cimc_response,
+            ucs_cimc_request_start_time,
+            ucs_cimc_request_error=sys.exc_info()[1]
+            )
+
+
+# Establish function to login to UCS CIMC and obtain the login cookie with asyncio
+async def _async_obtain_ucs_cimc_login_cookie(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    ucs_cimc_connection=None,
+    raise_on_failure=False
+    ):
+    """This is a function to login to a UCS CIMC using the asyncio client
+    engine and obtain the cookie for the login session.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        ucs_cimc_connection (UcsCimcAsyncConnection):
+            An optional keep-alive connection to the UCS CIMC to login over.
+            The default value is None.
+        raise_on_failure (bool):
+            Whether an unsuccessful login raises an exception instead of
+            returning None. The default value is False.
+
+    Returns:
+        A string of the cookie from the UCS CIMC login HTTP response, or None
+        if the login was unsuccessful.
+
+    Raises:
+        UcsCimcLoginError:
+            The UCS CIMC did not return a login cookie, if raise_on_failure is
+            True.
+        Exception:
+            An exception occurred due to an issue with accessing the UCS CIMC,
+            if raise_on_failure is True.
+    """
+    try:
+        ucs_cimc_login = await _async_post_ucs_cimc_xml_api(
+            ucs_cimc_server,
+            _build_ucs_cimc_login_post_body(
+                ucs_cimc_username,
+                ucs_cimc_password
+                ),
+            idempotent=True,
+            ucs_cimc_connection=ucs_cimc_connection
+            )
+        ucs_cimc_login_xml_string_response = et.fromstring(ucs_cimc_login.text)
+        ucs_cimc_login_cookie = ucs_cimc_login_xml_string_response.attrib.get("outCookie")
+        if ucs_cimc_login_cookie:
+            return ucs_cimc_login_cookie
+        else:
+            log_ucs_cimc_event(
+                "Unable to retrieve the login cookie.",
+                ucs_cimc_server=ucs_cimc_server,
+                phase="login",
+                status="failed",
+                error=str(ucs_cimc_login_xml_string_response.attrib),
+                error_class="InvalidResponse",
+                level=logging.ERROR
+                )
+            ucs_cimc_login_error = UcsCimcLoginError(
+                ucs_cimc_login_xml_string_response.attrib.get("errorDescr")
+                or "Unable to retrieve the login cookie."
+                )
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to login to the UCS CIMC.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="login",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR,
+            exc_info=True
+            )
+        if raise_on_failure:
+            raise
+        return None
+    if raise_on_failure:
+        raise ucs_cimc_login_error
+    return None
+
+
+# Establish function to run a login, configuration and logout sequence on a UCS CIMC with asyncio
+async def _async_configure_ucs_cimc(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    ucs_cimc_post_body_builder,
+    ucs_cimc_post_body_settings,
+    ucs_cimc_login_cookie=None
+    ):
+    """This is a function to run the aaaLogin, configConfMo and aaaLogout
+    sequence on a UCS CIMC using the asyncio client engine, over a single
+    keep-alive connection.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        ucs_cimc_post_body_builder (function):
+            A function that accepts the login cookie and the provided
+            settings, and returns the configConfMo XML API request body.
+        ucs_cimc_post_body_settings (dict):
+            The keyword arguments for the request body builder function.
+        ucs_cimc_login_cookie (str):
+            An optional login cookie of an existing session for the UCS CIMC,
+            such as one leased from a UcsCimcSessionCache. When provided, the
+            aaaLogin and aaaLogout requests are skipped and the session is
+            left logged in. The default value is None, which logs in and out
+            of the UCS CIMC for this request only.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the configConfMo HTTP request.
+
+    Raises:
+        UcsCimcLoginError:
+            The UCS CIMC did not return a login cookie.
+        Exception:
+            An exception occurred due to an issue with accessing the UCS CIMC.
+    """
+    async with UcsCimcAsyncConnection(ucs_cimc_server) as ucs_cimc_connection:
+        if ucs_cimc_login_cookie:
+            return await _async_post_ucs_cimc_xml_api(
+                ucs_cimc_server,
+                ucs_cimc_post_body_builder(
+                    ucs_cimc_login_cookie,
+                    **ucs_cimc_post_body_settings
+                    ),
+                ucs_cimc_connection=ucs_cimc_connection
+                )
+        ucs_cimc_login_cookie = await _async_obtain_ucs_cimc_login_cookie(
+            ucs_cimc_server,
+            ucs_cimc_username,
+            ucs_cimc_password,
+            ucs_cimc_connection=ucs_cimc_connection,
+            raise_on_failure=True
+            )
+        try:
+            return await _async_post_ucs_cimc_xml_api(
+                ucs_cimc_server,
+                ucs_cimc_post_body_builder(
+                    ucs_cimc_login_cookie,
+                    **ucs_cimc_post_body_settings
+                    ),
+                ucs_cimc_connection=ucs_cimc_connection
+                )
+        finally:
+            try:
+                await _async_post_ucs_cimc_xml_api(
+                    ucs_cimc_server,
+                    _build_ucs_cimc_logout_post_body(ucs_cimc_login_cookie),
+                    idempotent=True,
+                    ucs_cimc_connection=ucs_cimc_connection
+                    )
+            except Exception as exception_message:
+                log_ucs_cimc_event(
+                    "Unable to logout of the UCS CIMC.",
+                    ucs_cimc_server=ucs_cimc_server,
+                    phase="logout",
+                    status="failed",
+                    error=exception_message,
+                    level=logging.ERROR
+                    )
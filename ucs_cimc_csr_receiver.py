@@ -0,0 +1,646 @@
+"""
+UCS CIMC CSR Receiver
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC CSR Receiver is an embedded TFTP and FTP server that
+         receives the certificate signing request files pushed by the Cisco
+         Integrated Management Controller (CIMC), for use by the UCS CIMC
+         Certificate Renewal Tool in place of a separate file server.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import os
+import re
+import time
+import socket
+import struct
+import posixpath
+import threading
+import socketserver
+
+
+# Establish the TFTP opcodes and error codes
+TFTP_OPCODE_RRQ = 1
+TFTP_OPCODE_WRQ = 2
+TFTP_OPCODE_DATA = 3
+TFTP_OPCODE_ACK = 4
+TFTP_OPCODE_ERROR = 5
+TFTP_OPCODE_OACK = 6
+TFTP_ERROR_NOT_DEFINED = 0
+TFTP_ERROR_ACCESS_VIOLATION = 2
+TFTP_ERROR_ILLEGAL_OPERATION = 4
+TFTP_ERROR_UNKNOWN_TRANSFER_ID = 5
+
+
+# Establish class for the embedded UCS CIMC CSR receiver
+class UcsCimcCsrReceiver:
+    """This is a class for an embedded TFTP and FTP server that receives the
+    certificate signing request (CSR) files pushed by UCS CIMCs. Each upload
+    is handled in its own thread and written to disk as it arrives. Only the
+    CSR filenames registered with expect_csr() are accepted, and each file
+    is matched back to the UCS CIMC it was registered for.
+
+    Args:
+        csr_directory (str):
+            The directory to write the received CSR files to.
+        bind_address (str):
+            The local address to listen on. The default value is "0.0.0.0".
+        protocols (tuple):
+            The protocols to receive CSR files over. The options are "tftp"
+            and "ftp". The default value is ("tftp", "ftp").
+        tftp_port (int):
+            The UDP port of the TFTP server. The default value is 69.
+        ftp_port (int):
+            The TCP port of the FTP server. The default value is 21.
+        transfer_timeout (float):
+            The number of seconds to wait for the next packet or data of an
+            upload before it is abandoned. The default value is 10.
+    """
+    def __init__(
+        self,
+        csr_directory,
+        bind_address="0.0.0.0",
+        protocols=("tftp", "ftp"),
+        tftp_port=69,
+        ftp_port=21,
+        transfer_timeout=10
+        ):
+        self.csr_directory = csr_directory
+        self.bind_address = bind_address
+        self.protocols = tuple(protocols)
+        self.tftp_port = tftp_port
+        self.ftp_port = ftp_port
+        self.transfer_timeout = transfer_timeout
+        self._expected_csrs = {}
+        self._expected_credentials = set()
+        self._collected_csrs = {}
+        self._csr_condition = threading.Condition()
+        self._servers = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """This is a method to start the TFTP and FTP servers of the receiver
+        in background threads.
+        """
+        os.makedirs(self.csr_directory, exist_ok=True)
+        if "tftp" in self.protocols:
+            tftp_server = _UcsCimcTftpServer((self.bind_address, self.tftp_port), self)
+            self.tftp_port = tftp_server.server_address[1]
+            self._servers.append(tftp_server)
+        if "ftp" in self.protocols:
+            ftp_server = _UcsCimcFtpServer((self.bind_address, self.ftp_port), self)
+            self.ftp_port = ftp_server.server_address[1]
+            self._servers.append(ftp_server)
+        for receiver_server in self._servers:
+            threading.Thread(
+                target=receiver_server.serve_forever,
+                name=f"ucs-cimc-csr-receiver-{type(receiver_server).__name__}",
+                daemon=True
+                ).start()
+
+    def close(self):
+        """This is a method to stop the TFTP and FTP servers of the receiver.
+        """
+        for receiver_server in self._servers:
+            receiver_server.shutdown()
+            receiver_server.server_close()
+        self._servers = []
+
+    def expect_csr(
+        self,
+        ucs_cimc_server,
+        csr_filename,
+        remote_server_user="",
+        remote_server_password="",
+        remote_server_protocol="ftp"
+        ):
+        """This is a method to register the CSR file a UCS CIMC is going to
+        push to the receiver. The FTP login credentials are only registered
+        for UCS CIMCs pushing over FTP.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            csr_filename (str):
+                The filename of the CSR, in the format
+                "{common_name}-csr{extension}".
+            remote_server_user (str):
+                The FTP username the UCS CIMC logs in with. The default value
+                is an empty string ("").
+            remote_server_password (str):
+                The FTP password the UCS CIMC logs in with. The default value
+                is an empty string ("").
+            remote_server_protocol (str):
+                The protocol the UCS CIMC pushes the CSR with. The default
+                value is "ftp".
+        """
+        with self._csr_condition:
+            self._expected_csrs.setdefault(posixpath.basename(csr_filename), []).append(ucs_cimc_server)
+            if remote_server_protocol == "ftp":
+                self._expected_credentials.add((remote_server_user, remote_server_password))
+
+    def is_valid_login(
+        self,
+        remote_server_user,
+        remote_server_password
+        ):
+        """This is a method to check FTP login credentials against the
+        credentials registered with expect_csr().
+
+        Returns:
+            A boolean indicating whether the credentials are valid.
+        """
+        with self._csr_condition:
+            return (remote_server_user, remote_server_password) in self._expected_credentials
+
+    def match_csr(
+        self,
+        csr_filename,
+        peer_address
+        ):
+        """This is a method to match an incoming CSR upload back to the UCS
+        CIMC it was registered for. When several UCS CIMCs share a CSR
+        filename, the UCS CIMC whose address resolves to the address of the
+        sender is selected.
+
+        Args:
+            csr_filename (str):
+                The filename or filepath of the upload.
+            peer_address (str):
+                The IP address of the sender.
+
+        Returns:
+            A tuple of the UCS CIMC server entry and the local filepath to
+            write the CSR to, or (None, None) if the upload does not match an
+            expected CSR.
+        """
+        csr_filename = posixpath.basename(csr_filename.replace("\\", "/"))
+        with self._csr_condition:
+            ucs_cimc_servers = [
+                ucs_cimc_server
+                for ucs_cimc_server in self._expected_csrs.get(csr_filename, [])
+                if ucs_cimc_server not in self._collected_csrs
+                ]
+            shared_csr_filename = len(self._expected_csrs.get(csr_filename, [])) > 1
+        if len(ucs_cimc_servers) > 1:
+            ucs_cimc_servers = [
+                ucs_cimc_server
+                for ucs_cimc_server in ucs_cimc_servers
+                if peer_address in _resolve_ucs_cimc_server_addresses(ucs_cimc_server)
+                ]
+        if len(ucs_cimc_servers) != 1:
+            return None, None
+        ucs_cimc_server = ucs_cimc_servers[0]
+        if shared_csr_filename:
+            csr_filepath = os.path.join(
+                self.csr_directory,
+                re.sub(r"[^\w.-]", "_", str(ucs_cimc_server)),
+                csr_filename
+                )
+        else:
+            csr_filepath = os.path.join(self.csr_directory, csr_filename)
+        return ucs_cimc_server, csr_filepath
+
+    def record_csr(
+        self,
+        ucs_cimc_server,
+        csr_filepath,
+        protocol,
+        peer_address
+        ):
+        """This is a method to mark the CSR of a UCS CIMC as collected, once
+        the upload has been written to disk.
+        """
+        with self._csr_condition:
+            self._collected_csrs[ucs_cimc_server] = {
+                "csr_filepath": csr_filepath,
+                "csr_size": os.path.getsize(csr_filepath),
+                "protocol": protocol,
+                "peer_address": peer_address,
+                "received_time": time.time()
+                }
+            self._csr_condition.notify_all()
+
+    def get_collected_csr(self, ucs_cimc_server):
+        """This is a method to obtain the details of the collected CSR of a
+        UCS CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+
+        Returns:
+            A dictionary of the CSR filepath, size, protocol, sender address
+            and time received, or None if the CSR has not been collected.
+        """
+        with self._csr_condition:
+            return self._collected_csrs.get(ucs_cimc_server)
+
+    def wait_for_csrs(
+        self,
+        ucs_cimc_servers,
+        timeout
+        ):
+        """This is a method to wait until the CSRs of the given UCS CIMCs
+        have been collected or the timeout has passed.
+
+        Args:
+            ucs_cimc_servers (list):
+                The UCS CIMC server entries to wait for.
+            timeout (float):
+                The maximum number of seconds to wait.
+
+        Returns:
+            A boolean indicating whether all of the CSRs were collected.
+        """
+        with self._csr_condition:
+            return self._csr_condition.wait_for(
+                lambda: all(ucs_cimc_server in self._collected_csrs for ucs_cimc_server in ucs_cimc_servers),
+                timeout=timeout
+                )
+
+
+# Establish function to resolve the addresses of a UCS CIMC server entry
+def _resolve_ucs_cimc_server_addresses(ucs_cimc_server):
+    ucs_cimc_host = str(ucs_cimc_server)
+    if ucs_cimc_host.startswith("["):
+        ucs_cimc_host = ucs_cimc_host[1:].partition("]")[0]
+    elif ucs_cimc_host.count(":") == 1:
+        ucs_cimc_host = ucs_cimc_host.partition(":")[0]
+    try:
+        return {address_info[4][0] for address_info in socket.getaddrinfo(ucs_cimc_host, None)}
+    except OSError:
+        return set()
+
+
+# Establish function to write an upload to disk and mark the CSR as collected
+def _receive_ucs_cimc_csr_file(
+    csr_receiver,
+    ucs_cimc_server,
+    csr_filepath,
+    protocol,
+    peer_address,
+    write_chunks
+    ):
+    """This is a function to write an incoming CSR upload to a temporary file
+    as it arrives, move it into place once complete and mark the CSR as
+    collected.
+
+    Args:
+        write_chunks (callable):
+            A function taking the open temporary file that writes the upload
+            to it and returns True once the upload is complete.
+
+    Returns:
+        A boolean indicating whether the upload was completed.
+    """
+    os.makedirs(os.path.dirname(csr_filepath), exist_ok=True)
+    csr_temporary_filepath = f"{csr_filepath}.{threading.get_ident()}.part"
+    try:
+        with open(csr_temporary_filepath, "wb") as csr_temporary_file:
+            if not write_chunks(csr_temporary_file):
+                return False
+        os.replace(csr_temporary_filepath, csr_filepath)
+    finally:
+        if os.path.exists(csr_temporary_filepath):
+            os.remove(csr_temporary_filepath)
+    csr_receiver.record_csr(ucs_cimc_server, csr_filepath, protocol, peer_address)
+    return True
+
+
+# Establish class for the TFTP server of the receiver
+class _UcsCimcTftpServer(socketserver.ThreadingUDPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        server_address,
+        csr_receiver
+        ):
+        self.csr_receiver = csr_receiver
+        super().__init__(server_address, _UcsCimcTftpRequestHandler)
+
+
+# Establish class for handling TFTP write requests
+class _UcsCimcTftpRequestHandler(socketserver.BaseRequestHandler):
+    """This is a class for handling a TFTP write request (RFC 1350) from a
+    UCS CIMC on its own transfer socket, with support for the blksize,
+    timeout and tsize options (RFC 2347, 2348 and 2349).
+    """
+    def handle(self):
+        tftp_packet = self.request[0]
+        csr_receiver = self.server.csr_receiver
+        self.transfer_socket = socket.socket(self.server.address_family, socket.SOCK_DGRAM)
+        try:
+            self.transfer_socket.bind((self.server.server_address[0], 0))
+            self.transfer_socket.settimeout(csr_receiver.transfer_timeout)
+            tftp_opcode = struct.unpack("!H", tftp_packet[:2])[0] if len(tftp_packet) >= 2 else 0
+            if tftp_opcode == TFTP_OPCODE_RRQ:
+                self._send_error(TFTP_ERROR_ACCESS_VIOLATION, "Only uploads are accepted.")
+                return
+            if tftp_opcode != TFTP_OPCODE_WRQ:
+                self._send_error(TFTP_ERROR_ILLEGAL_OPERATION, "Illegal TFTP operation.")
+                return
+            tftp_request_fields = tftp_packet[2:].split(b"\0")
+            if len(tftp_request_fields) < 2:
+                self._send_error(TFTP_ERROR_ILLEGAL_OPERATION, "Malformed write request.")
+                return
+            csr_filename = tftp_request_fields[0].decode("utf-8", errors="replace")
+            tftp_mode = tftp_request_fields[1].decode("ascii", errors="replace").lower()
+            tftp_options = {
+                option_name.decode("ascii", errors="replace").lower(): option_value.decode("ascii", errors="replace")
+                for option_name, option_value in zip(tftp_request_fields[2::2], tftp_request_fields[3::2])
+                if option_name
+                }
+            ucs_cimc_server, csr_filepath = csr_receiver.match_csr(csr_filename, self.client_address[0])
+            if ucs_cimc_server is None:
+                self._send_error(TFTP_ERROR_ACCESS_VIOLATION, f"Unexpected file {csr_filename}.")
+                return
+            _receive_ucs_cimc_csr_file(
+                csr_receiver,
+                ucs_cimc_server,
+                csr_filepath,
+                "tftp",
+                self.client_address[0],
+                lambda csr_file: self._receive_blocks(csr_file, tftp_mode, tftp_options)
+                )
+        finally:
+            self.transfer_socket.close()
+
+    def _send_error(
+        self,
+        tftp_error_code,
+        tftp_error_message
+        ):
+        self.transfer_socket.sendto(
+            (struct.pack("!HH", TFTP_OPCODE_ERROR, tftp_error_code) +
+             tftp_error_message.encode("ascii", errors="replace") + b"\0"),
+            self.client_address
+            )
+
+    def _receive_blocks(
+        self,
+        csr_file,
+        tftp_mode,
+        tftp_options
+        ):
+        tftp_block_size = 512
+        tftp_accepted_options = {}
+        if "blksize" in tftp_options and tftp_options["blksize"].isdigit():
+            tftp_block_size = min(max(int(tftp_options["blksize"]), 8), 65464)
+            tftp_accepted_options["blksize"] = str(tftp_block_size)
+        if "timeout" in tftp_options and tftp_options["timeout"].isdigit() and 1 <= int(tftp_options["timeout"]) <= 255:
+            self.transfer_socket.settimeout(int(tftp_options["timeout"]))
+            tftp_accepted_options["timeout"] = tftp_options["timeout"]
+        if "tsize" in tftp_options:
+            tftp_accepted_options["tsize"] = tftp_options["tsize"]
+        if tftp_accepted_options:
+            tftp_reply = struct.pack("!H", TFTP_OPCODE_OACK) + b"".join(
+                option_name.encode("ascii") + b"\0" + option_value.encode("ascii") + b"\0"
+                for option_name, option_value in tftp_accepted_options.items()
+                )
+        else:
+            tftp_reply = struct.pack("!HH", TFTP_OPCODE_ACK, 0)
+        tftp_expected_block = 1
+        tftp_retries = 0
+        tftp_pending_carriage_return = False
+        self.transfer_socket.sendto(tftp_reply, self.client_address)
+        while True:
+            try:
+                tftp_packet, tftp_peer = self.transfer_socket.recvfrom(tftp_block_size + 4)
+            except socket.timeout:
+                tftp_retries += 1
+                if tftp_retries > 5:
+                    return False
+                self.transfer_socket.sendto(tftp_reply, self.client_address)
+                continue
+            if tftp_peer != self.client_address:
+                self.transfer_socket.sendto(
+                    struct.pack("!HH", TFTP_OPCODE_ERROR, TFTP_ERROR_UNKNOWN_TRANSFER_ID) + b"Unknown transfer ID.\0",
+                    tftp_peer
+                    )
+                continue
+            if len(tftp_packet) < 4:
+                continue
+            tftp_opcode, tftp_block = struct.unpack("!HH", tftp_packet[:4])
+            if tftp_opcode == TFTP_OPCODE_ERROR:
+                return False
+            if tftp_opcode != TFTP_OPCODE_DATA:
+                continue
+            if tftp_block != tftp_expected_block:
+                # Acknowledge a duplicate block again, so the sender moves on
+                self.transfer_socket.sendto(tftp_reply, self.client_address)
+                continue
+            tftp_retries = 0
+            tftp_data = tftp_packet[4:]
+            if tftp_mode == "netascii":
+                if tftp_pending_carriage_return:
+                    tftp_data = b"\r" + tftp_data
+                tftp_pending_carriage_return = tftp_data.endswith(b"\r") and len(tftp_packet) - 4 == tftp_block_size
+                if tftp_pending_carriage_return:
+                    tftp_data = tftp_data[:-1]
+                tftp_data = tftp_data.replace(b"\r\n", b"\n").replace(b"\r\0", b"\r")
+            csr_file.write(tftp_data)
+            tftp_reply = struct.pack("!HH", TFTP_OPCODE_ACK, tftp_block)
+            self.transfer_socket.sendto(tftp_reply, self.client_address)
+            tftp_expected_block = (tftp_expected_block + 1) % 65536
+            if len(tftp_packet) - 4 < tftp_block_size:
+                return True
+
+
+# Establish class for the FTP server of the receiver
+class _UcsCimcFtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 256
+
+    def __init__(
+        self,
+        server_address,
+        csr_receiver
+        ):
+        self.csr_receiver = csr_receiver
+        super().__init__(server_address, _UcsCimcFtpRequestHandler)
+
+
+# Establish class for handling FTP control connections
+class _UcsCimcFtpRequestHandler(socketserver.StreamRequestHandler):
+    """This is a class for handling an FTP control connection (RFC 959) from
+    a UCS CIMC. Only the commands needed to log in and store a file are
+    supported, in passive or active mode.
+    """
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        self.csr_receiver = self.server.csr_receiver
+        self.request.settimeout(self.csr_receiver.transfer_timeout)
+        self.peer_address = self.client_address[0]
+        self.remote_server_user = None
+        self.logged_in = False
+        self.passive_socket = None
+        self.active_address = None
+        self._send_reply("220 UCS CIMC CSR receiver ready.")
+        try:
+            while True:
+                ftp_command_line = self.rfile.readline(4096)
+                if not ftp_command_line:
+                    break
+                ftp_command, _, ftp_argument = ftp_command_line.decode("utf-8", errors="replace").strip().partition(" ")
+                ftp_command = ftp_command.upper()
+                if ftp_command == "QUIT":
+                    self._send_reply("221 Goodbye.")
+                    break
+                self._handle_command(ftp_command, ftp_argument)
+        except (OSError, socket.timeout):
+            pass
+        finally:
+            self._close_passive_socket()
+
+    def _send_reply(self, ftp_reply):
+        self.wfile.write(ftp_reply.encode("utf-8") + b"\r\n")
+
+    def _close_passive_socket(self):
+        if self.passive_socket is not None:
+            self.passive_socket.close()
+            self.passive_socket = None
+
+    def _handle_command(
+        self,
+        ftp_command,
+        ftp_argument
+        ):
+        if ftp_command == "USER":
+            self.remote_server_user = ftp_argument
+            self.logged_in = False
+            self._send_reply("331 Password required.")
+        elif ftp_command == "PASS":
+            if self.remote_server_user is not None and self.csr_receiver.is_valid_login(self.remote_server_user, ftp_argument):
+                self.logged_in = True
+                self._send_reply("230 Login successful.")
+            else:
+                self._send_reply("530 Login incorrect.")
+        elif ftp_command in ("SYST",):
+            self._send_reply("215 UNIX Type: L8")
+        elif ftp_command in ("NOOP", "TYPE", "MODE", "STRU", "OPTS", "ALLO"):
+            self._send_reply("200 OK.")
+        elif ftp_command == "FEAT":
+            self._send_reply("211 No features.")
+        elif not self.logged_in:
+            self._send_reply("530 Please login with USER and PASS.")
+        elif ftp_command in ("PWD", "XPWD"):
+            self._send_reply('257 "/" is the current directory.')
+        elif ftp_command in ("CWD", "XCWD", "CDUP"):
+            self._send_reply("250 Directory changed.")
+        elif ftp_command in ("MKD", "XMKD"):
+            self._send_reply(f'257 "{ftp_argument}" created.')
+        elif ftp_command in ("PASV", "EPSV"):
+            self._open_passive_socket(ftp_command)
+        elif ftp_command in ("PORT", "EPRT"):
+            self._set_active_address(ftp_command, ftp_argument)
+        elif ftp_command == "STOR":
+            self._store_file(ftp_argument)
+        else:
+            self._send_reply("502 Command not implemented.")
+
+    def _open_passive_socket(self, ftp_command):
+        self._close_passive_socket()
+        self.active_address = None
+        local_address = self.request.getsockname()[0]
+        self.passive_socket = socket.socket(self.request.family, socket.SOCK_STREAM)
+        self.passive_socket.settimeout(self.csr_receiver.transfer_timeout)
+        self.passive_socket.bind((local_address, 0))
+        self.passive_socket.listen(1)
+        passive_port = self.passive_socket.getsockname()[1]
+        if ftp_command == "EPSV":
+            self._send_reply(f"229 Entering Extended Passive Mode (|||{passive_port}|).")
+        else:
+            self._send_reply(
+                f"227 Entering Passive Mode ({local_address.replace('.', ',')},"
+                f"{passive_port >> 8},{passive_port & 0xFF})."
+                )
+
+    def _set_active_address(
+        self,
+        ftp_command,
+        ftp_argument
+        ):
+        self._close_passive_socket()
+        try:
+            if ftp_command == "EPRT":
+                _, _, active_host, active_port, _ = ftp_argument.split(ftp_argument[0])
+                active_port = int(active_port)
+            else:
+                active_fields = [int(active_field) for active_field in ftp_argument.split(",")]
+                active_host = ".".join(str(active_field) for active_field in active_fields[:4])
+                active_port = (active_fields[4] << 8) + active_fields[5]
+        except (ValueError, IndexError):
+            self._send_reply("501 Syntax error in parameters.")
+            return
+        # Only connect back to the UCS CIMC itself
+        if active_host != self.peer_address:
+            self._send_reply("504 Data connections are only made to the client address.")
+            return
+        self.active_address = (active_host, active_port)
+        self._send_reply("200 Command successful.")
+
+    def _open_data_connection(self):
+        if self.passive_socket is not None:
+            data_connection, data_address = self.passive_socket.accept()
+            self._close_passive_socket()
+            # Only accept data connections from the UCS CIMC itself
+            if data_address[0] != self.peer_address:
+                data_connection.close()
+                raise ConnectionRefusedError(f"Data connection from unexpected address {data_address[0]}.")
+        elif self.active_address is not None:
+            data_connection = socket.create_connection(self.active_address, timeout=self.csr_receiver.transfer_timeout)
+            self.active_address = None
+        else:
+            return None
+        data_connection.settimeout(self.csr_receiver.transfer_timeout)
+        return data_connection
+
+    def _store_file(self, csr_filename):
+        ucs_cimc_server, csr_filepath = self.csr_receiver.match_csr(csr_filename, self.peer_address)
+        if ucs_cimc_server is None:
+            self._close_passive_socket()
+            self._send_reply(f"553 Unexpected file {csr_filename}.")
+            return
+        if self.passive_socket is None and self.active_address is None:
+            self._send_reply("425 Use PORT or PASV first.")
+            return
+        self._send_reply("150 Ready to receive data.")
+        try:
+            data_connection = self._open_data_connection()
+        except OSError:
+            self._send_reply("425 Unable to open the data connection.")
+            return
+
+        def write_chunks(csr_file):
+            with data_connection:
+                while True:
+                    ftp_data = data_connection.recv(65536)
+                    if not ftp_data:
+                        return True
+                    csr_file.write(ftp_data)
+
+        try:
+            _receive_ucs_cimc_csr_file(
+                self.csr_receiver,
+                ucs_cimc_server,
+                csr_filepath,
+                "ftp",
+                self.peer_address,
+                write_chunks
+                )
+        except OSError:
+            self._send_reply("426 Connection closed; transfer aborted.")
+            return
+        self._send_reply("226 Transfer complete.")
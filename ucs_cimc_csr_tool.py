@@ -1,548 +1,1453 @@
-"""
-UCS CIMC Certificate Renewal Tool
-Author: Ugo Emekauwa
-Contact: uemekauw@cisco.com, uemekauwa@gmail.com
-Summary: The UCS CIMC Certificate Renewal Tool automates the process of
-         generating a new standard or self-signed certificate signing request
-         for the Cisco Integrated Management Controller (CIMC) of Cisco UCS
-         C-Series and HyperFlex servers.
-GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
-"""
-
-
-########################
-# MODULE REQUIREMENT 1 #
-########################
-"""
-Provide the required configuration settings. Remove the sample
-values and replace them with your own, where applicable.
-"""
-
-####### Start Configuration Settings - Provide values for the variables listed below. #######
-
-# General Settings
-## Provide a list of IP addresses or hostnames for all UCS CIMCs that need a new certificate signing request (standard or self-signed).
-ucs_cimc_server_list = ["hx-edge-cimc-01","hx-edge-cimc-02","hx-edge-cimc-03",]
-
-## Provide the authentication credentials for the UCS CIMCs.
-## If providing more than one UCS CIMC, the credentials must be the same.
-ucs_cimc_username = "admin"
-ucs_cimc_password = "C1sco12345"
-
-# General Certificate Settings
-request_self_signed_certificate = True
-replace_common_name_with_ucs_cimc_server_list_entries = True
-
-# Self-Signed Certificate Signing Request Settings
-self_signed_csr_common_name = "localhost"
-self_signed_csr_organization = "Cisco (Self-Signed)"
-self_signed_csr_organizational_unit = "Sales"
-self_signed_csr_locality = "San Jose"
-self_signed_csr_state = "California"
-self_signed_csr_country_code = "United States"
-
-# Standard Certificate Signing Request Settings
-## NOTE: Creates CSR file/s for later submission to a certificate authority.
-## Ensure that the variable 'self_signed' is set to False in 'General Certificate Settings' above.
-csr_common_name = "localhost"
-csr_organization = "Cisco"
-csr_organizational_unit = "Sales"
-csr_locality = "San Jose"
-csr_state = "California"
-csr_country_code = "United States"
-csr_email = ""
-csr_remote_server = "198.18.133.94"
-csr_remote_server_protocol = "scp"       # Options: ftp, sftp, tftp, scp, none
-csr_remote_server_user = "root"
-csr_remote_server_password = "C1sco12345"
-csr_remote_server_filepath = "/root/tmp/"     # Example: "/root/sample_folder/". For TFTP, just use "/".
-csr_remote_server_file_extension = ".txt"
-csr_signature_algorithm = "sha384"       # Options: sha1, sha256, sha384, sha512
-
-####### Finish Configuration Settings - The required value entries are complete. #######
-
-
-#############################################################################################################################
-#############################################################################################################################
-
-
-import sys
-import traceback
-import json
-import copy
-import re
-import requests
-import urllib3
-import time
-import xml.etree.ElementTree as et
-
-# Suppress InsecureRequestWarning error messages
-urllib3.disable_warnings()
-
-# Establish function to login to UCS CIMC
-def _request_ucs_cimc_login(
-    ucs_cimc_server,
-    ucs_cimc_username,
-    ucs_cimc_password
-    ):
-    """This is a function to request an HTTP response for a login to a UCS
-    CIMC.
-
-    Args:
-        ucs_cimc_server (str):
-            The hostname or IP address of the UCS CIMC.
-        ucs_cimc_username (str):
-            The admin username of the UCS CIMC.
-        ucs_cimc_password (str):
-            The admin password of the UCS CIMC.
-
-    Returns:
-        A Response class instance for the UCS CIMC Device
-        Console login HTTP request.
-
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the UCS CIMC
-            login HTTP request.
-    """
-    # Login to UCS CIMC
-    ucs_cimc_headers = {
-        "Content-Type": "application/xml"
-        }
-    ucs_cimc_url = f"https://{ucs_cimc_server}/nuova"
-    ucs_cimc_post_body = f"""<aaaLogin inName='{ucs_cimc_username}' inPassword='{ucs_cimc_password}'></aaaLogin>"""
-    try:
-        ucs_cimc_login_request = requests.post(
-            ucs_cimc_url,
-            headers=ucs_cimc_headers,
-            data=ucs_cimc_post_body,
-            verify=False
-            )
-        return ucs_cimc_login_request
-    except Exception as exception_message:
-        print("\nA configuration error has occurred!\n")
-        print(f"Unable to login to the UCS CIMC for "
-              f"{ucs_cimc_server}.\n")
-        print("Exception Message: ")
-        print(exception_message)
-         
-
-# Establish function to obtain UCS CIMC login cookie
-def _obtain_ucs_cimc_login_cookie(
-    ucs_cimc_server,
-    ucs_cimc_username,
-    ucs_cimc_password
-    ):
-    """This is a function to login to a UCS CIMC and obtain the cookies for
-    the login session.
-
-    Args:
-        ucs_cimc_server (str):
-            The hostname or IP address of the UCS CIMC.
-        ucs_cimc_username (str):
-            The admin username of the UCS CIMC.
-        ucs_cimc_password (str):
-            The admin password of the UCS CIMC.
-
-    Returns:
-        A string of the cookie from a Response class instance of a UCS CIMC 
-        login HTTP request.
-
-    Raises:
-        Exception:
-            An exception occurred due to an issue with accessing the provided
-            UCS CIMC.
-    """
-    try:
-        # Login to UCS CIMC
-        print(f"\nLogging in to {ucs_cimc_server}...")
-        ucs_cimc_login = _request_ucs_cimc_login(
-            ucs_cimc_server,
-            ucs_cimc_username,
-            ucs_cimc_password
-            )
-        ucs_cimc_login_text = ucs_cimc_login.text
-        ucs_cimc_login_xml_string_response = et.fromstring(ucs_cimc_login_text)
-        ucs_cimc_login_cookie = ucs_cimc_login_xml_string_response.attrib.get("outCookie")
-        if ucs_cimc_login_cookie:
-            return ucs_cimc_login_cookie
-        else:
-            print("\nA configuration error has occurred!\n")
-            print("Unable to retrieve the login cookie for "
-                  f"{ucs_cimc_server}.\n")
-            print("Exception Message: ")
-            print(ucs_cimc_login_xml_string_response.attrib)
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"Unable to login to {ucs_cimc_server}.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-         
-
-# Establish function to logout of UCS CIMC
-def _request_ucs_cimc_logout(
-    ucs_cimc_server,
-    ucs_cimc_login_cookie
-    ):
-    """This is a function to logout of a UCS CIMC.
-
-    Args:
-        ucs_cimc_server (str):
-            The hostname or IP address of the UCS CIMC.
-        ucs_cimc_login_cookie (str):
-            A string of the cookie from a Response class instance of a UCS CIMC 
-            login HTTP request.
-            
-    Returns:
-        A Response class instance for the UCS CIMC logout HTTP request.
-
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the UCS CIMC
-            logout HTTP request.
-    """
-    # Logout of UCS CIMC
-    ucs_cimc_headers = {
-        "Content-Type": "application/xml"
-        }
-    ucs_cimc_url = f"https://{ucs_cimc_server}/nuova"
-    ucs_cimc_post_body = f"""<aaaLogout cookie='{ucs_cimc_login_cookie}' inCookie='{ucs_cimc_login_cookie}'></aaaLogout>"""
-    try:
-        ucs_cimc_logout_request = requests.post(
-            ucs_cimc_url,
-            headers=ucs_cimc_headers,
-            data=ucs_cimc_post_body,
-            verify=False
-            )
-        return ucs_cimc_logout_request
-    except Exception as exception_message:
-        print("\nA configuration error has occurred!\n")
-        print(f"Unable to logout of the UCS CIMC for "
-              f"{ucs_cimc_server}.\n")
-        print("Exception Message: ")
-        print(exception_message)
-         
-
-# Establish function to generate UCS CIMC self-signed certificate
-def generate_ucs_cimc_self_signed_certificate(
-    ucs_cimc_server,
-    ucs_cimc_username,
-    ucs_cimc_password,
-    common_name="localhost",
-    organization="Cisco (Self-Signed)",
-    organizational_unit="Sales",
-    locality="San Jose",
-    state="California",
-    country_code="United States"
-    ):
-    """"This is a function to generate a self-signed certificate for the UCS
-    CIMC.
-
-    Args:
-        ucs_cimc_server (str):
-            The hostname or IP address of the UCS CIMC.
-        ucs_cimc_username (str):
-            The admin username of the UCS CIMC.
-        ucs_cimc_password (str):
-            The admin password of the UCS CIMC.
-        common_name (str):
-            The common name (CN) for the certificate signing request. The
-            default value is "localhost".
-        organization (str):
-            The organization for the certificate signing request. The
-            default value is "Cisco (Self-Signed)".
-        organizational_unit (str):
-            The organizational unit for the certificate signing request. The
-            default value is "Sales".
-        locality (str):
-            The locality for the certificate signing request. The
-            default value is "San Jose".
-        state (str):
-            The state for the certificate signing request. The
-            default value is "California".
-        country_code (str):
-            The country code for the certificate signing request. The
-            default value is "United States".
-
-    Returns:
-        A Response class instance for the UCS CIMC self-signed certificate
-        HTTP request.
-
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the UCS CIMC
-            self-signed certificate HTTP request.
-    """
-    # Login to UCS CIMC and retrieve login cookie
-    ucs_cimc_login_cookie = _obtain_ucs_cimc_login_cookie(
-        ucs_cimc_server,
-        ucs_cimc_username,
-        ucs_cimc_password
-        )
-    
-    # Generate a Self-Signed Certificate
-    ucs_cimc_headers = {
-        "Content-Type": "application/xml"
-        }
-    ucs_cimc_url = f"https://{ucs_cimc_server}/nuova"
-    ucs_cimc_post_body = f"""<configConfMo cookie='{ucs_cimc_login_cookie}' dn='sys/cert-mgmt/gen-csr-req' inHierarchical='false'>
-<inConfig>
-<generateCertificateSigningRequest
-commonName='{common_name}'
-organization='{organization}'
-organizationalUnit='{organizational_unit}'
-locality='{locality}'
-state='{state}'
-countryCode='{country_code}'
-dn='sys/cert-mgmt/gen-csr-req'
-selfSigned='yes'
-/>
-</inConfig>
-</configConfMo>"""
-    print("\nGenerating the self-signed certificate...")
-    try:
-        ucs_cimc_self_signed_certificate_generation_request = requests.post(
-            ucs_cimc_url,
-            headers=ucs_cimc_headers,
-            data=ucs_cimc_post_body,
-            verify=False
-            )
-        print(f"- Self-Signed Certificate Signing Request Status Code: {ucs_cimc_self_signed_certificate_generation_request.status_code}")
-        print(f"- Self-Signed Certificate Signing Request Response: {ucs_cimc_self_signed_certificate_generation_request.text}")
-
-        # Logout of UCS CIMC
-        print(f"Logging out of {ucs_cimc_server}...")
-        _request_ucs_cimc_logout(
-            ucs_cimc_server,
-            ucs_cimc_login_cookie
-            )
-        
-        return ucs_cimc_self_signed_certificate_generation_request
-    except Exception as exception_message:
-        print("\nA configuration error has occurred!\n")
-        print(f"Unable to complete generating a self-signed certificate for "
-              f"{ucs_cimc_server}.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-
-
-# Establish function to generate UCS CIMC certificate signing request
-def generate_ucs_cimc_certificate_signing_request(
-    ucs_cimc_server,
-    ucs_cimc_username,
-    ucs_cimc_password,
-    common_name="localhost",
-    organization="Cisco",
-    organizational_unit="Sales",
-    locality="San Jose",
-    state="California",
-    country_code="United States",
-    email="",
-    remote_server="",
-    remote_server_protocol="none",
-    remote_server_user="",
-    remote_server_password="",
-    remote_server_filepath="",
-    remote_server_file_extension=".txt",
-    signature_algorithm="sha384"
-    ):
-    """"This is a function to generate a certificate signing request (CSR) for
-    the UCS CIMC.
-
-    Args:
-        ucs_cimc_server (str):
-            The hostname or IP address of the UCS CIMC.
-        ucs_cimc_username (str):
-            The admin username of the UCS CIMC.
-        ucs_cimc_password (str):
-            The admin password of the UCS CIMC.
-        common_name (str):
-            The common name (CN) for the certificate signing request. The
-            default value is "localhost".
-        organization (str):
-            The organization for the certificate signing request. The
-            default value is "Cisco (Self-Signed)".
-        organizational_unit (str):
-            The organizational unit for the certificate signing request. The
-            default value is "Sales".
-        locality (str):
-            The locality for the certificate signing request. The
-            default value is "San Jose".
-        state (str):
-            The state for the certificate signing request. The
-            default value is "California".
-        country_code (str):
-            The country code for the certificate signing request. The
-            default value is "United States".
-        email (str):
-            The email address for the certificate signing request. The
-            default value is an empty string ("").
-        remote_server (str):
-            The IP address or hostname of the remote server to store the
-            certificate signing request. The default value is an empty string
-            ("").
-        remote_server_protocol (str):
-            The protocol used to access the remote server when storing the
-            certificate signing request. The options are ftp, sftp, tftp, scp
-            and none. The default value is "none".
-        remote_server_user (str):
-            The username for the remote server. The default value is an empty
-            string ("").
-        remote_server_password (str):
-            The password for the remote server. The default value is an empty
-            string ("").
-        remote_server_filepath (str):
-            The filepath on the remote server for storing the certificate
-            signing request. An example is "/root/sample_folder/". The default
-            value is an empty string ("").
-        remote_server_file_extension (str):
-            The file extension for the certificate signing request when stored
-            on the remote server. The default value is ".txt".
-        signature_algorithm (str):
-            The signature algorithm for the certificate signing request. The
-            options are sha1, sha256, sha384 and sha512. The default value is
-            "sha384".
-
-    Returns:
-        A Response class instance for the UCS CIMC CSR HTTP request.
-
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the UCS CIMC CSR HTTP
-            request.
-    """
-    # Login to UCS CIMC and retrieve login cookie
-    ucs_cimc_login_cookie = _obtain_ucs_cimc_login_cookie(
-        ucs_cimc_server,
-        ucs_cimc_username,
-        ucs_cimc_password
-        )
-    
-    # Generate a Certificate Signing Request
-    ucs_cimc_headers = {
-        "Content-Type": "application/xml"
-        }
-    ucs_cimc_url = f"https://{ucs_cimc_server}/nuova"
-    ucs_cimc_post_body = f"""<configConfMo cookie='{ucs_cimc_login_cookie}' dn='sys/cert-mgmt/gen-csr-req' inHierarchical='false'>
-<inConfig>
-<generateCertificateSigningRequest
-commonName='{common_name}'
-organization='{organization}'
-organizationalUnit='{organizational_unit}'
-locality='{locality}'
-state='{state}'
-countryCode='{country_code}'
-email='{email}'
-protocol='{remote_server_protocol}'
-remoteServer='{remote_server}'
-user='{remote_server_user}'
-pwd='{remote_server_password}'
-remoteFile='{remote_server_filepath}{common_name}-csr{remote_server_file_extension}'
-signatureAlgorithm='{signature_algorithm}'
-dn='sys/cert-mgmt/gen-csr-req'
-/>
-</inConfig>
-</configConfMo>"""
-    if not email:
-        ucs_cimc_post_body = ucs_cimc_post_body.replace("\nemail=''", "")
-    if not remote_server:
-        ucs_cimc_post_body = ucs_cimc_post_body.replace("\nremoteServer=''", "")
-    if not remote_server_filepath:
-        ucs_cimc_post_body = ucs_cimc_post_body.replace("\nremoteFile=''", "")
-    print("\nGenerating the certificate signing request...")
-    try:
-        ucs_cimc_certificate_signing_request = requests.post(
-            ucs_cimc_url,
-            headers=ucs_cimc_headers,
-            data=ucs_cimc_post_body,
-            verify=False
-            )
-        print(f"- Certificate Signing Request Status Code: {ucs_cimc_certificate_signing_request.status_code}")
-        print(f"- Certificate Signing Request Response: {ucs_cimc_certificate_signing_request.text}")
-
-        # Logout of UCS CIMC
-        print(f"Logging out of {ucs_cimc_server}...")
-        _request_ucs_cimc_logout(
-            ucs_cimc_server,
-            ucs_cimc_login_cookie
-            )
-        
-        return ucs_cimc_certificate_signing_request
-    except Exception as exception_message:
-        print("\nA configuration error has occurred!\n")
-        print(f"Unable to complete the certificate signing request for "
-              f"{ucs_cimc_server}.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-
-
-def main():
-    # Starting the UCS CIMC Certificate Renewal Tool
-    print(f"\nStarting the UCS CIMC Certificate Renewal Tool.")
-
-    # Cycle through the provided UCS CIMC server list and perform the certificate signing requests
-    if ucs_cimc_server_list:
-        for ucs_cimc_server in ucs_cimc_server_list:
-            if request_self_signed_certificate:
-                if replace_common_name_with_ucs_cimc_server_list_entries:
-                    self_signed_csr_common_name = ucs_cimc_server
-                try:
-                    generate_ucs_cimc_self_signed_certificate(
-                        ucs_cimc_server=ucs_cimc_server,
-                        ucs_cimc_username=ucs_cimc_username,
-                        ucs_cimc_password=ucs_cimc_password,
-                        common_name=self_signed_csr_common_name,
-                        organization=self_signed_csr_organization,
-                        organizational_unit=self_signed_csr_organizational_unit,
-                        locality=self_signed_csr_locality,
-                        state=self_signed_csr_state,
-                        country_code=self_signed_csr_country_code
-                        )   
-                except Exception:
-                    print("\nA configuration error has occurred!\n")
-                    print("There was an issue creating the self-signed "
-                          f"certificate for {ucs_cimc_server}.\n")
-                    print("Exception Message: ")
-                    traceback.print_exc()
-            else:
-                if replace_common_name_with_ucs_cimc_server_list_entries:
-                    csr_common_name = ucs_cimc_server
-                try:
-                    generate_ucs_cimc_certificate_signing_request(
-                        ucs_cimc_server=ucs_cimc_server,
-                        ucs_cimc_username=ucs_cimc_username,
-                        ucs_cimc_password=ucs_cimc_password,
-                        common_name=csr_common_name,
-                        organization=csr_organization,
-                        organizational_unit=csr_organizational_unit,
-                        locality=csr_locality,
-                        state=csr_state,
-                        country_code=csr_country_code,
-                        email=csr_email,
-                        remote_server=csr_remote_server,
-                        remote_server_protocol=csr_remote_server_protocol,
-                        remote_server_user=csr_remote_server_user,
-                        remote_server_password=csr_remote_server_password,
-                        remote_server_filepath=csr_remote_server_filepath,
-                        remote_server_file_extension=csr_remote_server_file_extension,
-                        signature_algorithm=csr_signature_algorithm
-                        )   
-                except Exception:
-                    print("\nA configuration error has occurred!\n")
-                    print("There was an issue creating the certificate signing "
-                          f"request for {ucs_cimc_server}.\n")
-                    print("Exception Message: ")
-                    traceback.print_exc()
-    else:
-        print("\nThere are no certificate signing requests to perform.")
-        print("There were no UCS CIMC servers provided.")
-
-    # UCS CIMC Certificate Renewal Tool completion
-    print(f"\nThe UCS CIMC Certificate Renewal Tool has completed.\n")
-
-
-if __name__ == "__main__":
-    main()
-
-# Exiting the UCS CIMC Certificate Renewal Tool
-sys.exit(0)
+"""
+UCS CIMC Certificate Renewal Tool
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC Certificate Renewal Tool automates the process of
+         generating a new standard or self-signed certificate signing request
+         for the Cisco Integrated Management Controller (CIMC) of Cisco UCS
+         C-Series and HyperFlex servers. The UCS CIMC XML API client,
+         certificate operations and fleet runner are provided by the
+         ucs_cimc_client, ucs_cimc_operations and ucs_cimc_runner modules.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+########################
+# MODULE REQUIREMENT 1 #
+########################
+"""
+Provide the required configuration settings. Remove the sample
+values and replace them with your own, where applicable.
+"""
+
+####### Start Configuration Settings - Provide values for the variables listed below. #######
+
+# General Settings
+## Provide a list of IP addresses or hostnames for all UCS CIMCs that need a new certificate signing request (standard or self-signed).
+ucs_cimc_server_list = ["hx-edge-cimc-01","hx-edge-cimc-02","hx-edge-cimc-03",]
+
+## Optionally, provide the filepath of a CSV or JSON lines inventory of UCS CIMCs to use instead of 'ucs_cimc_server_list'.
+## Use "-" to read the inventory from standard input. Each record must provide a 'ucs_cimc_server' field and may
+## override the credentials and certificate settings for that UCS CIMC with the fields 'ucs_cimc_username',
+## 'ucs_cimc_password', 'common_name', 'organization', 'organizational_unit', 'locality', 'state', 'country_code',
+## 'email', 'remote_server', 'remote_server_protocol', 'remote_server_user', 'remote_server_password',
+## 'remote_server_filepath', 'remote_server_file_extension' and 'signature_algorithm'. A 'cluster' field can be provided
+## to schedule the UCS CIMCs of a cluster together (see 'ucs_cimc_group_by' below).
+ucs_cimc_inventory_filepath = ""
+ucs_cimc_inventory_format = ""       # Options: csv, jsonl. Leave empty to detect the format.
+
+## Provide the authentication credentials for the UCS CIMCs.
+## If providing more than one UCS CIMC, the credentials must be the same.
+ucs_cimc_username = "admin"
+ucs_cimc_password = "C1sco12345"
+
+# General Certificate Settings
+request_self_signed_certificate = True
+replace_common_name_with_ucs_cimc_server_list_entries = True
+
+## Set 'certificate_request_validation_enabled' to True to check the certificate request settings of every UCS CIMC
+## before contacting any of them, such as the signature algorithm, the remote server protocol and the length of the
+## common name. If any UCS CIMC has invalid settings, they are all listed and the run stops before the first login.
+## The inventory is streamed once to validate it and again for the run, so only the invalid UCS CIMCs are kept in
+## memory, unless it is read from standard input. Run the tool with --dry-run to print the planned requests
+## without contacting the UCS CIMCs, or with --plan to write them with their XML API request bodies to a file.
+certificate_request_validation_enabled = True
+
+# Self-Signed Certificate Signing Request Settings
+self_signed_csr_common_name = "localhost"
+self_signed_csr_organization = "Cisco (Self-Signed)"
+self_signed_csr_organizational_unit = "Sales"
+self_signed_csr_locality = "San Jose"
+self_signed_csr_state = "California"
+self_signed_csr_country_code = "United States"
+
+# Standard Certificate Signing Request Settings
+## NOTE: Creates CSR file/s for later submission to a certificate authority.
+## Ensure that the variable 'self_signed' is set to False in 'General Certificate Settings' above.
+csr_common_name = "localhost"
+csr_organization = "Cisco"
+csr_organizational_unit = "Sales"
+csr_locality = "San Jose"
+csr_state = "California"
+csr_country_code = "United States"
+csr_email = ""
+csr_remote_server = "198.18.133.94"
+csr_remote_server_protocol = "scp"       # Options: ftp, sftp, tftp, scp, none
+csr_remote_server_user = "root"
+csr_remote_server_password = "C1sco12345"
+csr_remote_server_filepath = "/root/tmp/"     # Example: "/root/sample_folder/". For TFTP, just use "/".
+csr_remote_server_file_extension = ".txt"
+csr_signature_algorithm = "sha384"       # Options: sha1, sha256, sha384, sha512
+
+## Set 'csr_status_polling_enabled' to True to wait for each UCS CIMC to finish generating the certificate signing
+## request and storing it on the remote server. The polling interval starts at 'csr_status_polling_initial_interval'
+## seconds and grows up to 'csr_status_polling_max_interval' seconds while the status is unchanged.
+csr_status_polling_enabled = True
+csr_status_polling_initial_interval = 2
+csr_status_polling_max_interval = 30
+csr_status_polling_timeout = 600
+
+## Set 'csr_receiver_enabled' to True to receive the certificate signing request files with a TFTP and FTP receiver
+## built into the tool, instead of a separate file server. Set 'csr_remote_server' to an address of this system that
+## the UCS CIMCs can reach and 'csr_remote_server_protocol' to "tftp" or "ftp". The received files are written to
+## 'csr_receiver_directory', and the tool waits up to 'csr_receiver_timeout' seconds for them to arrive.
+csr_receiver_enabled = False
+csr_receiver_bind_address = "0.0.0.0"
+csr_receiver_tftp_port = 69
+csr_receiver_ftp_port = 21
+csr_receiver_directory = "received_csrs"
+csr_receiver_timeout = 120
+
+# Signed Certificate Upload Settings
+## Provide the directory of the certificates signed by your certificate authority (CA) to upload them to the UCS CIMCs
+## instead of generating certificate signing requests. This can also be set with the --upload-certificates argument.
+## Each PEM certificate is matched to the UCS CIMC with the same common name and uploaded as soon as it appears in the
+## directory, which is scanned every 'signed_certificate_upload_scan_interval' seconds. The upload stops once every
+## UCS CIMC has a certificate or no new certificate has appeared for 'signed_certificate_upload_idle_timeout' seconds.
+## Set the idle timeout to 0 to upload only the certificates already in the directory.
+signed_certificate_upload_directory = ""
+signed_certificate_upload_scan_interval = 2
+signed_certificate_upload_idle_timeout = 60
+
+# Certificate Verification Settings
+## Set 'tls_verification_enabled' to True to wait for each UCS CIMC to restart its HTTPS service after a self-signed
+## certificate renewal, then check that the certificate it serves has the requested common name, organization and
+## organizational unit and valid dates. After a signed certificate upload, the served certificate must be the uploaded one. Each UCS CIMC is probed every 'tls_verification_interval' seconds until it
+## is ready or 'tls_verification_timeout' seconds have passed.
+tls_verification_enabled = True
+tls_verification_interval = 2
+tls_verification_timeout = 300
+
+# Certificate Renewal Pre-Check Settings
+## Set 'renewal_precheck_enabled' to True to read the current certificate of each UCS CIMC before making any changes.
+## Only UCS CIMCs with a certificate expiring within 'renewal_precheck_expiry_window_days' days, or with a common name
+## that does not match the requested common name, will have a new certificate signing request generated.
+renewal_precheck_enabled = False
+renewal_precheck_expiry_window_days = 30
+renewal_precheck_require_common_name_match = True
+
+# Certificate Inventory Settings
+## Run the tool with --certificate-inventory to read the current certificate (subject, issuer, serial number and expiry)
+## of every UCS CIMC without making any changes, and store it with the time it was read in the SQLite cache at
+## 'certificate_inventory_cache_filepath'. Later runs only read the UCS CIMCs whose cached certificate is older than
+## 'certificate_inventory_cache_ttl' seconds or was changed by the tool since it was read. Set
+## 'renewal_precheck_use_inventory_cache' to True to let the renewal pre-check decide from the cached certificates that
+## are still current, instead of logging in to those UCS CIMCs. Set the filepath to an empty string ("") to disable the
+## cache.
+certificate_inventory_cache_filepath = "ucs_cimc_certificate_inventory.sqlite3"
+certificate_inventory_cache_ttl = 86400
+renewal_precheck_use_inventory_cache = True
+
+# Performance Settings
+## Provide the maximum number of UCS CIMCs to process concurrently. A value of 1 processes the UCS CIMCs one at a time.
+ucs_cimc_max_concurrent_workers = 1
+
+## Provide the client engine used to communicate with the UCS CIMCs.
+## The asyncio engine runs all UCS CIMC sessions from a single thread, limited by 'ucs_cimc_max_concurrent_sessions'.
+ucs_cimc_client_engine = "threads"       # Options: threads, asyncio
+ucs_cimc_max_concurrent_sessions = 100
+
+## Provide the grouping used to protect resources shared by several UCS CIMCs. Set 'ucs_cimc_group_by' to
+## "remote_server" to group the UCS CIMCs by the remote server receiving their certificate signing requests, or to
+## "cluster" to group them by the 'cluster' field of the inventory. Within each group, at most
+## 'ucs_cimc_group_max_concurrent' UCS CIMCs are processed at once and at most 'ucs_cimc_group_rate' UCS CIMCs are
+## started per second, after an initial burst of 'ucs_cimc_group_burst'. Set a limit to 0 to disable it.
+ucs_cimc_group_by = "none"       # Options: none, remote_server, cluster
+ucs_cimc_group_max_concurrent = 0
+ucs_cimc_group_rate = 0
+ucs_cimc_group_burst = 1
+
+## Provide the sizes of the canary waves to process before the rest of the UCS CIMCs, for example [1, 10, 50].
+## After each canary wave, the run stops if more than 'ucs_cimc_canary_max_failure_rate' of the wave failed.
+## Leave the list empty to process all UCS CIMCs in a single wave.
+ucs_cimc_canary_wave_sizes = []
+ucs_cimc_canary_max_failure_rate = 0.0
+
+## Provide the number of worker processes to split the UCS CIMCs across. Each worker process runs one shard of the
+## UCS CIMCs with its own connections, and the results of all shards are combined once they complete. Set
+## 'ucs_cimc_shard_by' to "group" to keep the UCS CIMCs of each 'ucs_cimc_group_by' group in the same shard, so the
+## group limits still apply to the whole group, or to "host" to spread the UCS CIMCs evenly across the shards.
+## To run the shards on separate systems instead, run the tool with --shard i/K on each system, then combine the
+## journal and metrics files of the shards with --merge.
+ucs_cimc_shard_processes = 1
+ucs_cimc_shard_by = "host"       # Options: host, group
+
+## Provide the connect and read timeouts in seconds for requests to the UCS CIMCs.
+ucs_cimc_connect_timeout = 10
+ucs_cimc_read_timeout = 60
+
+## Provide the retry settings for idempotent requests (login, resolve and logout) to the UCS CIMCs.
+## Retries wait a random time of up to 'ucs_cimc_retry_backoff_factor' seconds, doubling with each retry.
+ucs_cimc_max_retries = 3
+ucs_cimc_retry_backoff_factor = 1
+ucs_cimc_retry_backoff_max = 30
+
+## Provide the circuit breaker settings. After the given number of consecutive failures, requests to a UCS CIMC are
+## stopped until the reset timeout in seconds has passed.
+ucs_cimc_circuit_breaker_failure_threshold = 5
+ucs_cimc_circuit_breaker_reset_timeout = 300
+
+## Provide the filepath of the checkpoint journal that records the outcome for each UCS CIMC as it completes.
+## Set 'resume_from_journal' to True (or run with --resume) to skip UCS CIMCs already completed in a previous run.
+## Set the filepath to an empty string ("") to disable the journal.
+ucs_cimc_journal_filepath = "ucs_cimc_csr_tool_journal.jsonl"
+resume_from_journal = False
+
+## Provide the filepaths to write the per-phase latency metrics of each run to. The JSON lines file holds one record
+## per UCS CIMC and phase, followed by a summary record. The Prometheus textfile can be read by the node exporter
+## textfile collector. Set a filepath to an empty string ("") to skip writing that file.
+ucs_cimc_metrics_filepath = ""
+ucs_cimc_metrics_prometheus_filepath = ""
+
+## Provide the verbosity of the progress written to the console while the UCS CIMCs are processed. "quiet" only writes
+## warnings and errors, "normal" adds the progress of each UCS CIMC, and "verbose" adds every XML API request and
+## response and the tracebacks of errors. The password and cookie values are always redacted. The progress is written
+## from a queue by a background thread, and the plans and summaries are printed at every verbosity.
+ucs_cimc_event_log_verbosity = "normal"       # Options: quiet, normal, verbose
+
+## Optionally, provide the filepath of a JSON lines event log, with one record per event holding the UCS CIMC, phase,
+## status, duration and error class, written with the 'ucs_cimc_event_log_file_verbosity' verbosity.
+## Set the filepath to an empty string ("") to disable the event log file.
+ucs_cimc_event_log_filepath = ""
+ucs_cimc_event_log_file_verbosity = "verbose"       # Options: quiet, normal, verbose
+
+## Set 'ucs_cimc_dns_pre_resolution_enabled' to True to resolve the hostnames of all UCS CIMCs concurrently before
+## the run, with up to 'ucs_cimc_dns_max_concurrent_lookups' lookups at once. Each UCS CIMC is then connected to at its
+## resolved IP address, while the TLS server name (SNI) and the HTTP Host header keep its hostname. Resolved addresses
+## are reused for 'ucs_cimc_dns_cache_ttl' seconds, then resolved again in the background while the expired address is
+## still used. UCS CIMCs whose hostname cannot be resolved, or whose lookup takes longer than
+## 'ucs_cimc_dns_resolution_timeout' seconds, are listed before the run and skipped. If the resolver stops responding,
+## the remaining hostnames are not attempted, and their UCS CIMCs are resolved when they are contacted.
+ucs_cimc_dns_pre_resolution_enabled = True
+ucs_cimc_dns_max_concurrent_lookups = 32
+ucs_cimc_dns_resolution_timeout = 10
+ucs_cimc_dns_cache_ttl = 300
+
+## Provide the maximum number of UCS CIMC login sessions kept open for reuse across operations.
+## Sessions are logged out when they are evicted or when the tool completes.
+ucs_cimc_max_cached_sessions = 100
+
+####### Finish Configuration Settings - The required value entries are complete. #######
+
+
+#############################################################################################################################
+#############################################################################################################################
+
+
+import sys
+import os
+import argparse
+import json
+import logging
+import contextlib
+import functools
+import time
+
+# The UCS CIMC XML API client, certificate operations and fleet runner live in
+# separate library modules. Their public API is also available from this
+# module, so existing scripts that import ucs_cimc_csr_tool keep working.
+from ucs_cimc_client import (
+    UcsCimcRetryPolicy,
+    UcsCimcCircuitBreaker,
+    UcsCimcCircuitOpenError,
+    UcsCimcLoginError,
+    UcsCimcRunMetrics,
+    UcsCimcSession,
+    UcsCimcSessionCache,
+    UcsCimcResolverCache,
+    get_ucs_cimc_circuit_breaker,
+    set_ucs_cimc_resolver_cache,
+    set_ucs_cimc_client_settings,
+    set_ucs_cimc_run_metrics,
+    get_ucs_cimc_initial_certificate_fingerprint,
+    clear_ucs_cimc_initial_certificate_fingerprints,
+    UcsCimcEventLog,
+    log_ucs_cimc_event,
+    flush_ucs_cimc_event_log,
+    redact_ucs_cimc_xml_api_body,
+    _get_ucs_cimc_server_host
+    )
+from ucs_cimc_operations import (
+    generate_ucs_cimc_self_signed_certificate,
+    generate_ucs_cimc_certificate_signing_request,
+    upload_ucs_cimc_signed_certificate,
+    async_generate_ucs_cimc_self_signed_certificate,
+    async_generate_ucs_cimc_certificate_signing_request,
+    validate_ucs_cimc_certificate_request,
+    render_ucs_cimc_certificate_request,
+    get_ucs_cimc_current_certificate,
+    summarize_ucs_cimc_current_certificate,
+    read_ucs_cimc_fleet_current_certificates,
+    evaluate_ucs_cimc_certificate_renewal,
+    check_ucs_cimc_fleet_certificate_renewal,
+    get_ucs_cimc_certificate_signing_request_status,
+    poll_ucs_cimc_fleet_certificate_signing_request_completion,
+    UcsCimcCertificateParseError,
+    parse_ucs_cimc_der_certificate,
+    probe_ucs_cimc_tls_certificate,
+    evaluate_ucs_cimc_served_certificate,
+    verify_ucs_cimc_fleet_tls_certificates,
+    read_ucs_cimc_pem_certificate,
+    UcsCimcSignedCertificateWatcher
+    )
+from ucs_cimc_runner import (
+    UcsCimcInventoryRecord,
+    load_ucs_cimc_inventory,
+    _get_ucs_cimc_inventory_overrides,
+    UcsCimcRunJournal,
+    UcsCimcCertificateInventoryCache,
+    UcsCimcGroupScheduler,
+    run_ucs_cimc_canary_waves,
+    parse_ucs_cimc_shard,
+    get_ucs_cimc_shard_index,
+    select_ucs_cimc_shard,
+    get_ucs_cimc_shard_filepath,
+    run_ucs_cimc_shard_processes,
+    run_ucs_cimc_fleet,
+    async_run_ucs_cimc_fleet,
+    set_ucs_cimc_csr_receiver,
+    _expect_ucs_cimc_csr,
+    _print_ucs_cimc_fleet_summary,
+    _print_ucs_cimc_run_metrics_summary,
+    UcsCimcRunSettings,
+    run_ucs_cimc_certificate_renewal
+    )
+
+# Establish function to obtain the login credentials for a UCS CIMC
+def _get_ucs_cimc_credentials(ucs_cimc_server):
+    """This is a function to obtain the login credentials for a UCS CIMC,
+    based on the inventory and the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, or a
+            UcsCimcInventoryRecord class instance.
+
+    Returns:
+        A tuple of the username and password for the UCS CIMC.
+    """
+    ucs_cimc_inventory_overrides = _get_ucs_cimc_inventory_overrides(ucs_cimc_server)
+    return (
+        ucs_cimc_inventory_overrides.get("ucs_cimc_username", ucs_cimc_username),
+        ucs_cimc_inventory_overrides.get("ucs_cimc_password", ucs_cimc_password)
+        )
+
+
+# Establish function to obtain the certificate request settings for a UCS CIMC
+def _get_ucs_cimc_certificate_request_settings(ucs_cimc_server):
+    """This is a function to obtain the keyword arguments for generating a
+    self-signed certificate or a certificate signing request for a UCS CIMC,
+    based on the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, or a
+            UcsCimcInventoryRecord class instance whose settings take
+            precedence over the configuration settings.
+
+    Returns:
+        A tuple of a boolean indicating whether a self-signed certificate is
+        requested and a dictionary of keyword arguments for the matching
+        generate function.
+    """
+    ucs_cimc_inventory_overrides = _get_ucs_cimc_inventory_overrides(ucs_cimc_server)
+    if request_self_signed_certificate:
+        if replace_common_name_with_ucs_cimc_server_list_entries:
+            common_name = _get_ucs_cimc_server_host(ucs_cimc_server)
+        else:
+            common_name = self_signed_csr_common_name
+        ucs_cimc_certificate_request_settings = {
+            "ucs_cimc_server": ucs_cimc_server,
+            "ucs_cimc_username": ucs_cimc_username,
+            "ucs_cimc_password": ucs_cimc_password,
+            "common_name": common_name,
+            "organization": self_signed_csr_organization,
+            "organizational_unit": self_signed_csr_organizational_unit,
+            "locality": self_signed_csr_locality,
+            "state": self_signed_csr_state,
+            "country_code": self_signed_csr_country_code
+            }
+    else:
+        if replace_common_name_with_ucs_cimc_server_list_entries:
+            common_name = _get_ucs_cimc_server_host(ucs_cimc_server)
+        else:
+            common_name = csr_common_name
+        ucs_cimc_certificate_request_settings = {
+            "ucs_cimc_server": ucs_cimc_server,
+            "ucs_cimc_username": ucs_cimc_username,
+            "ucs_cimc_password": ucs_cimc_password,
+            "common_name": common_name,
+            "organization": csr_organization,
+            "organizational_unit": csr_organizational_unit,
+            "locality": csr_locality,
+            "state": csr_state,
+            "country_code": csr_country_code,
+            "email": csr_email,
+            "remote_server": csr_remote_server,
+            "remote_server_protocol": csr_remote_server_protocol,
+            "remote_server_user": csr_remote_server_user,
+            "remote_server_password": csr_remote_server_password,
+            "remote_server_filepath": csr_remote_server_filepath,
+            "remote_server_file_extension": csr_remote_server_file_extension,
+            "signature_algorithm": csr_signature_algorithm
+            }
+    ucs_cimc_certificate_request_settings.update(
+        (ucs_cimc_setting_name, ucs_cimc_setting_value)
+        for ucs_cimc_setting_name, ucs_cimc_setting_value in ucs_cimc_inventory_overrides.items()
+        if ucs_cimc_setting_name in ucs_cimc_certificate_request_settings
+        )
+    return request_self_signed_certificate, ucs_cimc_certificate_request_settings
+
+
+# Establish function to request a certificate for a UCS CIMC using the configuration settings
+def _request_ucs_cimc_certificate(
+    ucs_cimc_server,
+    ucs_cimc_session_cache=None
+    ):
+    """This is a function to generate a self-signed certificate or a
+    certificate signing request for a UCS CIMC, based on the provided
+    configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            An optional UcsCimcSessionCache class instance to obtain the login
+            session for the UCS CIMC from. The default value is None, which
+            logs in and out of the UCS CIMC for this request only.
+
+    Returns:
+        A Response class instance for the UCS CIMC self-signed certificate or
+        CSR HTTP request.
+    """
+    self_signed, ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)
+    if self_signed:
+        ucs_cimc_generate_function = generate_ucs_cimc_self_signed_certificate
+    else:
+        ucs_cimc_generate_function = generate_ucs_cimc_certificate_signing_request
+        _expect_ucs_cimc_csr(ucs_cimc_certificate_request_settings)
+    if ucs_cimc_session_cache is None:
+        return ucs_cimc_generate_function(**ucs_cimc_certificate_request_settings)
+    with ucs_cimc_session_cache.lease_session(
+        ucs_cimc_server,
+        *_get_ucs_cimc_credentials(ucs_cimc_server)
+        ) as ucs_cimc_session:
+        return ucs_cimc_generate_function(
+            ucs_cimc_session=ucs_cimc_session,
+            **ucs_cimc_certificate_request_settings
+            )
+
+
+# Establish function to check whether a UCS CIMC needs a certificate renewal using the configuration settings
+def _check_ucs_cimc_certificate_renewal(
+    ucs_cimc_server,
+    ucs_cimc_session_cache,
+    ucs_cimc_certificate_cache=None
+    ):
+    """This is a function to read the current certificate of a UCS CIMC and
+    determine whether it needs to be renewed, based on the provided
+    configuration settings. If the current certificate cannot be read, the
+    UCS CIMC is renewed.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            The UcsCimcSessionCache class instance to obtain the login session
+            for the UCS CIMC from.
+        ucs_cimc_certificate_cache (UcsCimcCertificateInventoryCache):
+            An optional certificate inventory cache. A cached certificate
+            that is still current is used instead of reading the UCS CIMC,
+            and a certificate read from the UCS CIMC is stored in the cache.
+            The default value is None.
+
+    Returns:
+        A dictionary containing the renewal decision for the UCS CIMC.
+    """
+    ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)[1]
+    ucs_cimc_renewal_check_result = {
+        "ucs_cimc_server": ucs_cimc_server,
+        "renewal_required": True,
+        "reason": "",
+        "current_certificate": None,
+        "cached": False
+        }
+    ucs_cimc_certificate_cache_entry = None
+    if ucs_cimc_certificate_cache is not None:
+        ucs_cimc_certificate_cache_entry = ucs_cimc_certificate_cache.get(ucs_cimc_server)
+        if ucs_cimc_certificate_cache.is_stale(ucs_cimc_certificate_cache_entry):
+            ucs_cimc_certificate_cache_entry = None
+    if ucs_cimc_certificate_cache_entry is not None:
+        ucs_cimc_current_certificate = ucs_cimc_certificate_cache_entry["certificate_attributes"]
+        ucs_cimc_renewal_check_result["cached"] = True
+    else:
+        try:
+            with ucs_cimc_session_cache.lease_session(
+                ucs_cimc_server,
+                *_get_ucs_cimc_credentials(ucs_cimc_server)
+                ) as ucs_cimc_session:
+                ucs_cimc_current_certificate = get_ucs_cimc_current_certificate(ucs_cimc_session)
+        except Exception as exception_message:
+            ucs_cimc_renewal_check_result["reason"] = f"Unable to read the current certificate: {exception_message}"
+            if ucs_cimc_certificate_cache is not None:
+                ucs_cimc_certificate_cache.record_error(ucs_cimc_server, ucs_cimc_renewal_check_result["reason"])
+            return ucs_cimc_renewal_check_result
+        if ucs_cimc_certificate_cache is not None:
+            ucs_cimc_certificate_cache.store_certificate(
+                ucs_cimc_server,
+                summarize_ucs_cimc_current_certificate(ucs_cimc_current_certificate)
+                )
+    ucs_cimc_renewal_check_result["current_certificate"] = ucs_cimc_current_certificate
+    ucs_cimc_renewal_check_result["renewal_required"], ucs_cimc_renewal_check_result["reason"] = evaluate_ucs_cimc_certificate_renewal(
+        ucs_cimc_current_certificate,
+        expected_common_name=(
+            ucs_cimc_certificate_request_settings["common_name"]
+            if renewal_precheck_require_common_name_match else None
+            ),
+        expiry_window_days=renewal_precheck_expiry_window_days
+        )
+    return ucs_cimc_renewal_check_result
+
+
+# Establish function to read the current certificate of a UCS CIMC into the certificate inventory cache
+def _read_ucs_cimc_current_certificate(
+    ucs_cimc_server,
+    ucs_cimc_session_cache,
+    ucs_cimc_certificate_cache
+    ):
+    """This is a function to read the current certificate of a UCS CIMC,
+    without making any changes to it, and store it in the certificate
+    inventory cache, based on the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            The UcsCimcSessionCache class instance to obtain the login session
+            for the UCS CIMC from.
+        ucs_cimc_certificate_cache (UcsCimcCertificateInventoryCache):
+            The certificate inventory cache to store the certificate in.
+
+    Returns:
+        A dictionary containing the outcome of the read for the UCS CIMC.
+    """
+    ucs_cimc_read_start_time = time.monotonic()
+    try:
+        with ucs_cimc_session_cache.lease_session(
+            ucs_cimc_server,
+            *_get_ucs_cimc_credentials(ucs_cimc_server)
+            ) as ucs_cimc_session:
+            ucs_cimc_certificate_summary = summarize_ucs_cimc_current_certificate(
+                get_ucs_cimc_current_certificate(ucs_cimc_session)
+                )
+    except Exception as exception_message:
+        ucs_cimc_certificate_cache.record_error(
+            ucs_cimc_server,
+            f"Unable to read the current certificate: {exception_message}"
+            )
+        log_ucs_cimc_event(
+            "Unable to read the current certificate.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_inventory",
+            status="failed",
+            duration=time.monotonic() - ucs_cimc_read_start_time,
+            error=exception_message,
+            level=logging.WARNING
+            )
+        return {"ucs_cimc_server": ucs_cimc_server, "succeeded": False, "error": str(exception_message)}
+    ucs_cimc_certificate_cache.store_certificate(ucs_cimc_server, ucs_cimc_certificate_summary)
+    log_ucs_cimc_event(
+        f"Read the certificate for {ucs_cimc_certificate_summary['subject'] or 'an unknown subject'}.",
+        ucs_cimc_server=ucs_cimc_server,
+        phase="certificate_inventory",
+        status="succeeded",
+        duration=time.monotonic() - ucs_cimc_read_start_time
+        )
+    return {"ucs_cimc_server": ucs_cimc_server, "succeeded": True, "error": ""}
+
+
+# Establish function to print the cached certificates of the UCS CIMCs
+def _print_ucs_cimc_certificate_inventory(
+    ucs_cimc_certificate_cache,
+    ucs_cimc_servers
+    ):
+    """This is a function to print the cached certificate of each UCS CIMC,
+    with the age of the cache entry, and count the certificates expiring
+    within the renewal pre-check window.
+
+    Args:
+        ucs_cimc_certificate_cache (UcsCimcCertificateInventoryCache):
+            The certificate inventory cache.
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs.
+    """
+    import datetime
+    ucs_cimc_current_time = time.time()
+    ucs_cimc_expiry_window_end = (datetime.datetime.now(datetime.timezone.utc) +
+                                  datetime.timedelta(days=renewal_precheck_expiry_window_days))
+    ucs_cimc_server_count = ucs_cimc_unavailable_count = ucs_cimc_expiring_count = 0
+    flush_ucs_cimc_event_log()
+    print("\nUCS CIMC Certificate Inventory:")
+    for ucs_cimc_server in ucs_cimc_servers:
+        ucs_cimc_server_count += 1
+        ucs_cimc_cache_entry = ucs_cimc_certificate_cache.get(ucs_cimc_server)
+        if ucs_cimc_cache_entry is None or ucs_cimc_cache_entry["fetched_at"] is None:
+            ucs_cimc_unavailable_count += 1
+            print(f"- {ucs_cimc_server}: Not available"
+                  f"{' - ' + ucs_cimc_cache_entry['error'] if ucs_cimc_cache_entry else ''}")
+            continue
+        ucs_cimc_certificate_expiry = ucs_cimc_cache_entry["expires_at"] or "an unknown date"
+        if (ucs_cimc_cache_entry["expires_at"] and
+                datetime.datetime.fromisoformat(ucs_cimc_cache_entry["expires_at"]) <= ucs_cimc_expiry_window_end):
+            ucs_cimc_expiring_count += 1
+        ucs_cimc_certificate_line = (f"- {ucs_cimc_server}: {ucs_cimc_cache_entry['subject']} - "
+                                     f"Issued by {ucs_cimc_cache_entry['issuer'] or 'an unknown issuer'} - "
+                                     f"Serial {ucs_cimc_cache_entry['serial_number'] or 'unknown'} - "
+                                     f"Expires {ucs_cimc_certificate_expiry[:10]} "
+                                     f"(read {(ucs_cimc_current_time - ucs_cimc_cache_entry['fetched_at']) / 3600:.1f} "
+                                     f"hour(s) ago)")
+        if ucs_cimc_cache_entry["error"]:
+            ucs_cimc_certificate_line += f" - The last read failed: {ucs_cimc_cache_entry['error']}"
+        print(ucs_cimc_certificate_line)
+    print(f"Total: {ucs_cimc_server_count}, Available: {ucs_cimc_server_count - ucs_cimc_unavailable_count}, "
+          f"Not Available: {ucs_cimc_unavailable_count}, "
+          f"Expiring Within {renewal_precheck_expiry_window_days} Days: {ucs_cimc_expiring_count}")
+
+
+# Establish function to refresh the certificate inventory cache of the UCS CIMCs
+def _run_ucs_cimc_certificate_inventory(
+    ucs_cimc_arguments,
+    ucs_cimc_servers,
+    ucs_cimc_resolver_cache=None
+    ):
+    """This is a function to read the current certificates of the UCS CIMCs
+    whose certificate inventory cache entries are stale, or of every UCS
+    CIMC if requested, without making any changes to them, then print the
+    certificate inventory.
+
+    Args:
+        ucs_cimc_arguments (argparse.Namespace):
+            The parsed command line arguments.
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs.
+        ucs_cimc_resolver_cache (UcsCimcResolverCache):
+            An optional cache of the pre-resolved UCS CIMC addresses. The
+            default value is None.
+    """
+    ucs_cimc_servers = list(ucs_cimc_servers)
+    with contextlib.ExitStack() as ucs_cimc_exit_stack:
+        ucs_cimc_certificate_cache = ucs_cimc_exit_stack.enter_context(
+            UcsCimcCertificateInventoryCache(
+                ucs_cimc_arguments.certificate_cache,
+                ttl=certificate_inventory_cache_ttl
+                )
+            )
+        if ucs_cimc_resolver_cache is not None:
+            set_ucs_cimc_resolver_cache(ucs_cimc_resolver_cache)
+            ucs_cimc_exit_stack.callback(set_ucs_cimc_resolver_cache, None)
+        ucs_cimc_session_cache = ucs_cimc_exit_stack.enter_context(
+            UcsCimcSessionCache(max_sessions=ucs_cimc_max_cached_sessions)
+            )
+        ucs_cimc_refresh_servers = (
+            ucs_cimc_servers if ucs_cimc_arguments.refresh_all
+            else ucs_cimc_certificate_cache.get_stale_ucs_cimc_servers(ucs_cimc_servers)
+            )
+        log_ucs_cimc_event(
+            f"\nReading the current certificates of {len(ucs_cimc_refresh_servers)} UCS CIMC(s). "
+            f"{len(ucs_cimc_servers) - len(ucs_cimc_refresh_servers)} UCS CIMC(s) are current in "
+            f"{ucs_cimc_arguments.certificate_cache}."
+            )
+        read_ucs_cimc_fleet_current_certificates(
+            ucs_cimc_refresh_servers,
+            functools.partial(
+                _read_ucs_cimc_current_certificate,
+                ucs_cimc_session_cache=ucs_cimc_session_cache,
+                ucs_cimc_certificate_cache=ucs_cimc_certificate_cache
+                ),
+            max_concurrent_workers=ucs_cimc_max_concurrent_workers
+            )
+        ucs_cimc_session_cache.close_all()
+        _print_ucs_cimc_certificate_inventory(ucs_cimc_certificate_cache, ucs_cimc_servers)
+
+
+# Establish function to retrieve the certificate signing request status of a UCS CIMC using the configuration settings
+def _get_ucs_cimc_certificate_signing_request_status(
+    ucs_cimc_server,
+    ucs_cimc_session_cache
+    ):
+    """This is a function to retrieve the certificate signing request status
+    of a UCS CIMC through the cached login session for the UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            The UcsCimcSessionCache class instance to obtain the login session
+            for the UCS CIMC from.
+
+    Returns:
+        A string of the csrStatus attribute reported by the UCS CIMC.
+    """
+    with ucs_cimc_session_cache.lease_session(
+        ucs_cimc_server,
+        *_get_ucs_cimc_credentials(ucs_cimc_server)
+        ) as ucs_cimc_session:
+        return get_ucs_cimc_certificate_signing_request_status(ucs_cimc_session)
+
+
+# Establish function to verify the certificate served by a UCS CIMC using the configuration settings
+def _verify_ucs_cimc_tls_certificate(ucs_cimc_server):
+    """This is a function to check whether a UCS CIMC is serving the
+    certificate requested for it, based on the provided configuration
+    settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Returns:
+        A tuple of the state and reason, as returned by
+        evaluate_ucs_cimc_served_certificate().
+    """
+    ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)[1]
+    return evaluate_ucs_cimc_served_certificate(
+        probe_ucs_cimc_tls_certificate(ucs_cimc_server, timeout=ucs_cimc_connect_timeout),
+        {
+            "commonName": ucs_cimc_certificate_request_settings["common_name"],
+            "organization": ucs_cimc_certificate_request_settings["organization"],
+            "organizationalUnit": ucs_cimc_certificate_request_settings["organizational_unit"]
+            },
+        initial_fingerprint=get_ucs_cimc_initial_certificate_fingerprint(ucs_cimc_server)
+        )
+
+
+# Establish function to obtain the common name of the signed certificate for a UCS CIMC
+def _get_ucs_cimc_signed_certificate_common_name(ucs_cimc_server):
+    """This is a function to obtain the common name that the signed
+    certificate for a UCS CIMC is expected to have, which is the common name
+    of its certificate signing request, based on the provided configuration
+    settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+
+    Returns:
+        A string of the expected common name.
+    """
+    ucs_cimc_common_name = _get_ucs_cimc_inventory_overrides(ucs_cimc_server).get("common_name")
+    if ucs_cimc_common_name:
+        return ucs_cimc_common_name
+    if replace_common_name_with_ucs_cimc_server_list_entries:
+        return _get_ucs_cimc_server_host(ucs_cimc_server)
+    return csr_common_name
+
+
+# Establish function to upload the signed certificate for a UCS CIMC using the configuration settings
+def _upload_ucs_cimc_signed_certificate(
+    ucs_cimc_server,
+    ucs_cimc_certificate_watcher,
+    ucs_cimc_session_cache=None
+    ):
+    """This is a function to upload the signed certificate matched to a UCS
+    CIMC, based on the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_certificate_watcher (UcsCimcSignedCertificateWatcher):
+            The watcher that matched the signed certificate to the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            An optional UcsCimcSessionCache class instance to obtain the login
+            session for the UCS CIMC from. The default value is None, which
+            logs in and out of the UCS CIMC for this request only.
+
+    Returns:
+        A Response class instance for the UCS CIMC certificate upload HTTP
+        request.
+    """
+    ucs_cimc_signed_certificate = ucs_cimc_certificate_watcher.get_signed_certificate(ucs_cimc_server)
+    ucs_cimc_credentials = _get_ucs_cimc_credentials(ucs_cimc_server)
+    if ucs_cimc_session_cache is None:
+        return upload_ucs_cimc_signed_certificate(
+            ucs_cimc_server,
+            *ucs_cimc_credentials,
+            ucs_cimc_signed_certificate["certificate_content"]
+            )
+    with ucs_cimc_session_cache.lease_session(
+        ucs_cimc_server,
+        *ucs_cimc_credentials
+        ) as ucs_cimc_session:
+        return upload_ucs_cimc_signed_certificate(
+            ucs_cimc_server,
+            *ucs_cimc_credentials,
+            ucs_cimc_signed_certificate["certificate_content"],
+            ucs_cimc_session=ucs_cimc_session
+            )
+
+
+# Establish function to verify that a UCS CIMC serves its uploaded signed certificate
+def _verify_ucs_cimc_uploaded_certificate(
+    ucs_cimc_server,
+    ucs_cimc_certificate_watcher
+    ):
+    """This is a function to check whether a UCS CIMC is serving the signed
+    certificate uploaded to it.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_certificate_watcher (UcsCimcSignedCertificateWatcher):
+            The watcher that matched the signed certificate to the UCS CIMC.
+
+    Returns:
+        A tuple of the state and reason, as described in
+        evaluate_ucs_cimc_served_certificate().
+    """
+    ucs_cimc_served_certificate = probe_ucs_cimc_tls_certificate(ucs_cimc_server, timeout=ucs_cimc_connect_timeout)
+    ucs_cimc_signed_certificate = ucs_cimc_certificate_watcher.get_signed_certificate(ucs_cimc_server)
+    if ucs_cimc_served_certificate["sha256_fingerprint"] != ucs_cimc_signed_certificate["sha256_fingerprint"]:
+        return "pending", "The certificate from before the upload is still served."
+    return "ready", f"The uploaded certificate is served until {ucs_cimc_signed_certificate['not_after']:%Y-%m-%d}."
+
+
+# Establish function to obtain the schedule group key of a UCS CIMC
+def _get_ucs_cimc_group_key(ucs_cimc_server):
+    """This is a function to obtain the key of the group a UCS CIMC is
+    scheduled in, based on the provided configuration settings. UCS CIMCs
+    without a remote server or cluster are placed in a group of their own.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, or a
+            UcsCimcInventoryRecord class instance.
+
+    Returns:
+        A string of the group key.
+    """
+    if ucs_cimc_group_by == "cluster":
+        ucs_cimc_group_key = _get_ucs_cimc_inventory_overrides(ucs_cimc_server).get("cluster", "")
+    elif ucs_cimc_group_by == "remote_server":
+        self_signed, ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)
+        ucs_cimc_group_key = "" if self_signed else ucs_cimc_certificate_request_settings["remote_server"]
+    else:
+        ucs_cimc_group_key = ""
+    return f"{ucs_cimc_group_by}:{ucs_cimc_group_key}" if ucs_cimc_group_key else f"server:{ucs_cimc_server}"
+
+
+# Establish function to obtain the shard key of a UCS CIMC using the configuration settings
+def _get_ucs_cimc_shard_key(ucs_cimc_server):
+    """This is a function to obtain the key used to assign a UCS CIMC to a
+    shard, based on the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, or a
+            UcsCimcInventoryRecord class instance.
+
+    Returns:
+        A string of the shard key.
+    """
+    if ucs_cimc_shard_by == "group":
+        return _get_ucs_cimc_group_key(ucs_cimc_server)
+    return str(ucs_cimc_server)
+
+
+# Establish function to plan the certificate requests of the UCS CIMCs using the configuration settings
+def _plan_ucs_cimc_certificate_requests(ucs_cimc_servers):
+    """This is a function to validate and render the certificate request of
+    every UCS CIMC, based on the provided configuration settings, without
+    contacting any of them. The remote server passwords are redacted from
+    the rendered request bodies. The UCS CIMCs are planned one at a time as
+    they are read, and only the common names of the certificate signing
+    requests are kept to find the common names shared by several UCS CIMCs.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs, or
+            UcsCimcInventoryRecord class instances.
+
+    Yields:
+        A dictionary containing the planned request of each UCS CIMC, with
+        the problems found in its settings and its configConfMo XML API
+        request body.
+    """
+    ucs_cimc_common_name_servers = {}
+    for ucs_cimc_server in ucs_cimc_servers:
+        self_signed, ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)
+        ucs_cimc_request_problems = validate_ucs_cimc_certificate_request(
+            self_signed,
+            ucs_cimc_certificate_request_settings
+            )
+        if not self_signed:
+            # The CSR files are named after the common name, so a shared common name overwrites another CSR file
+            ucs_cimc_common_name_server = ucs_cimc_common_name_servers.setdefault(
+                ucs_cimc_certificate_request_settings["common_name"],
+                str(ucs_cimc_server)
+                )
+            if ucs_cimc_common_name_server != str(ucs_cimc_server):
+                ucs_cimc_request_problems.append(
+                    f"The common name {ucs_cimc_certificate_request_settings['common_name']!r} is also used by "
+                    f"{ucs_cimc_common_name_server}, so their CSR files would overwrite each other."
+                    )
+            if csr_receiver_enabled and ucs_cimc_certificate_request_settings["remote_server_protocol"] not in ("tftp", "ftp"):
+                ucs_cimc_request_problems.append(
+                    "The embedded CSR receiver only supports the tftp and ftp remote server protocols."
+                    )
+            ucs_cimc_certificate_request_settings = dict(
+                ucs_cimc_certificate_request_settings,
+                remote_server_password="********" if ucs_cimc_certificate_request_settings["remote_server_password"] else ""
+                )
+        yield {
+            "ucs_cimc_server": str(ucs_cimc_server),
+            "self_signed": self_signed,
+            "common_name": ucs_cimc_certificate_request_settings["common_name"],
+            "remote_server": ucs_cimc_certificate_request_settings.get("remote_server", ""),
+            "remote_server_protocol": ucs_cimc_certificate_request_settings.get("remote_server_protocol", ""),
+            "problems": ucs_cimc_request_problems,
+            "post_body": render_ucs_cimc_certificate_request(self_signed, ucs_cimc_certificate_request_settings)
+            }
+
+
+# Establish function to request a certificate for a UCS CIMC with asyncio using the configuration settings
+async def _async_request_ucs_cimc_certificate(
+    ucs_cimc_server,
+    ucs_cimc_session_cache=None
+    ):
+    """This is a function to generate a self-signed certificate or a
+    certificate signing request for a UCS CIMC using the asyncio client
+    engine, based on the provided configuration settings.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_session_cache (UcsCimcSessionCache):
+            An optional UcsCimcSessionCache class instance to reuse the login
+            session of the UCS CIMC from, such as the session of the renewal
+            pre-check. The default value is None, which logs in and out of the
+            UCS CIMC for this request only.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the UCS CIMC self-signed
+        certificate or CSR HTTP request.
+    """
+    import asyncio
+
+    self_signed, ucs_cimc_certificate_request_settings = _get_ucs_cimc_certificate_request_settings(ucs_cimc_server)
+    if self_signed:
+        ucs_cimc_generate_function = async_generate_ucs_cimc_self_signed_certificate
+    else:
+        ucs_cimc_generate_function = async_generate_ucs_cimc_certificate_signing_request
+        _expect_ucs_cimc_csr(ucs_cimc_certificate_request_settings)
+    if ucs_cimc_session_cache is None:
+        return await ucs_cimc_generate_function(**ucs_cimc_certificate_request_settings)
+    ucs_cimc_username = ucs_cimc_certificate_request_settings["ucs_cimc_username"]
+    with ucs_cimc_session_cache.lease_login_cookie(
+        ucs_cimc_server,
+        ucs_cimc_username
+        ) as ucs_cimc_login_cookie:
+        if not ucs_cimc_login_cookie:
+            # Logout of a cached session that cannot be reused, so it does not
+            # hold a second session on the UCS CIMC during the new login
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                ucs_cimc_session_cache.evict,
+                ucs_cimc_server,
+                ucs_cimc_username
+                )
+        return await ucs_cimc_generate_function(
+            ucs_cimc_login_cookie=ucs_cimc_login_cookie,
+            **ucs_cimc_certificate_request_settings
+            )
+
+
+# Establish function to combine the journal and metrics files of UCS CIMC fleet runs
+def _merge_ucs_cimc_fleet_results(
+    merge_filepaths,
+    host_phase,
+    metrics_filepath="",
+    prometheus_filepath=""
+    ):
+    """This is a function to combine the journal and metrics files written by
+    the shards of a UCS CIMC fleet run into a single fleet report. The type
+    of each file is detected from its records.
+
+    Args:
+        merge_filepaths (list):
+            The filepaths of the journal and metrics files to combine.
+        host_phase (str):
+            The name of the phase recorded once per UCS CIMC, either
+            "certificate_request" or "certificate_upload".
+        metrics_filepath (str):
+            The filepath to write the combined JSON lines run metrics to. The
+            default value is an empty string (""), which skips writing it.
+        prometheus_filepath (str):
+            The filepath to write the combined Prometheus textfile to. The
+            default value is an empty string (""), which skips writing it.
+    """
+    ucs_cimc_journal_filepaths = []
+    ucs_cimc_metrics_filepaths = []
+    for merge_filepath in merge_filepaths:
+        if not os.path.exists(merge_filepath):
+            print(f"Skipping {merge_filepath}: The file does not exist.")
+            continue
+        with open(merge_filepath, encoding="utf-8") as ucs_cimc_merge_file:
+            try:
+                ucs_cimc_merge_first_record = json.loads(ucs_cimc_merge_file.readline())
+            except json.JSONDecodeError:
+                ucs_cimc_merge_first_record = {}
+        if "type" in ucs_cimc_merge_first_record:
+            ucs_cimc_metrics_filepaths.append(merge_filepath)
+        else:
+            ucs_cimc_journal_filepaths.append(merge_filepath)
+    print(f"\nCombining {len(ucs_cimc_journal_filepaths)} journal file(s) and "
+          f"{len(ucs_cimc_metrics_filepaths)} metrics file(s)...")
+
+    ucs_cimc_run_metrics = UcsCimcRunMetrics.load_json_lines(ucs_cimc_metrics_filepaths, host_phase=host_phase)
+    ucs_cimc_host_durations = {
+        ucs_cimc_metric_record["ucs_cimc_server"]: ucs_cimc_metric_record["duration"]
+        for ucs_cimc_metric_record in sorted(ucs_cimc_run_metrics.records,
+                                             key=lambda ucs_cimc_record: ucs_cimc_record["timestamp"])
+        if ucs_cimc_metric_record["phase"] == host_phase
+        }
+    ucs_cimc_fleet_results = [
+        {
+            "ucs_cimc_server": ucs_cimc_server,
+            "succeeded": ucs_cimc_journal_record["outcome"] == "succeeded",
+            "duration": ucs_cimc_host_durations.get(ucs_cimc_server, 0.0),
+            "error": ucs_cimc_journal_record.get("error", "")
+            }
+        for ucs_cimc_server, ucs_cimc_journal_record in UcsCimcRunJournal.load_ucs_cimc_results(
+            ucs_cimc_journal_filepaths,
+            host_phase
+            ).items()
+        ]
+    _print_ucs_cimc_fleet_summary(ucs_cimc_fleet_results)
+    if ucs_cimc_metrics_filepaths:
+        print(f"Elapsed Time: {ucs_cimc_run_metrics.get_summary()['run_duration']:.2f}s")
+        _print_ucs_cimc_run_metrics_summary(ucs_cimc_run_metrics.get_summary())
+        if metrics_filepath:
+            ucs_cimc_run_metrics.write_json_lines(metrics_filepath)
+            print(f"The combined run metrics have been written to {metrics_filepath}.")
+        if prometheus_filepath:
+            ucs_cimc_run_metrics.write_prometheus_textfile(prometheus_filepath)
+            print(f"The combined Prometheus textfile has been written to {prometheus_filepath}.")
+
+
+# Establish function to run the shards of the UCS CIMC fleet in worker processes
+def _run_ucs_cimc_csr_tool_shards(
+    ucs_cimc_arguments,
+    arguments=None
+    ):
+    """This is a function to run each shard of the UCS CIMCs in a separate
+    worker process of the UCS CIMC Certificate Renewal Tool, then combine
+    the journal and metrics files of the shards into a single fleet report.
+
+    Args:
+        ucs_cimc_arguments (argparse.Namespace):
+            The parsed command line arguments.
+        arguments (list):
+            The command line arguments passed to main(), which are passed on
+            to each worker process. The default value is None, which uses
+            sys.argv.
+    """
+    ucs_cimc_shard_count = ucs_cimc_arguments.shard_processes
+    if arguments is None:
+        arguments = sys.argv[1:]
+
+    def get_ucs_cimc_shard_command(shard_index, shard_count):
+        return [
+            sys.executable,
+            os.path.abspath(__file__),
+            *arguments,
+            "--shard", f"{shard_index}/{shard_count}"
+            ]
+
+    print(f"\nRunning the UCS CIMCs in {ucs_cimc_shard_count} shards...")
+    ucs_cimc_shard_exit_codes = run_ucs_cimc_shard_processes(get_ucs_cimc_shard_command, ucs_cimc_shard_count)
+    for shard_index, shard_exit_code in enumerate(ucs_cimc_shard_exit_codes, start=1):
+        if shard_exit_code:
+            print(f"Shard {shard_index}/{ucs_cimc_shard_count} exited with code {shard_exit_code}.")
+
+    # Print the certificate inventory the shards read into the shared certificate inventory cache
+    if ucs_cimc_arguments.certificate_inventory:
+        if ucs_cimc_arguments.inventory:
+            ucs_cimc_servers = load_ucs_cimc_inventory(
+                ucs_cimc_arguments.inventory,
+                ucs_cimc_arguments.inventory_format
+                )
+        else:
+            ucs_cimc_servers = ucs_cimc_server_list
+        with UcsCimcCertificateInventoryCache(
+            ucs_cimc_arguments.certificate_cache,
+            ttl=certificate_inventory_cache_ttl
+            ) as ucs_cimc_certificate_cache:
+            _print_ucs_cimc_certificate_inventory(ucs_cimc_certificate_cache, ucs_cimc_servers)
+        return
+
+    ucs_cimc_merge_filepaths = [
+        get_ucs_cimc_shard_filepath(ucs_cimc_filepath, shard_index, ucs_cimc_shard_count)
+        for ucs_cimc_filepath in (ucs_cimc_arguments.journal, ucs_cimc_arguments.metrics)
+        if ucs_cimc_filepath
+        for shard_index in range(1, ucs_cimc_shard_count + 1)
+        ]
+    _merge_ucs_cimc_fleet_results(
+        ucs_cimc_merge_filepaths,
+        "certificate_upload" if ucs_cimc_arguments.upload_certificates else "certificate_request",
+        metrics_filepath=ucs_cimc_arguments.metrics,
+        prometheus_filepath=ucs_cimc_arguments.prometheus_textfile
+        )
+
+
+# Establish function to parse a shard command line argument
+def _parse_ucs_cimc_shard_argument(shard):
+    """This is a function to parse the --shard command line argument.
+
+    Args:
+        shard (str):
+            The shard specification in the form "i/K".
+
+    Returns:
+        A tuple of the shard index and the number of shards.
+
+    Raises:
+        argparse.ArgumentTypeError:
+            The shard specification is not valid.
+    """
+    try:
+        return parse_ucs_cimc_shard(shard)
+    except ValueError as exception_message:
+        raise argparse.ArgumentTypeError(str(exception_message))
+
+
+# Establish function to parse the command line arguments
+def _parse_ucs_cimc_csr_tool_arguments(arguments=None):
+    """This is a function to parse the command line arguments of the UCS CIMC
+    Certificate Renewal Tool. Arguments that are not provided fall back to
+    the configuration settings.
+
+    Args:
+        arguments (list):
+            The command line arguments to parse. The default value is None,
+            which parses sys.argv.
+
+    Returns:
+        An argparse Namespace class instance of the parsed arguments.
+    """
+    ucs_cimc_argument_parser = argparse.ArgumentParser(
+        description="The UCS CIMC Certificate Renewal Tool generates a new "
+                    "standard or self-signed certificate signing request for "
+                    "UCS CIMCs."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--inventory",
+        default=ucs_cimc_inventory_filepath,
+        help="The filepath of a CSV or JSON lines inventory of UCS CIMCs, or - for standard input."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--inventory-format",
+        choices=["csv", "jsonl"],
+        default=ucs_cimc_inventory_format,
+        help="The format of the inventory. By default, the format is detected."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--upload-certificates",
+        metavar="DIRECTORY",
+        default=signed_certificate_upload_directory,
+        help="Upload the signed certificates in the directory to the UCS CIMCs with the same common name, "
+             "instead of generating certificate signing requests."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--certificate-inventory",
+        action="store_true",
+        help="Read the current certificate of the UCS CIMCs whose certificate inventory cache entries are "
+             "stale, without making any changes, then print the certificate inventory."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--refresh-all",
+        action="store_true",
+        help="Read the current certificate of every UCS CIMC for the certificate inventory, "
+             "including those with current cache entries."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--certificate-cache",
+        metavar="FILE",
+        default=certificate_inventory_cache_filepath,
+        help="The filepath of the SQLite certificate inventory cache."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=resume_from_journal,
+        help="Skip the UCS CIMCs already completed in the checkpoint journal."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--journal",
+        default=ucs_cimc_journal_filepath,
+        help="The filepath of the checkpoint journal."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--metrics",
+        default=ucs_cimc_metrics_filepath,
+        help="The filepath of the JSON lines run metrics report."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--prometheus-textfile",
+        default=ucs_cimc_metrics_prometheus_filepath,
+        help="The filepath of the Prometheus textfile for the run metrics."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--verbosity",
+        choices=["quiet", "normal", "verbose"],
+        default=ucs_cimc_event_log_verbosity,
+        help="The verbosity of the progress written to the console."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--event-log",
+        metavar="FILE",
+        default=ucs_cimc_event_log_filepath,
+        help="The filepath of the JSON lines event log."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Validate and print the certificate request of every UCS CIMC without contacting any of them."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--plan",
+        metavar="FILE",
+        help="Write the planned certificate request of every UCS CIMC, including its XML API request body, "
+             "to a JSON lines file."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--shard",
+        metavar="I/K",
+        type=_parse_ucs_cimc_shard_argument,
+        help="Run only shard I of K shards of the UCS CIMCs, for example 2/4. The journal, metrics, "
+             "Prometheus textfile and event log filepaths are given the shard as a suffix."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--shard-processes",
+        metavar="K",
+        type=int,
+        default=ucs_cimc_shard_processes,
+        help="Split the UCS CIMCs into K shards, each run by its own worker process."
+        )
+    ucs_cimc_argument_parser.add_argument(
+        "--merge",
+        metavar="FILE",
+        nargs="+",
+        help="Combine the journal and metrics files of the shards of a fleet run into a single fleet report, "
+             "instead of processing UCS CIMCs."
+        )
+    return ucs_cimc_argument_parser.parse_args(arguments)
+
+
+# Establish function to obtain the run settings from the command line arguments and the configuration settings
+def _get_ucs_cimc_run_settings(ucs_cimc_arguments):
+    """This is a function to map the parsed command line arguments and the
+    configuration settings to the settings of a UCS CIMC certificate renewal
+    run.
+
+    Args:
+        ucs_cimc_arguments (argparse.Namespace):
+            The parsed command line arguments.
+
+    Returns:
+        A UcsCimcRunSettings class instance.
+    """
+    ucs_cimc_csr_receiver = None
+    if not request_self_signed_certificate and csr_receiver_enabled:
+        from ucs_cimc_csr_receiver import UcsCimcCsrReceiver
+        ucs_cimc_csr_receiver = UcsCimcCsrReceiver(
+            csr_receiver_directory,
+            bind_address=csr_receiver_bind_address,
+            tftp_port=csr_receiver_tftp_port,
+            ftp_port=csr_receiver_ftp_port
+            )
+    return UcsCimcRunSettings(
+        request_task=_request_ucs_cimc_certificate,
+        async_request_task=_async_request_ucs_cimc_certificate,
+        renewal_check_task=_check_ucs_cimc_certificate_renewal,
+        csr_status_task=_get_ucs_cimc_certificate_signing_request_status,
+        upload_task=_upload_ucs_cimc_signed_certificate,
+        self_signed_verification_task=_verify_ucs_cimc_tls_certificate,
+        uploaded_certificate_verification_task=_verify_ucs_cimc_uploaded_certificate,
+        plan_function=_plan_ucs_cimc_certificate_requests,
+        certificate_inventory_function=functools.partial(_run_ucs_cimc_certificate_inventory, ucs_cimc_arguments),
+        signed_certificate_common_name_function=_get_ucs_cimc_signed_certificate_common_name,
+        group_key_function=_get_ucs_cimc_group_key if ucs_cimc_group_by != "none" else None,
+        self_signed=request_self_signed_certificate,
+        upload_directory=ucs_cimc_arguments.upload_certificates,
+        dry_run=ucs_cimc_arguments.dry_run,
+        plan_filepath=ucs_cimc_arguments.plan,
+        request_validation_enabled=certificate_request_validation_enabled,
+        certificate_inventory=ucs_cimc_arguments.certificate_inventory,
+        certificate_cache_filepath=ucs_cimc_arguments.certificate_cache,
+        certificate_cache_ttl=certificate_inventory_cache_ttl,
+        journal_filepath=ucs_cimc_arguments.journal,
+        resume=ucs_cimc_arguments.resume,
+        metrics_filepath=ucs_cimc_arguments.metrics,
+        prometheus_filepath=ucs_cimc_arguments.prometheus_textfile,
+        client_engine=ucs_cimc_client_engine,
+        max_concurrent_workers=ucs_cimc_max_concurrent_workers,
+        max_concurrent_sessions=ucs_cimc_max_concurrent_sessions,
+        max_cached_sessions=ucs_cimc_max_cached_sessions,
+        renewal_precheck_enabled=renewal_precheck_enabled,
+        renewal_precheck_use_inventory_cache=renewal_precheck_use_inventory_cache,
+        csr_status_polling_enabled=csr_status_polling_enabled,
+        csr_status_polling_initial_interval=csr_status_polling_initial_interval,
+        csr_status_polling_max_interval=csr_status_polling_max_interval,
+        csr_status_polling_timeout=csr_status_polling_timeout,
+        csr_receiver=ucs_cimc_csr_receiver,
+        csr_receiver_timeout=csr_receiver_timeout,
+        upload_scan_interval=signed_certificate_upload_scan_interval,
+        upload_idle_timeout=signed_certificate_upload_idle_timeout,
+        tls_verification_enabled=tls_verification_enabled,
+        tls_verification_interval=tls_verification_interval,
+        tls_verification_timeout=tls_verification_timeout,
+        dns_pre_resolution_enabled=ucs_cimc_dns_pre_resolution_enabled,
+        dns_cache_ttl=ucs_cimc_dns_cache_ttl,
+        dns_max_concurrent_lookups=ucs_cimc_dns_max_concurrent_lookups,
+        dns_resolution_timeout=ucs_cimc_dns_resolution_timeout,
+        group_max_concurrent=ucs_cimc_group_max_concurrent,
+        group_rate=ucs_cimc_group_rate,
+        group_burst=ucs_cimc_group_burst,
+        canary_wave_sizes=ucs_cimc_canary_wave_sizes,
+        canary_max_failure_rate=ucs_cimc_canary_max_failure_rate
+        )
+
+
+# Establish function to run the UCS CIMC Certificate Renewal Tool with the parsed command line arguments
+def _run_ucs_cimc_csr_tool(
+    ucs_cimc_arguments,
+    arguments=None
+    ):
+    """This is a function to run the UCS CIMC Certificate Renewal Tool with
+    the parsed command line arguments and the configuration settings. Merges
+    and worker processes are handled here, while the run of each process is
+    done by run_ucs_cimc_certificate_renewal().
+
+    Args:
+        ucs_cimc_arguments (argparse.Namespace):
+            The parsed command line arguments.
+        arguments (list):
+            The command line arguments passed to main(), which are passed on
+            to the worker processes of the shards. The default value is None,
+            which uses sys.argv.
+
+    Returns:
+        A list of dictionaries containing the result of the certificate
+        request or upload for each UCS CIMC processed in this process. The
+        list is empty if no UCS CIMCs were processed.
+    """
+    ucs_cimc_host_phase = "certificate_upload" if ucs_cimc_arguments.upload_certificates else "certificate_request"
+
+    # Combine the results of the shards of a fleet run, if requested
+    if ucs_cimc_arguments.merge:
+        _merge_ucs_cimc_fleet_results(
+            ucs_cimc_arguments.merge,
+            ucs_cimc_host_phase,
+            metrics_filepath=ucs_cimc_arguments.metrics,
+            prometheus_filepath=ucs_cimc_arguments.prometheus_textfile
+            )
+        return []
+
+    # Split the UCS CIMCs across worker processes, if requested
+    if ucs_cimc_arguments.shard is None and ucs_cimc_arguments.shard_processes > 1:
+        if ucs_cimc_arguments.inventory == "-":
+            log_ucs_cimc_event(
+                "\nThe inventory cannot be read from standard input when using worker processes. "
+                "Provide the filepath of the inventory instead.",
+                level=logging.ERROR
+                )
+        else:
+            _run_ucs_cimc_csr_tool_shards(ucs_cimc_arguments, arguments)
+        return []
+    if ucs_cimc_arguments.shard is not None:
+        ucs_cimc_shard_index, ucs_cimc_shard_count = ucs_cimc_arguments.shard
+        log_ucs_cimc_event(f"Running shard {ucs_cimc_shard_index} of {ucs_cimc_shard_count}.")
+        for ucs_cimc_output_argument in ("journal", "metrics", "prometheus_textfile"):
+            setattr(ucs_cimc_arguments, ucs_cimc_output_argument, get_ucs_cimc_shard_filepath(
+                getattr(ucs_cimc_arguments, ucs_cimc_output_argument),
+                ucs_cimc_shard_index,
+                ucs_cimc_shard_count
+                ))
+
+    # Reject the combinations of command line arguments that cannot be run
+    if ucs_cimc_arguments.upload_certificates and ucs_cimc_arguments.dry_run:
+        log_ucs_cimc_event(
+            "\nA dry run is only available for certificate requests, not for uploading signed certificates.",
+            level=logging.ERROR
+            )
+        return []
+    if ucs_cimc_arguments.certificate_inventory and (ucs_cimc_arguments.upload_certificates or
+                                                     ucs_cimc_arguments.dry_run or not ucs_cimc_arguments.certificate_cache):
+        log_ucs_cimc_event(
+            "\nThe certificate inventory requires a certificate inventory cache filepath, and cannot be combined "
+            "with uploading signed certificates or a dry run.",
+            level=logging.ERROR
+            )
+        return []
+
+    # Stream the UCS CIMCs from the inventory, which is read again for each pass over the UCS CIMCs made before the run
+    def open_ucs_cimc_servers():
+        if ucs_cimc_arguments.inventory:
+            ucs_cimc_servers = load_ucs_cimc_inventory(
+                ucs_cimc_arguments.inventory,
+                ucs_cimc_arguments.inventory_format
+                )
+        else:
+            ucs_cimc_servers = iter(ucs_cimc_server_list)
+        if ucs_cimc_arguments.shard is not None:
+            ucs_cimc_servers = select_ucs_cimc_shard(
+                ucs_cimc_servers,
+                ucs_cimc_shard_index,
+                ucs_cimc_shard_count,
+                shard_key_function=_get_ucs_cimc_shard_key
+                )
+        return ucs_cimc_servers
+
+    # Standard input can only be read once, so an inventory read from it is kept in memory for every pass
+    return run_ucs_cimc_certificate_renewal(
+        open_ucs_cimc_servers,
+        _get_ucs_cimc_run_settings(ucs_cimc_arguments),
+        rereadable=ucs_cimc_arguments.inventory != "-"
+        )
+
+
+def main(arguments=None):
+    # Starting the UCS CIMC Certificate Renewal Tool
+    print(f"\nStarting the UCS CIMC Certificate Renewal Tool.")
+    ucs_cimc_arguments = _parse_ucs_cimc_csr_tool_arguments(arguments)
+    set_ucs_cimc_client_settings(
+        connect_timeout=ucs_cimc_connect_timeout,
+        read_timeout=ucs_cimc_read_timeout,
+        max_retries=ucs_cimc_max_retries,
+        retry_backoff_factor=ucs_cimc_retry_backoff_factor,
+        retry_backoff_max=ucs_cimc_retry_backoff_max,
+        circuit_breaker_failure_threshold=ucs_cimc_circuit_breaker_failure_threshold,
+        circuit_breaker_reset_timeout=ucs_cimc_circuit_breaker_reset_timeout
+        )
+
+    # Write the progress of the UCS CIMCs from a queue on a background thread, so workers never wait for the console
+    ucs_cimc_event_log_filepath = ucs_cimc_arguments.event_log
+    if ucs_cimc_arguments.shard is not None:
+        ucs_cimc_event_log_filepath = get_ucs_cimc_shard_filepath(ucs_cimc_event_log_filepath, *ucs_cimc_arguments.shard)
+    with UcsCimcEventLog(
+        verbosity=ucs_cimc_arguments.verbosity,
+        json_lines_filepath=ucs_cimc_event_log_filepath,
+        json_lines_verbosity=ucs_cimc_event_log_file_verbosity
+        ):
+        ucs_cimc_fleet_results = _run_ucs_cimc_csr_tool(ucs_cimc_arguments, arguments)
+
+    # UCS CIMC Certificate Renewal Tool completion
+    print(f"\nThe UCS CIMC Certificate Renewal Tool has completed.\n")
+    return ucs_cimc_fleet_results
+
+
+if __name__ == "__main__":
+    main()
+
+    # Exiting the UCS CIMC Certificate Renewal Tool
+    sys.exit(0)
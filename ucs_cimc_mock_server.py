@@ -0,0 +1,839 @@
+"""
+UCS CIMC Mock XML API Server
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC Mock XML API Server is a local stand-in for the /nuova
+         XML API endpoint of the Cisco Integrated Management Controller
+         (CIMC), for measuring and regression testing the UCS CIMC
+         Certificate Renewal Tool without real hardware.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import sys
+import os
+import io
+import ssl
+import time
+import random
+import socket
+import struct
+import ftplib
+import base64
+import shutil
+import argparse
+import tempfile
+import datetime
+import threading
+import subprocess
+import collections
+import xml.etree.ElementTree as et
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from xml.sax.saxutils import quoteattr
+
+
+# Establish function to format a certificate date the way a UCS CIMC reports it
+def _format_ucs_cimc_certificate_date(certificate_date):
+    """This is a function to format a datetime the way a UCS CIMC reports
+    certificate validity dates, such as "Nov 20 16:59:36 2019 GMT".
+
+    Args:
+        certificate_date (datetime):
+            The certificate validity date.
+
+    Returns:
+        A string of the formatted certificate validity date.
+    """
+    return certificate_date.strftime("%b %d %H:%M:%S %Y GMT")
+
+
+# Establish function to build an XML element string
+def _build_xml_element(
+    tag,
+    attributes,
+    children=""
+    ):
+    """This is a function to build an XML element string with escaped
+    attribute values.
+
+    Args:
+        tag (str):
+            The tag of the XML element.
+        attributes (dict):
+            The attributes of the XML element.
+        children (str):
+            The XML of any child elements. The default value is an empty
+            string ("").
+
+    Returns:
+        A string of the XML element.
+    """
+    xml_attributes = "".join(
+        f" {attribute_name}={quoteattr(str(attribute_value))}"
+        for attribute_name, attribute_value in attributes.items()
+        )
+    if children:
+        return f"<{tag}{xml_attributes}>{children}</{tag}>"
+    return f"<{tag}{xml_attributes}/>"
+
+
+# Establish class for the simulated state of a UCS CIMC
+class UcsCimcMockHost:
+    """This is a class for the simulated state of a single UCS CIMC, holding
+    its login sessions, current certificate and certificate signing request
+    status.
+
+    Args:
+        host_address (str):
+            The address the UCS CIMC is reached at.
+    """
+    def __init__(self, host_address):
+        self.host_address = host_address
+        self.sessions = {}
+        self.csr_status = "Not Generated"
+        self.csr_completion_time = None
+        self.ssl_context = None
+        self.restart_end_time = 0.0
+        self.uploaded_certificate = None
+        current_time = datetime.datetime.now(datetime.timezone.utc)
+        self.current_certificate = {
+            "dn": "sys/cert-mgmt/curr-cert",
+            "serialNumber": f"{random.getrandbits(64):016X}",
+            "commonName": host_address,
+            "organization": "Cisco Systems Inc.",
+            "organizationalUnit": "UCS",
+            "locality": "San Jose",
+            "state": "California",
+            "countryCode": "US",
+            "issuerCommonName": host_address,
+            "issuerOrganization": "Cisco Systems Inc.",
+            "validFrom": _format_ucs_cimc_certificate_date(current_time - datetime.timedelta(days=365)),
+            "validTo": _format_ucs_cimc_certificate_date(current_time + datetime.timedelta(days=365))
+            }
+
+
+# Establish class for the configuration and shared state of the mock server
+class UcsCimcMockState:
+    """This is a class for the configuration and shared state of the mock
+    UCS CIMC XML API server. Each address the server is reached at is
+    treated as a separate UCS CIMC.
+
+    Args:
+        latency (float):
+            The number of seconds added to every XML API response. The
+            default value is 0.0.
+        latency_jitter (float):
+            The maximum number of random seconds added to the latency. The
+            default value is 0.0.
+        tls_handshake_delay (float):
+            The number of seconds added before every TLS handshake. The
+            default value is 0.0.
+        error_rate (float):
+            The fraction of XML API requests answered with an XML API error.
+            The default value is 0.0.
+        drop_rate (float):
+            The fraction of XML API requests answered by closing the
+            connection without a response. The default value is 0.0.
+        max_sessions (int):
+            The maximum number of concurrent login sessions per UCS CIMC. The
+            default value is 4.
+        session_refresh_period (int):
+            The number of seconds a login cookie is valid for. The default
+            value is 600.
+        csr_generation_time (float):
+            The number of seconds a UCS CIMC takes to complete a certificate
+            signing request. The default value is 0.0.
+        renew_served_certificates (bool):
+            Whether a self-signed certificate request replaces the certificate
+            served by the UCS CIMC, using the openssl command line tool. The
+            default value is False.
+        restart_time (float):
+            The number of seconds the HTTPS service of a UCS CIMC is
+            unavailable after a self-signed certificate request or a signed
+            certificate upload. The default value is 0.0.
+        csr_push_tftp_port (int):
+            The TFTP port of the remote server that certificate signing
+            requests using the TFTP protocol are pushed to. The default value
+            is None, which does not push the certificate signing requests.
+        csr_push_ftp_port (int):
+            The FTP port of the remote server that certificate signing
+            requests using the FTP protocol are pushed to. The default value
+            is None, which does not push the certificate signing requests.
+        username (str):
+            The accepted username. The default value is "admin".
+        password (str):
+            The accepted password. The default value is None, which accepts
+            any password.
+    """
+    def __init__(
+        self,
+        latency=0.0,
+        latency_jitter=0.0,
+        tls_handshake_delay=0.0,
+        error_rate=0.0,
+        drop_rate=0.0,
+        max_sessions=4,
+        session_refresh_period=600,
+        csr_generation_time=0.0,
+        renew_served_certificates=False,
+        restart_time=0.0,
+        csr_push_tftp_port=None,
+        csr_push_ftp_port=None,
+        username="admin",
+        password=None
+        ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.tls_handshake_delay = tls_handshake_delay
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.max_sessions = max_sessions
+        self.session_refresh_period = session_refresh_period
+        self.csr_generation_time = csr_generation_time
+        self.renew_served_certificates = renew_served_certificates
+        self.restart_time = restart_time
+        self.csr_push_ports = {"tftp": csr_push_tftp_port, "ftp": csr_push_ftp_port}
+        self.username = username
+        self.password = password
+        self.hosts = {}
+        self.request_counts = collections.Counter()
+        self.state_lock = threading.Lock()
+
+    def get_host(self, host_address):
+        """This is a method to obtain the simulated state of a UCS CIMC,
+        creating it on first use. The state lock must be held by the caller.
+
+        Args:
+            host_address (str):
+                The address the UCS CIMC is reached at.
+
+        Returns:
+            A UcsCimcMockHost class instance.
+        """
+        mock_host = self.hosts.get(host_address)
+        if mock_host is None:
+            mock_host = self.hosts[host_address] = UcsCimcMockHost(host_address)
+        return mock_host
+
+    def handle_xml_api_request(
+        self,
+        host_address,
+        request_body
+        ):
+        """This is a method to process an XML API request body for a UCS
+        CIMC.
+
+        Args:
+            host_address (str):
+                The address the UCS CIMC is reached at.
+            request_body (str):
+                The XML API request body.
+
+        Returns:
+            A string of the XML API response body.
+        """
+        try:
+            request_element = et.fromstring(request_body)
+        except et.ParseError:
+            return _build_xml_element(
+                "error",
+                {"response": "yes", "errorCode": "101", "errorDescr": "XML PARSING ERROR"}
+                )
+        method = request_element.tag
+        with self.state_lock:
+            self.request_counts[method] += 1
+            if random.random() < self.error_rate:
+                return self._build_error_response(request_element, "500", "Simulated error.")
+            mock_host = self.get_host(host_address)
+            self._expire_sessions(mock_host)
+            if method == "aaaLogin":
+                return self._handle_login(mock_host, request_element)
+            if not self._is_valid_cookie(mock_host, request_element.get("cookie") or request_element.get("inCookie")):
+                return self._build_error_response(request_element, "552", "Authorization required")
+            if method == "aaaRefresh":
+                return self._handle_refresh(mock_host, request_element)
+            if method == "aaaLogout":
+                mock_host.sessions.pop(request_element.get("inCookie"), None)
+                return _build_xml_element(
+                    "aaaLogout",
+                    {"cookie": "", "response": "yes", "outStatus": "success"}
+                    )
+            if method == "configResolveDn":
+                return self._handle_resolve_dn(mock_host, request_element)
+            if method == "configResolveClass":
+                return self._handle_resolve_class(mock_host, request_element)
+            if method == "configConfMo":
+                return self._handle_conf_mo(mock_host, request_element)
+            return self._build_error_response(request_element, "103", f"Unsupported method {method}.")
+
+    @staticmethod
+    def _build_error_response(
+        request_element,
+        error_code,
+        error_description
+        ):
+        return _build_xml_element(
+            request_element.tag,
+            {
+                "cookie": "",
+                "response": "yes",
+                "errorCode": error_code,
+                "invocationResult": "unidentified-fail",
+                "errorDescr": error_description
+                }
+            )
+
+    def _expire_sessions(self, mock_host):
+        current_time = time.monotonic()
+        for session_cookie, session_expiry in list(mock_host.sessions.items()):
+            if session_expiry <= current_time:
+                del mock_host.sessions[session_cookie]
+
+    def _is_valid_cookie(
+        self,
+        mock_host,
+        session_cookie
+        ):
+        return bool(session_cookie) and session_cookie in mock_host.sessions
+
+    def _create_session(self, mock_host):
+        session_cookie = f"{int(time.time())}/{random.getrandbits(128):032x}"
+        mock_host.sessions[session_cookie] = time.monotonic() + self.session_refresh_period
+        return session_cookie
+
+    def _handle_login(
+        self,
+        mock_host,
+        request_element
+        ):
+        if (request_element.get("inName") != self.username
+                or (self.password is not None and request_element.get("inPassword") != self.password)):
+            return self._build_error_response(request_element, "551", "Authentication failed")
+        if len(mock_host.sessions) >= self.max_sessions:
+            return self._build_error_response(request_element, "572", "User reached maximum session limit")
+        return _build_xml_element(
+            "aaaLogin",
+            {
+                "cookie": "",
+                "response": "yes",
+                "outCookie": self._create_session(mock_host),
+                "outRefreshPeriod": self.session_refresh_period,
+                "outPriv": "admin",
+                "outSessionId": len(mock_host.sessions),
+                "outVersion": "4.1(3b)"
+                }
+            )
+
+    def _handle_refresh(
+        self,
+        mock_host,
+        request_element
+        ):
+        mock_host.sessions.pop(request_element.get("inCookie"), None)
+        return _build_xml_element(
+            "aaaRefresh",
+            {
+                "cookie": "",
+                "response": "yes",
+                "outCookie": self._create_session(mock_host),
+                "outRefreshPeriod": self.session_refresh_period,
+                "outPriv": "admin"
+                }
+            )
+
+    def _get_csr_status_attributes(self, mock_host):
+        if (mock_host.csr_completion_time is not None
+                and time.monotonic() >= mock_host.csr_completion_time):
+            mock_host.csr_status = "Completed CSR"
+            mock_host.csr_completion_time = None
+        return {
+            "dn": "sys/cert-mgmt/gen-csr-req",
+            "csrStatus": mock_host.csr_status
+            }
+
+    def _build_managed_object(
+        self,
+        mock_host,
+        dn
+        ):
+        if dn == "sys/cert-mgmt/curr-cert":
+            return _build_xml_element("currentCertificate", mock_host.current_certificate)
+        if dn == "sys/cert-mgmt/gen-csr-req":
+            return _build_xml_element(
+                "generateCertificateSigningRequest",
+                self._get_csr_status_attributes(mock_host)
+                )
+        return ""
+
+    def _handle_resolve_dn(
+        self,
+        mock_host,
+        request_element
+        ):
+        dn = request_element.get("dn", "")
+        managed_object = self._build_managed_object(mock_host, dn)
+        return _build_xml_element(
+            "configResolveDn",
+            {"cookie": "", "response": "yes", "dn": dn},
+            f"<outConfig>{managed_object}</outConfig>"
+            )
+
+    def _handle_resolve_class(
+        self,
+        mock_host,
+        request_element
+        ):
+        class_id = request_element.get("classId", "")
+        class_dns = {
+            "currentCertificate": "sys/cert-mgmt/curr-cert",
+            "generateCertificateSigningRequest": "sys/cert-mgmt/gen-csr-req"
+            }
+        managed_object = ""
+        if class_id in class_dns:
+            managed_object = self._build_managed_object(mock_host, class_dns[class_id])
+        return _build_xml_element(
+            "configResolveClass",
+            {"cookie": "", "response": "yes", "classId": class_id},
+            f"<outConfigs>{managed_object}</outConfigs>"
+            )
+
+    def _handle_conf_mo(
+        self,
+        mock_host,
+        request_element
+        ):
+        dn = request_element.get("dn", "")
+        if dn == "sys/cert-mgmt/upload-cert":
+            return self._handle_certificate_upload(mock_host, request_element)
+        if dn != "sys/cert-mgmt/gen-csr-req":
+            return self._build_error_response(request_element, "104", f"Unsupported dn {dn}.")
+        csr_request = request_element.find("inConfig/generateCertificateSigningRequest")
+        if csr_request is None or not csr_request.get("commonName"):
+            return self._build_error_response(request_element, "103", "commonName is required.")
+        if csr_request.get("selfSigned") == "yes":
+            current_time = datetime.datetime.now(datetime.timezone.utc)
+            mock_host.current_certificate.update({
+                "serialNumber": f"{random.getrandbits(64):016X}",
+                "commonName": csr_request.get("commonName", ""),
+                "organization": csr_request.get("organization", ""),
+                "organizationalUnit": csr_request.get("organizationalUnit", ""),
+                "locality": csr_request.get("locality", ""),
+                "state": csr_request.get("state", ""),
+                "countryCode": csr_request.get("countryCode", ""),
+                "issuerCommonName": csr_request.get("commonName", ""),
+                "issuerOrganization": csr_request.get("organization", ""),
+                "validFrom": _format_ucs_cimc_certificate_date(current_time),
+                "validTo": _format_ucs_cimc_certificate_date(current_time + datetime.timedelta(days=365))
+                })
+            mock_host.restart_end_time = time.monotonic() + self.restart_time
+            if self.renew_served_certificates:
+                threading.Thread(
+                    target=_renew_mock_served_certificate,
+                    args=(mock_host, csr_request.attrib),
+                    daemon=True
+                    ).start()
+        elif self.csr_push_ports.get(csr_request.get("protocol")):
+            threading.Thread(
+                target=_push_mock_certificate_signing_request,
+                args=(
+                    mock_host.host_address,
+                    csr_request.get("protocol"),
+                    csr_request.get("remoteServer", ""),
+                    self.csr_push_ports[csr_request.get("protocol")],
+                    csr_request.get("user", ""),
+                    csr_request.get("pwd", ""),
+                    csr_request.get("remoteFile", ""),
+                    self.csr_generation_time
+                    ),
+                daemon=True
+                ).start()
+        if self.csr_generation_time > 0:
+            mock_host.csr_status = "Generating CSR"
+            mock_host.csr_completion_time = time.monotonic() + self.csr_generation_time
+        else:
+            mock_host.csr_status = "Completed CSR"
+            mock_host.csr_completion_time = None
+        return _build_xml_element(
+            "configConfMo",
+            {"cookie": "", "response": "yes", "dn": dn},
+            "<outConfig>" + _build_xml_element(
+                "generateCertificateSigningRequest",
+                self._get_csr_status_attributes(mock_host)
+                ) + "</outConfig>"
+            )
+
+    def _handle_certificate_upload(
+        self,
+        mock_host,
+        request_element
+        ):
+        upload_request = request_element.find("inConfig/uploadCertificate")
+        if upload_request is None or not upload_request.get("certificateContent", "").startswith(ssl.PEM_HEADER):
+            return self._build_error_response(request_element, "103", "certificateContent must be a PEM certificate.")
+        if upload_request.get("adminAction") != "content-certificate-upload":
+            return self._build_error_response(request_element, "103", "adminAction is not supported.")
+        mock_host.uploaded_certificate = upload_request.get("certificateContent")
+        mock_host.restart_end_time = time.monotonic() + self.restart_time
+        return _build_xml_element(
+            "configConfMo",
+            {"cookie": "", "response": "yes", "dn": "sys/cert-mgmt/upload-cert"},
+            "<outConfig>" + _build_xml_element(
+                "uploadCertificate",
+                {
+                    "dn": "sys/cert-mgmt/upload-cert",
+                    "uploadStatus": "Certificate uploaded successfully",
+                    "uploadProgress": "100"
+                    }
+                ) + "</outConfig>"
+            )
+
+
+# Establish function to replace the certificate served by a simulated UCS CIMC
+def _renew_mock_served_certificate(
+    mock_host,
+    csr_attributes
+    ):
+    """This is a function to create a self-signed certificate with the
+    requested subject and serve it for a simulated UCS CIMC, the way a UCS
+    CIMC does after a self-signed certificate request.
+    """
+    certificate_subject = "".join(
+        f"/{subject_field}=" + csr_attributes[csr_attribute].replace("\\", "\\\\").replace("/", "\\/")
+        for subject_field, csr_attribute in (
+            ("CN", "commonName"),
+            ("O", "organization"),
+            ("OU", "organizationalUnit"),
+            ("L", "locality"),
+            ("ST", "state")
+            )
+        if csr_attributes.get(csr_attribute)
+        )
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    with tempfile.TemporaryDirectory() as certificate_directory:
+        try:
+            ssl_context.load_cert_chain(*create_mock_server_certificate(certificate_directory, certificate_subject))
+        except Exception:
+            return
+    mock_host.ssl_context = ssl_context
+
+
+# Establish function to push a mock certificate signing request to a remote server
+def _push_mock_certificate_signing_request(
+    host_address,
+    protocol,
+    remote_server,
+    remote_server_port,
+    remote_server_user,
+    remote_server_password,
+    remote_file,
+    csr_generation_time
+    ):
+    """This is a function to push a mock certificate signing request file to
+    a remote server over TFTP or FTP from the address of the simulated UCS
+    CIMC, the way a UCS CIMC does once the certificate signing request has
+    been generated.
+    """
+    time.sleep(csr_generation_time)
+    csr_file_contents = (
+        "-----BEGIN CERTIFICATE REQUEST-----\n"
+        + base64.encodebytes(os.urandom(720)).decode("ascii")
+        + "-----END CERTIFICATE REQUEST-----\n"
+        ).encode("ascii")
+    try:
+        if protocol == "ftp":
+            with ftplib.FTP(source_address=(host_address, 0), timeout=10) as ftp_client:
+                ftp_client.connect(remote_server, remote_server_port)
+                ftp_client.login(remote_server_user, remote_server_password)
+                ftp_client.storbinary(f"STOR {remote_file}", io.BytesIO(csr_file_contents))
+        else:
+            _push_mock_tftp_file(host_address, remote_server, remote_server_port, remote_file, csr_file_contents)
+    except (OSError, EOFError, ftplib.Error):
+        pass
+
+
+# Establish function to upload a file with a TFTP write request
+def _push_mock_tftp_file(
+    host_address,
+    remote_server,
+    remote_server_port,
+    remote_file,
+    file_contents
+    ):
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tftp_socket:
+        tftp_socket.bind((host_address, 0))
+        tftp_socket.settimeout(5)
+        tftp_socket.sendto(
+            struct.pack("!H", 2) + remote_file.encode("utf-8") + b"\0octet\0",
+            (remote_server, remote_server_port)
+            )
+        tftp_reply, tftp_peer = tftp_socket.recvfrom(516)
+        for tftp_block in range(1, len(file_contents) // 512 + 2):
+            if struct.unpack("!H", tftp_reply[:2])[0] not in (4, 6):
+                return
+            tftp_socket.sendto(
+                struct.pack("!HH", 3, tftp_block) + file_contents[(tftp_block - 1) * 512:tftp_block * 512],
+                tftp_peer
+                )
+            tftp_reply = tftp_socket.recv(516)
+
+
+# Establish class for the mock server request handler
+class UcsCimcMockRequestHandler(BaseHTTPRequestHandler):
+    """This is a class for handling HTTP requests to the mock UCS CIMC XML
+    API server.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        mock_state = self.server.mock_state
+        request_body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path != "/nuova":
+            self._send_response(404, b"")
+            return
+        time.sleep(mock_state.latency + random.uniform(0, mock_state.latency_jitter))
+        if random.random() < mock_state.drop_rate:
+            self.close_connection = True
+            return
+        response_body = mock_state.handle_xml_api_request(
+            self.connection.getsockname()[0],
+            request_body.decode("utf-8", errors="replace")
+            )
+        self._send_response(200, response_body.encode("utf-8"))
+
+    def _send_response(
+        self,
+        status_code,
+        response_body
+        ):
+        self.send_response(status_code)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+
+# Establish class for the mock UCS CIMC XML API server
+class UcsCimcMockServer(ThreadingHTTPServer):
+    """This is a class for a mock UCS CIMC XML API server. TLS handshakes are
+    performed in the per-connection worker threads, so the simulated
+    handshake delay does not hold up other connections.
+
+    Args:
+        server_address (tuple):
+            The address and port to bind to. Binding to "0.0.0.0" or
+            "127.0.0.1" on Linux accepts connections on the whole 127.0.0.0/8
+            range, and each address is treated as a separate UCS CIMC.
+        ssl_context (ssl.SSLContext):
+            The server-side SSL context.
+        mock_state (UcsCimcMockState):
+            The configuration and shared state of the mock server.
+    """
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        server_address,
+        ssl_context,
+        mock_state
+        ):
+        self.ssl_context = ssl_context
+        self.mock_state = mock_state
+        super().__init__(server_address, UcsCimcMockRequestHandler)
+
+    def finish_request(
+        self,
+        request,
+        client_address
+        ):
+        mock_host = self.mock_state.hosts.get(request.getsockname()[0])
+        if mock_host is not None and time.monotonic() < mock_host.restart_end_time:
+            # The HTTPS service of the UCS CIMC is restarting
+            return
+        time.sleep(self.mock_state.tls_handshake_delay)
+        ssl_context = self.ssl_context
+        if mock_host is not None and mock_host.ssl_context is not None:
+            ssl_context = mock_host.ssl_context
+        try:
+            tls_request = ssl_context.wrap_socket(request, server_side=True)
+        except (OSError, ssl.SSLError):
+            return
+        try:
+            super().finish_request(tls_request, client_address)
+        finally:
+            try:
+                tls_request.close()
+            except OSError:
+                pass
+
+    def handle_error(
+        self,
+        request,
+        client_address
+        ):
+        pass
+
+
+# Establish function to create a temporary self-signed certificate for the mock server
+def create_mock_server_certificate(
+    certificate_directory,
+    subject="/CN=ucs-cimc-mock-server/O=Cisco/OU=UCS"
+    ):
+    """This is a function to create a self-signed certificate and private key
+    for the mock server with the openssl command line tool.
+
+    Args:
+        certificate_directory (str):
+            The directory to write cert.pem and key.pem to.
+        subject (str):
+            The subject of the certificate, in the openssl "/CN=.../O=..."
+            format. The default value is
+            "/CN=ucs-cimc-mock-server/O=Cisco/OU=UCS".
+
+    Returns:
+        A tuple of the certificate filepath and the private key filepath.
+
+    Raises:
+        Exception:
+            The openssl command line tool is not available or failed.
+    """
+    if not shutil.which("openssl"):
+        raise Exception("The openssl command line tool is required to create "
+                        "a certificate. Provide --certfile and --keyfile instead.")
+    certificate_filepath = os.path.join(certificate_directory, "cert.pem")
+    key_filepath = os.path.join(certificate_directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes",
+         "-keyout", key_filepath, "-out", certificate_filepath,
+         "-days", "365", "-subj", subject],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+        )
+    return certificate_filepath, key_filepath
+
+
+# Establish function to start the mock server in a background thread
+def start_ucs_cimc_mock_server(
+    port=0,
+    bind_address="127.0.0.1",
+    certfile=None,
+    keyfile=None,
+    **mock_state_settings
+    ):
+    """This is a function to start the mock UCS CIMC XML API server in a
+    background thread.
+
+    Args:
+        port (int):
+            The port to listen on. The default value is 0, which selects a
+            free port.
+        bind_address (str):
+            The address to bind to. The default value is "127.0.0.1".
+        certfile (str):
+            The filepath of the server certificate. The default value is None,
+            which creates a temporary self-signed certificate.
+        keyfile (str):
+            The filepath of the server private key. The default value is None.
+        **mock_state_settings:
+            The keyword arguments for the UcsCimcMockState class, such as
+            latency, error_rate and max_sessions.
+
+    Returns:
+        A UcsCimcMockServer class instance. The listening port is available
+        from server_address[1]. Call shutdown() and server_close() to stop
+        the server.
+    """
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    if certfile is None:
+        with tempfile.TemporaryDirectory() as certificate_directory:
+            certfile, keyfile = create_mock_server_certificate(certificate_directory)
+            ssl_context.load_cert_chain(certfile, keyfile)
+    else:
+        ssl_context.load_cert_chain(certfile, keyfile)
+    mock_server = UcsCimcMockServer(
+        (bind_address, port),
+        ssl_context,
+        UcsCimcMockState(**mock_state_settings)
+        )
+    threading.Thread(
+        target=mock_server.serve_forever,
+        name="ucs-cimc-mock-server",
+        daemon=True
+        ).start()
+    return mock_server
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(
+        description="Run a mock UCS CIMC XML API server for testing the UCS "
+                    "CIMC Certificate Renewal Tool."
+        )
+    argument_parser.add_argument("--bind-address", default="127.0.0.1")
+    argument_parser.add_argument("--port", type=int, default=8443)
+    argument_parser.add_argument("--certfile")
+    argument_parser.add_argument("--keyfile")
+    argument_parser.add_argument("--latency", type=float, default=0.0,
+                                 help="Seconds added to every XML API response.")
+    argument_parser.add_argument("--latency-jitter", type=float, default=0.0,
+                                 help="Maximum random seconds added to the latency.")
+    argument_parser.add_argument("--tls-handshake-delay", type=float, default=0.0,
+                                 help="Seconds added before every TLS handshake.")
+    argument_parser.add_argument("--error-rate", type=float, default=0.0,
+                                 help="Fraction of requests answered with an XML API error.")
+    argument_parser.add_argument("--drop-rate", type=float, default=0.0,
+                                 help="Fraction of requests answered by closing the connection.")
+    argument_parser.add_argument("--max-sessions", type=int, default=4,
+                                 help="Maximum concurrent login sessions per UCS CIMC.")
+    argument_parser.add_argument("--csr-generation-time", type=float, default=0.0,
+                                 help="Seconds a certificate signing request takes to complete.")
+    argument_parser.add_argument("--renew-served-certificates", action="store_true",
+                                 help="Serve a new certificate with the requested subject after a self-signed request.")
+    argument_parser.add_argument("--restart-time", type=float, default=0.0,
+                                 help="Seconds the HTTPS service is unavailable after a self-signed request.")
+    argument_parser.add_argument("--csr-push-tftp-port", type=int,
+                                 help="Push TFTP certificate signing requests to this port on the remote server.")
+    argument_parser.add_argument("--csr-push-ftp-port", type=int,
+                                 help="Push FTP certificate signing requests to this port on the remote server.")
+    argument_parser.add_argument("--username", default="admin")
+    argument_parser.add_argument("--password")
+    arguments = argument_parser.parse_args()
+
+    mock_server = start_ucs_cimc_mock_server(
+        port=arguments.port,
+        bind_address=arguments.bind_address,
+        certfile=arguments.certfile,
+        keyfile=arguments.keyfile,
+        latency=arguments.latency,
+        latency_jitter=arguments.latency_jitter,
+        tls_handshake_delay=arguments.tls_handshake_delay,
+        error_rate=arguments.error_rate,
+        drop_rate=arguments.drop_rate,
+        max_sessions=arguments.max_sessions,
+        csr_generation_time=arguments.csr_generation_time,
+        renew_served_certificates=arguments.renew_served_certificates,
+        restart_time=arguments.restart_time,
+        csr_push_tftp_port=arguments.csr_push_tftp_port,
+        csr_push_ftp_port=arguments.csr_push_ftp_port,
+        username=arguments.username,
+        password=arguments.password
+        )
+    print(f"The UCS CIMC Mock XML API Server is listening on "
+          f"https://{arguments.bind_address}:{mock_server.server_address[1]}/nuova",
+          flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock_server.shutdown()
+        mock_server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
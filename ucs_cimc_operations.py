@@ -0,0 +1,1668 @@
+"""
+UCS CIMC Certificate Operations
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC Certificate Operations generate self-signed
+         certificates and certificate signing requests, upload signed
+         certificates and read and verify the certificates of the Cisco
+         Integrated Management Controller (CIMC) of Cisco UCS C-Series and
+         HyperFlex servers, for a single UCS CIMC or a fleet of UCS CIMCs.
+         Importing this module does no work.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import os
+import re
+import time
+import heapq
+import hashlib
+import logging
+import datetime
+import threading
+import xml.etree.ElementTree as et
+
+from ucs_cimc_client import (
+    UcsCimcSession,
+    _async_configure_ucs_cimc,
+    _build_ucs_cimc_config_conf_mo_post_body,
+    _build_ucs_cimc_managed_object_xml,
+    _evaluate_ucs_cimc_response,
+    _get_ucs_cimc_connect_address,
+    _map_ucs_cimc_servers,
+    _split_ucs_cimc_server_address,
+    log_ucs_cimc_event
+    )
+
+
+# Establish the certificate settings accepted by the UCS CIMC
+UCS_CIMC_SIGNATURE_ALGORITHMS = ("sha1", "sha256", "sha384", "sha512")
+UCS_CIMC_REMOTE_SERVER_PROTOCOLS = ("ftp", "sftp", "tftp", "scp", "none")
+
+# Establish the maximum lengths of the certificate subject fields, from the X.509 upper bounds
+_UCS_CIMC_CERTIFICATE_FIELD_MAX_LENGTHS = {
+    "common_name": 64,
+    "organization": 64,
+    "organizational_unit": 64,
+    "locality": 128,
+    "state": 128,
+    "email": 255
+    }
+
+
+# Establish function to build the UCS CIMC self-signed certificate request body
+def _build_ucs_cimc_self_signed_certificate_post_body(
+    ucs_cimc_login_cookie,
+    common_name,
+    organization,
+    organizational_unit,
+    locality,
+    state,
+    country_code
+    ):
+    """This is a function to build the XML API request body for generating a
+    self-signed certificate on a UCS CIMC. The arguments are described in
+    generate_ucs_cimc_self_signed_certificate().
+
+    Returns:
+        A string of the configConfMo XML API request body.
+    """
+    return _build_ucs_cimc_config_conf_mo_post_body(
+        ucs_cimc_login_cookie,
+        "sys/cert-mgmt/gen-csr-req",
+        _build_ucs_cimc_managed_object_xml(
+            "generateCertificateSigningRequest",
+            {
+                "commonName": common_name,
+                "organization": organization,
+                "organizationalUnit": organizational_unit,
+                "locality": locality,
+                "state": state,
+                "countryCode": country_code,
+                "dn": "sys/cert-mgmt/gen-csr-req",
+                "selfSigned": "yes"
+                }
+            )
+        )
+
+
+# Establish function to build the UCS CIMC certificate signing request body
+def _build_ucs_cimc_certificate_signing_request_post_body(
+    ucs_cimc_login_cookie,
+    common_name,
+    organization,
+    organizational_unit,
+    locality,
+    state,
+    country_code,
+    email,
+    remote_server,
+    remote_server_protocol,
+    remote_server_user,
+    remote_server_password,
+    remote_server_filepath,
+    remote_server_file_extension,
+    signature_algorithm
+    ):
+    """This is a function to build the XML API request body for generating a
+    certificate signing request on a UCS CIMC. The arguments are described in
+    generate_ucs_cimc_certificate_signing_request(). The email and remote
+    server attributes are left out when they are not provided.
+
+    Returns:
+        A string of the configConfMo XML API request body.
+    """
+    return _build_ucs_cimc_config_conf_mo_post_body(
+        ucs_cimc_login_cookie,
+        "sys/cert-mgmt/gen-csr-req",
+        _build_ucs_cimc_managed_object_xml(
+            "generateCertificateSigningRequest",
+            {
+                "commonName": common_name,
+                "organization": organization,
+                "organizationalUnit": organizational_unit,
+                "locality": locality,
+                "state": state,
+                "countryCode": country_code,
+                "email": email or None,
+                "protocol": remote_server_protocol,
+                "remoteServer": remote_server or None,
+                "user": remote_server_user,
+                "pwd": remote_server_password,
+                "remoteFile": f"{remote_server_filepath}{common_name}-csr{remote_server_file_extension}",
+                "signatureAlgorithm": signature_algorithm,
+                "dn": "sys/cert-mgmt/gen-csr-req"
+                }
+            )
+        )
+
+
+# Establish function to build the UCS CIMC signed certificate upload request body
+def _build_ucs_cimc_certificate_upload_post_body(
+    ucs_cimc_login_cookie,
+    certificate_content
+    ):
+    """This is a function to build the XML API request body for uploading a
+    signed certificate to a UCS CIMC. The line breaks of the PEM certificate
+    are written as character references, so they are kept when the attribute
+    value is parsed.
+
+    Args:
+        ucs_cimc_login_cookie (str):
+            A string of the cookie from a Response class instance of a UCS CIMC
+            login HTTP request.
+        certificate_content (str):
+            The PEM encoded signed certificate.
+
+    Returns:
+        A string of the configConfMo XML API request body.
+    """
+    return _build_ucs_cimc_config_conf_mo_post_body(
+        ucs_cimc_login_cookie,
+        "sys/cert-mgmt/upload-cert",
+        _build_ucs_cimc_managed_object_xml(
+            "uploadCertificate",
+            {
+                "adminAction": "content-certificate-upload",
+                "certificateContent": certificate_content,
+                "dn": "sys/cert-mgmt/upload-cert"
+                }
+            )
+        )
+
+
+# Establish function to validate the settings of a UCS CIMC certificate request
+def validate_ucs_cimc_certificate_request(
+    self_signed,
+    ucs_cimc_certificate_request_settings
+    ):
+    """This is a function to check the settings of a self-signed certificate
+    or certificate signing request for a UCS CIMC without contacting the UCS
+    CIMC, so settings the UCS CIMC would reject are found before any login.
+
+    Args:
+        self_signed (bool):
+            Whether a self-signed certificate is requested.
+        ucs_cimc_certificate_request_settings (dict):
+            The keyword arguments for generate_ucs_cimc_self_signed_certificate()
+            or generate_ucs_cimc_certificate_signing_request().
+
+    Returns:
+        A list of strings describing each problem found. The list is empty if
+        the settings are valid.
+    """
+    ucs_cimc_request_problems = []
+    for ucs_cimc_setting_name in ("ucs_cimc_server", "ucs_cimc_username", "ucs_cimc_password",
+                                  "common_name", "country_code"):
+        if not str(ucs_cimc_certificate_request_settings.get(ucs_cimc_setting_name) or "").strip():
+            ucs_cimc_request_problems.append(f"The {ucs_cimc_setting_name} setting is empty.")
+    for ucs_cimc_setting_name, ucs_cimc_setting_value in ucs_cimc_certificate_request_settings.items():
+        if ucs_cimc_setting_name == "ucs_cimc_session" or ucs_cimc_setting_value is None:
+            continue
+        if re.search(r"[\x00-\x1f\x7f]", str(ucs_cimc_setting_value)):
+            ucs_cimc_request_problems.append(f"The {ucs_cimc_setting_name} setting contains control characters.")
+        ucs_cimc_field_max_length = _UCS_CIMC_CERTIFICATE_FIELD_MAX_LENGTHS.get(ucs_cimc_setting_name)
+        if ucs_cimc_field_max_length and len(str(ucs_cimc_setting_value)) > ucs_cimc_field_max_length:
+            ucs_cimc_request_problems.append(
+                f"The {ucs_cimc_setting_name} setting is {len(str(ucs_cimc_setting_value))} characters long. "
+                f"The maximum is {ucs_cimc_field_max_length}."
+                )
+    if self_signed:
+        return ucs_cimc_request_problems
+
+    signature_algorithm = ucs_cimc_certificate_request_settings.get("signature_algorithm", "sha384")
+    if signature_algorithm not in UCS_CIMC_SIGNATURE_ALGORITHMS:
+        ucs_cimc_request_problems.append(
+            f"The signature algorithm {signature_algorithm!r} is not supported. "
+            f"Options: {', '.join(UCS_CIMC_SIGNATURE_ALGORITHMS)}."
+            )
+    remote_server_protocol = ucs_cimc_certificate_request_settings.get("remote_server_protocol", "none")
+    if remote_server_protocol not in UCS_CIMC_REMOTE_SERVER_PROTOCOLS:
+        ucs_cimc_request_problems.append(
+            f"The remote server protocol {remote_server_protocol!r} is not supported. "
+            f"Options: {', '.join(UCS_CIMC_REMOTE_SERVER_PROTOCOLS)}."
+            )
+    elif remote_server_protocol != "none" and not ucs_cimc_certificate_request_settings.get("remote_server"):
+        ucs_cimc_request_problems.append(
+            f"The remote_server setting is empty, but is needed for the {remote_server_protocol} protocol."
+            )
+    email = ucs_cimc_certificate_request_settings.get("email", "")
+    if email and not re.fullmatch(r"[^@\s]+@[^@\s]+", email):
+        ucs_cimc_request_problems.append(f"The email {email!r} is not a valid email address.")
+    return ucs_cimc_request_problems
+
+
+# Establish function to render the XML API request body of a UCS CIMC certificate request
+def render_ucs_cimc_certificate_request(
+    self_signed,
+    ucs_cimc_certificate_request_settings,
+    ucs_cimc_login_cookie=""
+    ):
+    """This is a function to render the configConfMo XML API request body of
+    a self-signed certificate or certificate signing request for a UCS CIMC
+    without contacting the UCS CIMC, for example to review a planned run.
+
+    Args:
+        self_signed (bool):
+            Whether a self-signed certificate is requested.
+        ucs_cimc_certificate_request_settings (dict):
+            The keyword arguments for generate_ucs_cimc_self_signed_certificate()
+            or generate_ucs_cimc_certificate_signing_request(). Settings that
+            are not provided use the defaults of those functions.
+        ucs_cimc_login_cookie (str):
+            The login cookie to place in the request body. The default value is
+            an empty string (""), as the cookie is only known after a login.
+
+    Returns:
+        A string of the configConfMo XML API request body.
+    """
+    import inspect
+
+    if self_signed:
+        ucs_cimc_generate_function = generate_ucs_cimc_self_signed_certificate
+        ucs_cimc_build_function = _build_ucs_cimc_self_signed_certificate_post_body
+    else:
+        ucs_cimc_generate_function = generate_ucs_cimc_certificate_signing_request
+        ucs_cimc_build_function = _build_ucs_cimc_certificate_signing_request_post_body
+    ucs_cimc_build_arguments = {
+        ucs_cimc_parameter.name: ucs_cimc_certificate_request_settings.get(
+            ucs_cimc_parameter.name,
+            ucs_cimc_parameter.default
+            )
+        for ucs_cimc_parameter in inspect.signature(ucs_cimc_generate_function).parameters.values()
+        if ucs_cimc_parameter.name not in ("ucs_cimc_server", "ucs_cimc_username", "ucs_cimc_password",
+                                           "ucs_cimc_session")
+        }
+    return ucs_cimc_build_function(ucs_cimc_login_cookie, **ucs_cimc_build_arguments)
+
+
+# Establish function to generate UCS CIMC self-signed certificate
+def generate_ucs_cimc_self_signed_certificate(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    common_name="localhost",
+    organization="Cisco (Self-Signed)",
+    organizational_unit="Sales",
+    locality="San Jose",
+    state="California",
+    country_code="United States",
+    ucs_cimc_session=None
+    ):
+    """"This is a function to generate a self-signed certificate for the UCS
+    CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        common_name (str):
+            The common name (CN) for the certificate signing request. The
+            default value is "localhost".
+        organization (str):
+            The organization for the certificate signing request. The
+            default value is "Cisco (Self-Signed)".
+        organizational_unit (str):
+            The organizational unit for the certificate signing request. The
+            default value is "Sales".
+        locality (str):
+            The locality for the certificate signing request. The
+            default value is "San Jose".
+        state (str):
+            The state for the certificate signing request. The
+            default value is "California".
+        country_code (str):
+            The country code for the certificate signing request. The
+            default value is "United States".
+        ucs_cimc_session (UcsCimcSession):
+            An optional UcsCimcSession class instance for the UCS CIMC. When
+            provided, the request is sent through the session and the session
+            is left logged in for further operations. The default value is
+            None, which creates a session that is logged out on completion.
+
+    Returns:
+        A Response class instance for the UCS CIMC self-signed certificate
+        HTTP request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the UCS CIMC
+            self-signed certificate HTTP request.
+    """
+    # Login to UCS CIMC and retrieve login cookie
+    ucs_cimc_session_owned = ucs_cimc_session is None
+    if ucs_cimc_session_owned:
+        ucs_cimc_session = UcsCimcSession(
+            ucs_cimc_server,
+            ucs_cimc_username,
+            ucs_cimc_password
+            )
+    try:
+        ucs_cimc_login_cookie = ucs_cimc_session.login(raise_on_failure=True)
+    
+        # Generate a Self-Signed Certificate
+        ucs_cimc_post_body = _build_ucs_cimc_self_signed_certificate_post_body(
+            ucs_cimc_login_cookie,
+            common_name=common_name,
+            organization=organization,
+            organizational_unit=organizational_unit,
+            locality=locality,
+            state=state,
+            country_code=country_code
+            )
+        log_ucs_cimc_event(
+            "Generating the self-signed certificate...",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="started"
+            )
+        ucs_cimc_self_signed_certificate_generation_request = ucs_cimc_session.post(ucs_cimc_post_body)
+        log_ucs_cimc_event(
+            f"Self-Signed Certificate Signing Request Status Code: {ucs_cimc_self_signed_certificate_generation_request.status_code}",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="completed"
+            )
+        return ucs_cimc_self_signed_certificate_generation_request
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to complete generating a self-signed certificate.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR,
+            exc_info=True
+            )
+        raise
+    finally:
+        # Logout of UCS CIMC
+        if ucs_cimc_session_owned:
+            log_ucs_cimc_event(
+                "Logging out...",
+                ucs_cimc_server=ucs_cimc_server,
+                phase="logout",
+                status="started"
+                )
+            ucs_cimc_session.close()
+
+
+# Establish function to generate UCS CIMC certificate signing request
+def generate_ucs_cimc_certificate_signing_request(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    common_name="localhost",
+    organization="Cisco",
+    organizational_unit="Sales",
+    locality="San Jose",
+    state="California",
+    country_code="United States",
+    email="",
+    remote_server="",
+    remote_server_protocol="none",
+    remote_server_user="",
+    remote_server_password="",
+    remote_server_filepath="",
+    remote_server_file_extension=".txt",
+    signature_algorithm="sha384",
+    ucs_cimc_session=None
+    ):
+    """"This is a function to generate a certificate signing request (CSR) for
+    the UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        common_name (str):
+            The common name (CN) for the certificate signing request. The
+            default value is "localhost".
+        organization (str):
+            The organization for the certificate signing request. The
+            default value is "Cisco (Self-Signed)".
+        organizational_unit (str):
+            The organizational unit for the certificate signing request. The
+            default value is "Sales".
+        locality (str):
+            The locality for the certificate signing request. The
+            default value is "San Jose".
+        state (str):
+            The state for the certificate signing request. The
+            default value is "California".
+        country_code (str):
+            The country code for the certificate signing request. The
+            default value is "United States".
+        email (str):
+            The email address for the certificate signing request. The
+            default value is an empty string ("").
+        remote_server (str):
+            The IP address or hostname of the remote server to store the
+            certificate signing request. The default value is an empty string
+            ("").
+        remote_server_protocol (str):
+            The protocol used to access the remote server when storing the
+            certificate signing request. The options are ftp, sftp, tftp, scp
+            and none. The default value is "none".
+        remote_server_user (str):
+            The username for the remote server. The default value is an empty
+            string ("").
+        remote_server_password (str):
+            The password for the remote server. The default value is an empty
+            string ("").
+        remote_server_filepath (str):
+            The filepath on the remote server for storing the certificate
+            signing request. An example is "/root/sample_folder/". The default
+            value is an empty string ("").
+        remote_server_file_extension (str):
+            The file extension for the certificate signing request when stored
+            on the remote server. The default value is ".txt".
+        signature_algorithm (str):
+            The signature algorithm for the certificate signing request. The
+            options are sha1, sha256, sha384 and sha512. The default value is
+            "sha384".
+        ucs_cimc_session (UcsCimcSession):
+            An optional UcsCimcSession class instance for the UCS CIMC. When
+            provided, the request is sent through the session and the session
+            is left logged in for further operations. The default value is
+            None, which creates a session that is logged out on completion.
+
+    Returns:
+        A Response class instance for the UCS CIMC CSR HTTP request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the UCS CIMC CSR HTTP
+            request.
+    """
+    # Login to UCS CIMC and retrieve login cookie
+    ucs_cimc_session_owned = ucs_cimc_session is None
+    if ucs_cimc_session_owned:
+        ucs_cimc_session = UcsCimcSession(
+            ucs_cimc_server,
+            ucs_cimc_username,
+            ucs_cimc_password
+            )
+    try:
+        ucs_cimc_login_cookie = ucs_cimc_session.login(raise_on_failure=True)
+    
+        # Generate a Certificate Signing Request
+        ucs_cimc_post_body = _build_ucs_cimc_certificate_signing_request_post_body(
+            ucs_cimc_login_cookie,
+            common_name=common_name,
+            organization=organization,
+            organizational_unit=organizational_unit,
+            locality=locality,
+            state=state,
+            country_code=country_code,
+            email=email,
+            remote_server=remote_server,
+            remote_server_protocol=remote_server_protocol,
+            remote_server_user=remote_server_user,
+            remote_server_password=remote_server_password,
+            remote_server_filepath=remote_server_filepath,
+            remote_server_file_extension=remote_server_file_extension,
+            signature_algorithm=signature_algorithm
+            )
+        log_ucs_cimc_event(
+            "Generating the certificate signing request...",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="started"
+            )
+        ucs_cimc_certificate_signing_request = ucs_cimc_session.post(ucs_cimc_post_body)
+        log_ucs_cimc_event(
+            f"Certificate Signing Request Status Code: {ucs_cimc_certificate_signing_request.status_code}",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="completed"
+            )
+        return ucs_cimc_certificate_signing_request
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to complete the certificate signing request.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_request",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR,
+            exc_info=True
+            )
+        raise
+    finally:
+        # Logout of UCS CIMC
+        if ucs_cimc_session_owned:
+            log_ucs_cimc_event(
+                "Logging out...",
+                ucs_cimc_server=ucs_cimc_server,
+                phase="logout",
+                status="started"
+                )
+            ucs_cimc_session.close()
+
+
+# Establish function to upload a signed certificate to UCS CIMC
+def upload_ucs_cimc_signed_certificate(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    certificate_content,
+    ucs_cimc_session=None
+    ):
+    """"This is a function to upload a certificate signed by a certificate
+    authority (CA) to the UCS CIMC. The certificate must have been signed for
+    the last certificate signing request generated on the UCS CIMC. The UCS
+    CIMC restarts its HTTPS service to serve the uploaded certificate.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_username (str):
+            The admin username of the UCS CIMC.
+        ucs_cimc_password (str):
+            The admin password of the UCS CIMC.
+        certificate_content (str):
+            The PEM encoded signed certificate.
+        ucs_cimc_session (UcsCimcSession):
+            An optional UcsCimcSession class instance for the UCS CIMC. When
+            provided, the request is sent through the session and the session
+            is left logged in for further operations. The default value is
+            None, which creates a session that is logged out on completion.
+
+    Returns:
+        A Response class instance for the UCS CIMC certificate upload HTTP
+        request.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the UCS CIMC
+            certificate upload HTTP request.
+    """
+    # Login to UCS CIMC and retrieve login cookie
+    ucs_cimc_session_owned = ucs_cimc_session is None
+    if ucs_cimc_session_owned:
+        ucs_cimc_session = UcsCimcSession(
+            ucs_cimc_server,
+            ucs_cimc_username,
+            ucs_cimc_password
+            )
+    try:
+        ucs_cimc_login_cookie = ucs_cimc_session.login(raise_on_failure=True)
+
+        # Upload the Signed Certificate
+        ucs_cimc_post_body = _build_ucs_cimc_certificate_upload_post_body(
+            ucs_cimc_login_cookie,
+            certificate_content
+            )
+        log_ucs_cimc_event(
+            "Uploading the signed certificate...",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_upload",
+            status="started"
+            )
+        ucs_cimc_certificate_upload_request = ucs_cimc_session.post(ucs_cimc_post_body)
+        log_ucs_cimc_event(
+            f"Signed Certificate Upload Status Code: {ucs_cimc_certificate_upload_request.status_code}",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_upload",
+            status="completed"
+            )
+        return ucs_cimc_certificate_upload_request
+    except Exception as exception_message:
+        log_ucs_cimc_event(
+            "Unable to complete uploading the signed certificate.",
+            ucs_cimc_server=ucs_cimc_server,
+            phase="certificate_upload",
+            status="failed",
+            error=exception_message,
+            level=logging.ERROR,
+            exc_info=True
+            )
+        raise
+    finally:
+        # Logout of UCS CIMC
+        if ucs_cimc_session_owned:
+            log_ucs_cimc_event(
+                "Logging out...",
+                ucs_cimc_server=ucs_cimc_server,
+                phase="logout",
+                status="started"
+                )
+            ucs_cimc_session.close()
+
+
+# Establish function to generate UCS CIMC self-signed certificate with asyncio
+async def async_generate_ucs_cimc_self_signed_certificate(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    common_name="localhost",
+    organization="Cisco (Self-Signed)",
+    organizational_unit="Sales",
+    locality="San Jose",
+    state="California",
+    country_code="United States",
+    ucs_cimc_login_cookie=None
+    ):
+    """This is a function to generate a self-signed certificate for the UCS
+    CIMC using the asyncio client engine. The arguments are the same as
+    generate_ucs_cimc_self_signed_certificate(), except that an optional
+    ucs_cimc_login_cookie of an existing session, such as one leased from a
+    UcsCimcSessionCache, is accepted in place of a UcsCimcSession. The
+    session of a provided cookie is left logged in.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the UCS CIMC self-signed
+        certificate HTTP request.
+    """
+    return await _async_configure_ucs_cimc(
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password,
+        _build_ucs_cimc_self_signed_certificate_post_body,
+        {
+            "common_name": common_name,
+            "organization": organization,
+            "organizational_unit": organizational_unit,
+            "locality": locality,
+            "state": state,
+            "country_code": country_code
+            },
+        ucs_cimc_login_cookie=ucs_cimc_login_cookie
+        )
+
+
+# Establish function to generate UCS CIMC certificate signing request with asyncio
+async def async_generate_ucs_cimc_certificate_signing_request(
+    ucs_cimc_server,
+    ucs_cimc_username,
+    ucs_cimc_password,
+    common_name="localhost",
+    organization="Cisco",
+    organizational_unit="Sales",
+    locality="San Jose",
+    state="California",
+    country_code="United States",
+    email="",
+    remote_server="",
+    remote_server_protocol="none",
+    remote_server_user="",
+    remote_server_password="",
+    remote_server_filepath="",
+    remote_server_file_extension=".txt",
+    signature_algorithm="sha384",
+    ucs_cimc_login_cookie=None
+    ):
+    """This is a function to generate a certificate signing request (CSR) for
+    the UCS CIMC using the asyncio client engine. The arguments are the same
+    as generate_ucs_cimc_certificate_signing_request(), except that an
+    optional ucs_cimc_login_cookie of an existing session, such as one leased
+    from a UcsCimcSessionCache, is accepted in place of a UcsCimcSession. The
+    session of a provided cookie is left logged in.
+
+    Returns:
+        A UcsCimcAsyncResponse instance for the UCS CIMC CSR HTTP request.
+    """
+    return await _async_configure_ucs_cimc(
+        ucs_cimc_server,
+        ucs_cimc_username,
+        ucs_cimc_password,
+        _build_ucs_cimc_certificate_signing_request_post_body,
+        {
+            "common_name": common_name,
+            "organization": organization,
+            "organizational_unit": organizational_unit,
+            "locality": locality,
+            "state": state,
+            "country_code": country_code,
+            "email": email,
+            "remote_server": remote_server,
+            "remote_server_protocol": remote_server_protocol,
+            "remote_server_user": remote_server_user,
+            "remote_server_password": remote_server_password,
+            "remote_server_filepath": remote_server_filepath,
+            "remote_server_file_extension": remote_server_file_extension,
+            "signature_algorithm": signature_algorithm
+            },
+        ucs_cimc_login_cookie=ucs_cimc_login_cookie
+        )
+
+
+# Establish function to parse a UCS CIMC certificate date
+def _parse_ucs_cimc_certificate_date(ucs_cimc_certificate_date):
+    """This is a function to parse a certificate validity date reported by a
+    UCS CIMC, such as "Nov 20 16:59:36 2019 GMT".
+
+    Args:
+        ucs_cimc_certificate_date (str):
+            The certificate validity date reported by the UCS CIMC.
+
+    Returns:
+        A timezone-aware datetime class instance in UTC.
+    """
+    return datetime.datetime.strptime(
+        " ".join(ucs_cimc_certificate_date.split()),
+        "%b %d %H:%M:%S %Y %Z"
+        ).replace(tzinfo=datetime.timezone.utc)
+
+
+# Establish function to retrieve the current certificate of a UCS CIMC
+def get_ucs_cimc_current_certificate(ucs_cimc_session):
+    """This is a function to retrieve the details of the certificate
+    currently installed on a UCS CIMC from the sys/cert-mgmt/curr-cert
+    managed object.
+
+    Args:
+        ucs_cimc_session (UcsCimcSession):
+            A UcsCimcSession class instance for the UCS CIMC.
+
+    Returns:
+        A dictionary of the attributes of the currentCertificate managed
+        object, such as commonName, organization, serialNumber, validFrom and
+        validTo.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with retrieving or parsing
+            the current certificate.
+    """
+    ucs_cimc_current_certificate_request = ucs_cimc_session.config_resolve_dn(
+        "sys/cert-mgmt/curr-cert"
+        )
+    ucs_cimc_current_certificate_succeeded, ucs_cimc_current_certificate_error = _evaluate_ucs_cimc_response(
+        ucs_cimc_current_certificate_request
+        )
+    if not ucs_cimc_current_certificate_succeeded:
+        raise Exception(ucs_cimc_current_certificate_error)
+    ucs_cimc_current_certificate = et.fromstring(
+        ucs_cimc_current_certificate_request.text
+        ).find("outConfig/currentCertificate")
+    if ucs_cimc_current_certificate is None:
+        raise Exception("The currentCertificate managed object was not returned.")
+    return dict(ucs_cimc_current_certificate.attrib)
+
+
+# Establish the distinguished name fields of the certificate attributes reported by the UCS CIMC
+_UCS_CIMC_CERTIFICATE_NAME_ATTRIBUTES = (
+    ("CN", "commonName"),
+    ("O", "organization"),
+    ("OU", "organizationalUnit"),
+    ("L", "locality"),
+    ("ST", "state"),
+    ("C", "countryCode")
+    )
+
+
+# Establish function to summarize the current certificate of a UCS CIMC
+def summarize_ucs_cimc_current_certificate(ucs_cimc_current_certificate):
+    """This is a function to summarize the current certificate of a UCS
+    CIMC with its subject, issuer, serial number and validity dates.
+
+    Args:
+        ucs_cimc_current_certificate (dict):
+            The attributes of the currentCertificate managed object, as
+            returned by get_ucs_cimc_current_certificate().
+
+    Returns:
+        A dictionary of the common name, subject, issuer, serial number and
+        validity dates of the certificate, the expiry time in ISO 8601
+        format, which is empty if it could not be determined, and the
+        certificate attributes.
+    """
+    def format_ucs_cimc_certificate_name(attribute_prefix):
+        ucs_cimc_name_parts = []
+        for ucs_cimc_name_field, ucs_cimc_name_attribute in _UCS_CIMC_CERTIFICATE_NAME_ATTRIBUTES:
+            if attribute_prefix:
+                ucs_cimc_name_attribute = attribute_prefix + ucs_cimc_name_attribute[0].upper() + ucs_cimc_name_attribute[1:]
+            if ucs_cimc_current_certificate.get(ucs_cimc_name_attribute):
+                ucs_cimc_name_parts.append(f"{ucs_cimc_name_field}={ucs_cimc_current_certificate[ucs_cimc_name_attribute]}")
+        return ", ".join(ucs_cimc_name_parts)
+
+    try:
+        ucs_cimc_certificate_expiry = _parse_ucs_cimc_certificate_date(
+            ucs_cimc_current_certificate.get("validTo", "")
+            ).isoformat()
+    except ValueError:
+        ucs_cimc_certificate_expiry = ""
+    return {
+        "common_name": ucs_cimc_current_certificate.get("commonName", ""),
+        "subject": format_ucs_cimc_certificate_name(""),
+        "issuer": format_ucs_cimc_certificate_name("issuer"),
+        "serial_number": ucs_cimc_current_certificate.get("serialNumber", ""),
+        "valid_from": ucs_cimc_current_certificate.get("validFrom", ""),
+        "valid_to": ucs_cimc_current_certificate.get("validTo", ""),
+        "expires_at": ucs_cimc_certificate_expiry,
+        "certificate_attributes": dict(ucs_cimc_current_certificate)
+        }
+
+
+# Establish function to read the current certificates of a fleet of UCS CIMCs
+def read_ucs_cimc_fleet_current_certificates(
+    ucs_cimc_servers,
+    ucs_cimc_read_task,
+    max_concurrent_workers=1
+    ):
+    """This is a function to read the current certificates of multiple UCS
+    CIMCs in parallel, without making any changes to them.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs. Any iterable is
+            accepted and is consumed as worker threads become available.
+        ucs_cimc_read_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC,
+            reads its current certificate and returns a dictionary of the
+            outcome.
+        max_concurrent_workers (int):
+            The maximum number of UCS CIMCs to read concurrently. The default
+            value is 1.
+
+    Returns:
+        A list of the dictionaries returned by the read task, in the order
+        the UCS CIMCs were provided.
+    """
+    return _map_ucs_cimc_servers(
+        ucs_cimc_read_task,
+        ucs_cimc_servers,
+        max_concurrent_workers=max_concurrent_workers
+        )
+
+
+# Establish function to determine whether a UCS CIMC certificate needs renewal
+def evaluate_ucs_cimc_certificate_renewal(
+    ucs_cimc_current_certificate,
+    expected_common_name=None,
+    expiry_window_days=30,
+    current_time=None
+    ):
+    """This is a function to determine whether the current certificate of a
+    UCS CIMC needs to be renewed.
+
+    Args:
+        ucs_cimc_current_certificate (dict):
+            The attributes of the currentCertificate managed object, as
+            returned by get_ucs_cimc_current_certificate().
+        expected_common_name (str):
+            The common name (CN) the certificate is expected to have. The
+            default value is None, which skips the common name check.
+        expiry_window_days (int):
+            The number of days before expiry within which the certificate is
+            renewed. The default value is 30.
+        current_time (datetime):
+            The time to compare the certificate expiry against. The default
+            value is None, which uses the current time.
+
+    Returns:
+        A tuple of a boolean indicating whether the certificate needs to be
+        renewed and a string describing the reason.
+    """
+    if current_time is None:
+        current_time = datetime.datetime.now(datetime.timezone.utc)
+    ucs_cimc_common_name = ucs_cimc_current_certificate.get("commonName", "")
+    if expected_common_name and ucs_cimc_common_name != expected_common_name:
+        return True, (f"The common name '{ucs_cimc_common_name}' does not match "
+                      f"'{expected_common_name}'.")
+    try:
+        ucs_cimc_certificate_expiry = _parse_ucs_cimc_certificate_date(
+            ucs_cimc_current_certificate.get("validTo", "")
+            )
+    except ValueError:
+        return True, "The certificate expiry date could not be determined."
+    ucs_cimc_certificate_remaining_time = ucs_cimc_certificate_expiry - current_time
+    if ucs_cimc_certificate_remaining_time <= datetime.timedelta(days=expiry_window_days):
+        return True, f"The certificate expires on {ucs_cimc_certificate_expiry:%Y-%m-%d}."
+    return False, (f"The certificate is valid until {ucs_cimc_certificate_expiry:%Y-%m-%d} "
+                   f"and matches the common name.")
+
+
+# Establish function to check which UCS CIMCs in a fleet need a certificate renewal
+def check_ucs_cimc_fleet_certificate_renewal(
+    ucs_cimc_servers,
+    ucs_cimc_check_task,
+    max_concurrent_workers=1
+    ):
+    """This is a function to run a certificate renewal check across multiple
+    UCS CIMCs in parallel, ahead of generating any certificates.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs. Any iterable is
+            accepted and is consumed as worker threads become available.
+        ucs_cimc_check_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns a dictionary with a "renewal_required" key.
+        max_concurrent_workers (int):
+            The maximum number of UCS CIMCs to check concurrently. The default
+            value is 1.
+
+    Returns:
+        A list of dictionaries containing the renewal decision for each UCS
+        CIMC, in the order the UCS CIMCs were provided.
+    """
+    return _map_ucs_cimc_servers(
+        ucs_cimc_check_task,
+        ucs_cimc_servers,
+        max_concurrent_workers=max_concurrent_workers
+        )
+
+
+# Establish function to retrieve the certificate signing request status of a UCS CIMC
+def get_ucs_cimc_certificate_signing_request_status(ucs_cimc_session):
+    """This is a function to retrieve the status of the most recent
+    certificate signing request on a UCS CIMC from the
+    sys/cert-mgmt/gen-csr-req managed object.
+
+    Args:
+        ucs_cimc_session (UcsCimcSession):
+            A UcsCimcSession class instance for the UCS CIMC.
+
+    Returns:
+        A string of the csrStatus attribute reported by the UCS CIMC.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with retrieving or parsing
+            the certificate signing request status.
+    """
+    ucs_cimc_csr_status_request = ucs_cimc_session.config_resolve_dn(
+        "sys/cert-mgmt/gen-csr-req"
+        )
+    ucs_cimc_csr_status_succeeded, ucs_cimc_csr_status_error = _evaluate_ucs_cimc_response(
+        ucs_cimc_csr_status_request
+        )
+    if not ucs_cimc_csr_status_succeeded:
+        raise Exception(ucs_cimc_csr_status_error)
+    ucs_cimc_csr_status_mo = et.fromstring(
+        ucs_cimc_csr_status_request.text
+        ).find("outConfig/generateCertificateSigningRequest")
+    if ucs_cimc_csr_status_mo is None:
+        raise Exception("The generateCertificateSigningRequest managed object was not returned.")
+    return ucs_cimc_csr_status_mo.attrib.get("csrStatus", "")
+
+
+# Establish function to classify a UCS CIMC certificate signing request status
+def _classify_ucs_cimc_certificate_signing_request_status(ucs_cimc_csr_status):
+    """This is a function to classify the csrStatus attribute reported by a
+    UCS CIMC into a final or in progress state.
+
+    Args:
+        ucs_cimc_csr_status (str):
+            The csrStatus attribute reported by the UCS CIMC.
+
+    Returns:
+        A string of "completed", "failed" or "in_progress".
+    """
+    ucs_cimc_csr_status = ucs_cimc_csr_status.lower()
+    if "fail" in ucs_cimc_csr_status or "error" in ucs_cimc_csr_status:
+        return "failed"
+    if "complete" in ucs_cimc_csr_status or "success" in ucs_cimc_csr_status:
+        return "completed"
+    return "in_progress"
+
+
+# Establish function to poll the certificate signing request status across a fleet of UCS CIMCs
+def poll_ucs_cimc_fleet_certificate_signing_request_completion(
+    ucs_cimc_servers,
+    ucs_cimc_status_task,
+    initial_interval=2.0,
+    max_interval=30.0,
+    backoff_multiplier=1.5,
+    timeout=600.0,
+    max_concurrent_polls=10
+    ):
+    """This is a function to wait for multiple UCS CIMCs to finish generating
+    their certificate signing requests. All pending UCS CIMCs are tracked in
+    a single polling loop. The polling interval for a UCS CIMC grows while
+    its status is unchanged and is reset when its status changes.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs.
+        ucs_cimc_status_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns the csrStatus attribute reported by the UCS CIMC.
+        initial_interval (float):
+            The number of seconds before the first poll of each UCS CIMC. The
+            default value is 2.0.
+        max_interval (float):
+            The maximum number of seconds between polls of a UCS CIMC. The
+            default value is 30.0.
+        backoff_multiplier (float):
+            The factor the polling interval grows by while the status of a
+            UCS CIMC is unchanged. The default value is 1.5.
+        timeout (float):
+            The number of seconds after which a UCS CIMC that has not reached
+            a final status is reported as timed out. The default value is
+            600.0.
+        max_concurrent_polls (int):
+            The maximum number of status requests in flight at once. The
+            default value is 10.
+
+    Returns:
+        A list of dictionaries containing the final state, last reported
+        status, number of polls and time to completion for each UCS CIMC, in
+        the order the UCS CIMCs were provided.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    ucs_cimc_polling_start_time = time.monotonic()
+    ucs_cimc_polling_states = {}
+    ucs_cimc_polling_schedule = []
+    for ucs_cimc_server in ucs_cimc_servers:
+        ucs_cimc_polling_states[ucs_cimc_server] = {
+            "ucs_cimc_server": ucs_cimc_server,
+            "state": "in_progress",
+            "csr_status": "",
+            "polls": 0,
+            "time_to_completion": None,
+            "interval": initial_interval
+            }
+        heapq.heappush(
+            ucs_cimc_polling_schedule,
+            (ucs_cimc_polling_start_time + initial_interval, ucs_cimc_server)
+            )
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent_polls)) as ucs_cimc_executor:
+        ucs_cimc_polls_in_flight = {}
+        while ucs_cimc_polling_schedule or ucs_cimc_polls_in_flight:
+            # Start the polls that are due
+            ucs_cimc_current_time = time.monotonic()
+            while (ucs_cimc_polling_schedule
+                   and ucs_cimc_polling_schedule[0][0] <= ucs_cimc_current_time
+                   and len(ucs_cimc_polls_in_flight) < max_concurrent_polls):
+                ucs_cimc_server = heapq.heappop(ucs_cimc_polling_schedule)[1]
+                ucs_cimc_polls_in_flight[ucs_cimc_executor.submit(ucs_cimc_status_task, ucs_cimc_server)] = ucs_cimc_server
+
+            # Wait for a poll to finish or the next poll to become due
+            ucs_cimc_wait_time = None
+            if ucs_cimc_polling_schedule:
+                ucs_cimc_wait_time = max(0.0, ucs_cimc_polling_schedule[0][0] - time.monotonic())
+            if not ucs_cimc_polls_in_flight:
+                time.sleep(ucs_cimc_wait_time)
+                continue
+            ucs_cimc_completed_polls, _ = wait(
+                ucs_cimc_polls_in_flight,
+                timeout=ucs_cimc_wait_time,
+                return_when=FIRST_COMPLETED
+                )
+
+            # Update the state of the UCS CIMCs that were polled
+            for ucs_cimc_completed_poll in ucs_cimc_completed_polls:
+                ucs_cimc_server = ucs_cimc_polls_in_flight.pop(ucs_cimc_completed_poll)
+                ucs_cimc_polling_state = ucs_cimc_polling_states[ucs_cimc_server]
+                ucs_cimc_polling_state["polls"] += 1
+                ucs_cimc_elapsed_time = time.monotonic() - ucs_cimc_polling_start_time
+                try:
+                    ucs_cimc_csr_status = ucs_cimc_completed_poll.result()
+                except Exception as exception_message:
+                    ucs_cimc_csr_status = f"Unable to retrieve the status: {exception_message}"
+                    ucs_cimc_csr_state = "in_progress"
+                else:
+                    ucs_cimc_csr_state = _classify_ucs_cimc_certificate_signing_request_status(ucs_cimc_csr_status)
+                if ucs_cimc_csr_status != ucs_cimc_polling_state["csr_status"]:
+                    ucs_cimc_polling_state["interval"] = initial_interval
+                else:
+                    ucs_cimc_polling_state["interval"] = min(
+                        max_interval,
+                        ucs_cimc_polling_state["interval"] * backoff_multiplier
+                        )
+                ucs_cimc_polling_state["csr_status"] = ucs_cimc_csr_status
+                if ucs_cimc_csr_state != "in_progress":
+                    ucs_cimc_polling_state["state"] = ucs_cimc_csr_state
+                    ucs_cimc_polling_state["time_to_completion"] = ucs_cimc_elapsed_time
+                elif ucs_cimc_elapsed_time >= timeout:
+                    ucs_cimc_polling_state["state"] = "timed_out"
+                else:
+                    heapq.heappush(
+                        ucs_cimc_polling_schedule,
+                        (time.monotonic() + ucs_cimc_polling_state["interval"], ucs_cimc_server)
+                        )
+
+    ucs_cimc_polling_results = []
+    for ucs_cimc_polling_state in ucs_cimc_polling_states.values():
+        del ucs_cimc_polling_state["interval"]
+        ucs_cimc_polling_results.append(ucs_cimc_polling_state)
+    return ucs_cimc_polling_results
+
+
+# Establish exception raised when a certificate cannot be parsed
+class UcsCimcCertificateParseError(ValueError):
+    """This is an exception raised when a DER encoded certificate, such as
+    the certificate served by a UCS CIMC, cannot be parsed.
+    """
+
+
+# Establish the DER string types of the certificate subject attributes that are not UTF-8 compatible
+_UCS_CIMC_CERTIFICATE_STRING_ENCODINGS = {
+    0x14: "latin-1",
+    0x1C: "utf-32-be",
+    0x1E: "utf-16-be"
+    }
+
+
+# Establish the DER object identifiers of the certificate subject attributes
+_UCS_CIMC_CERTIFICATE_SUBJECT_OIDS = {
+    bytes([0x55, 0x04, 0x03]): "commonName",
+    bytes([0x55, 0x04, 0x0A]): "organization",
+    bytes([0x55, 0x04, 0x0B]): "organizationalUnit"
+    }
+
+
+# Establish function to read a DER element
+def _read_der_element(
+    der_data,
+    offset
+    ):
+    """This is a function to read the tag and content boundaries of a DER
+    encoded element.
+
+    Args:
+        der_data (bytes):
+            The DER encoded data.
+        offset (int):
+            The offset of the element in the data.
+
+    Returns:
+        A tuple of the tag, the offset of the content and the offset of the
+        end of the element.
+
+    Raises:
+        ValueError:
+            The element is truncated or uses an unsupported length encoding.
+    """
+    if offset + 2 > len(der_data):
+        raise ValueError("The DER element is truncated.")
+    der_tag = der_data[offset]
+    der_length = der_data[offset + 1]
+    der_content_offset = offset + 2
+    if der_length & 0x80:
+        der_length_size = der_length & 0x7F
+        if not 1 <= der_length_size <= 4:
+            raise ValueError("The DER element length is not supported.")
+        der_length = int.from_bytes(der_data[der_content_offset:der_content_offset + der_length_size], "big")
+        der_content_offset += der_length_size
+    if der_content_offset + der_length > len(der_data):
+        raise ValueError("The DER element is truncated.")
+    return der_tag, der_content_offset, der_content_offset + der_length
+
+
+# Establish function to read the elements of a DER sequence or set
+def _read_der_children(
+    der_data,
+    content_offset,
+    end_offset
+    ):
+    der_children = []
+    while content_offset < end_offset:
+        der_child = _read_der_element(der_data, content_offset)
+        der_children.append(der_child)
+        content_offset = der_child[2]
+    return der_children
+
+
+# Establish function to parse a DER encoded X.509 time
+def _parse_der_time(
+    der_tag,
+    der_time
+    ):
+    der_time = der_time.decode("ascii").rstrip("Z")
+    if der_tag == 0x17:
+        # UTCTime uses two-digit years, where 50 to 99 are in the 1900s
+        der_time = ("19" if int(der_time[:2]) >= 50 else "20") + der_time
+    return datetime.datetime.strptime(der_time[:14], "%Y%m%d%H%M%S").replace(tzinfo=datetime.timezone.utc)
+
+
+# Establish function to parse a DER encoded certificate
+def parse_ucs_cimc_der_certificate(ucs_cimc_der_certificate):
+    """This is a function to parse the subject and validity dates of a DER
+    encoded X.509 certificate, such as the certificate served by a UCS CIMC.
+
+    Args:
+        ucs_cimc_der_certificate (bytes):
+            The DER encoded certificate.
+
+    Returns:
+        A dictionary of the commonName, organization and organizationalUnit
+        of the subject, the notBefore and notAfter dates as timezone-aware
+        datetime class instances and the SHA-256 fingerprint of the
+        certificate.
+
+    Raises:
+        UcsCimcCertificateParseError:
+            The certificate could not be parsed.
+    """
+    try:
+        _, certificate_offset, certificate_end = _read_der_element(ucs_cimc_der_certificate, 0)
+        _, tbs_offset, tbs_end = _read_der_element(ucs_cimc_der_certificate, certificate_offset)
+        tbs_fields = _read_der_children(ucs_cimc_der_certificate, tbs_offset, tbs_end)
+        # Skip the optional explicitly tagged version
+        if tbs_fields[0][0] == 0xA0:
+            tbs_fields = tbs_fields[1:]
+        _, validity_offset, validity_end = tbs_fields[3]
+        _, subject_offset, subject_end = tbs_fields[4]
+        ucs_cimc_served_certificate = {
+            "commonName": "",
+            "organization": "",
+            "organizationalUnit": ""
+            }
+        for _, rdn_offset, rdn_end in _read_der_children(ucs_cimc_der_certificate, subject_offset, subject_end):
+            for _, attribute_offset, attribute_end in _read_der_children(ucs_cimc_der_certificate, rdn_offset, rdn_end):
+                (_, oid_offset, oid_end), (value_tag, value_offset, value_end) = _read_der_children(
+                    ucs_cimc_der_certificate,
+                    attribute_offset,
+                    attribute_end
+                    )[:2]
+                attribute_name = _UCS_CIMC_CERTIFICATE_SUBJECT_OIDS.get(ucs_cimc_der_certificate[oid_offset:oid_end])
+                if attribute_name:
+                    ucs_cimc_served_certificate[attribute_name] = ucs_cimc_der_certificate[value_offset:value_end].decode(
+                        _UCS_CIMC_CERTIFICATE_STRING_ENCODINGS.get(value_tag, "utf-8"),
+                        errors="replace"
+                        )
+        (not_before_tag, not_before_offset, not_before_end), (not_after_tag, not_after_offset, not_after_end) = _read_der_children(
+            ucs_cimc_der_certificate,
+            validity_offset,
+            validity_end
+            )
+        ucs_cimc_served_certificate["notBefore"] = _parse_der_time(
+            not_before_tag,
+            ucs_cimc_der_certificate[not_before_offset:not_before_end]
+            )
+        ucs_cimc_served_certificate["notAfter"] = _parse_der_time(
+            not_after_tag,
+            ucs_cimc_der_certificate[not_after_offset:not_after_end]
+            )
+    except (IndexError, ValueError, UnicodeDecodeError) as exception_message:
+        raise UcsCimcCertificateParseError(f"Unable to parse the certificate: {exception_message}") from None
+    ucs_cimc_served_certificate["sha256_fingerprint"] = hashlib.sha256(ucs_cimc_der_certificate).hexdigest()
+    return ucs_cimc_served_certificate
+
+
+# Establish function to retrieve the certificate served by a UCS CIMC
+def probe_ucs_cimc_tls_certificate(
+    ucs_cimc_server,
+    timeout=10
+    ):
+    """This is a function to perform a TLS handshake with a UCS CIMC and
+    retrieve the certificate it serves.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, optionally followed by
+            a colon and a port number.
+        timeout (float):
+            The number of seconds to wait for the connection and handshake.
+            The default value is 10.
+
+    Returns:
+        A dictionary of the served certificate, as returned by
+        parse_ucs_cimc_der_certificate().
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the connection to the
+            UCS CIMC or the served certificate.
+    """
+    import socket
+    import ssl
+    ucs_cimc_host, ucs_cimc_port = _split_ucs_cimc_server_address(ucs_cimc_server)
+    ucs_cimc_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ucs_cimc_ssl_context.check_hostname = False
+    ucs_cimc_ssl_context.verify_mode = ssl.CERT_NONE
+    ucs_cimc_connect_address = _get_ucs_cimc_connect_address(ucs_cimc_host)
+    with socket.create_connection((ucs_cimc_connect_address, ucs_cimc_port), timeout=timeout) as ucs_cimc_socket:
+        with ucs_cimc_ssl_context.wrap_socket(ucs_cimc_socket, server_hostname=ucs_cimc_host) as ucs_cimc_tls_socket:
+            ucs_cimc_der_certificate = ucs_cimc_tls_socket.getpeercert(binary_form=True)
+    if not ucs_cimc_der_certificate:
+        raise ValueError("No certificate was served.")
+    return parse_ucs_cimc_der_certificate(ucs_cimc_der_certificate)
+
+
+# Establish function to evaluate the certificate served by a UCS CIMC after a renewal
+def evaluate_ucs_cimc_served_certificate(
+    ucs_cimc_served_certificate,
+    expected_subject,
+    initial_fingerprint=None,
+    current_time=None
+    ):
+    """This is a function to determine whether a UCS CIMC is serving the
+    certificate requested in a renewal.
+
+    Args:
+        ucs_cimc_served_certificate (dict):
+            The served certificate, as returned by
+            parse_ucs_cimc_der_certificate().
+        expected_subject (dict):
+            The requested commonName, organization and organizationalUnit.
+        initial_fingerprint (str):
+            The SHA-256 fingerprint of the certificate served before the
+            renewal. The default value is None, which skips the check for a
+            replaced certificate.
+        current_time (datetime):
+            The time to compare the validity dates against. The default value
+            is None, which uses the current time.
+
+    Returns:
+        A tuple of the state and a string describing the reason. The state is
+        "ready" if the requested certificate is served, "pending" if the
+        certificate from before the renewal is still served or "failed" if a
+        replaced certificate does not match the request.
+    """
+    if current_time is None:
+        current_time = datetime.datetime.now(datetime.timezone.utc)
+    if initial_fingerprint and ucs_cimc_served_certificate["sha256_fingerprint"] == initial_fingerprint:
+        return "pending", "The certificate from before the renewal is still served."
+    for ucs_cimc_subject_attribute, ucs_cimc_expected_value in expected_subject.items():
+        if ucs_cimc_served_certificate.get(ucs_cimc_subject_attribute, "") != ucs_cimc_expected_value:
+            return "failed", (f"The served {ucs_cimc_subject_attribute} "
+                              f"'{ucs_cimc_served_certificate.get(ucs_cimc_subject_attribute, '')}' "
+                              f"does not match '{ucs_cimc_expected_value}'.")
+    if ucs_cimc_served_certificate["notBefore"] > current_time:
+        return "failed", f"The served certificate is not valid before {ucs_cimc_served_certificate['notBefore']:%Y-%m-%d %H:%M:%S} UTC."
+    if ucs_cimc_served_certificate["notAfter"] <= current_time:
+        return "failed", f"The served certificate expired on {ucs_cimc_served_certificate['notAfter']:%Y-%m-%d}."
+    return "ready", f"The requested certificate is served until {ucs_cimc_served_certificate['notAfter']:%Y-%m-%d}."
+
+
+# Establish function to wait for multiple UCS CIMCs to serve their renewed certificates
+def verify_ucs_cimc_fleet_tls_certificates(
+    ucs_cimc_servers,
+    ucs_cimc_verify_task,
+    interval=2.0,
+    timeout=300.0,
+    max_concurrent_probes=10
+    ):
+    """This is a function to wait for multiple UCS CIMCs to restart their
+    HTTPS service and serve their renewed certificates. All pending UCS
+    CIMCs are tracked in a single polling loop, with up to the given number
+    of TLS handshakes in flight at once.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs.
+        ucs_cimc_verify_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns a tuple of the state and reason, as returned by
+            evaluate_ucs_cimc_served_certificate(). Exceptions are treated as
+            the UCS CIMC not being ready yet, except a
+            UcsCimcCertificateParseError, which fails the UCS CIMC at once.
+        interval (float):
+            The number of seconds between probes of a UCS CIMC. The default
+            value is 2.0.
+        timeout (float):
+            The number of seconds after which a UCS CIMC that is not ready is
+            reported as timed out. The default value is 300.0.
+        max_concurrent_probes (int):
+            The maximum number of TLS handshakes in flight at once. The default
+            value is 10.
+
+    Returns:
+        A list of dictionaries containing the final state, reason, number of
+        probes and time to ready for each UCS CIMC, in the order the UCS CIMCs
+        were provided.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    ucs_cimc_verification_start_time = time.monotonic()
+    ucs_cimc_verification_states = {}
+    ucs_cimc_verification_schedule = []
+    for ucs_cimc_server in ucs_cimc_servers:
+        ucs_cimc_verification_states[ucs_cimc_server] = {
+            "ucs_cimc_server": ucs_cimc_server,
+            "state": "pending",
+            "reason": "",
+            "probes": 0,
+            "time_to_ready": None
+            }
+        heapq.heappush(ucs_cimc_verification_schedule, (ucs_cimc_verification_start_time, ucs_cimc_server))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent_probes)) as ucs_cimc_executor:
+        ucs_cimc_probes_in_flight = {}
+        while ucs_cimc_verification_schedule or ucs_cimc_probes_in_flight:
+            # Start the probes that are due
+            ucs_cimc_current_time = time.monotonic()
+            while (ucs_cimc_verification_schedule
+                   and ucs_cimc_verification_schedule[0][0] <= ucs_cimc_current_time
+                   and len(ucs_cimc_probes_in_flight) < max_concurrent_probes):
+                ucs_cimc_server = heapq.heappop(ucs_cimc_verification_schedule)[1]
+                ucs_cimc_probes_in_flight[ucs_cimc_executor.submit(ucs_cimc_verify_task, ucs_cimc_server)] = ucs_cimc_server
+
+            # Wait for a probe to finish or the next probe to become due
+            ucs_cimc_wait_time = None
+            if ucs_cimc_verification_schedule:
+                ucs_cimc_wait_time = max(0.0, ucs_cimc_verification_schedule[0][0] - time.monotonic())
+            if not ucs_cimc_probes_in_flight:
+                time.sleep(ucs_cimc_wait_time)
+                continue
+            ucs_cimc_completed_probes, _ = wait(
+                ucs_cimc_probes_in_flight,
+                timeout=ucs_cimc_wait_time,
+                return_when=FIRST_COMPLETED
+                )
+
+            # Update the state of the UCS CIMCs that were probed
+            for ucs_cimc_completed_probe in ucs_cimc_completed_probes:
+                ucs_cimc_server = ucs_cimc_probes_in_flight.pop(ucs_cimc_completed_probe)
+                ucs_cimc_verification_state = ucs_cimc_verification_states[ucs_cimc_server]
+                ucs_cimc_verification_state["probes"] += 1
+                ucs_cimc_elapsed_time = time.monotonic() - ucs_cimc_verification_start_time
+                try:
+                    ucs_cimc_tls_state, ucs_cimc_tls_reason = ucs_cimc_completed_probe.result()
+                except UcsCimcCertificateParseError as exception_message:
+                    # A served certificate that cannot be parsed will not be parsed on a later probe either
+                    ucs_cimc_tls_state = "failed"
+                    ucs_cimc_tls_reason = f"The served certificate could not be verified: {exception_message}"
+                except Exception as exception_message:
+                    ucs_cimc_tls_state = "pending"
+                    ucs_cimc_tls_reason = f"The HTTPS service is not available: {exception_message}"
+                ucs_cimc_verification_state["reason"] = ucs_cimc_tls_reason
+                if ucs_cimc_tls_state != "pending":
+                    ucs_cimc_verification_state["state"] = ucs_cimc_tls_state
+                    ucs_cimc_verification_state["time_to_ready"] = ucs_cimc_elapsed_time
+                elif ucs_cimc_elapsed_time >= timeout:
+                    ucs_cimc_verification_state["state"] = "timed_out"
+                else:
+                    heapq.heappush(
+                        ucs_cimc_verification_schedule,
+                        (time.monotonic() + interval, ucs_cimc_server)
+                        )
+
+    return list(ucs_cimc_verification_states.values())
+
+
+# Establish function to read a PEM encoded certificate file
+def read_ucs_cimc_pem_certificate(certificate_filepath):
+    """This is a function to read the first certificate of a PEM encoded
+    certificate file. Any further certificates in the file, such as an
+    intermediate CA chain, are ignored.
+
+    Args:
+        certificate_filepath (str):
+            The filepath of the PEM encoded certificate.
+
+    Returns:
+        A tuple of the PEM encoded certificate and a dictionary of the
+        certificate, as returned by parse_ucs_cimc_der_certificate().
+
+    Raises:
+        ValueError:
+            The file does not contain a complete PEM encoded certificate.
+    """
+    import ssl
+    with open(certificate_filepath, encoding="ascii", errors="replace") as certificate_file:
+        certificate_file_contents = certificate_file.read()
+    pem_certificate_match = re.search(
+        f"{re.escape(ssl.PEM_HEADER)}.*?{re.escape(ssl.PEM_FOOTER)}",
+        certificate_file_contents,
+        re.DOTALL
+        )
+    if pem_certificate_match is None:
+        raise ValueError("No complete PEM certificate was found.")
+    pem_certificate = pem_certificate_match.group(0) + "\n"
+    return pem_certificate, parse_ucs_cimc_der_certificate(ssl.PEM_cert_to_DER_cert(pem_certificate))
+
+
+# Establish class for watching a directory for signed certificates to upload to UCS CIMCs
+class UcsCimcSignedCertificateWatcher:
+    """This is a class for watching a directory for certificates signed by a
+    certificate authority (CA) and matching each one to the UCS CIMC with the
+    same common name. Iterating over the watcher yields each UCS CIMC as soon
+    as its certificate appears in the directory, so it can be passed straight
+    to run_ucs_cimc_fleet().
+
+    Args:
+        certificate_directory (str):
+            The directory of the signed certificates.
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs to match the
+            certificates to.
+        common_name_function (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns the common name its certificate is expected to have.
+            The default value is str, which expects the UCS CIMC server entry.
+        scan_interval (float):
+            The number of seconds between scans of the directory. The default
+            value is 2.0.
+        idle_timeout (float):
+            The number of seconds without a new certificate after which the
+            watcher stops. A value of 0 scans the directory once. The default
+            value is 60.0.
+        file_extensions (tuple):
+            The file extensions of the certificate files. The default value is
+            (".pem", ".crt", ".cer").
+    """
+    def __init__(
+        self,
+        certificate_directory,
+        ucs_cimc_servers,
+        common_name_function=str,
+        scan_interval=2.0,
+        idle_timeout=60.0,
+        file_extensions=(".pem", ".crt", ".cer")
+        ):
+        self.certificate_directory = certificate_directory
+        self.scan_interval = scan_interval
+        self.idle_timeout = idle_timeout
+        self.file_extensions = tuple(file_extension.lower() for file_extension in file_extensions)
+        self.skipped_certificates = []
+        self._ucs_cimc_servers_by_common_name = {}
+        for ucs_cimc_server in ucs_cimc_servers:
+            self._ucs_cimc_servers_by_common_name.setdefault(
+                common_name_function(ucs_cimc_server).lower(),
+                []
+                ).append(ucs_cimc_server)
+        self._signed_certificates = {}
+        self._signed_certificates_lock = threading.Lock()
+
+    def __iter__(self):
+        ucs_cimc_server_count = sum(len(ucs_cimc_servers) for ucs_cimc_servers in self._ucs_cimc_servers_by_common_name.values())
+        certificate_file_signatures = {}
+        unreadable_certificate_file_signatures = {}
+        last_certificate_time = time.monotonic()
+        while len(self._signed_certificates) < ucs_cimc_server_count:
+            try:
+                certificate_directory_entries = sorted(os.scandir(self.certificate_directory), key=lambda entry: entry.name)
+            except FileNotFoundError:
+                certificate_directory_entries = []
+            for certificate_directory_entry in certificate_directory_entries:
+                if (not certificate_directory_entry.name.lower().endswith(self.file_extensions)
+                        or not certificate_directory_entry.is_file()):
+                    continue
+                certificate_file_stat = certificate_directory_entry.stat()
+                certificate_file_signature = (certificate_file_stat.st_size, certificate_file_stat.st_mtime_ns)
+                if certificate_file_signatures.get(certificate_directory_entry.path) == certificate_file_signature:
+                    continue
+                try:
+                    pem_certificate, signed_certificate = read_ucs_cimc_pem_certificate(certificate_directory_entry.path)
+                except (OSError, ValueError) as exception_message:
+                    # The file may still be being written, so it is only skipped once it is unchanged for a scan
+                    if unreadable_certificate_file_signatures.get(certificate_directory_entry.path) == certificate_file_signature:
+                        certificate_file_signatures[certificate_directory_entry.path] = certificate_file_signature
+                        self.skipped_certificates.append({
+                            "certificate_filepath": certificate_directory_entry.path,
+                            "reason": str(exception_message)
+                            })
+                    unreadable_certificate_file_signatures[certificate_directory_entry.path] = certificate_file_signature
+                    continue
+                certificate_file_signatures[certificate_directory_entry.path] = certificate_file_signature
+                last_certificate_time = time.monotonic()
+                ucs_cimc_server, skip_reason = self._match_signed_certificate(signed_certificate)
+                if ucs_cimc_server is None:
+                    self.skipped_certificates.append({
+                        "certificate_filepath": certificate_directory_entry.path,
+                        "reason": skip_reason
+                        })
+                    continue
+                with self._signed_certificates_lock:
+                    self._signed_certificates[ucs_cimc_server] = {
+                        "certificate_filepath": certificate_directory_entry.path,
+                        "certificate_content": pem_certificate,
+                        "common_name": signed_certificate.get("commonName", ""),
+                        "not_after": signed_certificate["notAfter"],
+                        "sha256_fingerprint": signed_certificate["sha256_fingerprint"]
+                        }
+                yield ucs_cimc_server
+            if (len(self._signed_certificates) >= ucs_cimc_server_count
+                    or time.monotonic() - last_certificate_time >= self.idle_timeout):
+                return
+            time.sleep(self.scan_interval)
+
+    def _match_signed_certificate(self, signed_certificate):
+        """This is a method to find the UCS CIMC a signed certificate is for.
+
+        Args:
+            signed_certificate (dict):
+                The signed certificate, as returned by
+                parse_ucs_cimc_der_certificate().
+
+        Returns:
+            A tuple of the matching UCS CIMC, or None, and a string describing
+            why the certificate was skipped, if it was.
+        """
+        signed_certificate_common_name = signed_certificate.get("commonName", "")
+        ucs_cimc_servers = self._ucs_cimc_servers_by_common_name.get(signed_certificate_common_name.lower(), [])
+        if not ucs_cimc_servers:
+            return None, f"No pending UCS CIMC has the common name '{signed_certificate_common_name}'."
+        if len(ucs_cimc_servers) > 1:
+            return None, (f"The common name '{signed_certificate_common_name}' matches "
+                          f"{len(ucs_cimc_servers)} UCS CIMCs.")
+        if ucs_cimc_servers[0] in self._signed_certificates:
+            return None, (f"A certificate for {ucs_cimc_servers[0]} was already found in "
+                          f"{self._signed_certificates[ucs_cimc_servers[0]]['certificate_filepath']}.")
+        if signed_certificate["notAfter"] <= datetime.datetime.now(datetime.timezone.utc):
+            return None, f"The certificate expired on {signed_certificate['notAfter']:%Y-%m-%d}."
+        return ucs_cimc_servers[0], ""
+
+    def get_signed_certificate(self, ucs_cimc_server):
+        """This is a method to obtain the signed certificate matched to a UCS
+        CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+
+        Returns:
+            A dictionary of the certificate filepath, PEM encoded content,
+            common name, expiry date and SHA-256 fingerprint, or None if no
+            certificate has been matched to the UCS CIMC.
+        """
+        with self._signed_certificates_lock:
+            return self._signed_certificates.get(ucs_cimc_server)
+
+    def get_unmatched_ucs_cimc_servers(self):
+        """This is a method to obtain the UCS CIMCs that no signed certificate
+        has been matched to.
+
+        Returns:
+            A list of the hostnames or IP addresses of the UCS CIMCs.
+        """
+        with self._signed_certificates_lock:
+            return [
+                ucs_cimc_server
+                for ucs_cimc_servers in self._ucs_cimc_servers_by_common_name.values()
+                for ucs_cimc_server in ucs_cimc_servers
+                if ucs_cimc_server not in self._signed_certificates
+                ]
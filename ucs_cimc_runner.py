@@ -0,0 +1,2235 @@
+"""
+UCS CIMC Fleet Runner
+Author: Ugo Emekauwa
+Contact: uemekauw@cisco.com, uemekauwa@gmail.com
+Summary: The UCS CIMC Fleet Runner streams UCS CIMC inventories and runs
+         tasks across a fleet of UCS CIMCs with bounded concurrency,
+         per-group limits, canary waves and a checkpoint journal, using
+         either worker threads or asyncio. Large fleets can be split into
+         deterministic shards run by separate processes or systems.
+         The certificate renewal run of the UCS CIMC Certificate Renewal
+         Tool is provided by run_ucs_cimc_certificate_renewal(), which
+         takes its settings explicitly. Importing this module does no work.
+GitHub Repository: https://github.com/ugo-emekauwa/ucs-cimc-csr-tool
+"""
+
+
+import sys
+import os
+import csv
+import time
+import json
+import hashlib
+import logging
+import functools
+import itertools
+import threading
+import contextlib
+import collections
+
+from ucs_cimc_client import (
+    UcsCimcRunMetrics,
+    UcsCimcSessionCache,
+    UcsCimcResolverCache,
+    set_ucs_cimc_resolver_cache,
+    set_ucs_cimc_run_metrics,
+    clear_ucs_cimc_initial_certificate_fingerprints,
+    _evaluate_ucs_cimc_response,
+    _map_ucs_cimc_servers,
+    _record_ucs_cimc_phase_metric,
+    _split_ucs_cimc_server_address,
+    log_ucs_cimc_event,
+    flush_ucs_cimc_event_log
+    )
+from ucs_cimc_operations import (
+    check_ucs_cimc_fleet_certificate_renewal,
+    poll_ucs_cimc_fleet_certificate_signing_request_completion,
+    verify_ucs_cimc_fleet_tls_certificates,
+    UcsCimcSignedCertificateWatcher
+    )
+
+
+# Establish the inventory fields that can be provided for each UCS CIMC
+UCS_CIMC_INVENTORY_FIELDS = (
+    "ucs_cimc_server",
+    "cluster",
+    "ucs_cimc_username",
+    "ucs_cimc_password",
+    "common_name",
+    "organization",
+    "organizational_unit",
+    "locality",
+    "state",
+    "country_code",
+    "email",
+    "remote_server",
+    "remote_server_protocol",
+    "remote_server_user",
+    "remote_server_password",
+    "remote_server_filepath",
+    "remote_server_file_extension",
+    "signature_algorithm"
+    )
+
+
+# Establish class for a UCS CIMC server entry loaded from an inventory
+class UcsCimcInventoryRecord(str):
+    """This is a class for a UCS CIMC server entry loaded from an inventory.
+    The record is the hostname or IP address of the UCS CIMC and can be used
+    anywhere a UCS CIMC server entry is expected, while also carrying the
+    settings provided for the UCS CIMC in the inventory.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        overrides (dict):
+            The settings provided for the UCS CIMC, keyed by the names in
+            UCS_CIMC_INVENTORY_FIELDS. These take precedence over the
+            configuration settings. The default value is None.
+    """
+    def __new__(
+        cls,
+        ucs_cimc_server,
+        overrides=None
+        ):
+        ucs_cimc_inventory_record = super().__new__(cls, ucs_cimc_server)
+        ucs_cimc_inventory_record.overrides = dict(overrides or {})
+        return ucs_cimc_inventory_record
+
+
+# Establish function to obtain the inventory overrides for a UCS CIMC
+def _get_ucs_cimc_inventory_overrides(ucs_cimc_server):
+    """This is a function to obtain the settings provided in the inventory
+    for a UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC, or a
+            UcsCimcInventoryRecord class instance.
+
+    Returns:
+        A dictionary of the settings provided in the inventory. The dictionary
+        is empty for UCS CIMC server entries not loaded from an inventory.
+    """
+    return getattr(ucs_cimc_server, "overrides", {})
+
+
+# Establish function to stream the UCS CIMC records of an inventory
+def load_ucs_cimc_inventory(
+    inventory_source,
+    inventory_format=""
+    ):
+    """This is a function to stream the UCS CIMC records of an inventory file
+    in CSV or JSON lines format. Records are read one at a time, so
+    processing can begin before the whole inventory has been read.
+
+    CSV inventories must have a header row. Each CSV row or JSON lines object
+    must provide the ucs_cimc_server field and may provide any of the other
+    fields in UCS_CIMC_INVENTORY_FIELDS. Empty fields and unknown fields are
+    ignored. Records without a ucs_cimc_server are skipped with a message.
+
+    Args:
+        inventory_source (str):
+            The filepath of the inventory, or "-" to read from standard input.
+        inventory_format (str):
+            The format of the inventory, either "csv" or "jsonl". The default
+            value is an empty string (""), which selects the format from the
+            file extension, or from the first line when the extension is not
+            recognized.
+
+    Yields:
+        A UcsCimcInventoryRecord class instance for each UCS CIMC.
+    """
+    if inventory_source == "-":
+        ucs_cimc_inventory_file = contextlib.nullcontext(sys.stdin)
+    else:
+        ucs_cimc_inventory_file = open(inventory_source, newline="")
+    with ucs_cimc_inventory_file as ucs_cimc_inventory_lines:
+        if not inventory_format:
+            inventory_extension = os.path.splitext(inventory_source)[1].lower()
+            if inventory_extension == ".csv":
+                inventory_format = "csv"
+            elif inventory_extension in (".jsonl", ".ndjson", ".json"):
+                inventory_format = "jsonl"
+            else:
+                ucs_cimc_inventory_first_line = next(ucs_cimc_inventory_lines, "")
+                inventory_format = "jsonl" if ucs_cimc_inventory_first_line.lstrip().startswith("{") else "csv"
+                ucs_cimc_inventory_lines = itertools.chain([ucs_cimc_inventory_first_line], ucs_cimc_inventory_lines)
+        if inventory_format == "csv":
+            ucs_cimc_inventory_rows = csv.DictReader(ucs_cimc_inventory_lines)
+        elif inventory_format == "jsonl":
+            ucs_cimc_inventory_rows = _read_ucs_cimc_inventory_json_lines(ucs_cimc_inventory_lines)
+        else:
+            raise ValueError(f"Unsupported inventory format {inventory_format!r}. Options: csv, jsonl")
+        for ucs_cimc_inventory_row_number, ucs_cimc_inventory_row in enumerate(ucs_cimc_inventory_rows, start=1):
+            if ucs_cimc_inventory_row is None:
+                log_ucs_cimc_event(
+                    f"Skipping inventory record {ucs_cimc_inventory_row_number} of {inventory_source}: "
+                    "The record is not a valid JSON object.",
+                    level=logging.WARNING
+                    )
+                continue
+            ucs_cimc_inventory_overrides = {
+                ucs_cimc_inventory_field: str(ucs_cimc_inventory_row[ucs_cimc_inventory_field]).strip()
+                for ucs_cimc_inventory_field in UCS_CIMC_INVENTORY_FIELDS
+                if ucs_cimc_inventory_row.get(ucs_cimc_inventory_field) not in (None, "")
+                }
+            ucs_cimc_server = ucs_cimc_inventory_overrides.pop("ucs_cimc_server", "")
+            if not ucs_cimc_server:
+                log_ucs_cimc_event(
+                    f"Skipping inventory record {ucs_cimc_inventory_row_number} of {inventory_source}: "
+                    "The ucs_cimc_server field is missing.",
+                    level=logging.WARNING
+                    )
+                continue
+            yield UcsCimcInventoryRecord(ucs_cimc_server, ucs_cimc_inventory_overrides)
+
+
+# Establish function to parse the lines of a JSON lines inventory
+def _read_ucs_cimc_inventory_json_lines(ucs_cimc_inventory_lines):
+    """This is a function to parse the lines of a JSON lines inventory.
+
+    Args:
+        ucs_cimc_inventory_lines (iterable):
+            The lines of the JSON lines inventory.
+
+    Yields:
+        A dictionary for each JSON object, or None for each line that is not a
+        valid JSON object. Blank lines are ignored.
+    """
+    for ucs_cimc_inventory_line in ucs_cimc_inventory_lines:
+        if not ucs_cimc_inventory_line.strip():
+            continue
+        try:
+            ucs_cimc_inventory_row = json.loads(ucs_cimc_inventory_line)
+        except ValueError:
+            ucs_cimc_inventory_row = None
+        yield ucs_cimc_inventory_row if isinstance(ucs_cimc_inventory_row, dict) else None
+
+
+# Establish class for the checkpoint journal of a UCS CIMC fleet run
+class UcsCimcRunJournal:
+    """This is a class for an append-only checkpoint journal of a UCS CIMC
+    fleet run. One JSON record is written per UCS CIMC and phase as soon as
+    the phase completes, so an interrupted run can be resumed without
+    repeating the UCS CIMCs that already succeeded.
+
+    Args:
+        journal_filepath (str):
+            The filepath of the JSON lines journal file. The file is created
+            if it does not exist and appended to if it does.
+    """
+    def __init__(self, journal_filepath):
+        self.journal_filepath = journal_filepath
+        self._journal_file = open(journal_filepath, "a", encoding="utf-8")
+        self._journal_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def record(
+        self,
+        ucs_cimc_server,
+        phase,
+        succeeded,
+        response_fingerprint="",
+        error=""
+        ):
+        """This is a method to append a record for a UCS CIMC and phase to
+        the journal. The record is flushed to disk before the method returns.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            phase (str):
+                The name of the completed phase, such as
+                "certificate_request".
+            succeeded (bool):
+                Whether the phase succeeded.
+            response_fingerprint (str):
+                The SHA-256 fingerprint of the UCS CIMC response. The default
+                value is an empty string ("").
+            error (str):
+                A description of the error, if any. The default value is an
+                empty string ("").
+        """
+        ucs_cimc_journal_record = json.dumps({
+            "timestamp": time.time(),
+            "ucs_cimc_server": ucs_cimc_server,
+            "phase": phase,
+            "outcome": "succeeded" if succeeded else "failed",
+            "response_fingerprint": response_fingerprint,
+            "error": error
+            })
+        with self._journal_lock:
+            self._journal_file.write(ucs_cimc_journal_record + "\n")
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+
+    def close(self):
+        """This is a method to close the journal file."""
+        with self._journal_lock:
+            self._journal_file.close()
+
+    @staticmethod
+    def load_completed_ucs_cimc_servers(
+        journal_filepath,
+        phase
+        ):
+        """This is a method to read a journal file and obtain the UCS CIMCs
+        whose most recent record for a phase succeeded. The journal is read
+        one line at a time, and a truncated final line left by an
+        interrupted run is ignored.
+
+        Args:
+            journal_filepath (str):
+                The filepath of the JSON lines journal file.
+            phase (str):
+                The name of the phase, such as "certificate_request".
+
+        Returns:
+            A set of the hostnames or IP addresses of the completed UCS CIMCs.
+            The set is empty if the journal file does not exist.
+        """
+        ucs_cimc_completed_servers = set()
+        if not os.path.exists(journal_filepath):
+            return ucs_cimc_completed_servers
+        with open(journal_filepath, encoding="utf-8") as ucs_cimc_journal_file:
+            for ucs_cimc_journal_line in ucs_cimc_journal_file:
+                try:
+                    ucs_cimc_journal_record = json.loads(ucs_cimc_journal_line)
+                except json.JSONDecodeError:
+                    continue
+                if ucs_cimc_journal_record.get("phase") != phase:
+                    continue
+                if ucs_cimc_journal_record.get("outcome") == "succeeded":
+                    ucs_cimc_completed_servers.add(ucs_cimc_journal_record["ucs_cimc_server"])
+                else:
+                    ucs_cimc_completed_servers.discard(ucs_cimc_journal_record["ucs_cimc_server"])
+        return ucs_cimc_completed_servers
+
+    @staticmethod
+    def load_ucs_cimc_results(
+        journal_filepaths,
+        phase
+        ):
+        """This is a method to read one or more journal files, such as the
+        journals of the shards of a fleet run, and obtain the most recent
+        record of a phase for each UCS CIMC. Missing files and truncated
+        lines are ignored.
+
+        Args:
+            journal_filepaths (list):
+                The filepaths of the JSON lines journal files.
+            phase (str):
+                The name of the phase, such as "certificate_request".
+
+        Returns:
+            A dictionary of the most recent journal record for each UCS CIMC,
+            keyed by the hostname or IP address of the UCS CIMC and ordered
+            by the time of the record.
+        """
+        ucs_cimc_journal_records = {}
+        for journal_filepath in journal_filepaths:
+            if not os.path.exists(journal_filepath):
+                continue
+            with open(journal_filepath, encoding="utf-8") as ucs_cimc_journal_file:
+                for ucs_cimc_journal_line in ucs_cimc_journal_file:
+                    try:
+                        ucs_cimc_journal_record = json.loads(ucs_cimc_journal_line)
+                    except json.JSONDecodeError:
+                        continue
+                    if ucs_cimc_journal_record.get("phase") != phase:
+                        continue
+                    ucs_cimc_previous_record = ucs_cimc_journal_records.get(ucs_cimc_journal_record["ucs_cimc_server"])
+                    if (ucs_cimc_previous_record is None or
+                            ucs_cimc_journal_record["timestamp"] >= ucs_cimc_previous_record["timestamp"]):
+                        ucs_cimc_journal_records[ucs_cimc_journal_record["ucs_cimc_server"]] = ucs_cimc_journal_record
+        return dict(sorted(ucs_cimc_journal_records.items(), key=lambda ucs_cimc_item: ucs_cimc_item[1]["timestamp"]))
+
+
+# Establish class for the on-disk cache of the certificates of a UCS CIMC fleet
+class UcsCimcCertificateInventoryCache:
+    """This is a class for a SQLite cache of the current certificate of each
+    UCS CIMC, with the time it was read, so the certificates of a fleet can
+    be reported and checked for renewal without logging in to every UCS
+    CIMC again. A cached certificate is stale once it is older than the TTL
+    or its UCS CIMC has been flagged as changed. The cache can be shared by
+    the threads of a run and by several worker processes.
+
+    Args:
+        cache_filepath (str):
+            The filepath of the SQLite database file. The file is created if
+            it does not exist.
+        ttl (float):
+            The number of seconds a cached certificate is considered current.
+            The default value is 86400.
+    """
+    def __init__(
+        self,
+        cache_filepath,
+        ttl=86400
+        ):
+        import sqlite3
+        self.cache_filepath = cache_filepath
+        self.ttl = ttl
+        self._cache_lock = threading.Lock()
+        self._cache_connection = sqlite3.connect(cache_filepath, timeout=30, check_same_thread=False)
+        self._cache_connection.row_factory = sqlite3.Row
+        with self._cache_lock, self._cache_connection:
+            self._cache_connection.execute(
+                "CREATE TABLE IF NOT EXISTS ucs_cimc_certificates ("
+                "ucs_cimc_server TEXT PRIMARY KEY, "
+                "common_name TEXT NOT NULL DEFAULT '', "
+                "subject TEXT NOT NULL DEFAULT '', "
+                "issuer TEXT NOT NULL DEFAULT '', "
+                "serial_number TEXT NOT NULL DEFAULT '', "
+                "valid_from TEXT NOT NULL DEFAULT '', "
+                "valid_to TEXT NOT NULL DEFAULT '', "
+                "expires_at TEXT NOT NULL DEFAULT '', "
+                "certificate_attributes TEXT NOT NULL DEFAULT '{}', "
+                "fetched_at REAL, "
+                "changed INTEGER NOT NULL DEFAULT 0, "
+                "error TEXT NOT NULL DEFAULT '', "
+                "error_at REAL)"
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def get(self, ucs_cimc_server):
+        """This is a method to obtain the cache entry of a UCS CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+
+        Returns:
+            A dictionary of the cache entry, with the certificate attributes
+            under the "certificate_attributes" key, or None if the UCS CIMC
+            is not in the cache.
+        """
+        with self._cache_lock:
+            ucs_cimc_cache_row = self._cache_connection.execute(
+                "SELECT * FROM ucs_cimc_certificates WHERE ucs_cimc_server = ?",
+                (str(ucs_cimc_server),)
+                ).fetchone()
+        if ucs_cimc_cache_row is None:
+            return None
+        ucs_cimc_cache_entry = dict(ucs_cimc_cache_row)
+        ucs_cimc_cache_entry["certificate_attributes"] = json.loads(ucs_cimc_cache_entry["certificate_attributes"])
+        ucs_cimc_cache_entry["changed"] = bool(ucs_cimc_cache_entry["changed"])
+        return ucs_cimc_cache_entry
+
+    def is_stale(
+        self,
+        ucs_cimc_cache_entry,
+        current_time=None
+        ):
+        """This is a method to determine whether a cache entry needs to be
+        read again from its UCS CIMC.
+
+        Args:
+            ucs_cimc_cache_entry (dict):
+                The cache entry returned by get(), or None.
+            current_time (float):
+                The time.time() value to compare the age of the entry against.
+                The default value is None, which uses the current time.
+
+        Returns:
+            True if the entry is missing, has never held a certificate, has
+            been flagged as changed or is older than the TTL.
+        """
+        if ucs_cimc_cache_entry is None or ucs_cimc_cache_entry["fetched_at"] is None:
+            return True
+        if ucs_cimc_cache_entry["changed"]:
+            return True
+        if current_time is None:
+            current_time = time.time()
+        return current_time - ucs_cimc_cache_entry["fetched_at"] >= self.ttl
+
+    def get_stale_ucs_cimc_servers(self, ucs_cimc_servers):
+        """This is a method to obtain the UCS CIMCs whose cache entry needs to
+        be read again.
+
+        Args:
+            ucs_cimc_servers (iterable):
+                The hostnames or IP addresses of the UCS CIMCs.
+
+        Returns:
+            A list of the UCS CIMC server entries with a stale cache entry, in
+            the order they were provided.
+        """
+        ucs_cimc_current_time = time.time()
+        return [
+            ucs_cimc_server
+            for ucs_cimc_server in ucs_cimc_servers
+            if self.is_stale(self.get(ucs_cimc_server), current_time=ucs_cimc_current_time)
+            ]
+
+    def store_certificate(
+        self,
+        ucs_cimc_server,
+        ucs_cimc_certificate_summary
+        ):
+        """This is a method to store the certificate read from a UCS CIMC,
+        which clears its changed flag and any previous error.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            ucs_cimc_certificate_summary (dict):
+                The certificate summary returned by
+                summarize_ucs_cimc_current_certificate().
+        """
+        with self._cache_lock, self._cache_connection:
+            self._cache_connection.execute(
+                "INSERT OR REPLACE INTO ucs_cimc_certificates (ucs_cimc_server, common_name, subject, issuer, "
+                "serial_number, valid_from, valid_to, expires_at, certificate_attributes, fetched_at, changed, "
+                "error, error_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, '', NULL)",
+                (
+                    str(ucs_cimc_server),
+                    ucs_cimc_certificate_summary["common_name"],
+                    ucs_cimc_certificate_summary["subject"],
+                    ucs_cimc_certificate_summary["issuer"],
+                    ucs_cimc_certificate_summary["serial_number"],
+                    ucs_cimc_certificate_summary["valid_from"],
+                    ucs_cimc_certificate_summary["valid_to"],
+                    ucs_cimc_certificate_summary["expires_at"],
+                    json.dumps(ucs_cimc_certificate_summary["certificate_attributes"]),
+                    time.time()
+                    )
+                )
+
+    def record_error(
+        self,
+        ucs_cimc_server,
+        error
+        ):
+        """This is a method to record that the certificate of a UCS CIMC could
+        not be read. A previously cached certificate is kept, and the entry
+        stays stale so it is read again by the next refresh.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+            error (str):
+                A description of the error.
+        """
+        with self._cache_lock, self._cache_connection:
+            self._cache_connection.execute(
+                "INSERT INTO ucs_cimc_certificates (ucs_cimc_server, error, error_at, changed) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT (ucs_cimc_server) DO UPDATE SET error = excluded.error, error_at = excluded.error_at, "
+                "changed = 1",
+                (str(ucs_cimc_server), error, time.time())
+                )
+
+    def mark_changed(self, ucs_cimc_servers):
+        """This is a method to flag the UCS CIMCs whose certificate has been
+        changed, such as by a self-signed certificate or an uploaded signed
+        certificate, so their cache entries are read again by the next
+        refresh.
+
+        Args:
+            ucs_cimc_servers (iterable):
+                The hostnames or IP addresses of the UCS CIMCs.
+        """
+        with self._cache_lock, self._cache_connection:
+            self._cache_connection.executemany(
+                "UPDATE ucs_cimc_certificates SET changed = 1 WHERE ucs_cimc_server = ?",
+                [(str(ucs_cimc_server),) for ucs_cimc_server in ucs_cimc_servers]
+                )
+
+    def close(self):
+        """This is a method to close the SQLite database file."""
+        with self._cache_lock:
+            self._cache_connection.close()
+
+
+# Establish class for a token bucket rate limit
+class UcsCimcTokenBucket:
+    """This is a class for a token bucket that limits the rate at which UCS
+    CIMCs are started. Tokens are added at the given rate, up to the burst
+    size, and each UCS CIMC takes one token.
+
+    Args:
+        rate (float):
+            The number of tokens added per second.
+        burst (int):
+            The maximum number of tokens held at once. The default value is 1.
+    """
+    def __init__(
+        self,
+        rate,
+        burst=1
+        ):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """This is a method to take a token from the bucket.
+
+        Returns:
+            The number of seconds to wait before the token is available.
+        """
+        with self._lock:
+            current_time = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (current_time - self._updated_time) * self.rate)
+            self._updated_time = current_time
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+
+# Establish class for scheduling UCS CIMCs by group
+class UcsCimcGroupScheduler:
+    """This is a class for limiting the UCS CIMCs processed at once and the
+    rate they are started at within groups of UCS CIMCs that share a resource,
+    such as a remote server or a HyperFlex cluster. The limits apply to each
+    group separately, so UCS CIMCs in other groups are not held back.
+
+    Args:
+        group_key_function (function):
+            A function that accepts a UCS CIMC server entry and returns the key
+            of its group.
+        max_concurrent_per_group (int):
+            The maximum number of UCS CIMCs processed at once in each group. The
+            default value is 0, which sets no limit.
+        rate_per_group (float):
+            The maximum number of UCS CIMCs started per second in each group. The
+            default value is 0, which sets no limit.
+        burst_per_group (int):
+            The number of UCS CIMCs in each group that can be started at once
+            before the rate applies. The default value is 1.
+    """
+    def __init__(
+        self,
+        group_key_function,
+        max_concurrent_per_group=0,
+        rate_per_group=0,
+        burst_per_group=1
+        ):
+        self.group_key_function = group_key_function
+        self.max_concurrent_per_group = max_concurrent_per_group
+        self.rate_per_group = rate_per_group
+        self.burst_per_group = burst_per_group
+        self._semaphores = {}
+        self._async_semaphores = {}
+        self._async_semaphores_loop = None
+        self._token_buckets = {}
+        self._lock = threading.Lock()
+
+    def get_group_key(self, ucs_cimc_server):
+        """This is a method to obtain the group key of a UCS CIMC.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+
+        Returns:
+            The group key of the UCS CIMC.
+        """
+        return self.group_key_function(ucs_cimc_server)
+
+    def _get_group_limits(
+        self,
+        ucs_cimc_group_key,
+        asynchronous=False
+        ):
+        with self._lock:
+            if asynchronous:
+                import asyncio
+                if self._async_semaphores_loop is not asyncio.get_running_loop():
+                    # asyncio semaphores belong to the event loop they were first used in
+                    self._async_semaphores = {}
+                    self._async_semaphores_loop = asyncio.get_running_loop()
+            ucs_cimc_semaphores = self._async_semaphores if asynchronous else self._semaphores
+            if self.max_concurrent_per_group > 0 and ucs_cimc_group_key not in ucs_cimc_semaphores:
+                ucs_cimc_semaphores[ucs_cimc_group_key] = (
+                    asyncio.Semaphore(self.max_concurrent_per_group) if asynchronous
+                    else threading.Semaphore(self.max_concurrent_per_group)
+                    )
+            if self.rate_per_group > 0 and ucs_cimc_group_key not in self._token_buckets:
+                self._token_buckets[ucs_cimc_group_key] = UcsCimcTokenBucket(self.rate_per_group, self.burst_per_group)
+            return ucs_cimc_semaphores.get(ucs_cimc_group_key), self._token_buckets.get(ucs_cimc_group_key)
+
+    @contextlib.contextmanager
+    def slot(self, ucs_cimc_server):
+        """This is a method to wait until a UCS CIMC can be started within the
+        limits of its group, and hold its place while it is processed.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+        """
+        ucs_cimc_semaphore, ucs_cimc_token_bucket = self._get_group_limits(self.get_group_key(ucs_cimc_server))
+        if ucs_cimc_semaphore is not None:
+            ucs_cimc_semaphore.acquire()
+        try:
+            if ucs_cimc_token_bucket is not None:
+                time.sleep(ucs_cimc_token_bucket.reserve())
+            yield
+        finally:
+            if ucs_cimc_semaphore is not None:
+                ucs_cimc_semaphore.release()
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, ucs_cimc_server):
+        """This is a method to wait until a UCS CIMC can be started within the
+        limits of its group using the asyncio client engine, and hold its place
+        while it is processed.
+
+        Args:
+            ucs_cimc_server (str):
+                The hostname or IP address of the UCS CIMC.
+        """
+        import asyncio
+        ucs_cimc_semaphore, ucs_cimc_token_bucket = self._get_group_limits(
+            self.get_group_key(ucs_cimc_server),
+            asynchronous=True
+            )
+        if ucs_cimc_semaphore is not None:
+            await ucs_cimc_semaphore.acquire()
+        try:
+            if ucs_cimc_token_bucket is not None:
+                await asyncio.sleep(ucs_cimc_token_bucket.reserve())
+            yield
+        finally:
+            if ucs_cimc_semaphore is not None:
+                ucs_cimc_semaphore.release()
+
+    def interleave(
+        self,
+        ucs_cimc_servers,
+        lookahead=256
+        ):
+        """This is a method to reorder a stream of UCS CIMCs so that the groups
+        take turns, keeping the workers busy with other groups while a group
+        is at its limit. At most the lookahead number of UCS CIMCs are held in
+        memory at once.
+
+        Args:
+            ucs_cimc_servers (iterable):
+                The hostnames or IP addresses of the UCS CIMCs.
+            lookahead (int):
+                The maximum number of UCS CIMCs read ahead. The default value is
+                256.
+
+        Yields:
+            The UCS CIMC server entries, alternating between groups.
+        """
+        ucs_cimc_servers = iter(ucs_cimc_servers)
+        ucs_cimc_grouped_servers = {}
+        ucs_cimc_buffered_count = 0
+        ucs_cimc_servers_exhausted = False
+        while True:
+            while not ucs_cimc_servers_exhausted and ucs_cimc_buffered_count < lookahead:
+                ucs_cimc_server = next(ucs_cimc_servers, None)
+                if ucs_cimc_server is None:
+                    ucs_cimc_servers_exhausted = True
+                    break
+                ucs_cimc_grouped_servers.setdefault(
+                    self.get_group_key(ucs_cimc_server),
+                    collections.deque()
+                    ).append(ucs_cimc_server)
+                ucs_cimc_buffered_count += 1
+            if not ucs_cimc_buffered_count:
+                return
+            for ucs_cimc_group_key in list(ucs_cimc_grouped_servers):
+                yield ucs_cimc_grouped_servers[ucs_cimc_group_key].popleft()
+                ucs_cimc_buffered_count -= 1
+                if not ucs_cimc_grouped_servers[ucs_cimc_group_key]:
+                    del ucs_cimc_grouped_servers[ucs_cimc_group_key]
+
+
+# Establish function to run a fleet task in canary waves
+def run_ucs_cimc_canary_waves(
+    ucs_cimc_servers,
+    ucs_cimc_run_wave,
+    wave_sizes,
+    max_failure_rate=0.0
+    ):
+    """This is a function to run a task across multiple UCS CIMCs in canary
+    waves of increasing size, then across the remaining UCS CIMCs. The run
+    stops after a wave with more failures than allowed, so a problem found on
+    a few UCS CIMCs is not repeated across the whole fleet.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs.
+        ucs_cimc_run_wave (function):
+            A function that accepts an iterable of UCS CIMC server entries and
+            returns a list of result dictionaries, such as run_ucs_cimc_fleet()
+            with the task settings applied.
+        wave_sizes (list):
+            The number of UCS CIMCs in each canary wave, for example [1, 10, 50].
+        max_failure_rate (float):
+            The fraction of UCS CIMCs in a canary wave allowed to fail before
+            the run is stopped. The default value is 0.0.
+
+    Returns:
+        A tuple of the list of result dictionaries for the UCS CIMCs processed
+        and a boolean indicating whether the run was stopped early.
+    """
+    ucs_cimc_servers = iter(ucs_cimc_servers)
+    ucs_cimc_fleet_results = []
+    for ucs_cimc_wave_number, ucs_cimc_wave_size in enumerate(wave_sizes, start=1):
+        ucs_cimc_wave_servers = list(itertools.islice(ucs_cimc_servers, ucs_cimc_wave_size))
+        if not ucs_cimc_wave_servers:
+            return ucs_cimc_fleet_results, False
+        log_ucs_cimc_event(f"\nStarting canary wave {ucs_cimc_wave_number} with {len(ucs_cimc_wave_servers)} UCS CIMC(s)...")
+        ucs_cimc_wave_results = ucs_cimc_run_wave(ucs_cimc_wave_servers)
+        ucs_cimc_fleet_results.extend(ucs_cimc_wave_results)
+        ucs_cimc_wave_failed_count = sum(1 for ucs_cimc_result in ucs_cimc_wave_results if not ucs_cimc_result["succeeded"])
+        log_ucs_cimc_event(f"Canary wave {ucs_cimc_wave_number} completed with {ucs_cimc_wave_failed_count} failure(s).")
+        if ucs_cimc_wave_failed_count > max_failure_rate * len(ucs_cimc_wave_results):
+            log_ucs_cimc_event(
+                f"The failures in canary wave {ucs_cimc_wave_number} exceed the allowed failure rate of "
+                f"{max_failure_rate:.0%}. The remaining UCS CIMCs will not be processed.",
+                level=logging.WARNING
+                )
+            return ucs_cimc_fleet_results, True
+    log_ucs_cimc_event("\nStarting the remaining UCS CIMCs...")
+    ucs_cimc_fleet_results.extend(ucs_cimc_run_wave(ucs_cimc_servers))
+    return ucs_cimc_fleet_results, False
+
+
+# Establish function to parse a UCS CIMC shard specification
+def parse_ucs_cimc_shard(shard):
+    """This is a function to parse a shard specification in the form "i/K",
+    where K is the number of shards and i is the shard to run, from 1 to K.
+
+    Args:
+        shard (str):
+            The shard specification, for example "2/4".
+
+    Returns:
+        A tuple of the shard index and the number of shards.
+
+    Raises:
+        ValueError:
+            The shard specification is not in the form "i/K", or i is not
+            between 1 and K.
+    """
+    shard_index, separator, shard_count = shard.partition("/")
+    try:
+        shard_index, shard_count = int(shard_index), int(shard_count)
+    except ValueError:
+        raise ValueError(f"The shard '{shard}' is not in the form i/K, for example 2/4.") from None
+    if not separator or not 1 <= shard_index <= shard_count:
+        raise ValueError(f"The shard '{shard}' is not in the form i/K with i between 1 and K.")
+    return shard_index, shard_count
+
+
+# Establish function to obtain the shard a UCS CIMC is assigned to
+def get_ucs_cimc_shard_index(
+    shard_key,
+    shard_count
+    ):
+    """This is a function to obtain the shard a UCS CIMC is assigned to from
+    a stable hash of its shard key. The same key is always assigned to the
+    same shard, on any system and in any process, so shards run separately
+    never overlap.
+
+    Args:
+        shard_key (str):
+            The shard key of the UCS CIMC, such as its hostname or IP address,
+            or the key of its group.
+        shard_count (int):
+            The number of shards.
+
+    Returns:
+        The index of the shard, from 1 to the number of shards.
+    """
+    ucs_cimc_shard_hash = hashlib.sha256(str(shard_key).encode("utf-8")).digest()
+    return int.from_bytes(ucs_cimc_shard_hash[:8], "big") % shard_count + 1
+
+
+# Establish function to select the UCS CIMCs of a shard
+def select_ucs_cimc_shard(
+    ucs_cimc_servers,
+    shard_index,
+    shard_count,
+    shard_key_function=str
+    ):
+    """This is a function to select the UCS CIMCs assigned to a shard from an
+    iterable of UCS CIMCs. The UCS CIMCs are selected as they are read, so
+    large inventories are not loaded into memory.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs, or
+            UcsCimcInventoryRecord class instances.
+        shard_index (int):
+            The index of the shard to select, from 1 to the number of shards.
+        shard_count (int):
+            The number of shards.
+        shard_key_function (function):
+            A function that accepts a UCS CIMC server entry and returns its
+            shard key. UCS CIMCs with the same shard key are assigned to the
+            same shard. The default value is str, which shards by hostname or
+            IP address.
+
+    Yields:
+        The UCS CIMC server entries assigned to the shard.
+    """
+    for ucs_cimc_server in ucs_cimc_servers:
+        if get_ucs_cimc_shard_index(shard_key_function(ucs_cimc_server), shard_count) == shard_index:
+            yield ucs_cimc_server
+
+
+# Establish function to obtain the filepath of an output file for a shard
+def get_ucs_cimc_shard_filepath(
+    filepath,
+    shard_index,
+    shard_count
+    ):
+    """This is a function to obtain the filepath of an output file, such as a
+    journal or metrics file, for a shard, so the shards of a fleet run do not
+    write to the same file.
+
+    Args:
+        filepath (str):
+            The filepath of the output file for the whole fleet run.
+        shard_index (int):
+            The index of the shard, from 1 to the number of shards.
+        shard_count (int):
+            The number of shards.
+
+    Returns:
+        The filepath with the shard inserted before the file extension, for
+        example "journal.shard-2-of-4.jsonl", or an empty string ("") if the
+        filepath is empty.
+    """
+    if not filepath:
+        return filepath
+    filepath_root, filepath_extension = os.path.splitext(filepath)
+    return f"{filepath_root}.shard-{shard_index}-of-{shard_count}{filepath_extension}"
+
+
+# Establish function to run the shards of a UCS CIMC fleet in worker processes
+def run_ucs_cimc_shard_processes(
+    shard_command_function,
+    shard_count
+    ):
+    """This is a function to run each shard of a UCS CIMC fleet in its own
+    worker process and wait for all of them to complete. The output of each
+    worker process is printed as it arrives, with the shard as a prefix.
+
+    Args:
+        shard_command_function (function):
+            A function that accepts the index of a shard and the number of
+            shards and returns the command line of its worker process as a
+            list.
+        shard_count (int):
+            The number of shards.
+
+    Returns:
+        A list of the exit codes of the worker processes, in shard order.
+    """
+    import subprocess
+
+    ucs_cimc_output_lock = threading.Lock()
+
+    def print_ucs_cimc_shard_output(shard_index, shard_output):
+        for shard_output_line in shard_output:
+            with ucs_cimc_output_lock:
+                sys.stdout.write(f"[Shard {shard_index}/{shard_count}] {shard_output_line}")
+                sys.stdout.flush()
+
+    ucs_cimc_shard_processes = []
+    ucs_cimc_output_threads = []
+    try:
+        for shard_index in range(1, shard_count + 1):
+            ucs_cimc_shard_process = subprocess.Popen(
+                shard_command_function(shard_index, shard_count),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True
+                )
+            ucs_cimc_shard_processes.append(ucs_cimc_shard_process)
+            ucs_cimc_output_thread = threading.Thread(
+                target=print_ucs_cimc_shard_output,
+                args=(shard_index, ucs_cimc_shard_process.stdout),
+                daemon=True
+                )
+            ucs_cimc_output_thread.start()
+            ucs_cimc_output_threads.append(ucs_cimc_output_thread)
+        for ucs_cimc_shard_process in ucs_cimc_shard_processes:
+            ucs_cimc_shard_process.wait()
+    finally:
+        for ucs_cimc_shard_process in ucs_cimc_shard_processes:
+            if ucs_cimc_shard_process.poll() is None:
+                ucs_cimc_shard_process.terminate()
+                ucs_cimc_shard_process.wait()
+        for ucs_cimc_output_thread in ucs_cimc_output_threads:
+            ucs_cimc_output_thread.join()
+    return [ucs_cimc_shard_process.returncode for ucs_cimc_shard_process in ucs_cimc_shard_processes]
+
+
+# Establish function to create a result record for a UCS CIMC task
+def _create_ucs_cimc_task_result(
+    ucs_cimc_server,
+    phase
+    ):
+    """This is a function to create an empty result record for a task run
+    against a single UCS CIMC.
+
+    Args:
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        phase (str):
+            The name of the phase the task performs.
+
+    Returns:
+        A dictionary for the result of the task for the UCS CIMC.
+    """
+    return {
+        "ucs_cimc_server": ucs_cimc_server,
+        "phase": phase,
+        "succeeded": False,
+        "status_code": None,
+        "response_fingerprint": "",
+        "error": "",
+        "error_class": "",
+        "duration": 0.0
+        }
+
+
+# Establish function to complete a result record for a UCS CIMC task
+def _complete_ucs_cimc_task_result(
+    ucs_cimc_task_result,
+    ucs_cimc_response,
+    ucs_cimc_task_start_time,
+    ucs_cimc_journal=None
+    ):
+    """This is a function to complete the result record for a task run
+    against a single UCS CIMC and record it in the journal, if provided.
+
+    Args:
+        ucs_cimc_task_result (dict):
+            The result record created by _create_ucs_cimc_task_result(). The
+            "error" key is expected to be set already if the task raised an
+            exception.
+        ucs_cimc_response (Response):
+            The response returned by the task, or None.
+        ucs_cimc_task_start_time (float):
+            The time.monotonic() value when the task started.
+        ucs_cimc_journal (UcsCimcRunJournal):
+            An optional journal to record the result in. The default value is
+            None.
+
+    Returns:
+        The completed result record.
+    """
+    if not ucs_cimc_task_result["error"]:
+        ucs_cimc_task_result["succeeded"], ucs_cimc_task_result["error"] = _evaluate_ucs_cimc_response(ucs_cimc_response)
+        ucs_cimc_task_result["error_class"] = "" if ucs_cimc_task_result["succeeded"] else "InvalidResponse"
+    if ucs_cimc_response is not None:
+        ucs_cimc_task_result["status_code"] = ucs_cimc_response.status_code
+        ucs_cimc_task_result["response_fingerprint"] = hashlib.sha256(
+            ucs_cimc_response.text.encode("utf-8")
+            ).hexdigest()
+    ucs_cimc_task_result["duration"] = time.monotonic() - ucs_cimc_task_start_time
+    _record_ucs_cimc_phase_metric(
+        ucs_cimc_task_result["ucs_cimc_server"],
+        ucs_cimc_task_result["phase"],
+        ucs_cimc_task_result["duration"],
+        ucs_cimc_task_result["succeeded"]
+        )
+    ucs_cimc_task_error = ucs_cimc_task_result["error"]
+    if ucs_cimc_task_error.startswith(f"{ucs_cimc_task_result['error_class']}: "):
+        ucs_cimc_task_error = ucs_cimc_task_error[len(ucs_cimc_task_result["error_class"]) + 2:]
+    log_ucs_cimc_event(
+        f"{ucs_cimc_task_result['phase'].replace('_', ' ').capitalize()} "
+        f"{'succeeded' if ucs_cimc_task_result['succeeded'] else 'failed'} "
+        f"in {ucs_cimc_task_result['duration']:.2f}s.",
+        ucs_cimc_server=ucs_cimc_task_result["ucs_cimc_server"],
+        phase=ucs_cimc_task_result["phase"],
+        status="succeeded" if ucs_cimc_task_result["succeeded"] else "failed",
+        duration=ucs_cimc_task_result["duration"],
+        error=ucs_cimc_task_error or None,
+        error_class=ucs_cimc_task_result["error_class"],
+        level=logging.INFO if ucs_cimc_task_result["succeeded"] else logging.WARNING
+        )
+    if ucs_cimc_journal is not None:
+        _record_ucs_cimc_task_result(ucs_cimc_journal, ucs_cimc_task_result)
+    return ucs_cimc_task_result
+
+
+# Establish function to record a result record for a UCS CIMC task in the journal
+def _record_ucs_cimc_task_result(
+    ucs_cimc_journal,
+    ucs_cimc_task_result
+    ):
+    """This is a function to record the completed result record for a task
+    run against a single UCS CIMC in the journal.
+
+    Args:
+        ucs_cimc_journal (UcsCimcRunJournal):
+            The journal to record the result in.
+        ucs_cimc_task_result (dict):
+            The result record completed by _complete_ucs_cimc_task_result().
+    """
+    ucs_cimc_journal.record(
+        ucs_cimc_task_result["ucs_cimc_server"],
+        ucs_cimc_task_result["phase"],
+        ucs_cimc_task_result["succeeded"],
+        response_fingerprint=ucs_cimc_task_result["response_fingerprint"],
+        error=ucs_cimc_task_result["error"]
+        )
+
+
+# Establish function to run a task for a single UCS CIMC and record the result
+def _run_ucs_cimc_fleet_task(
+    ucs_cimc_task,
+    ucs_cimc_server,
+    phase="certificate_request",
+    ucs_cimc_journal=None,
+    ucs_cimc_group_scheduler=None
+    ):
+    """This is a function to run a task against a single UCS CIMC and
+    collect the outcome as a result record.
+
+    Args:
+        ucs_cimc_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns a Response class instance.
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        phase (str):
+            The name of the phase the task performs. The default value is
+            "certificate_request".
+        ucs_cimc_journal (UcsCimcRunJournal):
+            An optional journal to record the result in. The default value is
+            None.
+        ucs_cimc_group_scheduler (UcsCimcGroupScheduler):
+            An optional scheduler to wait for before the task is started. The
+            default value is None.
+
+    Returns:
+        A dictionary containing the result of the task for the UCS CIMC.
+    """
+    with (ucs_cimc_group_scheduler.slot(ucs_cimc_server) if ucs_cimc_group_scheduler is not None
+          else contextlib.nullcontext()):
+        ucs_cimc_task_start_time = time.monotonic()
+        ucs_cimc_task_result = _create_ucs_cimc_task_result(ucs_cimc_server, phase)
+        ucs_cimc_response = None
+        try:
+            ucs_cimc_response = ucs_cimc_task(ucs_cimc_server)
+        except Exception as exception_message:
+            ucs_cimc_task_result["error"] = f"{type(exception_message).__name__}: {exception_message}"
+            ucs_cimc_task_result["error_class"] = type(exception_message).__name__
+        return _complete_ucs_cimc_task_result(
+            ucs_cimc_task_result,
+            ucs_cimc_response,
+            ucs_cimc_task_start_time,
+            ucs_cimc_journal=ucs_cimc_journal
+            )
+
+
+# Establish function to run a task across a fleet of UCS CIMCs
+def run_ucs_cimc_fleet(
+    ucs_cimc_servers,
+    ucs_cimc_task,
+    max_concurrent_workers=1,
+    phase="certificate_request",
+    ucs_cimc_journal=None,
+    ucs_cimc_group_scheduler=None
+    ):
+    """This is a function to run a task across multiple UCS CIMCs using a
+    bounded pool of worker threads.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs. Any iterable is
+            accepted and is consumed as worker threads become available.
+        ucs_cimc_task (function):
+            A function that accepts the hostname or IP address of a UCS CIMC
+            and returns a Response class instance.
+        max_concurrent_workers (int):
+            The maximum number of UCS CIMCs to process concurrently. A value
+            of 1 processes the UCS CIMCs one at a time. The default value is
+            1.
+        phase (str):
+            The name of the phase the task performs. The default value is
+            "certificate_request".
+        ucs_cimc_journal (UcsCimcRunJournal):
+            An optional journal to record each result in as soon as it is
+            available. The default value is None.
+        ucs_cimc_group_scheduler (UcsCimcGroupScheduler):
+            An optional scheduler limiting the UCS CIMCs processed at once and
+            the rate they are started at within each group. The default value
+            is None.
+
+    Returns:
+        A list of dictionaries containing the result of the task for each
+        UCS CIMC, in the order the UCS CIMCs were provided.
+    """
+    return _map_ucs_cimc_servers(
+        functools.partial(
+            _run_ucs_cimc_fleet_task,
+            ucs_cimc_task,
+            phase=phase,
+            ucs_cimc_journal=ucs_cimc_journal,
+            ucs_cimc_group_scheduler=ucs_cimc_group_scheduler
+            ),
+        ucs_cimc_servers,
+        max_concurrent_workers=max_concurrent_workers
+        )
+
+
+# Establish function to run an asyncio task for a single UCS CIMC and record the result
+async def _async_run_ucs_cimc_fleet_task(
+    ucs_cimc_async_task,
+    ucs_cimc_server,
+    ucs_cimc_semaphore,
+    phase="certificate_request",
+    ucs_cimc_journal=None,
+    ucs_cimc_group_scheduler=None
+    ):
+    """This is a function to run an asyncio task against a single UCS CIMC,
+    limited by a shared semaphore, and collect the outcome as a result record.
+    The result is written to the journal in a worker thread, so flushing the
+    journal to disk does not hold up the other UCS CIMCs on the event loop.
+
+    Args:
+        ucs_cimc_async_task (coroutine function):
+            A coroutine function that accepts the hostname or IP address of a
+            UCS CIMC and returns a UcsCimcAsyncResponse instance.
+        ucs_cimc_server (str):
+            The hostname or IP address of the UCS CIMC.
+        ucs_cimc_semaphore (asyncio.Semaphore):
+            The semaphore limiting the number of concurrent UCS CIMC sessions.
+        phase (str):
+            The name of the phase the task performs. The default value is
+            "certificate_request".
+        ucs_cimc_journal (UcsCimcRunJournal):
+            An optional journal to record the result in. The default value is
+            None.
+        ucs_cimc_group_scheduler (UcsCimcGroupScheduler):
+            An optional scheduler to wait for before the task is started. The
+            default value is None.
+
+    Returns:
+        A dictionary containing the result of the task for the UCS CIMC.
+    """
+    import asyncio
+    async with contextlib.AsyncExitStack() as ucs_cimc_exit_stack:
+        if ucs_cimc_group_scheduler is not None:
+            await ucs_cimc_exit_stack.enter_async_context(ucs_cimc_group_scheduler.async_slot(ucs_cimc_server))
+        await ucs_cimc_exit_stack.enter_async_context(ucs_cimc_semaphore)
+        ucs_cimc_task_start_time = time.monotonic()
+        ucs_cimc_task_result = _create_ucs_cimc_task_result(ucs_cimc_server, phase)
+        ucs_cimc_response = None
+        try:
+            ucs_cimc_response = await ucs_cimc_async_task(ucs_cimc_server)
+        except Exception as exception_message:
+            ucs_cimc_task_result["error"] = f"{type(exception_message).__name__}: {exception_message}"
+            ucs_cimc_task_result["error_class"] = type(exception_message).__name__
+        _complete_ucs_cimc_task_result(
+            ucs_cimc_task_result,
+            ucs_cimc_response,
+            ucs_cimc_task_start_time
+            )
+    if ucs_cimc_journal is not None:
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            _record_ucs_cimc_task_result,
+            ucs_cimc_journal,
+            ucs_cimc_task_result
+            )
+    return ucs_cimc_task_result
+
+
+# Establish function to run an asyncio task across a fleet of UCS CIMCs
+async def async_run_ucs_cimc_fleet(
+    ucs_cimc_servers,
+    ucs_cimc_async_task,
+    max_concurrent_sessions=100,
+    phase="certificate_request",
+    ucs_cimc_journal=None,
+    ucs_cimc_group_scheduler=None
+    ):
+    """This is a function to run an asyncio task across multiple UCS CIMCs in
+    a single thread, limited by a global concurrency semaphore.
+
+    Args:
+        ucs_cimc_servers (iterable):
+            The hostnames or IP addresses of the UCS CIMCs. Any iterable is
+            accepted and is consumed as session slots become available.
+        ucs_cimc_async_task (coroutine function):
+            A coroutine function that accepts the hostname or IP address of a
+            UCS CIMC and returns a UcsCimcAsyncResponse instance.
+        max_concurrent_sessions (int):
+            The maximum number of UCS CIMC sessions in flight at once. The
+            default value is 100.
+        phase (str):
+            The name of the phase the task performs. The default value is
+            "certificate_request".
+        ucs_cimc_journal (UcsCimcRunJournal):
+            An optional journal to record each result in as soon as it is
+            available. The default value is None.
+        ucs_cimc_group_scheduler (UcsCimcGroupScheduler):
+            An optional scheduler limiting the UCS CIMCs processed at once and
+            the rate they are started at within each group. The default value
+            is None.
+
+    Returns:
+        A list of dictionaries containing the result of the task for each
+        UCS CIMC, in the order the UCS CIMCs were provided.
+    """
+    import asyncio
+    ucs_cimc_semaphore = asyncio.Semaphore(max_concurrent_sessions)
+    ucs_cimc_indexed_results = {}
+    ucs_cimc_pending_tasks = {}
+    for ucs_cimc_server_index, ucs_cimc_server in enumerate(ucs_cimc_servers):
+        if len(ucs_cimc_pending_tasks) >= max_concurrent_sessions * 2:
+            ucs_cimc_completed_tasks, _ = await asyncio.wait(
+                ucs_cimc_pending_tasks,
+                return_when=asyncio.FIRST_COMPLETED
+                )
+            for ucs_cimc_completed_task in ucs_cimc_completed_tasks:
+                ucs_cimc_indexed_results[ucs_cimc_pending_tasks.pop(ucs_cimc_completed_task)] = ucs_cimc_completed_task.result()
+        ucs_cimc_pending_task = asyncio.ensure_future(
+            _async_run_ucs_cimc_fleet_task(
+                ucs_cimc_async_task,
+                ucs_cimc_server,
+                ucs_cimc_semaphore,
+                phase=phase,
+                ucs_cimc_journal=ucs_cimc_journal,
+                ucs_cimc_group_scheduler=ucs_cimc_group_scheduler
+                )
+            )
+        ucs_cimc_pending_tasks[ucs_cimc_pending_task] = ucs_cimc_server_index
+    if ucs_cimc_pending_tasks:
+        for ucs_cimc_completed_task in (await asyncio.wait(ucs_cimc_pending_tasks))[0]:
+            ucs_cimc_indexed_results[ucs_cimc_pending_tasks[ucs_cimc_completed_task]] = ucs_cimc_completed_task.result()
+    return [ucs_cimc_indexed_results[ucs_cimc_server_index] for ucs_cimc_server_index in sorted(ucs_cimc_indexed_results)]
+
+
+
+# Establish the embedded CSR receiver for certificate signing requests made in the process
+_ucs_cimc_csr_receiver = None
+
+
+# Establish function to set the embedded CSR receiver for certificate signing requests
+def set_ucs_cimc_csr_receiver(ucs_cimc_csr_receiver):
+    """This is a function to set the UcsCimcCsrReceiver class instance that
+    the certificate signing requests made in the process are registered
+    with, so the CSR files pushed by the UCS CIMCs can be matched back to
+    them.
+
+    Args:
+        ucs_cimc_csr_receiver (UcsCimcCsrReceiver):
+            The embedded CSR receiver, or None to stop registering certificate
+            signing requests.
+    """
+    global _ucs_cimc_csr_receiver
+    _ucs_cimc_csr_receiver = ucs_cimc_csr_receiver
+
+
+# Establish function to register a certificate signing request with the embedded CSR receiver
+def _expect_ucs_cimc_csr(ucs_cimc_certificate_request_settings):
+    """This is a function to register the CSR file a UCS CIMC is going to push
+    with the embedded CSR receiver, if one is set.
+
+    Args:
+        ucs_cimc_certificate_request_settings (dict):
+            The keyword arguments for generate_ucs_cimc_certificate_signing_request().
+    """
+    if _ucs_cimc_csr_receiver is not None:
+        _ucs_cimc_csr_receiver.expect_csr(
+            ucs_cimc_certificate_request_settings["ucs_cimc_server"],
+            (f"{ucs_cimc_certificate_request_settings['common_name']}-csr"
+             f"{ucs_cimc_certificate_request_settings['remote_server_file_extension']}"),
+            ucs_cimc_certificate_request_settings["remote_server_user"],
+            ucs_cimc_certificate_request_settings["remote_server_password"],
+            ucs_cimc_certificate_request_settings["remote_server_protocol"]
+            )
+
+
+# Establish function to print the planned certificate requests of the UCS CIMCs
+def _print_ucs_cimc_certificate_request_plan(
+    ucs_cimc_request_plan,
+    invalid_only=False,
+    total_count=None
+    ):
+    """This is a function to print the planned certificate requests of the
+    UCS CIMCs and the problems found in their settings.
+
+    Args:
+        ucs_cimc_request_plan (list):
+            The planned requests yielded by the plan function of the run
+            settings.
+        invalid_only (bool):
+            Whether to print only the UCS CIMCs with invalid settings. The
+            default value is False.
+        total_count (int):
+            The number of UCS CIMCs planned, if the provided planned requests
+            are only the invalid ones. The default value is None, which
+            counts the provided planned requests.
+    """
+    ucs_cimc_invalid_count = sum(1 for ucs_cimc_planned_request in ucs_cimc_request_plan
+                                 if ucs_cimc_planned_request["problems"])
+    if total_count is None:
+        total_count = len(ucs_cimc_request_plan)
+    flush_ucs_cimc_event_log()
+    print("\nUCS CIMC Certificate Request Plan:")
+    for ucs_cimc_planned_request in ucs_cimc_request_plan:
+        if ucs_cimc_planned_request["problems"]:
+            print(f"- {ucs_cimc_planned_request['ucs_cimc_server']}: Invalid - "
+                  f"{' '.join(ucs_cimc_planned_request['problems'])}")
+        elif invalid_only:
+            continue
+        elif ucs_cimc_planned_request["self_signed"]:
+            print(f"- {ucs_cimc_planned_request['ucs_cimc_server']}: Self-signed certificate for "
+                  f"{ucs_cimc_planned_request['common_name']}")
+        else:
+            print(f"- {ucs_cimc_planned_request['ucs_cimc_server']}: Certificate signing request for "
+                  f"{ucs_cimc_planned_request['common_name']} to {ucs_cimc_planned_request['remote_server'] or 'the UCS CIMC'} "
+                  f"({ucs_cimc_planned_request['remote_server_protocol']})")
+    print(f"Total: {total_count}, Valid: {total_count - ucs_cimc_invalid_count}, "
+          f"Invalid: {ucs_cimc_invalid_count}")
+
+
+# Establish function to print a summary of the UCS CIMC fleet results
+def _print_ucs_cimc_fleet_summary(ucs_cimc_fleet_results):
+    """This is a function to print a summary of the results of a task run
+    across a fleet of UCS CIMCs.
+
+    Args:
+        ucs_cimc_fleet_results (list):
+            A list of dictionaries containing the result of the task for each
+            UCS CIMC.
+    """
+    ucs_cimc_succeeded_count = sum(1 for ucs_cimc_result in ucs_cimc_fleet_results if ucs_cimc_result["succeeded"])
+    ucs_cimc_failed_count = len(ucs_cimc_fleet_results) - ucs_cimc_succeeded_count
+    flush_ucs_cimc_event_log()
+    print("\nUCS CIMC Certificate Renewal Summary:")
+    for ucs_cimc_result in ucs_cimc_fleet_results:
+        ucs_cimc_result_status = "Succeeded" if ucs_cimc_result["succeeded"] else "Failed"
+        ucs_cimc_result_line = (f"- {ucs_cimc_result['ucs_cimc_server']}: {ucs_cimc_result_status} "
+                                f"({ucs_cimc_result['duration']:.2f}s)")
+        if ucs_cimc_result["error"]:
+            ucs_cimc_result_line += f" - {ucs_cimc_result['error']}"
+        print(ucs_cimc_result_line)
+    print(f"Total: {len(ucs_cimc_fleet_results)}, Succeeded: {ucs_cimc_succeeded_count}, "
+          f"Failed: {ucs_cimc_failed_count}")
+
+
+# Establish function to print a summary of the UCS CIMC run metrics
+def _print_ucs_cimc_run_metrics_summary(ucs_cimc_run_summary):
+    """This is a function to print the aggregate latency and throughput
+    metrics of a UCS CIMC fleet run.
+
+    Args:
+        ucs_cimc_run_summary (dict):
+            The summary returned by UcsCimcRunMetrics.get_summary().
+    """
+    print(f"Throughput: {ucs_cimc_run_summary['hosts_per_minute']:.1f} UCS CIMC(s) per minute")
+    print("Phase Latency (p50 / p95 / p99):")
+    for ucs_cimc_phase, ucs_cimc_phase_summary in sorted(ucs_cimc_run_summary["phases"].items()):
+        print(f"- {ucs_cimc_phase}: {ucs_cimc_phase_summary['p50']:.3f}s / "
+              f"{ucs_cimc_phase_summary['p95']:.3f}s / {ucs_cimc_phase_summary['p99']:.3f}s "
+              f"({ucs_cimc_phase_summary['count']} total, {ucs_cimc_phase_summary['failures']} failed)")
+
+
+# Establish class for the settings of a UCS CIMC certificate renewal run
+class UcsCimcRunSettings:
+    """This is a class for the settings of a UCS CIMC certificate renewal run,
+    including the per-UCS CIMC task functions the run calls. The task
+    functions accept a UCS CIMC server entry and return a result dictionary
+    for run_ucs_cimc_fleet(), or the value expected by the fleet function
+    they are passed to.
+
+    Args:
+        request_task (function):
+            A function that requests a certificate for a UCS CIMC with the
+            threads client engine. It also accepts an ucs_cimc_session_cache
+            keyword argument.
+        async_request_task (function):
+            An async function that requests a certificate for a UCS CIMC with
+            the asyncio client engine. It also accepts an
+            ucs_cimc_session_cache keyword argument.
+        renewal_check_task (function):
+            A function that returns the renewal check result of a UCS CIMC. It
+            also accepts the ucs_cimc_session_cache and
+            ucs_cimc_certificate_cache keyword arguments.
+        csr_status_task (function):
+            A function that returns the certificate signing request status of
+            a UCS CIMC. It also accepts an ucs_cimc_session_cache keyword
+            argument.
+        upload_task (function):
+            A function that uploads the signed certificate of a UCS CIMC. It
+            also accepts the ucs_cimc_certificate_watcher and
+            ucs_cimc_session_cache keyword arguments.
+        self_signed_verification_task (function):
+            A function that returns the TLS verification state of a UCS CIMC
+            after a self-signed certificate request.
+        uploaded_certificate_verification_task (function):
+            A function that returns the TLS verification state of a UCS CIMC
+            after a signed certificate upload. It also accepts an
+            ucs_cimc_certificate_watcher keyword argument.
+        plan_function (function):
+            A function that accepts the UCS CIMC server entries and yields the
+            planned certificate request of each UCS CIMC, as a dictionary with
+            the ucs_cimc_server, self_signed, common_name, remote_server,
+            remote_server_protocol, problems and post_body keys.
+        certificate_inventory_function (function):
+            A function that accepts the UCS CIMC server entries and an
+            ucs_cimc_resolver_cache keyword argument, then refreshes and
+            prints the certificate inventory.
+        signed_certificate_common_name_function (function):
+            A function that returns the common name expected on the signed
+            certificate of a UCS CIMC.
+        group_key_function (function):
+            A function that returns the group key of a UCS CIMC. The default
+            value is None, which does not group the UCS CIMCs.
+        self_signed (bool):
+            Whether the certificate requests are for self-signed certificates.
+            The default value is True.
+        upload_directory (str):
+            The directory to upload the signed certificates from. The default
+            value is "", which requests certificates instead.
+        dry_run (bool):
+            Whether to only print the planned certificate requests. The default
+            value is False.
+        plan_filepath (str):
+            The filepath to write the planned certificate requests to as JSON
+            lines. The default value is "".
+        request_validation_enabled (bool):
+            Whether to validate the certificate requests of every UCS CIMC
+            before contacting any of them. The default value is True.
+        certificate_inventory (bool):
+            Whether to only refresh and print the certificate inventory. The
+            default value is False.
+        certificate_cache_filepath (str):
+            The filepath of the certificate inventory cache. The default value
+            is "", which uses no cache.
+        certificate_cache_ttl (int):
+            The number of seconds a certificate inventory cache entry is
+            current for. The default value is 86400.
+        journal_filepath (str):
+            The filepath of the checkpoint journal. The default value is "",
+            which keeps no journal.
+        resume (bool):
+            Whether to skip the UCS CIMCs completed in the checkpoint journal.
+            The default value is False.
+        metrics_filepath (str):
+            The filepath to write the run metrics to as JSON lines. The default
+            value is "".
+        prometheus_filepath (str):
+            The filepath to write the run metrics to as a Prometheus textfile.
+            The default value is "".
+        client_engine (str):
+            The client engine for the certificate requests, either "threads"
+            or "asyncio". The default value is "threads".
+        max_concurrent_workers (int):
+            The maximum number of worker threads. The default value is 1.
+        max_concurrent_sessions (int):
+            The maximum number of UCS CIMCs processed at once with the asyncio
+            client engine. The default value is 100.
+        max_cached_sessions (int):
+            The maximum number of cached login sessions. The default value is
+            100.
+        renewal_precheck_enabled (bool):
+            Whether to skip the UCS CIMCs that do not need a renewal. The
+            default value is False.
+        renewal_precheck_use_inventory_cache (bool):
+            Whether the renewal pre-check reads from the certificate inventory
+            cache. The default value is True.
+        csr_status_polling_enabled (bool):
+            Whether to wait for the certificate signing requests to complete.
+            The default value is True.
+        csr_status_polling_initial_interval (float):
+            The first interval in seconds between status polls. The default
+            value is 2.
+        csr_status_polling_max_interval (float):
+            The maximum interval in seconds between status polls. The default
+            value is 30.
+        csr_status_polling_timeout (float):
+            The number of seconds to wait for a certificate signing request.
+            The default value is 600.
+        csr_receiver (UcsCimcCsrReceiver):
+            An optional embedded CSR receiver that is started for the
+            certificate signing requests. The default value is None.
+        csr_receiver_timeout (float):
+            The number of seconds to wait for the CSR files. The default value
+            is 120.
+        upload_scan_interval (float):
+            The number of seconds between scans of the upload directory. The
+            default value is 2.
+        upload_idle_timeout (float):
+            The number of seconds to wait for a new signed certificate. The
+            default value is 60.
+        tls_verification_enabled (bool):
+            Whether to wait for the renewed UCS CIMCs to serve their new
+            certificates. The default value is True.
+        tls_verification_interval (float):
+            The number of seconds between TLS probes. The default value is 2.
+        tls_verification_timeout (float):
+            The number of seconds to wait for a new certificate. The default
+            value is 300.
+        dns_pre_resolution_enabled (bool):
+            Whether to resolve the hostnames of all UCS CIMCs before the run.
+            The default value is True.
+        dns_cache_ttl (float):
+            The number of seconds a resolved address is cached for. The
+            default value is 300.
+        dns_max_concurrent_lookups (int):
+            The maximum number of hostname lookups at once. The default value
+            is 32.
+        dns_resolution_timeout (float):
+            The number of seconds to wait for all hostname lookups. The
+            default value is 10.
+        group_max_concurrent (int):
+            The maximum number of UCS CIMCs processed at once in each group.
+            The default value is 0, which sets no limit.
+        group_rate (float):
+            The maximum number of UCS CIMCs started per second in each group.
+            The default value is 0, which sets no limit.
+        group_burst (int):
+            The number of UCS CIMCs in each group that can be started at once.
+            The default value is 1.
+        canary_wave_sizes (list):
+            The sizes of the canary waves. The default value is None, which
+            runs every UCS CIMC in a single wave.
+        canary_max_failure_rate (float):
+            The fraction of UCS CIMCs in a canary wave allowed to fail. The
+            default value is 0.0.
+    """
+    def __init__(
+        self,
+        request_task,
+        async_request_task,
+        renewal_check_task,
+        csr_status_task,
+        upload_task,
+        self_signed_verification_task,
+        uploaded_certificate_verification_task,
+        plan_function,
+        certificate_inventory_function,
+        signed_certificate_common_name_function,
+        group_key_function=None,
+        self_signed=True,
+        upload_directory="",
+        dry_run=False,
+        plan_filepath="",
+        request_validation_enabled=True,
+        certificate_inventory=False,
+        certificate_cache_filepath="",
+        certificate_cache_ttl=86400,
+        journal_filepath="",
+        resume=False,
+        metrics_filepath="",
+        prometheus_filepath="",
+        client_engine="threads",
+        max_concurrent_workers=1,
+        max_concurrent_sessions=100,
+        max_cached_sessions=100,
+        renewal_precheck_enabled=False,
+        renewal_precheck_use_inventory_cache=True,
+        csr_status_polling_enabled=True,
+        csr_status_polling_initial_interval=2,
+        csr_status_polling_max_interval=30,
+        csr_status_polling_timeout=600,
+        csr_receiver=None,
+        csr_receiver_timeout=120,
+        upload_scan_interval=2,
+        upload_idle_timeout=60,
+        tls_verification_enabled=True,
+        tls_verification_interval=2,
+        tls_verification_timeout=300,
+        dns_pre_resolution_enabled=True,
+        dns_cache_ttl=300,
+        dns_max_concurrent_lookups=32,
+        dns_resolution_timeout=10,
+        group_max_concurrent=0,
+        group_rate=0,
+        group_burst=1,
+        canary_wave_sizes=None,
+        canary_max_failure_rate=0.0
+        ):
+        self.request_task = request_task
+        self.async_request_task = async_request_task
+        self.renewal_check_task = renewal_check_task
+        self.csr_status_task = csr_status_task
+        self.upload_task = upload_task
+        self.self_signed_verification_task = self_signed_verification_task
+        self.uploaded_certificate_verification_task = uploaded_certificate_verification_task
+        self.plan_function = plan_function
+        self.certificate_inventory_function = certificate_inventory_function
+        self.signed_certificate_common_name_function = signed_certificate_common_name_function
+        self.group_key_function = group_key_function
+        self.self_signed = self_signed
+        self.upload_directory = upload_directory
+        self.dry_run = dry_run
+        self.plan_filepath = plan_filepath
+        self.request_validation_enabled = request_validation_enabled
+        self.certificate_inventory = certificate_inventory
+        self.certificate_cache_filepath = certificate_cache_filepath
+        self.certificate_cache_ttl = certificate_cache_ttl
+        self.journal_filepath = journal_filepath
+        self.resume = resume
+        self.metrics_filepath = metrics_filepath
+        self.prometheus_filepath = prometheus_filepath
+        self.client_engine = client_engine
+        self.max_concurrent_workers = max_concurrent_workers
+        self.max_concurrent_sessions = max_concurrent_sessions
+        self.max_cached_sessions = max_cached_sessions
+        self.renewal_precheck_enabled = renewal_precheck_enabled
+        self.renewal_precheck_use_inventory_cache = renewal_precheck_use_inventory_cache
+        self.csr_status_polling_enabled = csr_status_polling_enabled
+        self.csr_status_polling_initial_interval = csr_status_polling_initial_interval
+        self.csr_status_polling_max_interval = csr_status_polling_max_interval
+        self.csr_status_polling_timeout = csr_status_polling_timeout
+        self.csr_receiver = csr_receiver
+        self.csr_receiver_timeout = csr_receiver_timeout
+        self.upload_scan_interval = upload_scan_interval
+        self.upload_idle_timeout = upload_idle_timeout
+        self.tls_verification_enabled = tls_verification_enabled
+        self.tls_verification_interval = tls_verification_interval
+        self.tls_verification_timeout = tls_verification_timeout
+        self.dns_pre_resolution_enabled = dns_pre_resolution_enabled
+        self.dns_cache_ttl = dns_cache_ttl
+        self.dns_max_concurrent_lookups = dns_max_concurrent_lookups
+        self.dns_resolution_timeout = dns_resolution_timeout
+        self.group_max_concurrent = group_max_concurrent
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.canary_wave_sizes = canary_wave_sizes
+        self.canary_max_failure_rate = canary_max_failure_rate
+
+    @property
+    def host_phase(self):
+        """The phase recorded in the checkpoint journal for each UCS CIMC of
+        the run.
+        """
+        return "certificate_upload" if self.upload_directory else "certificate_request"
+
+
+# Establish function to run the certificate renewal of a fleet of UCS CIMCs
+def run_ucs_cimc_certificate_renewal(
+    ucs_cimc_servers_function,
+    ucs_cimc_run_settings,
+    rereadable=True
+    ):
+    """This is a function to run the certificate requests or signed
+    certificate uploads of a fleet of UCS CIMCs with the provided run
+    settings, including the validation, hostname pre-resolution, renewal
+    pre-check, CSR status polling, TLS verification and CSR collection
+    around them. The progress of the UCS CIMCs is logged as events, while
+    the plans and summaries are printed once the events logged before them
+    are written.
+
+    Args:
+        ucs_cimc_servers_function (function):
+            A function that returns a new iterable of the UCS CIMC server
+            entries for each pass made over the UCS CIMCs.
+        ucs_cimc_run_settings (UcsCimcRunSettings):
+            The settings of the run.
+        rereadable (bool):
+            Whether ucs_cimc_servers_function() can be called more than once.
+            The default value is True. If False, the UCS CIMC server entries
+            are kept in memory for every pass.
+
+    Returns:
+        A list of dictionaries containing the result of the certificate
+        request or upload for each UCS CIMC. The list is empty if no UCS CIMCs
+        were processed.
+    """
+    ucs_cimc_host_phase = ucs_cimc_run_settings.host_phase
+
+    # Skip the UCS CIMCs completed in a previous run, if resuming
+    ucs_cimc_completed_servers = set()
+    if ucs_cimc_run_settings.resume and ucs_cimc_run_settings.journal_filepath:
+        ucs_cimc_completed_servers = UcsCimcRunJournal.load_completed_ucs_cimc_servers(
+            ucs_cimc_run_settings.journal_filepath,
+            ucs_cimc_host_phase
+            )
+        log_ucs_cimc_event(
+            f"\nResuming from {ucs_cimc_run_settings.journal_filepath}. "
+            f"{len(ucs_cimc_completed_servers)} UCS CIMC(s) already completed will be skipped."
+            )
+
+    # Stream the UCS CIMCs again for each pass over the UCS CIMCs made before the run
+    def select_ucs_cimc_pending_servers(ucs_cimc_servers):
+        return (
+            ucs_cimc_server
+            for ucs_cimc_server in ucs_cimc_servers
+            if ucs_cimc_server not in ucs_cimc_completed_servers
+            )
+
+    ucs_cimc_servers = iter(ucs_cimc_servers_function())
+    ucs_cimc_first_server = next(ucs_cimc_servers, None)
+    ucs_cimc_pending_servers = select_ucs_cimc_pending_servers(
+        itertools.chain([ucs_cimc_first_server], ucs_cimc_servers) if ucs_cimc_first_server is not None else ()
+        )
+
+    # Validate and render the certificate requests of every UCS CIMC before contacting any of them
+    if (ucs_cimc_first_server is not None and not ucs_cimc_run_settings.upload_directory and
+            not ucs_cimc_run_settings.certificate_inventory and
+            (ucs_cimc_run_settings.request_validation_enabled or ucs_cimc_run_settings.dry_run or
+             ucs_cimc_run_settings.plan_filepath)):
+        if not rereadable:
+            ucs_cimc_pending_servers = list(ucs_cimc_pending_servers)
+        # Only the planned requests that are printed are kept, which are the invalid ones unless it is a dry run
+        ucs_cimc_printed_requests = []
+        ucs_cimc_planned_count = ucs_cimc_invalid_count = 0
+        with contextlib.ExitStack() as ucs_cimc_plan_exit_stack:
+            ucs_cimc_plan_file = None
+            if ucs_cimc_run_settings.plan_filepath:
+                ucs_cimc_plan_file = ucs_cimc_plan_exit_stack.enter_context(
+                    open(ucs_cimc_run_settings.plan_filepath, "w", encoding="utf-8")
+                    )
+            for ucs_cimc_planned_request in ucs_cimc_run_settings.plan_function(ucs_cimc_pending_servers):
+                ucs_cimc_planned_count += 1
+                if ucs_cimc_plan_file is not None:
+                    ucs_cimc_plan_file.write(json.dumps(ucs_cimc_planned_request) + "\n")
+                if ucs_cimc_planned_request["problems"]:
+                    ucs_cimc_invalid_count += 1
+                if ucs_cimc_planned_request["problems"] or ucs_cimc_run_settings.dry_run:
+                    del ucs_cimc_planned_request["post_body"]
+                    ucs_cimc_printed_requests.append(ucs_cimc_planned_request)
+        if ucs_cimc_run_settings.plan_filepath:
+            log_ucs_cimc_event(f"\nThe certificate request plan has been written to {ucs_cimc_run_settings.plan_filepath}.")
+        if ucs_cimc_run_settings.dry_run or ucs_cimc_invalid_count:
+            _print_ucs_cimc_certificate_request_plan(
+                ucs_cimc_printed_requests,
+                invalid_only=not ucs_cimc_run_settings.dry_run,
+                total_count=ucs_cimc_planned_count
+                )
+            if ucs_cimc_invalid_count:
+                print("\nNo UCS CIMC has been contacted. Correct the settings of the UCS CIMCs listed as invalid "
+                      "and run the tool again.")
+            return []
+        if rereadable:
+            ucs_cimc_pending_servers = select_ucs_cimc_pending_servers(ucs_cimc_servers_function())
+
+    # Resolve the hostnames of all UCS CIMCs concurrently, so UCS CIMCs that cannot be resolved are never scheduled
+    ucs_cimc_resolver_cache = None
+    ucs_cimc_unresolved_servers = {}
+    if ucs_cimc_run_settings.dns_pre_resolution_enabled and ucs_cimc_first_server is not None:
+        if not rereadable:
+            ucs_cimc_pending_servers = list(ucs_cimc_pending_servers)
+        log_ucs_cimc_event("\nResolving the hostnames of the UCS CIMCs...")
+        ucs_cimc_resolver_cache = UcsCimcResolverCache(ttl=ucs_cimc_run_settings.dns_cache_ttl)
+        ucs_cimc_unresolved_hosts, ucs_cimc_unattempted_hosts = ucs_cimc_resolver_cache.resolve_all(
+            (_split_ucs_cimc_server_address(ucs_cimc_server)[0] for ucs_cimc_server in ucs_cimc_pending_servers),
+            max_concurrent_lookups=ucs_cimc_run_settings.dns_max_concurrent_lookups,
+            timeout=ucs_cimc_run_settings.dns_resolution_timeout
+            )
+        if rereadable:
+            ucs_cimc_pending_servers = select_ucs_cimc_pending_servers(ucs_cimc_servers_function())
+        if ucs_cimc_unattempted_hosts:
+            log_ucs_cimc_event(
+                f"The resolver stopped responding, so {len(ucs_cimc_unattempted_hosts)} hostname(s) were not "
+                "attempted. Their UCS CIMCs will be resolved when they are contacted.",
+                level=logging.WARNING
+                )
+        if ucs_cimc_unresolved_hosts:
+            for ucs_cimc_server in ucs_cimc_pending_servers:
+                ucs_cimc_host = _split_ucs_cimc_server_address(ucs_cimc_server)[0]
+                if ucs_cimc_host in ucs_cimc_unresolved_hosts:
+                    ucs_cimc_unresolved_servers[ucs_cimc_server] = ucs_cimc_unresolved_hosts[ucs_cimc_host]
+            if rereadable:
+                ucs_cimc_pending_servers = select_ucs_cimc_pending_servers(ucs_cimc_servers_function())
+            log_ucs_cimc_event(
+                f"{len(ucs_cimc_unresolved_servers)} UCS CIMC(s) will be skipped, as their hostname could not be "
+                f"resolved:",
+                level=logging.WARNING
+                )
+            for ucs_cimc_server, ucs_cimc_resolution_error in ucs_cimc_unresolved_servers.items():
+                log_ucs_cimc_event(
+                    "Skipped",
+                    ucs_cimc_server=ucs_cimc_server,
+                    phase="dns_resolution",
+                    status="failed",
+                    error=ucs_cimc_resolution_error,
+                    error_class="ResolutionError",
+                    level=logging.WARNING
+                    )
+            ucs_cimc_pending_servers = (
+                ucs_cimc_server
+                for ucs_cimc_server in ucs_cimc_pending_servers
+                if ucs_cimc_server not in ucs_cimc_unresolved_servers
+                )
+
+    # Read the current certificates of the UCS CIMCs into the certificate inventory cache, if requested
+    if ucs_cimc_run_settings.certificate_inventory:
+        if ucs_cimc_first_server is None:
+            log_ucs_cimc_event("\nThere were no UCS CIMC servers provided.")
+            return []
+        ucs_cimc_run_settings.certificate_inventory_function(
+            list(ucs_cimc_pending_servers),
+            ucs_cimc_resolver_cache=ucs_cimc_resolver_cache
+            )
+        return []
+
+    # Cycle through the provided UCS CIMC server list and perform the certificate signing requests
+    if ucs_cimc_first_server is None:
+        log_ucs_cimc_event("\nThere are no certificate signing requests to perform.")
+        log_ucs_cimc_event("There were no UCS CIMC servers provided.")
+        return []
+    ucs_cimc_fleet_start_time = time.monotonic()
+    ucs_cimc_run_metrics = UcsCimcRunMetrics(host_phase=ucs_cimc_host_phase)
+    set_ucs_cimc_run_metrics(ucs_cimc_run_metrics)
+    clear_ucs_cimc_initial_certificate_fingerprints()
+    with contextlib.ExitStack() as ucs_cimc_exit_stack:
+        ucs_cimc_exit_stack.callback(set_ucs_cimc_run_metrics, None)
+        ucs_cimc_journal = None
+        if ucs_cimc_run_settings.journal_filepath:
+            ucs_cimc_journal = ucs_cimc_exit_stack.enter_context(
+                UcsCimcRunJournal(ucs_cimc_run_settings.journal_filepath)
+                )
+            for ucs_cimc_server, ucs_cimc_resolution_error in ucs_cimc_unresolved_servers.items():
+                ucs_cimc_journal.record(
+                    ucs_cimc_server,
+                    ucs_cimc_host_phase,
+                    False,
+                    error=ucs_cimc_resolution_error
+                    )
+        if ucs_cimc_resolver_cache is not None:
+            set_ucs_cimc_resolver_cache(ucs_cimc_resolver_cache)
+            ucs_cimc_exit_stack.callback(set_ucs_cimc_resolver_cache, None)
+        ucs_cimc_session_cache = ucs_cimc_exit_stack.enter_context(
+            UcsCimcSessionCache(max_sessions=ucs_cimc_run_settings.max_cached_sessions)
+            )
+        ucs_cimc_certificate_cache = None
+        if ucs_cimc_run_settings.certificate_cache_filepath and (
+                os.path.exists(ucs_cimc_run_settings.certificate_cache_filepath) or
+                (ucs_cimc_run_settings.renewal_precheck_enabled and
+                 ucs_cimc_run_settings.renewal_precheck_use_inventory_cache)):
+            ucs_cimc_certificate_cache = ucs_cimc_exit_stack.enter_context(
+                UcsCimcCertificateInventoryCache(
+                    ucs_cimc_run_settings.certificate_cache_filepath,
+                    ttl=ucs_cimc_run_settings.certificate_cache_ttl
+                    )
+                )
+
+        # Limit the UCS CIMCs processed at once within each group sharing a resource
+        ucs_cimc_group_scheduler = None
+        if ucs_cimc_run_settings.group_key_function is not None and (
+                ucs_cimc_run_settings.group_max_concurrent > 0 or ucs_cimc_run_settings.group_rate > 0):
+            ucs_cimc_group_scheduler = UcsCimcGroupScheduler(
+                ucs_cimc_run_settings.group_key_function,
+                max_concurrent_per_group=ucs_cimc_run_settings.group_max_concurrent,
+                rate_per_group=ucs_cimc_run_settings.group_rate,
+                burst_per_group=ucs_cimc_run_settings.group_burst
+                )
+
+        ucs_cimc_csr_receiver = None
+        ucs_cimc_failed_csr_servers = set()
+        ucs_cimc_certificate_watcher = None
+        if ucs_cimc_run_settings.upload_directory:
+            # Upload the signed certificates to the matching UCS CIMCs as they appear in the directory
+            ucs_cimc_certificate_watcher = UcsCimcSignedCertificateWatcher(
+                ucs_cimc_run_settings.upload_directory,
+                ucs_cimc_pending_servers,
+                common_name_function=ucs_cimc_run_settings.signed_certificate_common_name_function,
+                scan_interval=ucs_cimc_run_settings.upload_scan_interval,
+                idle_timeout=ucs_cimc_run_settings.upload_idle_timeout
+                )
+            log_ucs_cimc_event(f"\nUploading the signed certificates from {ucs_cimc_run_settings.upload_directory}...")
+            ucs_cimc_fleet_results = run_ucs_cimc_fleet(
+                ucs_cimc_certificate_watcher,
+                functools.partial(
+                    ucs_cimc_run_settings.upload_task,
+                    ucs_cimc_certificate_watcher=ucs_cimc_certificate_watcher,
+                    ucs_cimc_session_cache=ucs_cimc_session_cache
+                    ),
+                max_concurrent_workers=ucs_cimc_run_settings.max_concurrent_workers,
+                phase="certificate_upload",
+                ucs_cimc_journal=ucs_cimc_journal,
+                ucs_cimc_group_scheduler=ucs_cimc_group_scheduler
+                )
+            for ucs_cimc_skipped_certificate in ucs_cimc_certificate_watcher.skipped_certificates:
+                log_ucs_cimc_event(
+                    f"- {ucs_cimc_skipped_certificate['certificate_filepath']}: Skipped - "
+                    f"{ucs_cimc_skipped_certificate['reason']}",
+                    level=logging.WARNING
+                    )
+            ucs_cimc_unmatched_servers = ucs_cimc_certificate_watcher.get_unmatched_ucs_cimc_servers()
+            if ucs_cimc_unmatched_servers:
+                log_ucs_cimc_event(
+                    f"No signed certificate was found for {len(ucs_cimc_unmatched_servers)} UCS CIMC(s): "
+                    f"{', '.join(ucs_cimc_unmatched_servers)}",
+                    level=logging.WARNING
+                    )
+        else:
+            # Check the current certificates and skip the UCS CIMCs that do not need renewal
+            if ucs_cimc_run_settings.renewal_precheck_enabled:
+                log_ucs_cimc_event("\nChecking the current certificates of the UCS CIMCs...")
+                ucs_cimc_renewal_check_results = check_ucs_cimc_fleet_certificate_renewal(
+                    ucs_cimc_pending_servers,
+                    functools.partial(
+                        ucs_cimc_run_settings.renewal_check_task,
+                        ucs_cimc_session_cache=ucs_cimc_session_cache,
+                        ucs_cimc_certificate_cache=(
+                            ucs_cimc_certificate_cache if ucs_cimc_run_settings.renewal_precheck_use_inventory_cache
+                            else None
+                            )
+                        ),
+                    max_concurrent_workers=ucs_cimc_run_settings.max_concurrent_workers
+                    )
+                for ucs_cimc_renewal_check_result in ucs_cimc_renewal_check_results:
+                    ucs_cimc_renewal_check_status = "Renewal required" if ucs_cimc_renewal_check_result["renewal_required"] else "Skipped"
+                    if ucs_cimc_renewal_check_result["cached"]:
+                        ucs_cimc_renewal_check_status += " (from the certificate inventory cache)"
+                    log_ucs_cimc_event(
+                        f"{ucs_cimc_renewal_check_status} - {ucs_cimc_renewal_check_result['reason']}",
+                        ucs_cimc_server=ucs_cimc_renewal_check_result["ucs_cimc_server"],
+                        phase="renewal_check",
+                        status="renewal_required" if ucs_cimc_renewal_check_result["renewal_required"] else "skipped"
+                        )
+                ucs_cimc_pending_servers = [
+                    ucs_cimc_renewal_check_result["ucs_cimc_server"]
+                    for ucs_cimc_renewal_check_result in ucs_cimc_renewal_check_results
+                    if ucs_cimc_renewal_check_result["renewal_required"]
+                    ]
+                log_ucs_cimc_event(
+                    f"{len(ucs_cimc_renewal_check_results) - len(ucs_cimc_pending_servers)} UCS CIMC(s) "
+                    "do not require a renewal and will be skipped."
+                    )
+
+            # Start the embedded CSR receiver for the certificate signing request files
+            if not ucs_cimc_run_settings.self_signed and ucs_cimc_run_settings.csr_receiver is not None:
+                ucs_cimc_csr_receiver = ucs_cimc_exit_stack.enter_context(ucs_cimc_run_settings.csr_receiver)
+                set_ucs_cimc_csr_receiver(ucs_cimc_csr_receiver)
+                ucs_cimc_exit_stack.callback(set_ucs_cimc_csr_receiver, None)
+                log_ucs_cimc_event(
+                    f"\nThe CSR receiver is listening on {ucs_cimc_csr_receiver.bind_address} "
+                    f"(TFTP port {ucs_cimc_csr_receiver.tftp_port}, FTP port {ucs_cimc_csr_receiver.ftp_port})."
+                    )
+
+            # Interleave the groups, so the UCS CIMCs of one group do not wait behind each other
+            if ucs_cimc_group_scheduler is not None:
+                ucs_cimc_pending_servers = ucs_cimc_group_scheduler.interleave(
+                    ucs_cimc_pending_servers,
+                    lookahead=4 * max(ucs_cimc_run_settings.max_concurrent_workers,
+                                      ucs_cimc_run_settings.max_concurrent_sessions)
+                    )
+
+            if ucs_cimc_run_settings.client_engine == "asyncio":
+                import asyncio
+
+                def ucs_cimc_run_wave(ucs_cimc_wave_servers):
+                    return asyncio.run(
+                        async_run_ucs_cimc_fleet(
+                            ucs_cimc_wave_servers,
+                            functools.partial(
+                                ucs_cimc_run_settings.async_request_task,
+                                ucs_cimc_session_cache=ucs_cimc_session_cache
+                                ),
+                            max_concurrent_sessions=ucs_cimc_run_settings.max_concurrent_sessions,
+                            ucs_cimc_journal=ucs_cimc_journal,
+                            ucs_cimc_group_scheduler=ucs_cimc_group_scheduler
+                            )
+                        )
+            else:
+                ucs_cimc_run_wave = functools.partial(
+                    run_ucs_cimc_fleet,
+                    ucs_cimc_task=functools.partial(
+                        ucs_cimc_run_settings.request_task,
+                        ucs_cimc_session_cache=ucs_cimc_session_cache
+                        ),
+                    max_concurrent_workers=ucs_cimc_run_settings.max_concurrent_workers,
+                    ucs_cimc_journal=ucs_cimc_journal,
+                    ucs_cimc_group_scheduler=ucs_cimc_group_scheduler
+                    )
+            if ucs_cimc_run_settings.canary_wave_sizes:
+                ucs_cimc_fleet_results, _ = run_ucs_cimc_canary_waves(
+                    ucs_cimc_pending_servers,
+                    ucs_cimc_run_wave,
+                    ucs_cimc_run_settings.canary_wave_sizes,
+                    max_failure_rate=ucs_cimc_run_settings.canary_max_failure_rate
+                    )
+            else:
+                ucs_cimc_fleet_results = ucs_cimc_run_wave(ucs_cimc_pending_servers)
+
+            # Wait for the certificate signing requests to complete
+            if not ucs_cimc_run_settings.self_signed and ucs_cimc_run_settings.csr_status_polling_enabled:
+                ucs_cimc_polling_servers = [
+                    ucs_cimc_result["ucs_cimc_server"]
+                    for ucs_cimc_result in ucs_cimc_fleet_results
+                    if ucs_cimc_result["succeeded"]
+                    ]
+                if ucs_cimc_polling_servers:
+                    log_ucs_cimc_event("\nWaiting for the certificate signing requests to complete...")
+                    ucs_cimc_polling_results = poll_ucs_cimc_fleet_certificate_signing_request_completion(
+                        ucs_cimc_polling_servers,
+                        functools.partial(
+                            ucs_cimc_run_settings.csr_status_task,
+                            ucs_cimc_session_cache=ucs_cimc_session_cache
+                            ),
+                        initial_interval=ucs_cimc_run_settings.csr_status_polling_initial_interval,
+                        max_interval=ucs_cimc_run_settings.csr_status_polling_max_interval,
+                        timeout=ucs_cimc_run_settings.csr_status_polling_timeout,
+                        max_concurrent_polls=ucs_cimc_run_settings.max_concurrent_workers
+                        )
+                    for ucs_cimc_polling_result in ucs_cimc_polling_results:
+                        if ucs_cimc_polling_result["time_to_completion"] is not None:
+                            ucs_cimc_run_metrics.record(
+                                ucs_cimc_polling_result["ucs_cimc_server"],
+                                "csr_completion",
+                                ucs_cimc_polling_result["time_to_completion"],
+                                ucs_cimc_polling_result["state"] == "completed"
+                                )
+                        if ucs_cimc_polling_result["state"] != "completed":
+                            ucs_cimc_failed_csr_servers.add(ucs_cimc_polling_result["ucs_cimc_server"])
+                        if ucs_cimc_polling_result["state"] == "completed":
+                            log_ucs_cimc_event(
+                                f"Completed in {ucs_cimc_polling_result['time_to_completion']:.2f}s",
+                                ucs_cimc_server=ucs_cimc_polling_result["ucs_cimc_server"],
+                                phase="csr_completion",
+                                status="succeeded",
+                                duration=ucs_cimc_polling_result["time_to_completion"]
+                                )
+                        else:
+                            log_ucs_cimc_event(
+                                f"{ucs_cimc_polling_result['state'].replace('_', ' ').capitalize()} - "
+                                f"{ucs_cimc_polling_result['csr_status']}",
+                                ucs_cimc_server=ucs_cimc_polling_result["ucs_cimc_server"],
+                                phase="csr_completion",
+                                status=ucs_cimc_polling_result["state"],
+                                duration=ucs_cimc_polling_result["time_to_completion"],
+                                level=logging.WARNING
+                                )
+                        if ucs_cimc_journal is not None:
+                            ucs_cimc_journal.record(
+                                ucs_cimc_polling_result["ucs_cimc_server"],
+                                "csr_completion",
+                                ucs_cimc_polling_result["state"] == "completed",
+                                error=("" if ucs_cimc_polling_result["state"] == "completed"
+                                       else ucs_cimc_polling_result["csr_status"])
+                                )
+
+        # Flag the renewed UCS CIMCs, so their certificate inventory cache entries are read again
+        if ucs_cimc_certificate_cache is not None and (ucs_cimc_certificate_watcher is not None or
+                                                       ucs_cimc_run_settings.self_signed):
+            ucs_cimc_certificate_cache.mark_changed(
+                ucs_cimc_result["ucs_cimc_server"]
+                for ucs_cimc_result in ucs_cimc_fleet_results
+                if ucs_cimc_result["succeeded"]
+                )
+
+        # Wait for the renewed UCS CIMCs to serve their new self-signed or uploaded certificates
+        ucs_cimc_verify_task = None
+        if ucs_cimc_certificate_watcher is not None:
+            ucs_cimc_verify_task = functools.partial(
+                ucs_cimc_run_settings.uploaded_certificate_verification_task,
+                ucs_cimc_certificate_watcher=ucs_cimc_certificate_watcher
+                )
+        elif ucs_cimc_run_settings.self_signed:
+            ucs_cimc_verify_task = ucs_cimc_run_settings.self_signed_verification_task
+        if ucs_cimc_verify_task is not None and ucs_cimc_run_settings.tls_verification_enabled:
+            ucs_cimc_verification_servers = [
+                ucs_cimc_result["ucs_cimc_server"]
+                for ucs_cimc_result in ucs_cimc_fleet_results
+                if ucs_cimc_result["succeeded"]
+                ]
+            if ucs_cimc_verification_servers:
+                log_ucs_cimc_event("\nWaiting for the UCS CIMCs to serve the new certificates...")
+                ucs_cimc_verification_results = verify_ucs_cimc_fleet_tls_certificates(
+                    ucs_cimc_verification_servers,
+                    ucs_cimc_verify_task,
+                    interval=ucs_cimc_run_settings.tls_verification_interval,
+                    timeout=ucs_cimc_run_settings.tls_verification_timeout,
+                    max_concurrent_probes=max(ucs_cimc_run_settings.max_concurrent_workers, 10)
+                    )
+                for ucs_cimc_verification_result in ucs_cimc_verification_results:
+                    ucs_cimc_tls_ready = ucs_cimc_verification_result["state"] == "ready"
+                    if ucs_cimc_verification_result["time_to_ready"] is not None:
+                        ucs_cimc_run_metrics.record(
+                            ucs_cimc_verification_result["ucs_cimc_server"],
+                            "tls_ready",
+                            ucs_cimc_verification_result["time_to_ready"],
+                            ucs_cimc_tls_ready
+                            )
+                    if ucs_cimc_tls_ready:
+                        log_ucs_cimc_event(
+                            f"Ready in {ucs_cimc_verification_result['time_to_ready']:.2f}s",
+                            ucs_cimc_server=ucs_cimc_verification_result["ucs_cimc_server"],
+                            phase="tls_verification",
+                            status="succeeded",
+                            duration=ucs_cimc_verification_result["time_to_ready"]
+                            )
+                    else:
+                        log_ucs_cimc_event(
+                            f"{ucs_cimc_verification_result['state'].replace('_', ' ').capitalize()} - "
+                            f"{ucs_cimc_verification_result['reason']}",
+                            ucs_cimc_server=ucs_cimc_verification_result["ucs_cimc_server"],
+                            phase="tls_verification",
+                            status=ucs_cimc_verification_result["state"],
+                            duration=ucs_cimc_verification_result["time_to_ready"],
+                            level=logging.WARNING
+                            )
+                    if ucs_cimc_journal is not None:
+                        ucs_cimc_journal.record(
+                            ucs_cimc_verification_result["ucs_cimc_server"],
+                            "tls_verification",
+                            ucs_cimc_tls_ready,
+                            error="" if ucs_cimc_tls_ready else ucs_cimc_verification_result["reason"]
+                            )
+
+        # Collect the certificate signing request files pushed to the embedded CSR receiver
+        if ucs_cimc_csr_receiver is not None:
+            ucs_cimc_receiving_results = [
+                ucs_cimc_result
+                for ucs_cimc_result in ucs_cimc_fleet_results
+                if ucs_cimc_result["succeeded"] and ucs_cimc_result["ucs_cimc_server"] not in ucs_cimc_failed_csr_servers
+                ]
+            if ucs_cimc_receiving_results:
+                log_ucs_cimc_event("\nWaiting for the certificate signing request files to be received...")
+                ucs_cimc_csr_receiver.wait_for_csrs(
+                    [ucs_cimc_result["ucs_cimc_server"] for ucs_cimc_result in ucs_cimc_receiving_results],
+                    timeout=ucs_cimc_run_settings.csr_receiver_timeout
+                    )
+                for ucs_cimc_result in ucs_cimc_receiving_results:
+                    ucs_cimc_collected_csr = ucs_cimc_csr_receiver.get_collected_csr(ucs_cimc_result["ucs_cimc_server"])
+                    ucs_cimc_result["csr_collected"] = ucs_cimc_collected_csr is not None
+                    ucs_cimc_result["csr_filepath"] = ucs_cimc_collected_csr["csr_filepath"] if ucs_cimc_collected_csr else ""
+                    if ucs_cimc_collected_csr:
+                        log_ucs_cimc_event(
+                            f"Collected over {ucs_cimc_collected_csr['protocol'].upper()} to "
+                            f"{ucs_cimc_collected_csr['csr_filepath']}",
+                            ucs_cimc_server=ucs_cimc_result["ucs_cimc_server"],
+                            phase="csr_collection",
+                            status="succeeded"
+                            )
+                    else:
+                        log_ucs_cimc_event(
+                            "Not received",
+                            ucs_cimc_server=ucs_cimc_result["ucs_cimc_server"],
+                            phase="csr_collection",
+                            status="failed",
+                            level=logging.WARNING
+                            )
+                    if ucs_cimc_journal is not None:
+                        ucs_cimc_journal.record(
+                            ucs_cimc_result["ucs_cimc_server"],
+                            "csr_collection",
+                            ucs_cimc_result["csr_collected"],
+                            error="" if ucs_cimc_collected_csr else "The CSR file was not received."
+                            )
+    ucs_cimc_run_metrics.finish()
+    _print_ucs_cimc_fleet_summary(ucs_cimc_fleet_results)
+    print(f"Elapsed Time: {time.monotonic() - ucs_cimc_fleet_start_time:.2f}s")
+    _print_ucs_cimc_run_metrics_summary(ucs_cimc_run_metrics.get_summary())
+    if ucs_cimc_run_settings.metrics_filepath:
+        ucs_cimc_run_metrics.write_json_lines(ucs_cimc_run_settings.metrics_filepath)
+        print(f"The run metrics have been written to {ucs_cimc_run_settings.metrics_filepath}.")
+    if ucs_cimc_run_settings.prometheus_filepath:
+        ucs_cimc_run_metrics.write_prometheus_textfile(ucs_cimc_run_settings.prometheus_filepath)
+        print(f"The Prometheus textfile has been written to {ucs_cimc_run_settings.prometheus_filepath}.")
+    return ucs_cimc_fleet_results